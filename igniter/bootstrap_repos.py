@@ -11,8 +11,12 @@ from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
 import platform
+import json
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from zipfile import ZipFile, BadZipFile
+from zipfile import ZipFile, BadZipFile, ZipInfo
 
 from appdirs import user_data_dir
 from speedcopy import copyfile
@@ -77,6 +81,222 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+def sha256sum_zip_member(zip_path, member_name):
+    """Calculate sha256 for content of the file inside zip.
+
+    Each call opens its own handle of zip file so it can be used from
+    multiple threads at once.
+
+    Args:
+        zip_path (Path): Path to zip file.
+        member_name (str): Name of file in zip.
+
+    Returns:
+        str: hex encoded sha256
+
+    """
+    h = hashlib.sha256()
+    with ZipFile(zip_path, "r") as zip_file:
+        with zip_file.open(member_name) as f:
+            for chunk in iter(lambda: f.read(128 * 1024), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def get_hash_workers():
+    """Number of threads used to calculate checksums."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ZipValidationCache:
+    """Results of zip file checks stored by path, size and modification time.
+
+    Zip file is not checked again until its size or modification time
+    change. Results can be persisted to json file so they're shared with
+    next start of OpenPype.
+
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+        self._filepath = None
+
+    @property
+    def filepath(self) -> Union[Path, None]:
+        return self._filepath
+
+    def set_filepath(self, filepath: Union[Path, None]) -> None:
+        """Set json file where results are persisted and load it.
+
+        Args:
+            filepath (Path): Path to json file or None to keep results
+                only in memory.
+
+        """
+        with self._lock:
+            self._filepath = filepath
+            if not filepath or not filepath.exists():
+                return
+            try:
+                with open(filepath, "r") as stream:
+                    data = json.load(stream)
+            except (OSError, ValueError):
+                return
+
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    self._data.setdefault(key, value)
+
+    @staticmethod
+    def _get_item_key(path: Path) -> Tuple[str, dict]:
+        stat = path.stat()
+        return str(path.resolve()), {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+        }
+
+    def get(self, path: Path, category: str) -> Union[Tuple[bool, str], None]:
+        """Get cached result of check for zip file.
+
+        Args:
+            path (Path): Path to zip file.
+            category (str): Type of check.
+
+        Returns:
+            tuple(bool, str): Cached result or None if zip was not checked
+                or was changed since then.
+
+        """
+        try:
+            key, stat_data = self._get_item_key(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            item = self._data.get(key)
+            if not item or item["stat"] != stat_data:
+                return None
+            result = item["results"].get(category)
+        if result is None:
+            return None
+        return tuple(result)
+
+    def set(self, path: Path, category: str, result: Tuple[bool, str]):
+        """Store result of check for zip file.
+
+        Args:
+            path (Path): Path to zip file.
+            category (str): Type of check.
+            result (tuple(bool, str)): Result of check.
+
+        """
+        try:
+            key, stat_data = self._get_item_key(path)
+        except OSError:
+            return
+
+        with self._lock:
+            item = self._data.get(key)
+            if not item or item["stat"] != stat_data:
+                item = {"stat": stat_data, "results": {}}
+                self._data[key] = item
+            item["results"][category] = list(result)
+            self._save()
+
+    def clear(self):
+        with self._lock:
+            self._data = {}
+            self._save()
+
+    def _save(self):
+        if not self._filepath:
+            return
+
+        # remove records of zip files which don't exist anymore
+        self._data = {
+            key: value
+            for key, value in self._data.items()
+            if os.path.exists(key)
+        }
+        tmp_path = self._filepath.with_name(
+            f"{self._filepath.name}.{os.getpid()}.tmp")
+        try:
+            self._filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump(self._data, stream)
+            os.replace(tmp_path, self._filepath)
+        except OSError:
+            # cache is just optimization
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+
+zip_validation_cache = ZipValidationCache()
+
+
+def read_zip_checksums(
+        zip_file: ZipFile) -> Union[List[Tuple[str, str]], None]:
+    """Read checksums stored in OpenPype zip file.
+
+    Args:
+        zip_file (ZipFile): Opened zip file.
+
+    Returns:
+        list of tuple(str, str): Checksum and file name or None
+            if zip doesn't contain checksums.
+
+    """
+    try:
+        checksums_data = zip_file.read("checksums").decode("utf-8")
+    except KeyError:
+        return None
+
+    return [
+        tuple(line.split(":", 1))
+        for line in checksums_data.split("\n") if line
+    ]
+
+
+def copy_zip_member(source_zip: ZipFile, target_zip: ZipFile, name: str):
+    """Copy compressed file between zip files without recompression.
+
+    Args:
+        source_zip (ZipFile): Zip opened for reading.
+        target_zip (ZipFile): Zip opened for writing.
+        name (str): Name of file to copy.
+
+    """
+    source_info = source_zip.getinfo(name)
+
+    # skip local file header of source file to get to the compressed data
+    source_zip.fp.seek(source_info.header_offset)
+    header = source_zip.fp.read(30)
+    if header[:4] != b"PK\003\004":
+        raise BadZipFile(f"Bad local header of {name}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source_zip.fp.seek(name_length + extra_length, os.SEEK_CUR)
+    data = source_zip.fp.read(source_info.compress_size)
+
+    info = ZipInfo(source_info.filename, source_info.date_time)
+    info.compress_type = source_info.compress_type
+    info.external_attr = source_info.external_attr
+    info.create_system = source_info.create_system
+    # sizes are known so data descriptor is not needed
+    info.flag_bits = source_info.flag_bits & ~0x08
+    info.CRC = source_info.CRC
+    info.compress_size = source_info.compress_size
+    info.file_size = source_info.file_size
+
+    target_zip.fp.seek(target_zip.start_dir)
+    info.header_offset = target_zip.fp.tell()
+    target_zip.fp.write(info.FileHeader())
+    target_zip.fp.write(data)
+    target_zip.filelist.append(info)
+    target_zip.NameToInfo[info.filename] = info
+    target_zip.start_dir = target_zip.fp.tell()
+    target_zip._didModify = True
+
+
 class ZipFileLongPaths(ZipFile):
     def _extract_member(self, member, targetpath, pwd):
         return ZipFile._extract_member(
@@ -258,6 +478,16 @@ class OpenPypeVersion(semver.VersionInfo):
         if zip_item.suffix.lower() != ".zip":
             return False, "Not a zip"
 
+        cache_category = f"version:{version.get_main_version()}"
+        result = zip_validation_cache.get(zip_item, cache_category)
+        if result is None:
+            result = OpenPypeVersion._is_version_in_zip(zip_item, version)
+            zip_validation_cache.set(zip_item, cache_category, result)
+        return result
+
+    @staticmethod
+    def _is_version_in_zip(
+            zip_item: Path, version: OpenPypeVersion) -> Tuple[bool, str]:
         try:
             with ZipFile(zip_item, "r") as zip_file:
                 with zip_file.open(
@@ -607,6 +837,8 @@ class BootstrapRepos:
         else:
             self._print(f"overriding local folder: {data_dir}")
             self.data_dir = data_dir
+        zip_validation_cache.set_filepath(
+            Path(self.data_dir) / "zip_validation_cache.json")
 
     @staticmethod
     def get_version_path_from_list(
@@ -694,7 +926,8 @@ class BootstrapRepos:
                 Path(temp_dir) / f"openpype-v{version}.zip"
             self._print(f"creating zip: {temp_zip}")
 
-            self._create_openpype_zip(temp_zip, repo_dir)
+            self._create_openpype_zip(
+                temp_zip, repo_dir, self._find_previous_zip(version))
             if not os.path.exists(temp_zip):
                 self._print("make archive failed.", LOG_ERROR)
                 return None
@@ -807,7 +1040,9 @@ class BootstrapRepos:
 
         return OpenPypeVersion(version=version, path=destination)
 
-    def _create_openpype_zip(self, zip_path: Path, openpype_path: Path) -> None:
+    def _create_openpype_zip(
+            self, zip_path: Path, openpype_path: Path,
+            previous_zip: Union[Path, None] = None) -> None:
         """Pack repositories and OpenPype into zip.
 
         We are using :mod:`ZipFile` instead :meth:`shutil.make_archive`
@@ -816,9 +1051,14 @@ class BootstrapRepos:
         and :attr:`openpype_filter` on top level directory in OpenPype
         repository.
 
+        Files with the same checksum as in previous zip are copied from it
+        without compressing them again.
+
         Args:
             zip_path (Path): Path to zip file.
             openpype_path (Path): Path to OpenPype sources.
+            previous_zip (Path, optional): Zip created from previous
+                version of sources.
 
         """
         # get filtered list of file in Pype repository
@@ -831,56 +1071,104 @@ class BootstrapRepos:
             else:
                 openpype_list.append(openpype_path / f)
 
-        openpype_files = len(openpype_list)
+        openpype_root = openpype_path.resolve()
+        # generate list of filtered paths
+        dir_filter = [openpype_root / f for f in self.openpype_filter]
+
+        files = []
+        file: Path
+        for file in openpype_list:
+            # if file resides in filtered path, skip it
+            is_inside = None
+            df: Path
+            for df in dir_filter:
+                try:
+                    is_inside = file.resolve().relative_to(df)
+                except ValueError:
+                    pass
+
+            if not is_inside:
+                continue
+            files.append((file, file.resolve().relative_to(openpype_root)))
+
+        with ThreadPoolExecutor(max_workers=get_hash_workers()) as executor:
+            checksums = list(executor.map(
+                lambda item: sha256sum(sanitize_long_path(
+                    item[0].as_posix())),
+                files
+            ))
+
+        previous_zip_file = None
+        previous_checksums = {}
+        if previous_zip and previous_zip.is_file():
+            try:
+                previous_zip_file = ZipFile(previous_zip, "r")
+                previous_checksums = {
+                    file_name: file_checksum
+                    for file_checksum, file_name in (
+                        read_zip_checksums(previous_zip_file) or []
+                    )
+                }
+            except (OSError, BadZipFile):
+                self._print(
+                    f"Cannot read previous zip {previous_zip}", LOG_WARNING)
 
-        openpype_inc = 98.0 / float(openpype_files)
+        openpype_inc = 98.0 / float(max(len(files), 1))
+        reused = 0
+        try:
+            with ZipFile(zip_path, "w") as zip_file:
+                progress = 0
+                checksums_str = ""
+                for (file, arc_path), checksum in zip(files, checksums):
+                    progress += openpype_inc
+                    self._progress_callback(int(progress))
 
-        with ZipFile(zip_path, "w") as zip_file:
-            progress = 0
-            openpype_root = openpype_path.resolve()
-            # generate list of filtered paths
-            dir_filter = [openpype_root / f for f in self.openpype_filter]
-            checksums = []
+                    self._print(f"- processing {file}")
+                    arc_name = arc_path.as_posix()
+                    if previous_checksums.get(arc_name) == checksum:
+                        copy_zip_member(previous_zip_file, zip_file, arc_name)
+                        reused += 1
+                    else:
+                        zip_file.write(file, arc_path)
+                    checksums_str += "{}:{}\n".format(checksum, arc_name)
+
+                zip_file.writestr("checksums", checksums_str)
+                # test if zip is ok
+                zip_file.testzip()
+        finally:
+            if previous_zip_file is not None:
+                previous_zip_file.close()
+
+        if previous_zip_file is not None:
+            self._print(
+                f"Reused {reused} of {len(files)} files from {previous_zip}")
+        self._progress_callback(100)
 
-            file: Path
-            for file in openpype_list:
-                progress += openpype_inc
-                self._progress_callback(int(progress))
+    def _find_previous_zip(self, version: str) -> Union[Path, None]:
+        """Find the latest zip with the same major and minor version.
 
-                # if file resides in filtered path, skip it
-                is_inside = None
-                df: Path
-                for df in dir_filter:
-                    try:
-                        is_inside = file.resolve().relative_to(df)
-                    except ValueError:
-                        pass
+        Args:
+            version (str): Version of zip that will be created.
 
-                if not is_inside:
-                    continue
+        Returns:
+            Path: Zip file in user data dir or None if there is none.
 
-                processed_path = file
-                self._print(f"- processing {processed_path}")
+        """
+        openpype_version = OpenPypeVersion.version_in_str(version)
+        if not openpype_version:
+            return None
+        version_dir = Path(self.data_dir) / (
+            f"{openpype_version.major}.{openpype_version.minor}")
+        if not version_dir.is_dir():
+            return None
 
-                checksums.append(
-                    (
-                        sha256sum(sanitize_long_path(file.as_posix())),
-                        file.resolve().relative_to(openpype_root)
-                    )
-                )
-                zip_file.write(
-                    file, file.resolve().relative_to(openpype_root))
-
-            checksums_str = ""
-            for c in checksums:
-                file_str = c[1]
-                if platform.system().lower() == "windows":
-                    file_str = c[1].as_posix().replace("\\", "/")
-                checksums_str += "{}:{}\n".format(c[0], file_str)
-            zip_file.writestr("checksums", checksums_str)
-            # test if zip is ok
-            zip_file.testzip()
-            self._progress_callback(100)
+        zips = [
+            item for item in version_dir.iterdir()
+            if item.is_file() and item.suffix.lower() == ".zip"
+        ]
+        if not zips:
+            return None
+        return max(zips, key=lambda item: item.stat().st_mtime)
 
     def validate_openpype_version(self, path: Path) -> tuple:
         """Validate version directory or zip file.
@@ -908,21 +1196,31 @@ class BootstrapRepos:
 
     @staticmethod
     def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
+        """Validate content of zip file.
+
+        Result is cached until size or modification time of zip changes.
+
+        """
+        result = zip_validation_cache.get(path, "checksums")
+        if result is None:
+            result = BootstrapRepos._validate_zip_checksums(path)
+            zip_validation_cache.set(path, "checksums", result)
+        return result
+
+    @staticmethod
+    def _validate_zip_checksums(path: Path) -> tuple:
+        """Compare content of zip file with its checksums.
+
+        Checksums of files are calculated in multiple threads.
+
+        """
         with ZipFile(path, "r") as zip_file:
             # read checksums
-            try:
-                checksums_data = str(zip_file.read("checksums"))
-            except IOError:
+            checksums = read_zip_checksums(zip_file)
+            if checksums is None:
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
 
-            # split it to the list of tuples
-            checksums = [
-                tuple(line.split(":"))
-                for line in checksums_data.split("\n") if line
-            ]
-
             # get list of files in zip minus `checksums` file itself
             # and turn in to set to compare against list of files
             # from checksum file. If difference exists, something is
@@ -934,17 +1232,23 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
-                try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
+            missing = files_in_checksum.difference(files_in_zip)
+            if missing:
+                return False, f"Missing file [ {sorted(missing)[0]} ]"
+
+        # calculate and compare checksums in the zip file
+        executor = ThreadPoolExecutor(max_workers=get_hash_workers())
+        try:
+            current_checksums = executor.map(
+                lambda item: sha256sum_zip_member(path, item[1]),
+                checksums
+            )
+            for (file_checksum, file_name), current in zip(
+                    checksums, current_checksums):
+                if current != file_checksum:
                     return False, f"Invalid checksum on {file_name}"
+        finally:
+            executor.shutdown(cancel_futures=True)
 
         return True, "All ok"
 
@@ -1390,7 +1694,9 @@ class BootstrapRepos:
                     Path(temp_dir) / f"openpype-v{openpype_version}.zip"
                 self._print(f"creating zip: {temp_zip}")
 
-                self._create_openpype_zip(temp_zip, openpype_version.path)
+                self._create_openpype_zip(
+                    temp_zip, openpype_version.path,
+                    self._find_previous_zip(str(openpype_version)))
                 if not os.path.exists(temp_zip):
                     self._print("make archive failed.", LOG_ERROR)
                     raise OpenPypeVersionIOError("Zip creation failed.")
@@ -210,6 +210,21 @@ def publish_report_viewer():
     sys.exit(main())
 
 
+@main.command()
+@click.argument("report_path", type=click.Path(exists=True))
+@click.option("-t", "--top", type=int, default=20,
+              help="Show only the slowest plugins (0 to show all)")
+@click.option("-i", "--instances", is_flag=True, default=False,
+              help="Show times of instances under plugins")
+def publish_report_timings(report_path, top, instances):
+    """Print the slowest plugins from saved publish report.
+
+    Report can be saved from Publisher or by headless publishing with
+    'OPENPYPE_PUBLISH_REPORT_PATH' environment variable set.
+    """
+    PypeCommands.publish_report_timings(report_path, top, instances)
+
+
 @main.command()
 @click.argument("output_path")
 @click.option("--project", help="Define project context")
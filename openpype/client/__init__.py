@@ -30,6 +30,7 @@ from .entities import (
     get_last_version_by_subset_name,
     get_output_link_versions,
 
+    get_versions_latest_state,
     version_is_latest,
 
     get_representation_by_id,
@@ -90,6 +91,7 @@ __all__ = (
     "get_last_version_by_subset_name",
     "get_output_link_versions",
 
+    "get_versions_latest_state",
     "version_is_latest",
 
     "get_representation_by_id",
@@ -950,6 +950,87 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
     }
 
 
+def get_versions_latest_state(project_name, version_ids):
+    """Latest and hero state of versions resolved by single aggregation.
+
+    Replacement of 'version_is_latest', 'get_last_version_by_subset_id' and
+    'get_hero_version_by_subset_id' called for each version.
+
+    Note:
+        Hero versions are considered as latest.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        version_ids (Iterable[Union[str, ObjectId]]): Version or hero version
+            ids.
+
+    Returns:
+        dict[ObjectId, dict[str, Any]]: State by version id with keys
+            'subset_id', 'is_hero', 'is_latest', 'last_version_id',
+            'last_version_name' and 'hero_version_id'. Versions which were
+            not found are not in output.
+    """
+
+    version_ids = convert_ids(version_ids)
+    if not version_ids:
+        return {}
+
+    version_types = ["version", "hero_version"]
+    is_version = {"$eq": ["$sibling.type", "version"]}
+    aggregation_pipeline = [
+        {"$match": {
+            "_id": {"$in": version_ids},
+            "type": {"$in": version_types}
+        }},
+        {"$group": {
+            "_id": "$parent",
+            "requested": {"$push": {"_id": "$_id", "type": "$type"}}
+        }},
+        # All versions of subsets (uses index on 'parent')
+        {"$lookup": {
+            "from": project_name,
+            "localField": "_id",
+            "foreignField": "parent",
+            "as": "sibling"
+        }},
+        # '$unwind' and '$match' right after '$lookup' are merged into it
+        #   so documents of all versions are not stored in single array
+        {"$unwind": "$sibling"},
+        {"$match": {"sibling.type": {"$in": version_types}}},
+        {"$group": {
+            "_id": "$_id",
+            "requested": {"$first": "$requested"},
+            # 'null' values are ignored by '$max'
+            "last_version": {"$max": {"$cond": [
+                is_version,
+                {"name": "$sibling.name", "_id": "$sibling._id"},
+                None
+            ]}},
+            "hero_version_id": {"$max": {"$cond": [
+                is_version, None, "$sibling._id"
+            ]}}
+        }}
+    ]
+
+    conn = get_project_connection(project_name)
+    output = {}
+    for item in conn.aggregate(aggregation_pipeline):
+        last_version = item.get("last_version") or {}
+        last_version_id = last_version.get("_id")
+        for version in item["requested"]:
+            version_id = version["_id"]
+            is_hero = version["type"] == "hero_version"
+            output[version_id] = {
+                "subset_id": item["_id"],
+                "is_hero": is_hero,
+                "is_latest": is_hero or version_id == last_version_id,
+                "last_version_id": last_version_id,
+                "last_version_name": last_version.get("name"),
+                "hero_version_id": item.get("hero_version_id"),
+            }
+    return output
+
+
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     """Last version for passed subset id.
 
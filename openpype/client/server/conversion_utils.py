@@ -1,10 +1,23 @@
 import os
 import arrow
+import datetime
 import collections
+import functools
 import json
 
 import six
 
+# Caches are disabled in Python 2
+try:
+    from functools import lru_cache
+except ImportError:
+    def lru_cache(maxsize):
+        def max_size(func):
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+            return wrapper
+        return max_size
+
 from openpype.client.operations_base import REMOVED_VALUE
 from openpype.client.mongo.operations import (
     CURRENT_PROJECT_SCHEMA,
@@ -68,7 +81,92 @@ REPRESENTATION_FIELDS_MAPPING_V3_V4 = {
     "files": {"files"},
 }
 
+# Max number of cached results of fields conversion (per entity type) and
+#   of compiled converters
+FIELDS_CONVERSION_CACHE_SIZE = 128
+CONVERTERS_CACHE_SIZE = 128
+
+
+class _AttributesProvider(object):
+    """Provide attribute names of entity type to fields conversion."""
+
+    def __init__(self, attribute_names):
+        self._attributes = {name: {} for name in attribute_names}
+
+    def get_attributes_for_type(self, entity_type):
+        return self._attributes
+
+
+def _cached_fields_conversion(attributes_entity_type):
+    """Cache result of v3 to v4 fields conversion.
+
+    Result depends on requested fields and on available attributes of
+    entity type so both are used as key of the cache. Conversion function
+    receives only names of attributes. Returned value is a copy so callers
+    can modify it.
+
+    Args:
+        attributes_entity_type (str): Entity type of attributes used for
+            conversion.
+    """
+
+    def decorator(func):
+        @lru_cache(maxsize=FIELDS_CONVERSION_CACHE_SIZE)
+        def _convert(fields, attribute_names):
+            output = func(fields, _AttributesProvider(attribute_names))
+            if output is not None:
+                output = frozenset(output)
+            return output
+
+        @functools.wraps(func)
+        def wrapper(fields, con):
+            if not fields:
+                return None
+
+            attributes = con.get_attributes_for_type(attributes_entity_type)
+            output = _convert(frozenset(fields), tuple(attributes.keys()))
+            if output is None:
+                return None
+            return set(output)
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=CONVERTERS_CACHE_SIZE)
+def _get_cached_converter(compile_func, fields):
+    return compile_func(fields)
+
 
+def _get_converter(compile_func, fields):
+    """Get cached converter for queried fields.
+
+    Args:
+        compile_func (Callable): Function creating converter for fields.
+        fields (Union[Iterable[str], None]): Queried v4 fields.
+
+    Returns:
+        Callable: Converter.
+    """
+
+    if fields is not None:
+        fields = frozenset(fields)
+    return _get_cached_converter(compile_func, fields)
+
+
+def _fields_contain(fields, *keys):
+    """Any of keys or their sub-keys is available in queried fields."""
+
+    if fields is None:
+        return True
+
+    for field in fields:
+        for key in keys:
+            if field == key or field.startswith(key + "."):
+                return True
+    return False
+
+
+@_cached_fields_conversion("project")
 def project_fields_v3_to_v4(fields, con):
     """Convert project fields from v3 to v4 structure.
 
@@ -284,6 +382,7 @@ def convert_v4_project_to_v3(project):
     return output
 
 
+@_cached_fields_conversion("folder")
 def folder_fields_v3_to_v4(fields, con):
     """Convert folder fields from v3 to v4 structure.
 
@@ -339,24 +438,138 @@ def folder_fields_v3_to_v4(fields, con):
     return output
 
 
-def convert_v4_tasks_to_v3(tasks):
+def _compile_task_converter(fields):
+    """Create converter of v4 tasks to v3 task items for queried fields.
+
+    Args:
+        fields (Union[FrozenSet[str], None]): Queried v4 fields of tasks.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
+
+    convert_task_type = _fields_contain(fields, "taskType")
+
+    def converter(task):
+        output = {}
+        if convert_task_type and "taskType" in task:
+            output["type"] = task["taskType"]
+        return output
+    return converter
+
+
+def get_v4_task_converter(fields=None):
+    """Cached converter of v4 tasks to v3 task items for queried fields.
+
+    Args:
+        fields (Optional[Iterable[str]]): Queried v4 fields. All fields
+            are expected if not passed.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
+
+    return _get_converter(_compile_task_converter, fields)
+
+
+def convert_v4_tasks_to_v3(tasks, fields=None):
     """Convert v4 task item to v3 task.
 
     Args:
-        tasks (List[Dict[str, Any]]): Task entites.
+        tasks (Iterable[Dict[str, Any]]): Task entites.
+        fields (Optional[Iterable[str]]): Queried v4 fields of tasks.
 
     Returns:
         Dict[str, Dict[str, Any]]: Tasks in v3 variant ready for v3 asset.
     """
 
-    output = {}
-    for task in tasks:
-        task_name = task["name"]
-        new_task = {
-            "type": task["taskType"]
+    converter = get_v4_task_converter(fields)
+    return {
+        task["name"]: converter(task)
+        for task in tasks
+    }
+
+
+def _compile_folder_converter(fields):
+    """Create converter of v4 folders for queried fields.
+
+    Args:
+        fields (Union[FrozenSet[str], None]): Queried v4 fields.
+
+    Returns:
+        Callable[[Dict[str, Any], str], Dict[str, Any]]: Converter
+            of folder from project.
+    """
+
+    data_keys = tuple(
+        (src_key, dst_key)
+        for src_key, dst_key in (
+            ("parentId", "visualParent"),
+            ("active", "active"),
+            ("thumbnailId", "thumbnail_id"),
+            ("parents", "parents"),
+        )
+        if _fields_contain(fields, src_key)
+    )
+    convert_name = _fields_contain(fields, "name")
+    convert_folder_type = _fields_contain(fields, "folderType")
+    convert_attrib = _fields_contain(fields, "attrib")
+    task_converter = None
+    if _fields_contain(fields, "tasks"):
+        task_converter = get_v4_task_converter()
+
+    def converter(folder, project_name):
+        output = {
+            "_id": folder["id"],
+            "parent": project_name,
+            "type": "asset",
+            "schema": CURRENT_ASSET_DOC_SCHEMA
         }
-        output[task_name] = new_task
-    return output
+
+        output_data = folder.get("data") or {}
+
+        if convert_name and "name" in folder:
+            output["name"] = folder["name"]
+            output_data["label"] = folder["name"]
+
+        if convert_folder_type and "folderType" in folder:
+            output_data["entityType"] = folder["folderType"]
+
+        for src_key, dst_key in data_keys:
+            if src_key in folder:
+                output_data[dst_key] = folder[src_key]
+
+        if convert_attrib and "attrib" in folder:
+            output_data.update(folder["attrib"])
+
+        if "tools" in output_data:
+            output_data["tools_env"] = output_data.pop("tools")
+
+        if task_converter is not None and "tasks" in folder:
+            output_data["tasks"] = {
+                task["name"]: task_converter(task)
+                for task in folder["tasks"]
+            }
+
+        output["data"] = output_data
+
+        return output
+    return converter
+
+
+def get_v4_folder_converter(fields=None):
+    """Cached converter of v4 folders to v3 assets for queried fields.
+
+    Args:
+        fields (Optional[Iterable[str]]): Queried v4 fields. All fields
+            are expected if not passed.
+
+    Returns:
+        Callable[[Dict[str, Any], str], Dict[str, Any]]: Converter
+            of folder from project.
+    """
+
+    return _get_converter(_compile_folder_converter, fields)
 
 
 def convert_v4_folder_to_v3(folder, project_name):
@@ -370,45 +583,27 @@ def convert_v4_folder_to_v3(folder, project_name):
         Dict[str, Any]: Converted v4 folder to v3 asset.
     """
 
-    output = {
-        "_id": folder["id"],
-        "parent": project_name,
-        "type": "asset",
-        "schema": CURRENT_ASSET_DOC_SCHEMA
-    }
-
-    output_data = folder.get("data") or {}
-
-    if "name" in folder:
-        output["name"] = folder["name"]
-        output_data["label"] = folder["name"]
-
-    if "folderType" in folder:
-        output_data["entityType"] = folder["folderType"]
-
-    for src_key, dst_key in (
-        ("parentId", "visualParent"),
-        ("active", "active"),
-        ("thumbnailId", "thumbnail_id"),
-        ("parents", "parents"),
-    ):
-        if src_key in folder:
-            output_data[dst_key] = folder[src_key]
+    return get_v4_folder_converter()(folder, project_name)
 
-    if "attrib" in folder:
-        output_data.update(folder["attrib"])
 
-    if "tools" in output_data:
-        output_data["tools_env"] = output_data.pop("tools")
+def convert_v4_folders_to_v3(folders, project_name, fields=None):
+    """Convert v4 folders to v3 assets.
 
-    if "tasks" in folder:
-        output_data["tasks"] = convert_v4_tasks_to_v3(folder["tasks"])
+    Args:
+        folders (Iterable[Dict[str, Any]]): Queried v4 folders.
+        project_name (str): Project name from which folders were queried.
+        fields (Optional[Iterable[str]]): Queried v4 fields.
 
-    output["data"] = output_data
+    Returns:
+        Generator[Dict[str, Any], None, None]: Converted assets.
+    """
 
-    return output
+    converter = get_v4_folder_converter(fields)
+    for folder in folders:
+        yield converter(folder, project_name)
 
 
+@_cached_fields_conversion("product")
 def subset_fields_v3_to_v4(fields, con):
     """Convert subset fields from v3 to v4 structure.
 
@@ -462,39 +657,102 @@ def subset_fields_v3_to_v4(fields, con):
     return output
 
 
+def _compile_subset_converter(fields):
+    """Create converter of v4 products for queried fields.
+
+    Args:
+        fields (Union[FrozenSet[str], None]): Queried v4 fields.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
+
+    convert_folder_id = _fields_contain(fields, "folderId")
+    convert_name = _fields_contain(fields, "name")
+    convert_active = _fields_contain(fields, "active")
+    convert_attrib = _fields_contain(fields, "attrib")
+    convert_product_type = _fields_contain(fields, "productType")
+
+    def converter(subset):
+        output = {
+            "_id": subset["id"],
+            "type": "subset",
+            "schema": CURRENT_SUBSET_SCHEMA
+        }
+        if convert_folder_id and "folderId" in subset:
+            output["parent"] = subset["folderId"]
+
+        output_data = subset.get("data") or {}
+
+        if convert_name and "name" in subset:
+            output["name"] = subset["name"]
+
+        if convert_active and "active" in subset:
+            output_data["active"] = subset["active"]
+
+        if convert_attrib and "attrib" in subset:
+            attrib = subset["attrib"]
+            if "productGroup" in attrib:
+                attrib["subsetGroup"] = attrib.pop("productGroup")
+            output_data.update(attrib)
+
+        family = None
+        if convert_product_type:
+            family = subset.get("productType")
+        if family:
+            output_data["family"] = family
+            output_data["families"] = [family]
+
+        output["data"] = output_data
+
+        return output
+    return converter
+
+
+def get_v4_subset_converter(fields=None):
+    """Cached converter of v4 products to v3 subsets for queried fields.
+
+    Args:
+        fields (Optional[Iterable[str]]): Queried v4 fields. All fields
+            are expected if not passed.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
+
+    return _get_converter(_compile_subset_converter, fields)
+
+
 def convert_v4_subset_to_v3(subset):
-    output = {
-        "_id": subset["id"],
-        "type": "subset",
-        "schema": CURRENT_SUBSET_SCHEMA
-    }
-    if "folderId" in subset:
-        output["parent"] = subset["folderId"]
+    """Convert v4 product to v3 subset.
+
+    Args:
+        subset (Dict[str, Any]): Queried v4 product entity.
 
-    output_data = subset.get("data") or {}
+    Returns:
+        Dict[str, Any]: Converted product to v3 subset structure.
+    """
 
-    if "name" in subset:
-        output["name"] = subset["name"]
+    return get_v4_subset_converter()(subset)
 
-    if "active" in subset:
-        output_data["active"] = subset["active"]
 
-    if "attrib" in subset:
-        attrib = subset["attrib"]
-        if "productGroup" in attrib:
-            attrib["subsetGroup"] = attrib.pop("productGroup")
-        output_data.update(attrib)
+def convert_v4_subsets_to_v3(subsets, fields=None):
+    """Convert v4 products to v3 subsets.
 
-    family = subset.get("productType")
-    if family:
-        output_data["family"] = family
-        output_data["families"] = [family]
+    Args:
+        subsets (Iterable[Dict[str, Any]]): Queried v4 products.
+        fields (Optional[Iterable[str]]): Queried v4 fields.
 
-    output["data"] = output_data
+    Returns:
+        Generator[Dict[str, Any], None, None]: Converted subsets.
+    """
 
-    return output
+    converter = get_v4_subset_converter(fields)
+    for subset in subsets:
+        yield converter(subset)
 
 
+@_cached_fields_conversion("version")
 def version_fields_v3_to_v4(fields, con):
     """Convert version fields from v3 to v4 structure.
 
@@ -560,60 +818,142 @@ def version_fields_v3_to_v4(fields, con):
     return output
 
 
-def convert_v4_version_to_v3(version):
-    """Convert v4 version entity to v4 version.
+def _convert_v4_created_at(created_at):
+    """Convert v4 'createdAt' value to v3 'time' value in local time."""
+
+    parsed = None
+    if isinstance(created_at, six.string_types):
+        # Use fast parsing when possible, 'arrow' is slow for big amount
+        #   of versions
+        fromisoformat = getattr(datetime.datetime, "fromisoformat", None)
+        if fromisoformat is not None:
+            value = created_at
+            if value.endswith("Z"):
+                value = value[:-1] + "+00:00"
+            try:
+                parsed = fromisoformat(value)
+            except ValueError:
+                pass
+
+        if parsed is not None:
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+            parsed = parsed.astimezone()
+
+    if parsed is None:
+        parsed = arrow.get(created_at).to("local")
+    return parsed.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _compile_version_converter(fields):
+    """Create converter of v4 versions for queried fields.
 
     Args:
-        version (Dict[str, Any]): Queried v4 version entity.
+        fields (Union[FrozenSet[str], None]): Queried v4 fields.
 
     Returns:
-        Dict[str, Any]: Conveted version entity to v3 structure.
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
     """
 
-    version_num = version["version"]
-    if version_num < 0:
+    data_keys = tuple(
+        (src_key, dst_key)
+        for src_key, dst_key in (
+            ("active", "active"),
+            ("thumbnailId", "thumbnail_id"),
+            ("author", "author")
+        )
+        if _fields_contain(fields, src_key)
+    )
+    convert_attrib = _fields_contain(fields, "attrib")
+    convert_created_at = _fields_contain(fields, "createdAt")
+
+    def converter(version):
+        version_num = version["version"]
+        if version_num < 0:
+            output = {
+                "_id": version["id"],
+                "type": "hero_version",
+                "schema": CURRENT_HERO_VERSION_SCHEMA,
+            }
+            if "productId" in version:
+                output["parent"] = version["productId"]
+
+            if "data" in version:
+                output["data"] = version["data"]
+            return output
+
         output = {
             "_id": version["id"],
-            "type": "hero_version",
-            "schema": CURRENT_HERO_VERSION_SCHEMA,
+            "type": "version",
+            "name": version_num,
+            "schema": CURRENT_VERSION_SCHEMA
         }
         if "productId" in version:
             output["parent"] = version["productId"]
 
-        if "data" in version:
-            output["data"] = version["data"]
+        output_data = version.get("data") or {}
+        if convert_attrib and "attrib" in version:
+            output_data.update(version["attrib"])
+
+        for src_key, dst_key in data_keys:
+            if src_key in version:
+                output_data[dst_key] = version[src_key]
+
+        if convert_created_at and "createdAt" in version:
+            output_data["time"] = _convert_v4_created_at(
+                version["createdAt"]
+            )
+
+        output["data"] = output_data
+
         return output
+    return converter
 
-    output = {
-        "_id": version["id"],
-        "type": "version",
-        "name": version_num,
-        "schema": CURRENT_VERSION_SCHEMA
-    }
-    if "productId" in version:
-        output["parent"] = version["productId"]
 
-    output_data = version.get("data") or {}
-    if "attrib" in version:
-        output_data.update(version["attrib"])
+def get_v4_version_converter(fields=None):
+    """Cached converter of v4 versions to v3 for queried fields.
 
-    for src_key, dst_key in (
-        ("active", "active"),
-        ("thumbnailId", "thumbnail_id"),
-        ("author", "author")
-    ):
-        if src_key in version:
-            output_data[dst_key] = version[src_key]
+    Args:
+        fields (Optional[Iterable[str]]): Queried v4 fields. All fields
+            are expected if not passed.
 
-    if "createdAt" in version:
-        created_at = arrow.get(version["createdAt"]).to("local")
-        output_data["time"] = created_at.strftime("%Y%m%dT%H%M%SZ")
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
 
-    output["data"] = output_data
+    return _get_converter(_compile_version_converter, fields)
 
-    return output
 
+def convert_v4_version_to_v3(version):
+    """Convert v4 version entity to v4 version.
+
+    Args:
+        version (Dict[str, Any]): Queried v4 version entity.
+
+    Returns:
+        Dict[str, Any]: Conveted version entity to v3 structure.
+    """
+
+    return get_v4_version_converter()(version)
 
+
+def convert_v4_versions_to_v3(versions, fields=None):
+    """Convert v4 versions to v3 versions.
+
+    Args:
+        versions (Iterable[Dict[str, Any]]): Queried v4 versions.
+        fields (Optional[Iterable[str]]): Queried v4 fields.
+
+    Returns:
+        Generator[Dict[str, Any], None, None]: Converted versions.
+    """
+
+    converter = get_v4_version_converter(fields)
+    for version in versions:
+        yield converter(version)
+
+
+@_cached_fields_conversion("representation")
 def representation_fields_v3_to_v4(fields, con):
     """Convert representation fields from v3 to v4 structure.
 
@@ -659,6 +999,129 @@ def representation_fields_v3_to_v4(fields, con):
     return output
 
 
+def _convert_v4_representation_context(context):
+    if isinstance(context, six.string_types):
+        context = json.loads(context)
+
+    if "asset" not in context and "folder" in context:
+        _c_folder = context["folder"]
+        context["asset"] = _c_folder["name"]
+
+    elif "asset" in context and "folder" not in context:
+        context["folder"] = {"name": context["asset"]}
+
+    if "product" in context:
+        _c_product = context.pop("product")
+        context["family"] = _c_product["type"]
+        context["subset"] = _c_product["name"]
+    return context
+
+
+def _convert_v4_representation_files(files):
+    # From GraphQl is list
+    if isinstance(files, list):
+        items = ((file_info["id"], file_info) for file_info in files)
+
+    # From RestPoint is dictionary
+    elif isinstance(files, dict):
+        items = files.items()
+
+    else:
+        return []
+
+    new_files = []
+    for file_id, file_info in items:
+        file_info["_id"] = file_id
+        if not file_info.get("sites"):
+            file_info["sites"] = [{"name": "studio"}]
+        new_files.append(file_info)
+    return new_files
+
+
+def _compile_representation_converter(fields):
+    """Create converter of v4 representations for queried fields.
+
+    Only conversion steps of queried fields are used.
+
+    Args:
+        fields (Union[FrozenSet[str], None]): Queried v4 fields.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
+
+    convert_context = _fields_contain(fields, "context")
+    convert_files = _fields_contain(fields, "files")
+    convert_active = _fields_contain(fields, "active")
+    convert_attrib = _fields_contain(fields, "attrib")
+    keys_mapping = tuple(
+        (v3_key, v4_key)
+        for v3_key, v4_key in (
+            ("_id", "id"),
+            ("name", "name"),
+            ("parent", "versionId")
+        )
+        if _fields_contain(fields, v4_key)
+    )
+
+    def converter(representation):
+        output = {
+            "type": "representation",
+            "schema": CURRENT_REPRESENTATION_SCHEMA,
+        }
+        for v3_key, v4_key in keys_mapping:
+            if v4_key in representation:
+                output[v3_key] = representation[v4_key]
+
+        if convert_context and "context" in representation:
+            output["context"] = _convert_v4_representation_context(
+                representation["context"]
+            )
+
+        if convert_files and "files" in representation:
+            output["files"] = _convert_v4_representation_files(
+                representation["files"]
+            )
+
+        has_active = convert_active and "active" in representation
+        if has_active and representation["active"] is False:
+            output["type"] = "archived_representation"
+            output["old_id"] = output["_id"]
+
+        output_data = representation.get("data") or {}
+        if convert_attrib and "attrib" in representation:
+            output_data.update(representation["attrib"])
+
+        if has_active:
+            output_data["active"] = representation["active"]
+
+        if "template" in output_data:
+            output_data["template"] = (
+                output_data["template"]
+                .replace("{product[name]}", "{subset}")
+                .replace("{product[type]}", "{family}")
+            )
+
+        output["data"] = output_data
+
+        return output
+    return converter
+
+
+def get_v4_representation_converter(fields=None):
+    """Cached converter of v4 representations to v3 for queried fields.
+
+    Args:
+        fields (Optional[Iterable[str]]): Queried v4 fields. All fields
+            are expected if not passed.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Converter.
+    """
+
+    return _get_converter(_compile_representation_converter, fields)
+
+
 def convert_v4_representation_to_v3(representation):
     """Convert v4 representation to v3 representation.
 
@@ -669,94 +1132,29 @@ def convert_v4_representation_to_v3(representation):
         Dict[str, Any]: Converted representation to v3 structure.
     """
 
-    output = {
-        "type": "representation",
-        "schema": CURRENT_REPRESENTATION_SCHEMA,
-    }
-    if "id" in representation:
-        output["_id"] = representation["id"]
+    return get_v4_representation_converter()(representation)
 
-    for v3_key, v4_key in (
-        ("name", "name"),
-        ("parent", "versionId")
-    ):
-        if v4_key in representation:
-            output[v3_key] = representation[v4_key]
-
-    if "context" in representation:
-        context = representation["context"]
-        if isinstance(context, six.string_types):
-            context = json.loads(context)
-
-        if "asset" not in context and "folder" in context:
-            _c_folder = context["folder"]
-            context["asset"] = _c_folder["name"]
-
-        elif "asset" in context and "folder" not in context:
-            context["folder"] = {"name": context["asset"]}
-
-        if "product" in context:
-            _c_product = context.pop("product")
-            context["family"] = _c_product["type"]
-            context["subset"] = _c_product["name"]
-
-        output["context"] = context
-
-    if "files" in representation:
-        files = representation["files"]
-        new_files = []
-        # From GraphQl is list
-        if isinstance(files, list):
-            for file_info in files:
-                file_info["_id"] = file_info["id"]
-                new_files.append(file_info)
-
-        # From RestPoint is dictionary
-        elif isinstance(files, dict):
-            for file_id, file_info in files:
-                file_info["_id"] = file_id
-                new_files.append(file_info)
-
-        for file_info in new_files:
-            if not file_info.get("sites"):
-                file_info["sites"] = [{
-                    "name": "studio"
-                }]
-
-        output["files"] = new_files
-
-    if representation.get("active") is False:
-        output["type"] = "archived_representation"
-        output["old_id"] = output["_id"]
-
-    output_data = representation.get("data") or {}
-    if "attrib" in representation:
-        output_data.update(representation["attrib"])
-
-    for key, data_key in (
-        ("active", "active"),
-    ):
-        if key in representation:
-            output_data[data_key] = representation[key]
-
-    if "template" in output_data:
-        output_data["template"] = (
-            output_data["template"]
-            .replace("{product[name]}", "{subset}")
-            .replace("{product[type]}", "{family}")
-        )
 
-    output["data"] = output_data
+def convert_v4_representations_to_v3(representations, fields=None):
+    """Convert v4 representations to v3 representations.
 
-    return output
+    Args:
+        representations (Iterable[Dict[str, Any]]): Queried v4
+            representations.
+        fields (Optional[Iterable[str]]): Queried v4 fields.
 
+    Returns:
+        Generator[Dict[str, Any], None, None]: Converted representations.
+    """
 
-def workfile_info_fields_v3_to_v4(fields):
-    if not fields:
-        return None
+    converter = get_v4_representation_converter(fields)
+    for representation in representations:
+        yield converter(representation)
 
+
+@lru_cache(maxsize=FIELDS_CONVERSION_CACHE_SIZE)
+def _workfile_info_fields_v3_to_v4(fields):
     new_fields = set()
-    fields = set(fields)
     for v3_key, v4_key in (
         ("_id", "id"),
         ("files", "path"),
@@ -769,28 +1167,75 @@ def workfile_info_fields_v3_to_v4(fields):
     if "parent" in fields or "task_name" in fields:
         new_fields.add("taskId")
 
-    return new_fields
+    return frozenset(new_fields)
 
 
-def convert_v4_workfile_info_to_v3(workfile_info, task):
-    output = {
-        "type": "workfile",
-        "schema": CURRENT_WORKFILE_INFO_SCHEMA,
-    }
-    if "id" in workfile_info:
-        output["_id"] = workfile_info["id"]
+def workfile_info_fields_v3_to_v4(fields):
+    if not fields:
+        return None
 
-    if "path" in workfile_info:
-        output["files"] = [workfile_info["path"]]
+    return set(_workfile_info_fields_v3_to_v4(frozenset(fields)))
 
-    if "name" in workfile_info:
-        output["filename"] = workfile_info["name"]
 
-    if "taskId" in workfile_info:
-        output["task_name"] = task["name"]
-        output["parent"] = task["folderId"]
+def _compile_workfile_info_converter(fields):
+    """Create converter of v4 workfiles info for queried fields.
 
-    return output
+    Args:
+        fields (Union[FrozenSet[str], None]): Queried v4 fields.
+
+    Returns:
+        Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]:
+            Converter of workfile info of task.
+    """
+
+    keys_mapping = tuple(
+        (v3_key, v4_key)
+        for v3_key, v4_key in (
+            ("_id", "id"),
+            ("filename", "name"),
+        )
+        if _fields_contain(fields, v4_key)
+    )
+    convert_path = _fields_contain(fields, "path")
+    convert_task = _fields_contain(fields, "taskId")
+
+    def converter(workfile_info, task):
+        output = {
+            "type": "workfile",
+            "schema": CURRENT_WORKFILE_INFO_SCHEMA,
+        }
+        for v3_key, v4_key in keys_mapping:
+            if v4_key in workfile_info:
+                output[v3_key] = workfile_info[v4_key]
+
+        if convert_path and "path" in workfile_info:
+            output["files"] = [workfile_info["path"]]
+
+        if convert_task and "taskId" in workfile_info:
+            output["task_name"] = task["name"]
+            output["parent"] = task["folderId"]
+
+        return output
+    return converter
+
+
+def get_v4_workfile_info_converter(fields=None):
+    """Cached converter of v4 workfiles info to v3 for queried fields.
+
+    Args:
+        fields (Optional[Iterable[str]]): Queried v4 fields. All fields
+            are expected if not passed.
+
+    Returns:
+        Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]:
+            Converter of workfile info of task.
+    """
+
+    return _get_converter(_compile_workfile_info_converter, fields)
+
+
+def convert_v4_workfile_info_to_v3(workfile_info, task):
+    return get_v4_workfile_info_converter()(workfile_info, task)
 
 
 def convert_create_asset_to_v4(asset, project, con):
@@ -10,18 +10,21 @@ from .conversion_utils import (
 
     folder_fields_v3_to_v4,
     convert_v4_folder_to_v3,
+    get_v4_folder_converter,
 
     subset_fields_v3_to_v4,
     convert_v4_subset_to_v3,
+    get_v4_subset_converter,
 
     version_fields_v3_to_v4,
     convert_v4_version_to_v3,
+    get_v4_version_converter,
 
     representation_fields_v3_to_v4,
-    convert_v4_representation_to_v3,
+    convert_v4_representations_to_v3,
 
     workfile_info_fields_v3_to_v4,
-    convert_v4_workfile_info_to_v3,
+    get_v4_workfile_info_converter,
 )
 
 
@@ -78,6 +81,7 @@ def _get_subsets(
     if archived:
         active = None
 
+    converter = get_v4_subset_converter(fields)
     for subset in con.get_products(
         project_name,
         product_ids=subset_ids,
@@ -87,7 +91,7 @@ def _get_subsets(
         active=active,
         fields=fields,
     ):
-        yield convert_v4_subset_to_v3(subset)
+        yield converter(subset)
 
 
 def _get_versions(
@@ -123,13 +127,14 @@ def _get_versions(
         fields=fields
     )
 
+    converter = get_v4_version_converter(fields)
     version_entities = []
     hero_versions = []
     for version in queried_versions:
         if version["version"] < 0:
             hero_versions.append(version)
         else:
-            version_entities.append(convert_v4_version_to_v3(version))
+            version_entities.append(converter(version))
 
     if hero_versions:
         subset_ids = set()
@@ -157,7 +162,7 @@ def _get_versions(
                 if version["version"] == abs_version:
                     version_id = version["id"]
                     break
-            conv_hero = convert_v4_version_to_v3(hero_version)
+            conv_hero = converter(hero_version)
             conv_hero["version_id"] = version_id
             version_entities.append(conv_hero)
 
@@ -212,6 +217,7 @@ def get_assets(
 
     con = get_ayon_server_api_connection()
     fields = folder_fields_v3_to_v4(fields, con)
+    converter = get_v4_folder_converter(fields)
     kwargs = dict(
         folder_ids=asset_ids,
         parent_ids=parent_ids,
@@ -219,7 +225,7 @@ def get_assets(
     )
     if not asset_names:
         for folder in _folders_query(project_name, con, fields, **kwargs):
-            yield convert_v4_folder_to_v3(folder, project_name)
+            yield converter(folder, project_name)
         return
 
     new_asset_names = set()
@@ -236,7 +242,7 @@ def get_assets(
             project_name, con, fields, folder_paths=folder_paths, **kwargs
         ):
             yielded_ids.add(folder["id"])
-            yield convert_v4_folder_to_v3(folder, project_name)
+            yield converter(folder, project_name)
 
     if not new_asset_names:
         return
@@ -246,7 +252,7 @@ def get_assets(
     ):
         if folder["id"] not in yielded_ids:
             yielded_ids.add(folder["id"])
-            yield convert_v4_folder_to_v3(folder, project_name)
+            yield converter(folder, project_name)
 
 
 def get_archived_assets(
@@ -476,6 +482,49 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return get_versions(project_name, version_ids=version_ids, fields=fields)
 
 
+def get_versions_latest_state(project_name, version_ids):
+    version_ids = set(version_ids)
+    if not version_ids:
+        return {}
+
+    versions = get_versions(
+        project_name,
+        version_ids=version_ids,
+        hero=True,
+        fields=["_id", "parent", "type"]
+    )
+    subset_ids = {version["parent"] for version in versions}
+    if not subset_ids:
+        return {}
+
+    last_versions = get_last_versions(
+        project_name, subset_ids, fields=["_id", "name"]
+    )
+    hero_version_ids = {
+        hero_version["parent"]: hero_version["_id"]
+        for hero_version in get_hero_versions(
+            project_name, subset_ids=subset_ids, fields=["_id", "parent"]
+        )
+    }
+
+    output = {}
+    for version in versions:
+        version_id = version["_id"]
+        subset_id = version["parent"]
+        last_version = last_versions.get(subset_id) or {}
+        last_version_id = last_version.get("_id")
+        is_hero = version["type"] == "hero_version"
+        output[version_id] = {
+            "subset_id": subset_id,
+            "is_hero": is_hero,
+            "is_latest": is_hero or version_id == last_version_id,
+            "last_version_id": last_version_id,
+            "last_version_name": last_version.get("name"),
+            "hero_version_id": hero_version_ids.get(subset_id),
+        }
+    return output
+
+
 def version_is_latest(project_name, version_id):
     con = get_ayon_server_api_connection()
     return con.version_is_latest(project_name, version_id)
@@ -546,8 +595,10 @@ def get_representations(
         active=active,
         fields=fields
     )
-    for representation in representations:
-        yield convert_v4_representation_to_v3(representation)
+    for representation in convert_v4_representations_to_v3(
+        representations, fields
+    ):
+        yield representation
 
 
 def get_representation_parents(project_name, representation):
@@ -716,10 +767,11 @@ def get_workfile_info(
         return None
 
     fields = workfile_info_fields_v3_to_v4(fields)
+    converter = get_v4_workfile_info_converter(fields)
 
     for workfile_info in con.get_workfiles_info(
         project_name, task_ids=[task["id"]], fields=fields
     ):
         if workfile_info["name"] == filename:
-            return convert_v4_workfile_info_to_v3(workfile_info, task)
+            return converter(workfile_info, task)
     return None
@@ -4,11 +4,15 @@
 """
 import json
 import logging
+import contextlib
 
 import attr
 
 from wsrpc_aiohttp import WebSocketAsync
 from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.metadata_session import (
+    AdobeMetadataSession
+)
 
 
 class ConnectionNotEstablishedYet(Exception):
@@ -42,6 +46,37 @@ class AEItem(object):
     containing_comps = attr.ib(factory=list)
 
 
+class AfterEffectsMetadataSession(AdobeMetadataSession):
+    """Local mirror of metadata stored in Label field of document.
+
+    Args:
+        stub (AfterEffectsServerStub): Stub used for communication.
+        items_meta (Optional[list[dict]]): Already queried metadata.
+        all_items (Optional[list[AEItem]]): Already queried items.
+    """
+
+    def __init__(self, stub, items_meta=None, all_items=None):
+        item_ids = None
+        if all_items:
+            item_ids = {int(item.id) for item in all_items}
+        super(AfterEffectsMetadataSession, self).__init__(
+            stub, items_meta, item_ids
+        )
+
+    def _query_metadata(self):
+        return self._stub.query_metadata()
+
+    def _query_item_ids(self):
+        # loaders create FootageItem now
+        all_items = self._stub.get_items(
+            comps=True, folders=True, footages=True
+        )
+        return {int(item.id) for item in all_items}
+
+    def _write_metadata(self, items_meta):
+        return self._stub.write_metadata(items_meta)
+
+
 class AfterEffectsServerStub():
     """
         Stub for calling function on client (Photoshop js) side.
@@ -52,11 +87,81 @@ class AfterEffectsServerStub():
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
+    # Stub may be created for each call, metadata session is shared
+    _metadata_session = None
+    # Older extension versions don't have batch route
+    _batch_available = None
+
     def __init__(self):
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
         self.log = logging.getLogger(self.__class__.__name__)
 
+    @contextlib.contextmanager
+    def metadata_session(self):
+        """Apply changes of metadata in memory and write them once.
+
+        Calls of 'imprint', 'remove_instance' and 'get_metadata' inside the
+        context use local mirror of metadata. Changes are written to
+        document when context ends, also on an exception, so metadata of
+        items created before the exception are not lost.
+
+        Nested calls use the already opened session.
+
+        Yields:
+            AfterEffectsMetadataSession: Opened session.
+        """
+        cls = AfterEffectsServerStub
+        if cls._metadata_session is not None:
+            yield cls._metadata_session
+            return
+
+        session = AfterEffectsMetadataSession(self)
+        cls._metadata_session = session
+        try:
+            yield session
+        finally:
+            cls._metadata_session = None
+            session.flush()
+
+    def batch_call(self, calls):
+        """Call multiple routes of client using single request.
+
+        Routes are called one by one if extension does not support batch
+        calls.
+
+        Args:
+            calls (Iterable[tuple[str, dict]]): Route name
+                (e.g. 'AfterEffects.rename_item') with its arguments.
+
+        Returns:
+            list[Any]: Results of calls in the same order.
+        """
+        calls = [
+            {"method": method, "params": params or {}}
+            for method, params in calls
+        ]
+        if not calls:
+            return []
+
+        cls = AfterEffectsServerStub
+        if cls._batch_available is not False:
+            res = self.websocketserver.call(
+                self.client.call('AfterEffects.batch', calls=calls)
+            )
+            # Client responds with 'None' if route is not found
+            if res is not None:
+                cls._batch_available = True
+                return [self._handle_return(item) for item in res]
+            cls._batch_available = False
+
+        return [
+            self._handle_return(self.websocketserver.call(
+                self.client.call(call["method"], **call["params"])
+            ))
+            for call in calls
+        ]
+
     @staticmethod
     def get_client():
         """
@@ -90,11 +195,22 @@ class AfterEffectsServerStub():
             field.
 
             It contains containers loaded by any Loader OR instances created
-            by Creator.
+            by Creator. Local mirror is used when metadata session is opened.
 
         Returns:
             (list)
         """
+        session = AfterEffectsServerStub._metadata_session
+        if session is not None:
+            return session.get_metadata()
+        return self.query_metadata()
+
+    def query_metadata(self):
+        """Query metadata from document ignoring metadata session.
+
+        Returns:
+            list[dict]: Metadata of items and instances.
+        """
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.get_metadata'))
         metadata = self._handle_return(res)
@@ -136,45 +252,22 @@ class AfterEffectsServerStub():
                            loop - value should be same)
         Returns: None
         """
-        if not items_meta:
-            items_meta = self.get_metadata()
-
-        result_meta = []
-        # fix existing
-        is_new = True
-
-        for item_meta in items_meta:
-            if ((item_meta.get('members') and
-                    str(item_id) == str(item_meta.get('members')[0])) or
-                    item_meta.get("instance_id") == item_id):
-                is_new = False
-                if data:
-                    item_meta.update(data)
-                    result_meta.append(item_meta)
-            else:
-                result_meta.append(item_meta)
-
-        if is_new:
-            result_meta.append(data)
-
-        # Ensure only valid ids are stored.
-        if not all_items:
-            # loaders create FootageItem now
-            all_items = self.get_items(comps=True,
-                                       folders=True,
-                                       footages=True)
-        item_ids = [int(item.id) for item in all_items]
-        cleaned_data = []
-        for meta in result_meta:
-            # do not added instance with nonexistend item id
-            if meta.get("members"):
-                if int(meta["members"][0]) not in item_ids:
-                    continue
+        session = AfterEffectsServerStub._metadata_session
+        if session is not None:
+            session.imprint(item_id, data)
+            return None
 
-            cleaned_data.append(meta)
+        session = AfterEffectsMetadataSession(self, items_meta, all_items)
+        session.imprint(item_id, data)
+        return session.flush()
 
-        payload = json.dumps(cleaned_data, indent=4)
+    def write_metadata(self, items_meta):
+        """Write metadata to Label field of active document.
 
+        Args:
+            items_meta (list[dict]): Metadata of all items and instances.
+        """
+        payload = json.dumps(items_meta, indent=4)
         res = self.websocketserver.call(self.client.call
                                         ('AfterEffects.imprint',
                                          payload=payload))
@@ -356,22 +449,22 @@ class AfterEffectsServerStub():
             Args:
                 instance_id(string): instance id
         """
+        session = AfterEffectsServerStub._metadata_session
+        if session is not None:
+            session.remove_instance(instance_id)
+            return None
+
         cleaned_data = []
 
         if metadata is None:
-            metadata = self.get_metadata()
+            metadata = self.query_metadata()
 
         for instance in metadata:
             inst_id = instance.get("instance_id") or instance.get("uuid")
             if inst_id != instance_id:
                 cleaned_data.append(instance)
 
-        payload = json.dumps(cleaned_data, indent=4)
-        res = self.websocketserver.call(self.client.call
-                                        ('AfterEffects.imprint',
-                                         payload=payload))
-
-        return self._handle_return(res)
+        return self.write_metadata(cleaned_data)
 
     def is_saved(self):
         # TODO
@@ -142,13 +142,15 @@ class RenderCreator(Creator):
                 self._add_instance_to_context(instance)
 
     def update_instances(self, update_list):
-        for created_inst, _changes in update_list:
-            api.get_stub().imprint(created_inst.get("instance_id"),
-                                   created_inst.data_to_store())
-            subset_change = _changes.get("subset")
-            if subset_change:
-                api.get_stub().rename_item(created_inst.data["members"][0],
-                                           subset_change.new_value)
+        stub = api.get_stub()
+        with stub.metadata_session():
+            for created_inst, _changes in update_list:
+                stub.imprint(created_inst.get("instance_id"),
+                             created_inst.data_to_store())
+                subset_change = _changes.get("subset")
+                if subset_change:
+                    stub.rename_item(created_inst.data["members"][0],
+                                     subset_change.new_value)
 
     def remove_instances(self, instances):
         """Removes metadata and renames to original comp name if available."""
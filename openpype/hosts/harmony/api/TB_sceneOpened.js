@@ -141,6 +141,31 @@ function Client() {
         timer.start();
     };
 
+    /**
+     * Call function defined in request with its arguments.
+     * @function
+     * @param  {object} request - request with 'function' and 'args' keys
+     * @return {object} result of called function.
+     */
+    self.callFunction = function(request) {
+        var result = null;
+        try {
+            var _func = eval.call(null, request["function"]);
+
+            if (request.args == null) {
+                result = _func();
+            } else {
+                result = _func(request.args);
+            }
+        } catch (error) {
+            result = 'Error processing request.\n' +
+                     'Request:\n' +
+                     self.prettifyJson(request) + '\n' +
+                     'Error:\n' + error;
+        }
+        return result;
+    };
+
     /**
      * Process received request. This will eval received function and produce
      * results.
@@ -165,19 +190,12 @@ function Client() {
                 self.logError(error);
             }
         } else if (typeof request["function"] !== 'undefined') {
-            try {
-                var _func = eval.call(null, request["function"]);
-
-                if (request.args == null) {
-                    result = _func();
-                } else {
-                    result = _func(request.args);
-                }
-            } catch (error) {
-                result = 'Error processing request.\n' +
-                         'Request:\n' +
-                         self.prettifyJson(request) + '\n' +
-                         'Error:\n' + error;
+            result = self.callFunction(request);
+        } else if (typeof request.batch !== 'undefined') {
+            // Multiple function calls sent in one message.
+            result = [];
+            for (var i = 0; i < request.batch.length; ++i) {
+                result.push(self.callFunction(request.batch[i]));
             }
         } else {
             self.logError('Command type not implemented.');
@@ -257,8 +275,9 @@ function Client() {
             self._send(JSON.stringify(request));
         }
 
-        if ((length < data.size()) || (length < self.buffer.size())) {
-            // we've received more data.
+        if (self.buffer.size() >= 6) {
+            // we've received more data, there can be multiple messages
+            //  when requests are pipelined.
             self.logDebug('--- Got more data to process ...');
             self.processBuffer();
         }
@@ -26,6 +26,8 @@ from .lib import (
     imprint,
     read,
     send,
+    send_async,
+    send_batch,
     maintained_nodes_state,
     save_scene,
     save_scene_as,
@@ -69,6 +71,8 @@ __all__ = [
     "imprint",
     "read",
     "send",
+    "send_async",
+    "send_batch",
     "maintained_nodes_state",
     "save_scene",
     "save_scene_as",
@@ -516,6 +516,28 @@ def send(request):
     return ProcessContext.server.send(request)
 
 
+def send_async(request):
+    """Send request to Harmony without waiting for reply.
+
+    Returns:
+        Future: Future resolved with reply from Harmony.
+    """
+    return ProcessContext.server.send_async(request)
+
+
+def send_batch(requests):
+    """Call multiple functions in Harmony using single message.
+
+    Args:
+        requests (Iterable[dict]): Requests with "function" and optional
+            "args" keys.
+
+    Returns:
+        list[Any]: Results of functions in order of requests.
+    """
+    return ProcessContext.server.send_batch(requests)
+
+
 def select_nodes(nodes):
     """ Selects nodes in Node View """
     _ = send(
@@ -529,17 +551,11 @@ def select_nodes(nodes):
 @contextlib.contextmanager
 def maintained_nodes_state(nodes):
     """Maintain nodes states during context."""
-    # Collect current state.
-    states = send(
-        {
-            "function": "AvalonHarmony.areEnabled", "args": nodes
-        })["result"]
-
-    # Disable all nodes.
-    send(
-        {
-            "function": "AvalonHarmony.disableNodes", "args": nodes
-        })
+    # Collect current state and disable all nodes.
+    states, _ = send_batch([
+        {"function": "AvalonHarmony.areEnabled", "args": nodes},
+        {"function": "AvalonHarmony.disableNodes", "args": nodes},
+    ])
 
     try:
         yield
@@ -1,39 +1,65 @@
 # -*- coding: utf-8 -*-
-"""Server-side implementation of Toon Boon Harmony communication."""
+"""Server-side implementation of Toon Boon Harmony communication.
+
+Messages sent to Harmony are framed as ``AH`` followed by 4 bytes of big
+endian content length. Harmony 21.1 can't write bytes, so messages from
+Harmony have content length encoded as 8 hexadecimal characters.
+
+Each request sent to Harmony gets a future which is resolved by the reader
+thread once a reply with the same message id arrives. That allows to have
+multiple requests in flight at once (pipelining) and to wait for replies
+without polling.
+"""
 import socket
 import logging
 import json
 import traceback
 import importlib
 import functools
-import time
 import struct
 from datetime import datetime
 import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
 from . import lib
 
+HEADER_PREFIX = b"AH"
+# 'AH' + 8 hexadecimal characters with content length
+RECEIVE_HEADER_SIZE = 10
+
 
 class Server(threading.Thread):
     """Class for communication with Toon Boon Harmony.
 
     Attributes:
         connection (Socket): connection holding object.
-        received (str): received data buffer.any(iterable)
         port (int): port number.
-        message_id (int): index of last message going out.
-        queue (dict): dictionary holding queue of incoming messages.
+        message_id (int): index of next message going out.
+        queue (dict): futures of requests waiting for reply by message id.
+        reply_timeout (float): Seconds after which is logged that Harmony
+            did not reply yet.
+        reply_retries (int): How many times is 'reply_timeout' waited before
+            request is considered as lost.
 
     """
 
+    reply_timeout = 30
+    reply_retries = 30
+    connection_timeout = 60
+
     def __init__(self, port):
         """Constructor."""
         super(Server, self).__init__()
         self.daemon = True
         self.connection = None
-        self.received = ""
         self.port = port
         self.message_id = 1
 
+        self._connected = threading.Event()
+        self._stopped = False
+        self._send_lock = threading.Lock()
+        self._queue_lock = threading.Lock()
+
         # Setup logging.
         self.log = logging.getLogger(__name__)
         self.log.setLevel(logging.DEBUG)
@@ -48,6 +74,8 @@ class Server(threading.Thread):
             f"[{self.timestamp()}] Starting up on "
             f"{server_address[0]}:{server_address[1]}")
         self.socket.bind(server_address)
+        # Port may be '0' to let system pick free port
+        self.port = self.socket.getsockname()[1]
 
         # Listen for incoming connections
         self.socket.listen(1)
@@ -81,87 +109,102 @@ class Server(threading.Thread):
         except Exception:
             self.log.error(traceback.format_exc())
 
-    def receive(self):
-        """Receives data from `self.connection`.
+    def _recv_exact(self, size):
+        """Read exactly 'size' bytes from connection.
 
-        When the data is a json serializable string, a reply is sent then
-        processing of the request.
+        Returns:
+            Union[bytes, None]: Received data or None if connection was
+                closed.
         """
-        current_time = time.time()
-        while True:
-            self.log.info("wait ttt")
-            # Receive the data in small chunks and retransmit it
-            request = None
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            connection = self.connection
+            if connection is None:
+                return None
             try:
-                header = self.connection.recv(10)
+                chunk = connection.recv(remaining)
             except OSError:
                 # could happen on MacOS
-                self.log.info("")
-                break
+                return None
 
-            if len(header) == 0:
+            if not chunk:
                 # null data received, socket is closing.
+                return None
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def receive(self):
+        """Receives data from `self.connection`.
+
+        Replies from Harmony resolve futures of pending requests. Requests
+        from Harmony are acknowledged and processed.
+        """
+        while True:
+            header = self._recv_exact(RECEIVE_HEADER_SIZE)
+            if header is None:
                 self.log.info(f"[{self.timestamp()}] Connection closing.")
                 break
 
-            if header[0:2] != b"AH":
+            if header[0:2] != HEADER_PREFIX:
                 self.log.error("INVALID HEADER")
-            content_length_str = header[2:].decode()
-
-            length = int(content_length_str, 16)
-            data = self.connection.recv(length)
-            while (len(data) < length):
-                # we didn't received everything in first try, lets wait for
-                # all data.
-                self.log.info("loop")
-                time.sleep(0.1)
-                if self.connection is None:
-                    self.log.error(f"[{self.timestamp()}] "
-                                   "Connection is broken")
-                    break
-                if time.time() > current_time + 30:
-                    self.log.error(f"[{self.timestamp()}] Connection timeout.")
-                    break
-
-                data += self.connection.recv(length - len(data))
-            self.log.debug("data:: {} {}".format(data, type(data)))
-            self.received += data.decode("utf-8")
-            pretty = self._pretty(self.received)
+                break
+
+            length = int(header[2:].decode(), 16)
+            data = self._recv_exact(length)
+            if data is None:
+                self.log.error(f"[{self.timestamp()}] Connection is broken")
+                break
+
+            received = data.decode("utf-8")
             self.log.debug(
-                f"[{self.timestamp()}] Received:\n{pretty}")
+                f"[{self.timestamp()}] Received:\n{self._pretty(received)}")
 
             try:
-                request = json.loads(self.received)
+                request = json.loads(received)
             except json.decoder.JSONDecodeError as e:
                 self.log.error(f"[{self.timestamp()}] "
                                f"Invalid message received.\n{e}",
                                exc_info=True)
+                continue
 
-            self.received = ""
-            if request is None:
+            if request.get("reply"):
+                self._resolve_reply(request)
                 continue
 
-            if "message_id" in request.keys():
-                message_id = request["message_id"]
-                self.message_id = message_id + 1
-                self.log.debug(f"--- storing request as {message_id}")
-                self.queue[message_id] = request
-            if "reply" not in request.keys():
-                request["reply"] = True
-                self.send(request)
-                self.process_request(request)
-
-                if "message_id" in request.keys():
-                    try:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"Removing from the queue {message_id}")
-                        del self.queue[message_id]
-                    except IndexError:
-                        self.log.debug(f"[{self.timestamp()}] "
-                                       f"{message_id} is no longer in queue")
-            else:
-                self.log.debug(f"[{self.timestamp()}] "
-                               "received data was just a reply.")
+            # Request from Harmony - acknowledge it and process
+            request["reply"] = True
+            try:
+                self._send(json.dumps(request))
+            except OSError:
+                self.log.warning("Failed to acknowledge request.")
+            self.process_request(request)
+
+        self._on_disconnect()
+
+    def _resolve_reply(self, reply):
+        message_id = reply.get("message_id")
+        with self._queue_lock:
+            future = self.queue.pop(message_id, None)
+
+        if future is None:
+            self.log.debug(f"[{self.timestamp()}] "
+                           f"{message_id} is no longer in queue")
+            return
+        future.set_result(reply)
+
+    def _on_disconnect(self):
+        self._connected.clear()
+        with self._queue_lock:
+            futures = list(self.queue.values())
+            self.queue.clear()
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(
+                    ConnectionError("Connection to Harmony was closed.")
+                )
 
     def run(self):
         """Entry method for server.
@@ -169,29 +212,48 @@ class Server(threading.Thread):
         Waits for a connection on `self.port` before going into listen mode.
         """
         # Wait for a connection
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")
-        self.log.debug(f"[{timestamp}] Waiting for a connection.")
-        self.connection, client_address = self.socket.accept()
+        self.log.debug(f"[{self.timestamp()}] Waiting for a connection.")
+        try:
+            self.connection, client_address = self.socket.accept()
+        except OSError:
+            # Server was stopped before any connection
+            return
+
+        if self._stopped:
+            self.connection.close()
+            self.connection = None
+            return
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")
-        self.log.debug(f"[{timestamp}] Connection from: {client_address}")
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._connected.set()
+
+        self.log.debug(
+            f"[{self.timestamp()}] Connection from: {client_address}")
 
         self.receive()
 
     def stop(self):
         """Shutdown socket server gracefully."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")
-        self.log.debug(f"[{timestamp}] Shutting down server.")
-        if self.connection is None:
-            self.log.debug("Connect to shutdown.")
-            socket.socket(
-                socket.AF_INET, socket.SOCK_STREAM
-            ).connect(("localhost", self.port))
-
-        self.connection.close()
+        self.log.debug(f"[{self.timestamp()}] Shutting down server.")
+        self._stopped = True
+        connection = self.connection
         self.connection = None
+        if connection is None:
+            self.log.debug("Connect to shutdown.")
+            # Unblock waiting for connection in 'run'
+            try:
+                socket.create_connection(("127.0.0.1", self.port)).close()
+            except OSError:
+                pass
+        else:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            connection.close()
 
         self.socket.close()
+        self._on_disconnect()
 
     def _send(self, message):
         """Send a message to Harmony.
@@ -200,18 +262,81 @@ class Server(threading.Thread):
             message (str): Data to send to Harmony.
         """
         # Wait for a connection.
-        while not self.connection:
-            pass
+        if not self._connected.wait(self.connection_timeout):
+            raise ConnectionError("Harmony is not connected.")
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")
         encoded = message.encode("utf-8")
-        coded_message = b"AH" + struct.pack('>I', len(encoded)) + encoded
-        pretty = self._pretty(coded_message)
+        coded_message = (
+            HEADER_PREFIX + struct.pack(">I", len(encoded)) + encoded
+        )
         self.log.debug(
-            f"[{timestamp}] Sending [{self.message_id}]:\n{pretty}")
+            f"[{self.timestamp()}] Sending:\n{self._pretty(coded_message)}")
         self.log.debug(f"--- Message length: {len(encoded)}")
-        self.connection.sendall(coded_message)
-        self.message_id += 1
+        # Don't interleave messages sent from multiple threads
+        with self._send_lock:
+            self.connection.sendall(coded_message)
+
+    def _next_message_id(self):
+        with self._queue_lock:
+            message_id = self.message_id
+            self.message_id += 1
+        return message_id
+
+    def send_async(self, request):
+        """Send a request to Harmony without waiting for reply.
+
+        Multiple requests can be sent before any reply arrives, Harmony
+        processes them in order.
+
+        Args:
+            request (dict): Data to send to Harmony.
+
+        Returns:
+            Future: Future resolved with reply from Harmony.
+        """
+        future = Future()
+        message_id = self._next_message_id()
+        request["message_id"] = message_id
+        with self._queue_lock:
+            self.queue[message_id] = future
+
+        try:
+            self._send(json.dumps(request))
+        except Exception as exc:
+            with self._queue_lock:
+                self.queue.pop(message_id, None)
+            future.set_exception(exc)
+        return future
+
+    def wait_for_reply(self, future, message_id=None):
+        """Wait for reply of request sent with 'send_async'.
+
+        Args:
+            future (Future): Future returned by 'send_async'.
+            message_id (Optional[int]): Id used in log messages.
+
+        Returns:
+            Union[dict, None]: Reply from Harmony or None if Harmony did not
+                reply in time or connection was closed.
+        """
+        for try_index in range(1, self.reply_retries + 1):
+            try:
+                return future.result(self.reply_timeout)
+            except FutureTimeoutError:
+                self.log.error((f"[{self.timestamp()}][{message_id}] "
+                                "No reply from Harmony in "
+                                f"{self.reply_timeout}s. "
+                                f"Retrying {try_index}"))
+            except Exception:
+                self.log.error(
+                    f"[{self.timestamp()}][{message_id}] Request failed.",
+                    exc_info=True
+                )
+                return None
+
+        with self._queue_lock:
+            self.queue.pop(message_id, None)
+        return None
 
     def send(self, request):
         """Send a request in dictionary to Harmony.
@@ -220,48 +345,64 @@ class Server(threading.Thread):
 
         Args:
             request (dict): Data to send to Harmony.
+
+        Returns:
+            Union[dict, None]: Reply from Harmony.
         """
-        request["message_id"] = self.message_id
-        self._send(json.dumps(request))
         if request.get("reply"):
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")
+            request.setdefault("message_id", self._next_message_id())
+            self._send(json.dumps(request))
             self.log.debug(
-                f"[{timestamp}] sent reply, not waiting for anything.")
+                f"[{self.timestamp()}] sent reply, not waiting for anything.")
             return None
-        result = None
-        current_time = time.time()
-        try_index = 1
-        while True:
-            time.sleep(0.1)
-            if time.time() > current_time + 30:
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.error((f"[{timestamp}][{self.message_id}] "
-                                "No reply from Harmony in 30s. "
-                                f"Retrying {try_index}"))
-                try_index += 1
-                current_time = time.time()
-            if try_index > 30:
-                break
-            try:
-                result = self.queue[request["message_id"]]
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")
-                self.log.debug((f"[{timestamp}] Got request "
-                                f"id {self.message_id}, "
-                                "removing from queue"))
-                del self.queue[request["message_id"]]
-                break
-            except KeyError:
-                # response not in received queue yey
-                pass
-            try:
-                result = json.loads(self.received)
-                break
-            except json.decoder.JSONDecodeError:
-                pass
 
-        self.received = ""
+        future = self.send_async(request)
+        return self.wait_for_reply(future, request["message_id"])
+
+    def send_many(self, requests):
+        """Send multiple requests at once and wait for all replies.
+
+        Requests are pipelined so latency of connection is paid only once.
+
+        Args:
+            requests (Iterable[dict]): Requests to send to Harmony.
+
+        Returns:
+            list[Union[dict, None]]: Replies in order of requests.
+        """
+        futures = [
+            (request, self.send_async(request))
+            for request in requests
+        ]
+        return [
+            self.wait_for_reply(future, request["message_id"])
+            for request, future in futures
+        ]
+
+    def send_batch(self, requests):
+        """Send multiple function calls to Harmony in single message.
+
+        Harmony calls functions in order and replies with list of results.
+
+        Args:
+            requests (Iterable[dict]): Requests with "function" and
+                optional "args" keys.
 
-        return result
+        Returns:
+            Union[list[Any], None]: Results of functions in order of
+                requests or None if Harmony did not reply.
+        """
+        batch = [
+            {
+                "function": request["function"],
+                "args": request.get("args")
+            }
+            for request in requests
+        ]
+        reply = self.send({"batch": batch})
+        if reply is None:
+            return None
+        return reply.get("result")
 
     def _pretty(self, message) -> str:
         # result = pformat(message, indent=2)
@@ -6,8 +6,6 @@ import pyblish.api
 import openpype.hosts.harmony.api as harmony
 import openpype.lib
 
-import clique
-
 
 class ExtractRender(pyblish.api.InstancePlugin):
     """Produce a flattened image file from instance.
@@ -73,12 +71,14 @@ class ExtractRender(pyblish.api.InstancePlugin):
 
         # Collect rendered files.
         self.log.debug(f"collecting from: {path}")
-        files = os.listdir(path)
-        assert files, (
+        # Directory was just rendered to, listing must not be cached
+        collections, remainder = openpype.lib.scan_directory(
+            path, minimum_items=1, use_cache=False
+        )
+        assert collections or remainder, (
             "No rendered files found, render failed."
         )
-        self.log.debug(f"files there: {files}")
-        collections, remainder = clique.assemble(files, minimum_items=1)
+        self.log.debug(f"sequences there: {collections}")
         assert not remainder, (
             "There should not be a remainder for {0}: {1}".format(
                 instance.data["setMembers"][0], remainder
@@ -78,6 +78,13 @@
       RPC.connect();
   
       log.warn("connected"); 
+
+      // routes registered with 'addRoute' can be called in batch
+      var routes = {};
+      function addRoute(route, callback) {
+          routes[route] = callback;
+          RPC.addRoute(route, callback);
+      }
       
       function EscapeStringForJSX(str){
       // Replaces:
@@ -88,7 +95,7 @@
           return str.replace(/\\/g, '\\\\').replace(/'/g, "\\'").replace(/"/g, '\\"');
       }
       
-      RPC.addRoute('Photoshop.open', function (data) {
+      addRoute('Photoshop.open', function (data) {
               log.warn('Server called client route "open":', data);
               var escapedPath = EscapeStringForJSX(data.path);
               return runEvalScript("fileOpen('" + escapedPath +"')")
@@ -98,7 +105,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.read', function (data) {
+      addRoute('Photoshop.read', function (data) {
               log.warn('Server called client route "read":', data);
               return runEvalScript("getHeadline()")
                   .then(function(result){
@@ -107,7 +114,7 @@
                   });
       });
   
-      RPC.addRoute('Photoshop.get_layers', function (data) {
+      addRoute('Photoshop.get_layers', function (data) {
               log.warn('Server called client route "get_layers":', data);
               return runEvalScript("getLayers()")
                   .then(function(result){
@@ -116,7 +123,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.set_visible', function (data) {
+      addRoute('Photoshop.set_visible', function (data) {
               log.warn('Server called client route "set_visible":', data);
               return runEvalScript("setVisible(" + data.layer_id + ", " +
                                    data.visibility + ")")
@@ -126,7 +133,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.get_active_document_name', function (data) {
+      addRoute('Photoshop.get_active_document_name', function (data) {
               log.warn('Server called client route "get_active_document_name":', 
                         data);
               return runEvalScript("getActiveDocumentName()")
@@ -136,7 +143,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.get_active_document_full_name', function (data) {
+      addRoute('Photoshop.get_active_document_full_name', function (data) {
               log.warn('Server called client route ' +
                        '"get_active_document_full_name":', data);
               return runEvalScript("getActiveDocumentFullName()")
@@ -146,7 +153,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.save', function (data) {
+      addRoute('Photoshop.save', function (data) {
               log.warn('Server called client route "save":', data);
               
               return runEvalScript("save()")
@@ -156,7 +163,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.get_selected_layers', function (data) {
+      addRoute('Photoshop.get_selected_layers', function (data) {
               log.warn('Server called client route "get_selected_layers":', data);
               
               return runEvalScript("getSelectedLayers()")
@@ -166,7 +173,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.create_group', function (data) {
+      addRoute('Photoshop.create_group', function (data) {
               log.warn('Server called client route "create_group":', data);
               
               return runEvalScript("createGroup('" + data.name + "')")
@@ -176,7 +183,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.group_selected_layers', function (data) {
+      addRoute('Photoshop.group_selected_layers', function (data) {
               log.warn('Server called client route "group_selected_layers":', 
                        data);
               
@@ -188,7 +195,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.import_smart_object', function (data) {
+      addRoute('Photoshop.import_smart_object', function (data) {
               log.warn('Server called client "import_smart_object":', data);
               var escapedPath = EscapeStringForJSX(data.path);
               return runEvalScript("importSmartObject('" + escapedPath +"', " +
@@ -200,7 +207,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.replace_smart_object', function (data) {
+      addRoute('Photoshop.replace_smart_object', function (data) {
               log.warn('Server called route "replace_smart_object":', data);
               var escapedPath = EscapeStringForJSX(data.path);
               return runEvalScript("replaceSmartObjects("+data.layer_id+"," +
@@ -212,7 +219,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.delete_layer', function (data) {
+      addRoute('Photoshop.delete_layer', function (data) {
               log.warn('Server called route "delete_layer":', data);
               return runEvalScript("deleteLayer("+data.layer_id+")")
                   .then(function(result){
@@ -221,7 +228,7 @@
                   });
       });
 
-      RPC.addRoute('Photoshop.rename_layer', function (data) {
+      addRoute('Photoshop.rename_layer', function (data) {
         log.warn('Server called route "rename_layer":', data);
         return runEvalScript("renameLayer("+data.layer_id+", " +
                                           "'"+ data.name +"')")
@@ -231,7 +238,7 @@
             });
 });
        
-      RPC.addRoute('Photoshop.select_layers', function (data) {
+      addRoute('Photoshop.select_layers', function (data) {
               log.warn('Server called client route "select_layers":', data);
               
               return runEvalScript("selectLayers('" + data.layers +"')")
@@ -241,7 +248,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.is_saved', function (data) {
+      addRoute('Photoshop.is_saved', function (data) {
               log.warn('Server called client route "is_saved":', data);
               
               return runEvalScript("isSaved()")
@@ -251,7 +258,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.saveAs', function (data) {
+      addRoute('Photoshop.saveAs', function (data) {
               log.warn('Server called client route "saveAsJPEG":', data);
               var escapedPath = EscapeStringForJSX(data.image_path);
               return runEvalScript("saveAs('" + escapedPath + "', " +
@@ -263,7 +270,7 @@
                   });
       });
       
-      RPC.addRoute('Photoshop.imprint', function (data) {
+      addRoute('Photoshop.imprint', function (data) {
               log.warn('Server called client route "imprint":', data);
               var escaped = data.payload.replace(/\n/g, "\\n");
               return runEvalScript("imprint('" + escaped + "')")
@@ -273,15 +280,30 @@
                   });
       });
 
-      RPC.addRoute('Photoshop.get_extension_version', function (data) {
+      addRoute('Photoshop.get_extension_version', function (data) {
         log.warn('Server called client route "get_extension_version":', data);
         return get_extension_version();
       });
 
-      RPC.addRoute('Photoshop.close', function (data) {
+      addRoute('Photoshop.close', function (data) {
         log.warn('Server called client route "close":', data);
         return runEvalScript("close()");
       });
+
+      addRoute('Photoshop.batch', function (data) {
+        // Calls multiple routes one by one, returns list of their results
+        log.warn('Server called client route "batch":', data);
+        var results = [];
+        return data.calls.reduce(function (promise, call) {
+            return promise.then(function () {
+                return routes[call.method](call.params || {});
+            }).then(function (result) {
+                results.push(result);
+            });
+        }, Promise.resolve()).then(function () {
+            return results;
+        });
+      });
         
       RPC.call('Photoshop.ping').then(function (data) {
           log.warn('Result for calling server route "ping": ', data);
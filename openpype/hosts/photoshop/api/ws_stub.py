@@ -3,10 +3,15 @@
     Used anywhere solution is calling client methods.
 """
 import json
+import contextlib
+
 import attr
 from wsrpc_aiohttp import WebSocketAsync
 
 from openpype.tools.adobe_webserver.app import WebServerTool
+from openpype.tools.adobe_webserver.metadata_session import (
+    AdobeMetadataSession
+)
 
 
 @attr.s
@@ -40,6 +45,36 @@ class PSItem(object):
                          .replace(PhotoshopServerStub.LOADED_ICON, ''))
 
 
+class PhotoshopMetadataSession(AdobeMetadataSession):
+    """Local mirror of layers metadata stored in Headline of document.
+
+    Args:
+        stub (PhotoshopServerStub): Stub used for communication.
+        items_meta (Optional[list[dict]]): Already queried metadata.
+        all_layers (Optional[list[PSItem]]): Already queried layers.
+    """
+
+    def __init__(self, stub, items_meta=None, all_layers=None):
+        layer_ids = None
+        if all_layers:
+            layer_ids = {int(layer.id) for layer in all_layers}
+        super(PhotoshopMetadataSession, self).__init__(
+            stub, items_meta, layer_ids
+        )
+
+    def get_layers_metadata(self):
+        return self.get_metadata()
+
+    def _query_metadata(self):
+        return self._stub.query_layers_metadata()
+
+    def _query_item_ids(self):
+        return {int(layer.id) for layer in self._stub.get_layers()}
+
+    def _write_metadata(self, items_meta):
+        self._stub.write_layers_metadata(items_meta)
+
+
 class PhotoshopServerStub:
     """
         Stub for calling function on client (Photoshop js) side.
@@ -50,10 +85,85 @@ class PhotoshopServerStub:
     PUBLISH_ICON = '\u2117 '
     LOADED_ICON = '\u25bc'
 
+    # Stub is created for each call, metadata session is shared
+    _metadata_session = None
+    # Older extension versions don't have batch route
+    _batch_available = None
+
     def __init__(self):
         self.websocketserver = WebServerTool.get_instance()
         self.client = self.get_client()
 
+    @contextlib.contextmanager
+    def metadata_session(self):
+        """Apply changes of layers metadata in memory and write them once.
+
+        Calls of 'imprint', 'remove_instance' and 'get_layers_metadata'
+        inside the context use local mirror of metadata. Changes are
+        written to document when context ends, also on an exception, so
+        metadata of items created before the exception are not lost.
+
+        Nested calls use the already opened session.
+
+        Example:
+            >>> with stub.metadata_session():
+            ...     for instance in instances:
+            ...         stub.imprint(instance_id, instance_data)
+
+        Yields:
+            PhotoshopMetadataSession: Opened session.
+        """
+        cls = PhotoshopServerStub
+        if cls._metadata_session is not None:
+            yield cls._metadata_session
+            return
+
+        session = PhotoshopMetadataSession(self)
+        cls._metadata_session = session
+        try:
+            yield session
+        finally:
+            cls._metadata_session = None
+            session.flush()
+
+    def batch_call(self, calls):
+        """Call multiple routes of client using single request.
+
+        Routes are called one by one if extension does not support batch
+        calls.
+
+        Args:
+            calls (Iterable[tuple[str, dict]]): Route name
+                (e.g. 'Photoshop.set_visible') with its arguments.
+
+        Returns:
+            list[Any]: Results of calls in the same order.
+        """
+        calls = [
+            {"method": method, "params": params or {}}
+            for method, params in calls
+        ]
+        if not calls:
+            return []
+
+        cls = PhotoshopServerStub
+        if cls._batch_available is not False:
+            result = self.websocketserver.call(
+                self.client.call('Photoshop.batch', calls=calls)
+            )
+            # Client responds with 'None' if route is not found
+            if result is not None:
+                cls._batch_available = True
+                return result
+            cls._batch_available = False
+
+        return [
+            self.websocketserver.call(
+                self.client.call(call["method"], **call["params"])
+            )
+            for call in calls
+        ]
+
     @staticmethod
     def get_client():
         """
@@ -147,45 +257,14 @@ class PhotoshopServerStub:
                            loop - value should be same)
         Returns: None
         """
-        if not items_meta:
-            items_meta = self.get_layers_metadata()
-
-        # json.dumps writes integer values in a dictionary to string, so
-        # anticipating it here.
-        item_id = str(item_id)
-        is_new = True
-        result_meta = []
-        for item_meta in items_meta:
-            if ((item_meta.get('members') and
-                 item_id == str(item_meta.get('members')[0])) or
-                    item_meta.get("instance_id") == item_id):
-                is_new = False
-                if data:
-                    item_meta.update(data)
-                    result_meta.append(item_meta)
-            else:
-                result_meta.append(item_meta)
-
-        if is_new:
-            result_meta.append(data)
-
-        # Ensure only valid ids are stored.
-        if not all_layers:
-            all_layers = self.get_layers()
-        layer_ids = [layer.id for layer in all_layers]
-        cleaned_data = []
-
-        for item in result_meta:
-            if item.get("members"):
-                if int(item["members"][0]) not in layer_ids:
-                    continue
+        session = PhotoshopServerStub._metadata_session
+        if session is not None:
+            session.imprint(item_id, data)
+            return
 
-            cleaned_data.append(item)
-
-        payload = json.dumps(cleaned_data, indent=4)
-        self.websocketserver.call(
-            self.client.call('Photoshop.imprint', payload=payload)
-        )
+        session = PhotoshopMetadataSession(self, items_meta, all_layers)
+        session.imprint(item_id, data)
+        session.flush()
 
     def get_layers(self):
         """Returns JSON document with all(?) layers in active document.
@@ -408,14 +487,22 @@ class PhotoshopServerStub:
         """
         if not layers:
             layers = self.get_layers()
-        for layer in layers:
-            if layer.visible and layer.id not in extract_ids:
-                self.set_visible(layer.id, False)
+
+        self.batch_call(
+            (
+                'Photoshop.set_visible',
+                {"layer_id": layer.id, "visibility": False}
+            )
+            for layer in layers
+            if layer.visible and layer.id not in extract_ids
+        )
 
     def get_layers_metadata(self):
         """Reads layers metadata from Headline from active document in PS.
         (Headline accessible by File > File Info)
 
+        Local mirror is used when metadata session is opened.
+
         Returns:
             (list)
             example:
@@ -424,6 +511,17 @@ class PhotoshopServerStub:
                       "asset":"Town"}}
                 8 is layer(group) id - used for deletion, update etc.
         """
+        session = PhotoshopServerStub._metadata_session
+        if session is not None:
+            return session.get_layers_metadata()
+        return self.query_layers_metadata()
+
+    def query_layers_metadata(self):
+        """Query layers metadata from document ignoring metadata session.
+
+        Returns:
+            list[dict]: Metadata of layers and instances.
+        """
         res = self.websocketserver.call(self.client.call('Photoshop.read'))
         layers_data = []
         try:
@@ -508,15 +606,27 @@ class PhotoshopServerStub:
         )
 
     def remove_instance(self, instance_id):
+        session = PhotoshopServerStub._metadata_session
+        if session is not None:
+            session.remove_instance(instance_id)
+            return
+
         cleaned_data = []
 
-        for item in self.get_layers_metadata():
+        for item in self.query_layers_metadata():
             inst_id = item.get("instance_id") or item.get("uuid")
             if inst_id != instance_id:
                 cleaned_data.append(item)
 
-        payload = json.dumps(cleaned_data, indent=4)
+        self.write_layers_metadata(cleaned_data)
 
+    def write_layers_metadata(self, items_meta):
+        """Write metadata to Headline of active document.
+
+        Args:
+            items_meta (list[dict]): Metadata of all layers and instances.
+        """
+        payload = json.dumps(items_meta, indent=4)
         self.websocketserver.call(
             self.client.call('Photoshop.imprint', payload=payload)
         )
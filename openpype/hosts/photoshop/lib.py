@@ -28,9 +28,11 @@ class PSAutoCreator(AutoCreator):
 
     def update_instances(self, update_list):
         self.log.debug("update_list:: {}".format(update_list))
-        for created_inst, _changes in update_list:
-            api.stub().imprint(created_inst.get("instance_id"),
-                               created_inst.data_to_store())
+        stub = api.stub()
+        with stub.metadata_session():
+            for created_inst, _changes in update_list:
+                stub.imprint(created_inst.get("instance_id"),
+                             created_inst.data_to_store())
 
     def create(self, options=None):
         existing_instance = None
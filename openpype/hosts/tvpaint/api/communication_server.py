@@ -13,6 +13,7 @@ import threading
 import shutil
 
 from contextlib import closing
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 from aiohttp import web
 from aiohttp_json_rpc import JsonRpc
@@ -62,6 +63,13 @@ class CommunicationWrapper:
             return
         return cls.communicator.execute_george(george_script)
 
+    @classmethod
+    def execute_george_many(cls, george_scripts):
+        """Execute passed goerge scripts in TVPaint."""
+        if not cls.communicator:
+            return
+        return cls.communicator.execute_george_many(george_scripts)
+
 
 class WebSocketServer:
     def __init__(self):
@@ -198,12 +206,80 @@ class WebsocketServerThread(threading.Thread):
         self.loop.stop()
 
 
+class RpcResponseError(Exception):
+    """Client responded to request with an error.
+
+    Args:
+        error (dict): Error data from response.
+    """
+
+    def __init__(self, error):
+        self.error = error
+        self.code = None
+        if isinstance(error, dict):
+            self.code = error.get("code")
+        super().__init__("Error happened: {}".format(error))
+
+
+class RpcMetrics:
+    """Latency metrics of requests sent to client by method name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def add(self, method, duration, failed=False):
+        with self._lock:
+            item = self._data.get(method)
+            if item is None:
+                item = {
+                    "count": 0,
+                    "errors": 0,
+                    "total": 0.0,
+                    "min": duration,
+                    "max": duration,
+                }
+                self._data[method] = item
+
+            item["count"] += 1
+            item["total"] += duration
+            item["min"] = min(item["min"], duration)
+            item["max"] = max(item["max"], duration)
+            if failed:
+                item["errors"] += 1
+
+    def get(self):
+        """Metrics by method name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Count of requests, count of errors and
+                total, average, min and max duration in seconds.
+        """
+        output = {}
+        with self._lock:
+            for method, item in self._data.items():
+                item = dict(item)
+                item["average"] = item["total"] / item["count"]
+                output[method] = item
+        return output
+
+    def reset(self):
+        with self._lock:
+            self._data.clear()
+
+
 class BaseTVPaintRpc(JsonRpc):
+    # Interval in which is checked if client is still connected when
+    #   waiting for response
+    connection_check_interval = 0.5
+
     def __init__(self, communication_obj, route_name="", **kwargs):
         super().__init__(**kwargs)
         self.requests_ids = collections.defaultdict(lambda: 0)
-        self.waiting_requests = collections.defaultdict(list)
-        self.responses = collections.defaultdict(list)
+        # Futures of requests waiting for response by client host and id
+        self.waiting_requests = collections.defaultdict(dict)
+        self._requests_lock = threading.Lock()
+        self.metrics = RpcMetrics()
 
         self.route_name = route_name
         self.communication_obj = communication_obj
@@ -212,7 +288,7 @@ class BaseTVPaintRpc(JsonRpc):
         # This is duplicated code from super but there is no way how to do it
         # to be able handle server->client requests
         host = http_request.host
-        if host in self.waiting_requests:
+        if self.waiting_requests.get(host):
             try:
                 _raw_message = raw_msg.data
                 msg = decode_msg(_raw_message)
@@ -223,8 +299,12 @@ class BaseTVPaintRpc(JsonRpc):
 
             if msg.type in (JsonRpcMsgTyp.RESULT, JsonRpcMsgTyp.ERROR):
                 msg_data = json.loads(_raw_message)
-                if msg_data.get("id") in self.waiting_requests[host]:
-                    self.responses[host].append(msg_data)
+                with self._requests_lock:
+                    future = self.waiting_requests[host].pop(
+                        msg_data.get("id"), None
+                    )
+                if future is not None:
+                    future.set_result(msg_data)
                     return
 
         return await super()._handle_rpc_msg(http_request, raw_msg)
@@ -243,58 +323,89 @@ class BaseTVPaintRpc(JsonRpc):
             loop=self.loop
         )
 
-    def send_request(self, client, method, params=None, timeout=0):
+    def _send_request(self, client, method, params):
         if params is None:
             params = []
 
         client_host = client.host
-
-        request_id = self.requests_ids[client_host]
-        self.requests_ids[client_host] += 1
-
-        self.waiting_requests[client_host].append(request_id)
+        future = Future()
+        with self._requests_lock:
+            request_id = self.requests_ids[client_host]
+            self.requests_ids[client_host] += 1
+            self.waiting_requests[client_host][request_id] = future
 
         log.debug("Sending request to client {} ({}, {}) id: {}".format(
             client_host, method, params, request_id
         ))
-        future = asyncio.run_coroutine_threadsafe(
+        asyncio.run_coroutine_threadsafe(
             client.ws.send_str(encode_request(method, request_id, params)),
             loop=self.loop
-        )
-        result = future.result()
+        ).result()
+        return request_id, future
 
-        not_found = object()
-        response = not_found
-        start = time.time()
+    def _wait_for_response(
+        self, client, method, request_id, future, start, timeout
+    ):
         while True:
+            try:
+                response = future.result(self.connection_check_interval)
+                break
+            except FutureTimeoutError:
+                pass
+
             if client.ws.closed:
+                self._discard_request(client, request_id)
                 return None
 
-            for _response in self.responses[client_host]:
-                _id = _response.get("id")
-                if _id == request_id:
-                    response = _response
-                    break
-
-            if response is not not_found:
-                break
-
             if timeout > 0 and (time.time() - start) > timeout:
+                self._discard_request(client, request_id)
+                self.metrics.add(method, time.time() - start, True)
                 raise Exception("Timeout passed")
-                return
 
-            time.sleep(0.1)
+        error = response.get("error")
+        self.metrics.add(method, time.time() - start, bool(error))
+        if error:
+            raise RpcResponseError(error)
+        return response.get("result")
 
-        if response is not_found:
-            raise Exception("Connection closed")
+    def _discard_request(self, client, request_id):
+        with self._requests_lock:
+            self.waiting_requests[client.host].pop(request_id, None)
 
-        self.responses[client_host].remove(response)
+    def send_request(self, client, method, params=None, timeout=0):
+        start = time.time()
+        request_id, future = self._send_request(client, method, params)
+        return self._wait_for_response(
+            client, method, request_id, future, start, timeout
+        )
 
-        error = response.get("error")
-        result = response.get("result")
-        if error:
-            raise Exception("Error happened: {}".format(error))
-        return result
+    def send_requests(self, client, requests, timeout=0):
+        """Send multiple requests at once and wait for their results.
+
+        All requests are sent before waiting for first response so
+        communication latency is not paid for each request.
+
+        Args:
+            client (JsonRpcClient): Client to which requests are sent.
+            requests (Iterable[tuple[str, list]]): Method names with
+                params.
+            timeout (Optional[float]): Timeout for each request.
+
+        Returns:
+            list[Any]: Results of requests in same order.
+        """
+        start = time.time()
+        sent_requests = []
+        for method, params in requests:
+            request_id, future = self._send_request(client, method, params)
+            sent_requests.append((method, request_id, future))
+
+        return [
+            self._wait_for_response(
+                client, method, request_id, future, start, timeout
+            )
+            for method, request_id, future in sent_requests
+        ]
 
 
 class QtTVPaintRpc(BaseTVPaintRpc):
@@ -379,7 +490,6 @@ class MainThreadItem:
     for the callback. Item hold information about it's process.
     """
     not_set = object()
-    sleep_time = 0.1
 
     def __init__(self, callback, *args, **kwargs):
         self.done = False
@@ -389,6 +499,11 @@ class MainThreadItem:
         self.args = args
         self.kwargs = kwargs
 
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+        # Asyncio futures of 'async_wait' calls with their loops
+        self._async_waiters = []
+
     def execute(self):
         """Execute callback and store its result.
 
@@ -413,7 +528,27 @@ class MainThreadItem:
             self.exception = exc
 
         finally:
+            self._mark_done()
+
+    def _mark_done(self):
+        with self._lock:
             self.done = True
+            async_waiters = self._async_waiters
+            self._async_waiters = []
+
+        self._done_event.set()
+        for loop, future in async_waiters:
+            loop.call_soon_threadsafe(self._set_future_done, future)
+
+    @staticmethod
+    def _set_future_done(future):
+        if not future.done():
+            future.set_result(None)
+
+    def _get_output(self):
+        if self.exception is self.not_set:
+            return self.result
+        raise self.exception
 
     def wait(self):
         """Wait for result from main thread.
@@ -427,12 +562,8 @@ class MainThreadItem:
             Exception: Reraise any exception that happened during callback
                 execution.
         """
-        while not self.done:
-            time.sleep(self.sleep_time)
-
-        if self.exception is self.not_set:
-            return self.result
-        raise self.exception
+        self._done_event.wait()
+        return self._get_output()
 
     async def async_wait(self):
         """Wait for result from main thread.
@@ -444,12 +575,16 @@ class MainThreadItem:
             Exception: Reraise any exception that happened during callback
                 execution.
         """
-        while not self.done:
-            await asyncio.sleep(self.sleep_time)
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.done:
+                future.set_result(None)
+            else:
+                self._async_waiters.append((loop, future))
 
-        if self.exception is self.not_set:
-            return self.result
-        raise self.exception
+        await future
+        return self._get_output()
 
 
 class BaseCommunicator:
@@ -459,6 +594,8 @@ class BaseCommunicator:
         self.websocket_rpc = None
         self.exit_code = None
         self._connected_client = None
+        # Older plugin builds don't have 'execute_george_many' method
+        self._george_many_available = None
 
     @property
     def server_is_running(self):
@@ -797,6 +934,31 @@ class BaseCommunicator:
             client, method, params
         )
 
+    def send_requests(self, requests):
+        """Send multiple requests at once and wait for their results.
+
+        Args:
+            requests (Iterable[tuple[str, list]]): Method names with params.
+
+        Returns:
+            Union[list[Any], None]: Results of requests in same order.
+        """
+        client = self.client()
+        if not client:
+            return
+
+        return self.websocket_rpc.send_requests(client, requests)
+
+    def get_request_metrics(self):
+        """Latency metrics of requests sent to client by method name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Metrics of each method.
+        """
+        if not self.websocket_rpc:
+            return {}
+        return self.websocket_rpc.metrics.get()
+
     def send_notification(self, method, params=None):
         client = self.client()
         if not client:
@@ -812,6 +974,44 @@ class BaseCommunicator:
             "execute_george", [george_script]
         )
 
+    def execute_george_many(self, george_scripts):
+        """Execute multiple george scripts in TVPaint using one request.
+
+        Scripts are sent as separate pipelined requests if plugin in TVPaint
+        does not support 'execute_george_many' method.
+
+        Args:
+            george_scripts (Iterable[str]): George scripts to execute.
+
+        Returns:
+            Union[list[str], None]: Output of each script in same order.
+        """
+        george_scripts = list(george_scripts)
+        if not george_scripts:
+            return []
+
+        if self._george_many_available is not False:
+            try:
+                result = self.send_request(
+                    "execute_george_many", [george_scripts]
+                )
+                self._george_many_available = True
+                return result
+
+            except RpcResponseError as exc:
+                # Method not found
+                if exc.code != -32601:
+                    raise
+                log.debug(
+                    "TVPaint plugin does not support 'execute_george_many'."
+                )
+                self._george_many_available = False
+
+        return self.send_requests([
+            ("execute_george", [george_script])
+            for george_script in george_scripts
+        ])
+
     def execute_george_through_file(self, george_script):
         """Execute george script with temp file.
 
@@ -13,6 +13,20 @@ def execute_george(george_script, communicator=None):
     return communicator.execute_george(george_script)
 
 
+def execute_george_many(george_scripts, communicator=None):
+    """Execute multiple george scripts using single request.
+
+    Args:
+        george_scripts (Iterable[str]): George scripts to execute.
+
+    Returns:
+        list[str]: Output of each script in same order.
+    """
+    if not communicator:
+        communicator = CommunicationWrapper.communicator
+    return communicator.execute_george_many(george_scripts)
+
+
 def execute_george_through_file(george_script, communicator=None):
     """Execute george script with temp file.
 
@@ -473,7 +487,15 @@ def get_scene_data(communicator=None):
     Returns:
         dict: Scene data collected in many ways.
     """
-    workfile_info = execute_george("tv_projectinfo", communicator)
+    (
+        workfile_info,
+        mark_in_result,
+        mark_out_result,
+        start_frame
+    ) = execute_george_many(
+        ["tv_projectinfo", "tv_markin", "tv_markout", "tv_startframe"],
+        communicator
+    )
     workfile_info_parts = workfile_info.split(" ")
 
     # Project frame start - not used
@@ -485,13 +507,9 @@ def get_scene_data(communicator=None):
     width = int(workfile_info_parts.pop(-1))
 
     # Marks return as "{frame - 1} {state} ", example "0 set".
-    result = execute_george("tv_markin", communicator)
-    mark_in_frame, mark_in_state, _ = result.split(" ")
-
-    result = execute_george("tv_markout", communicator)
-    mark_out_frame, mark_out_state, _ = result.split(" ")
+    mark_in_frame, mark_in_state, _ = mark_in_result.split(" ")
+    mark_out_frame, mark_out_state, _ = mark_out_result.split(" ")
 
-    start_frame = execute_george("tv_startframe", communicator)
     return {
         "width": width,
         "height": height,
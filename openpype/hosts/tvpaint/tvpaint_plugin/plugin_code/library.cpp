@@ -456,9 +456,39 @@ jsonrpcpp::response_ptr execute_george(const jsonrpcpp::Id &id, const jsonrpcpp:
     return std::make_shared<jsonrpcpp::Response>(id, output);
 }
 
+jsonrpcpp::response_ptr execute_george_many(const jsonrpcpp::Id &id, const jsonrpcpp::Parameter &params) {
+    /* Execute multiple george scripts.
+
+    First parameter is list of george scripts. Response contains list with
+    output of each script in the same order.
+    */
+    char empty_char = {0};
+    nlohmann::json outputs = nlohmann::json::array();
+    nlohmann::json json_params = params.to_json();
+
+    for (auto& item : json_params[0]) {
+        char cmd_output[1024] = {0};
+        std::string std_george_script = item;
+        std::string output;
+
+        TVSendCmd(Data.current_filter, std_george_script.c_str(), cmd_output);
+
+        for (int i = 0; i < sizeof(cmd_output); i++)
+        {
+            if (cmd_output[i] == empty_char){
+                break;
+            }
+            output += cmd_output[i];
+        }
+        outputs.push_back(output);
+    }
+    return std::make_shared<jsonrpcpp::Response>(id, outputs);
+}
+
 void register_callbacks(){
     parser.register_request_callback("define_menu", define_menu);
     parser.register_request_callback("execute_george", execute_george);
+    parser.register_request_callback("execute_george_many", execute_george_many);
 }
 
 Communicator* communication = nullptr;
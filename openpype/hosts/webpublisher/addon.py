@@ -66,6 +66,18 @@ def publish(project, path, user=None, targets=None):
     cli_publish(project, path, user, targets)
 
 
+@cli_main.command()
+def publish_worker():
+    """Process publish jobs from stdin in warm process (Inner command).
+
+    Used by worker pool of webpublisher server.
+    """
+
+    from .publish_functions import run_publish_worker
+
+    run_publish_worker()
+
+
 @cli_main.command()
 @click.argument("path")
 @click.option("-p", "--project", help="Project")
@@ -90,7 +102,29 @@ def publishfromapp(project, path, host, user=None, targets=None):
 @click.option("-u", "--upload_dir", help="Upload dir")
 @click.option("-h", "--host", help="Host", default=None)
 @click.option("-p", "--port", help="Port", default=None)
-def webserver(executable, upload_dir, host=None, port=None):
+@click.option("--workers", type=int, default=2, show_default=True,
+              envvar="OPENPYPE_WEBPUBLISH_WORKERS",
+              help="Warm publish workers, 0 starts process for each batch")
+@click.option("--queue-size", type=int, default=20, show_default=True,
+              envvar="OPENPYPE_WEBPUBLISH_QUEUE_SIZE",
+              help="Batches waiting for worker before new are refused")
+@click.option("--max-jobs-per-worker", type=int, default=50,
+              show_default=True,
+              envvar="OPENPYPE_WEBPUBLISH_MAX_JOBS_PER_WORKER",
+              help="Worker is restarted after processing the batches")
+@click.option("--max-worker-rss", type=int, default=4096, show_default=True,
+              envvar="OPENPYPE_WEBPUBLISH_MAX_WORKER_RSS",
+              help="Worker is restarted when its memory is above (MB)")
+def webserver(
+    executable,
+    upload_dir,
+    host=None,
+    port=None,
+    workers=2,
+    queue_size=20,
+    max_jobs_per_worker=50,
+    max_worker_rss=4096
+):
     """Start service for communication with Webpublish Front end.
 
         OP must be congigured on a machine, eg. OPENPYPE_MONGO filled AND
@@ -101,4 +135,13 @@ def webserver(executable, upload_dir, host=None, port=None):
 
     from .webserver_service import run_webserver
 
-    run_webserver(executable, upload_dir, host, port)
+    run_webserver(
+        executable,
+        upload_dir,
+        host,
+        port,
+        workers=workers,
+        queue_size=queue_size,
+        max_jobs_per_worker=max_jobs_per_worker,
+        max_worker_rss=max_worker_rss
+    )
@@ -143,6 +143,9 @@ def publish_and_log(dbcon, _id, log, close_plugin_name=None, batch_id=None):
             batch_id (str) - id sent from frontend
             close_plugin_name (str): name of plugin with responsibility to
                 close host app
+
+        Returns:
+            bool: Publish finished without errors. Error is stored in DB.
     """
     # Error exit as soon as any error occurs.
     error_format = "Failed {plugin.__name__}: {error} -- {error.traceback}\n"
@@ -178,7 +181,7 @@ def publish_and_log(dbcon, _id, log, close_plugin_name=None, batch_id=None):
             if close_plugin:  # close host app explicitly after error
                 context = pyblish.api.Context()
                 close_plugin().process(context)
-            return
+            return False
         elif processed % log_every == 0:
             # pyblish returns progress in 0.0 - 2.0
             progress = min(round(result["progress"] / 2 * 100), 99)
@@ -216,6 +219,7 @@ def publish_and_log(dbcon, _id, log, close_plugin_name=None, batch_id=None):
                 }
         }
     )
+    return True
 
 
 def fail_batch(_id, dbcon, msg):
@@ -237,6 +241,51 @@ def fail_batch(_id, dbcon, msg):
     raise ValueError(msg)
 
 
+def fail_unfinished_batch(dbcon, batch_id, user, msg, since=None):
+    """Set records of batch which are still in progress as failed.
+
+    Used when process publishing the batch ended before it finished its
+    record, e.g. crashed or was killed on timeout. Failed record is created
+    if process ended before it created one.
+
+    Args:
+        dbcon (OpenPypeMongoConnection)
+        batch_id (str): Id of batch sent from frontend.
+        user (str): Email of user who published the batch.
+        msg (str): Reason of failure stored as log of record.
+        since (Optional[datetime]): Time when publishing of batch was
+            requested. Record is created only if there is no record started
+            after it.
+    """
+    result = dbcon.update_many(
+        {"batch_id": batch_id, "status": IN_PROGRESS_STATUS},
+        {"$set":
+            {
+                "finish_date": datetime.now(),
+                "status": ERROR_STATUS,
+                "log": msg
+            }}
+    )
+    if result.modified_count:
+        return
+
+    query_filter = {"batch_id": batch_id}
+    if since is not None:
+        query_filter["start_date"] = {"$gte": since}
+    if dbcon.count_documents(query_filter):
+        return
+
+    dbcon.insert_one({
+        "batch_id": batch_id,
+        "start_date": since or datetime.now(),
+        "finish_date": datetime.now(),
+        "user": user,
+        "status": ERROR_STATUS,
+        "progress": 0,
+        "log": msg
+    })
+
+
 def find_variant_key(application_manager, host):
     """Searches for latest installed variant for 'host'
 
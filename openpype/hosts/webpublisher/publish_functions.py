@@ -1,14 +1,19 @@
 import os
+import sys
+import json
 import time
+import traceback
 import pyblish.api
 import pyblish.util
 
 from openpype.lib import Logger
+from openpype.lib.profiling import get_peak_rss
 from openpype.lib.applications import (
     ApplicationManager,
     LaunchTypes,
 )
-from openpype.pipeline import install_host
+from openpype.pipeline import install_host, uninstall_host
+from openpype.pipeline.context_tools import install_openpype_plugins
 from openpype.hosts.webpublisher.api import WebpublisherHost
 
 from .lib import (
@@ -42,6 +47,9 @@ def cli_publish(project_name, batch_path, user_email, targets):
         targets (list): Pyblish targets
             (to choose validator for example)
 
+    Returns:
+        bool: Publish finished without errors.
+
     Raises:
         RuntimeError: When there is no path to process.
     """
@@ -81,9 +89,115 @@ def cli_publish(project_name, batch_path, user_email, targets):
         msg += "Create new batch and set context properly."
         fail_batch(_id, dbcon, msg)
 
-    publish_and_log(dbcon, _id, log, batch_id=batch_id)
+    success = publish_and_log(dbcon, _id, log, batch_id=batch_id)
 
     log.info("Publish finished.")
+    return success
+
+
+def _get_pyblish_state():
+    return {
+        "targets": list(pyblish.api.registered_targets()),
+        "paths": list(pyblish.api.registered_paths()),
+        "hosts": list(pyblish.api.registered_hosts()),
+        "discovery_filters": list(
+            pyblish.api.registered_discovery_filters()
+        ),
+    }
+
+
+def _restore_pyblish_state(state):
+    pyblish.api.deregister_all_targets()
+    pyblish.api.deregister_all_paths()
+    pyblish.api.deregister_all_hosts()
+    pyblish.api.deregister_all_discovery_filters()
+    for target in state["targets"]:
+        pyblish.api.register_target(target)
+    for path in state["paths"]:
+        pyblish.api.register_plugin_path(path)
+    for host_name in state["hosts"]:
+        pyblish.api.register_host(host_name)
+    for discovery_filter in state["discovery_filters"]:
+        pyblish.api.register_discovery_filter(discovery_filter)
+
+
+def run_publish_worker():
+    """Process publish jobs received on stdin in a warm process.
+
+    Long living counterpart of 'cli_publish' used by worker pool of
+    webpublisher server. Modules and settings are loaded only once and
+    each job is processed by 'cli_publish'. Environment and pyblish
+    registrations are restored after each job so jobs don't affect each
+    other.
+
+    Each line of stdin is json job with 'project', 'path', 'user' and
+    'targets' keys. Result of each job is written as json line to stdout,
+    output of publishing is redirected to stderr. Process ends on empty
+    line or when stdin is closed.
+    """
+    log = Logger.get_logger("WebpublishWorker")
+
+    # Only results are written to stdout
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    def send(data):
+        protocol.write(json.dumps(data) + "\n")
+        protocol.flush()
+
+    env_snapshot = dict(os.environ)
+    pyblish_state = _get_pyblish_state()
+
+    # Warm up - load modules, settings and database connection
+    install_openpype_plugins()
+    get_webpublish_conn()
+    _restore_pyblish_state(pyblish_state)
+
+    send({"type": "ready", "pid": os.getpid()})
+    log.info("Publish worker {} is ready".format(os.getpid()))
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            break
+
+        job = json.loads(line)
+        start = time.time()
+        error = None
+        try:
+            success = cli_publish(
+                job["project"], job["path"], job["user"], job.get("targets")
+            )
+            # Publish errors are stored to batch log without exception
+            if not success:
+                error = "Publish failed, see log of batch"
+                log.error("Publish of {} failed".format(job["path"]))
+
+        except Exception as exc:
+            error = "{}: {}".format(exc.__class__.__name__, exc)
+            log.error(
+                "Publish of {} failed".format(job["path"]), exc_info=True
+            )
+            traceback.print_exc()
+
+        finally:
+            try:
+                uninstall_host()
+            except Exception:
+                log.warning("Failed to uninstall host", exc_info=True)
+            os.environ.clear()
+            os.environ.update(env_snapshot)
+            _restore_pyblish_state(pyblish_state)
+
+        send({
+            "type": "result",
+            "id": job.get("id"),
+            "success": error is None,
+            "error": error,
+            "duration": time.time() - start,
+            "peak_rss": get_peak_rss(),
+        })
 
 
 def cli_publish_from_app(
@@ -0,0 +1,374 @@
+"""Cached context trees of projects for webpublisher hierarchy endpoint.
+
+Tree of a project is built once from asset documents and kept in memory with
+its encoded response body. Each change of the tree increases version of the
+tree which is used as ETag of the response.
+
+Changes of assets are received using MongoDB change stream of the project
+collection and applied to the tree node by node. When change streams are
+not available (e.g. standalone MongoDB server) the tree is reloaded when is
+older than 'reload_interval'.
+"""
+import uuid
+import time
+import threading
+
+import pymongo
+
+from openpype import AYON_SERVER_ENABLED
+from openpype.client import get_assets
+from openpype.lib import Logger
+
+ASSET_FIELDS = (
+    "_id",
+    "data.tasks",
+    "data.visualParent",
+    "data.entityType",
+    "name",
+    "type",
+)
+
+log = Logger.get_logger("WebpublishHierarchy")
+
+
+class Node(dict):
+    """Node element in context tree."""
+
+    def __init__(self, uid, node_type, name):
+        self._parent = None  # pointer to parent Node
+        self["type"] = node_type
+        self["name"] = name
+        self['id'] = uid  # keep reference to id #
+        self['children'] = []  # collection of pointers to child Nodes
+
+    @property
+    def parent(self):
+        return self._parent  # simply return the object at the _parent pointer
+
+    @parent.setter
+    def parent(self, node):
+        self._parent = node
+        # add this node to parent's list of children
+        node['children'].append(self)
+
+    def detach(self):
+        """Remove node from children of its parent."""
+        parent = self._parent
+        if parent is None:
+            return
+        self._parent = None
+        children = parent["children"]
+        for idx, child in enumerate(children):
+            if child is self:
+                children.pop(idx)
+                break
+
+
+class TaskNode(Node):
+    """Special node type only for Tasks."""
+
+    def __init__(self, node_type, name):
+        self._parent = None
+        self["type"] = node_type
+        self["name"] = name
+        self["attributes"] = {}
+
+
+class ProjectHierarchy:
+    """Context tree of a project which can be changed by asset documents.
+
+    Assets with unknown parent are shown under project node until their
+    parent appears.
+
+    Args:
+        project_name (str): Project name.
+        asset_docs (Iterable[dict]): Asset documents with 'ASSET_FIELDS'.
+    """
+
+    def __init__(self, project_name, asset_docs=None):
+        self.root = Node(None, "project", project_name)
+        self._nodes_by_id = {}
+        self._parent_ids_by_id = {}
+        # Nodes under project node waiting for their parent
+        self._waiting_by_parent_id = {}
+        for asset_doc in asset_docs or []:
+            self.upsert_asset(asset_doc)
+
+    def __contains__(self, asset_id):
+        return asset_id in self._nodes_by_id
+
+    def _set_tasks(self, node, asset_doc):
+        children = [
+            child
+            for child in node["children"]
+            if not isinstance(child, TaskNode)
+        ]
+        node["children"] = []
+        tasks = asset_doc["data"].get("tasks") or {}
+        for t_name, t_con in tasks.items():
+            task_node = TaskNode("task", t_name)
+            task_node["attributes"]["type"] = t_con.get("type")
+            task_node.parent = node
+        node["children"].extend(children)
+
+    def _set_parent(self, node, parent_id):
+        node.detach()
+        self._parent_ids_by_id[node["id"]] = parent_id
+        parent_node = self._nodes_by_id.get(parent_id)
+        if parent_node is None:
+            parent_node = self.root
+            if parent_id is not None:
+                self._waiting_by_parent_id.setdefault(
+                    parent_id, []).append(node)
+        node.parent = parent_node
+
+    def upsert_asset(self, asset_doc):
+        """Add new asset to tree or update existing node.
+
+        Args:
+            asset_doc (dict): Asset document.
+        """
+        asset_id = asset_doc["_id"]
+        node = self._nodes_by_id.get(asset_id)
+        is_new = node is None
+        if is_new:
+            node = Node(asset_id, "Folder", asset_doc["name"])
+            self._nodes_by_id[asset_id] = node
+
+        node["name"] = asset_doc["name"]
+        node["type"] = asset_doc["data"].get("entityType", "Folder")
+        self._set_tasks(node, asset_doc)
+
+        parent_id = asset_doc["data"].get("visualParent")
+        if is_new or self._parent_ids_by_id.get(asset_id) != parent_id:
+            self._set_parent(node, parent_id)
+
+        if is_new:
+            # Children which were added before this asset
+            for child in self._waiting_by_parent_id.pop(asset_id, []):
+                child_id = child["id"]
+                if (
+                    child_id in self._nodes_by_id
+                    and self._parent_ids_by_id.get(child_id) == asset_id
+                ):
+                    self._set_parent(child, asset_id)
+
+    def remove_asset(self, asset_id):
+        """Remove asset from tree.
+
+        Children of removed asset are moved under project node.
+
+        Args:
+            asset_id (ObjectId): Id of removed asset.
+        """
+        node = self._nodes_by_id.pop(asset_id, None)
+        if node is None:
+            return
+        self._parent_ids_by_id.pop(asset_id, None)
+        node.detach()
+        for child in list(node["children"]):
+            if not isinstance(child, TaskNode):
+                self._set_parent(child, asset_id)
+
+
+class _CachedHierarchy:
+    def __init__(self, project_name):
+        self.project_name = project_name
+        self.lock = threading.Lock()
+        self.hierarchy = None
+        self.version = 0
+        self.body = None
+        self.dirty = False
+        self.loaded_at = 0
+        self.watching = False
+        self.stop_event = threading.Event()
+
+
+class HierarchyCache:
+    """Cache of encoded context trees by project name.
+
+    Methods are blocking and are expected to be called from executor.
+
+    Args:
+        encode_func (Callable[[Any], bytes]): Encode tree to response body.
+        reload_interval (float): Seconds after which is tree reloaded when
+            changes are not received using change stream.
+    """
+
+    def __init__(self, encode_func, reload_interval=60):
+        self._encode_func = encode_func
+        self.reload_interval = reload_interval
+        # Different ETag after server restart
+        self._instance_id = uuid.uuid4().hex[:8]
+        self._items = {}
+        self._items_lock = threading.Lock()
+
+    def _get_item(self, project_name):
+        with self._items_lock:
+            item = self._items.get(project_name)
+            if item is None:
+                item = _CachedHierarchy(project_name)
+                self._items[project_name] = item
+        return item
+
+    def get_etag(self, project_name, version):
+        return '"{}-{}-{}"'.format(self._instance_id, project_name, version)
+
+    def get(self, project_name):
+        """Encoded tree of project with ETag.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            tuple[bytes, str]: Response body and ETag.
+        """
+        item = self._get_item(project_name)
+        with item.lock:
+            if item.hierarchy is None:
+                # Stream is opened before load so no change is missed
+                stream = self._open_stream(item)
+                try:
+                    self._load(item)
+                except Exception:
+                    if stream is not None:
+                        stream.close()
+                    raise
+                if stream is not None:
+                    self._start_watch(item, stream)
+
+            elif (
+                not item.watching
+                and time.time() - item.loaded_at > self.reload_interval
+            ):
+                self._load(item)
+
+            if item.dirty:
+                self._update_body(item, item.hierarchy)
+            return item.body, self.get_etag(project_name, item.version)
+
+    def get_version(self, project_name):
+        """Current version of cached tree or None if is not cached."""
+        item = self._get_item(project_name)
+        if item.hierarchy is None:
+            return None
+        return item.version
+
+    def invalidate(self, project_name=None):
+        """Drop cached trees so they are loaded again on next request."""
+        with self._items_lock:
+            if project_name is None:
+                items = list(self._items.values())
+                self._items = {}
+            else:
+                item = self._items.pop(project_name, None)
+                items = [item] if item else []
+        for item in items:
+            item.stop_event.set()
+
+    def stop(self):
+        self.invalidate()
+
+    def apply_changes(self, project_name, upserted=None, removed_ids=None):
+        """Apply changed assets to cached tree.
+
+        Response body is encoded on next request and version of the tree
+        is changed only if the body changed.
+
+        Args:
+            project_name (str): Project name.
+            upserted (Optional[Iterable[dict]]): Created or changed assets.
+            removed_ids (Optional[Iterable[ObjectId]]): Ids of removed
+                assets.
+        """
+        item = self._get_item(project_name)
+        with item.lock:
+            hierarchy = item.hierarchy
+            if hierarchy is None:
+                return
+            for asset_doc in upserted or []:
+                hierarchy.upsert_asset(asset_doc)
+            for asset_id in removed_ids or []:
+                hierarchy.remove_asset(asset_id)
+            item.dirty = True
+
+    def _update_body(self, item, hierarchy):
+        body = self._encode_func(hierarchy.root)
+        item.hierarchy = hierarchy
+        item.dirty = False
+        if item.body != body:
+            item.body = body
+            item.version += 1
+
+    def _load(self, item):
+        asset_docs = get_assets(item.project_name, fields=ASSET_FIELDS)
+        self._update_body(
+            item, ProjectHierarchy(item.project_name, asset_docs)
+        )
+        item.loaded_at = time.time()
+
+    def _open_stream(self, item):
+        if AYON_SERVER_ENABLED:
+            return None
+
+        from openpype.client.mongo import get_project_connection
+
+        pipeline = [{"$match": {"$or": [
+            {"operationType": "delete"},
+            {"fullDocument.type": {"$in": ["asset", "archived_asset"]}},
+        ]}}]
+        collection = get_project_connection(item.project_name)
+        try:
+            return collection.watch(
+                pipeline,
+                full_document="updateLookup",
+                max_await_time_ms=1000
+            )
+        except pymongo.errors.PyMongoError as exc:
+            log.info((
+                "Change streams are not available ({}),"
+                " hierarchy of '{}' is reloaded after {} seconds."
+            ).format(exc, item.project_name, self.reload_interval))
+        return None
+
+    def _start_watch(self, item, stream):
+        item.watching = True
+        thread = threading.Thread(
+            target=self._watch_changes,
+            args=(item, stream),
+            name="HierarchyWatch-{}".format(item.project_name),
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _watch_changes(self, item, stream):
+        """Apply changes of assets received from change stream."""
+        project_name = item.project_name
+        try:
+            with stream:
+                while stream.alive and not item.stop_event.is_set():
+                    change = stream.try_next()
+                    if change is None:
+                        continue
+
+                    doc = change.get("fullDocument")
+                    if doc is not None and doc.get("type") == "asset":
+                        self.apply_changes(project_name, upserted=[doc])
+                        continue
+
+                    # Deleted or archived
+                    doc_id = change["documentKey"]["_id"]
+                    with item.lock:
+                        hierarchy = item.hierarchy
+                        if hierarchy is None or doc_id not in hierarchy:
+                            continue
+                    self.apply_changes(project_name, removed_ids=[doc_id])
+
+        except pymongo.errors.PyMongoError:
+            log.warning((
+                "Watching of '{}' assets stopped, hierarchy is reloaded"
+                " after {} seconds."
+            ).format(project_name, self.reload_interval), exc_info=True)
+
+        finally:
+            item.watching = False
@@ -2,15 +2,14 @@
 import os
 import json
 import datetime
+import asyncio
 import collections
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from bson.objectid import ObjectId
 from aiohttp.web_response import Response
 
-from openpype.client import (
-    get_projects,
-    get_assets,
-)
+from openpype.client import get_projects
 from openpype.lib import Logger
 from openpype.settings import get_project_settings
 from openpype_modules.webserver.base_routes import RestApiEndpoint
@@ -18,10 +17,15 @@ from openpype_modules.webpublisher import WebpublisherAddon
 from openpype_modules.webpublisher.lib import (
     get_webpublish_conn,
     get_task_data,
+    get_batch_asset_task_info,
+    get_timeout,
     ERROR_STATUS,
     REPROCESS_STATUS
 )
 
+from .hierarchy import HierarchyCache
+from .worker_pool import PoolQueueFull
+
 log = Logger.get_logger("WebpublishRoutes")
 
 
@@ -64,15 +68,23 @@ class JsonApiResource:
 class RestApiResource(JsonApiResource):
     """Resource carrying needed info and Avalon DB connection for publish."""
     def __init__(self, server_manager, executable, upload_dir,
-                 studio_task_queue=None):
+                 studio_task_queue=None, worker_pool=None):
         self.server_manager = server_manager
         self.upload_dir = upload_dir
         self.executable = executable
+        # Warm workers processing 'publish' command
+        self.worker_pool = worker_pool
 
         if studio_task_queue is None:
             studio_task_queue = collections.deque().dequeu
         self.studio_task_queue = studio_task_queue
 
+        # Blocking database queries are processed out of event loop
+        self.executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="WebpublishQuery"
+        )
+        self.hierarchy_cache = HierarchyCache(self.encode)
+
 
 class WebpublishRestApiResource(JsonApiResource):
     """Resource carrying OP DB connection for storing batch info into DB."""
@@ -99,101 +111,37 @@ class ProjectsEndpoint(ResourceRestApiEndpoint):
 
 
 class HiearchyEndpoint(ResourceRestApiEndpoint):
-    """Returns dictionary with context tree from assets."""
-    async def get(self, project_name) -> Response:
-        query_projection = {
-            "_id": 1,
-            "data.tasks": 1,
-            "data.visualParent": 1,
-            "data.entityType": 1,
-            "name": 1,
-            "type": 1,
-        }
+    """Returns dictionary with context tree from assets.
 
-        asset_docs = get_assets(project_name, fields=query_projection.keys())
-        asset_docs_by_id = {
-            asset_doc["_id"]: asset_doc
-            for asset_doc in asset_docs
-        }
-
-        asset_docs_by_parent_id = collections.defaultdict(list)
-        for asset_doc in asset_docs_by_id.values():
-            parent_id = asset_doc["data"].get("visualParent")
-            asset_docs_by_parent_id[parent_id].append(asset_doc)
-
-        assets = collections.defaultdict(list)
-
-        for parent_id, children in asset_docs_by_parent_id.items():
-            for child in children:
-                node = assets.get(child["_id"])
-                if not node:
-                    node = Node(child["_id"],
-                                child["data"].get("entityType", "Folder"),
-                                child["name"])
-                    assets[child["_id"]] = node
-
-                    tasks = child["data"].get("tasks", {})
-                    for t_name, t_con in tasks.items():
-                        task_node = TaskNode("task", t_name)
-                        task_node["attributes"]["type"] = t_con.get("type")
-
-                        task_node.parent = node
-
-                parent_node = assets.get(parent_id)
-                if not parent_node:
-                    asset_doc = asset_docs_by_id.get(parent_id)
-                    if asset_doc:  # regular node
-                        parent_node = Node(parent_id,
-                                           asset_doc["data"].get("entityType",
-                                                                 "Folder"),
-                                           asset_doc["name"])
-                    else:  # root
-                        parent_node = Node(parent_id,
-                                           "project",
-                                           project_name)
-                    assets[parent_id] = parent_node
-                node.parent = parent_node
-
-        roots = [x for x in assets.values() if x.parent is None]
+    Tree is cached and its version is sent as 'ETag' header. Response
+    without body with status 304 is returned when tree did not change
+    since version in 'If-None-Match' header.
+    """
+    async def get(self, request, project_name) -> Response:
+        loop = asyncio.get_running_loop()
+        body, etag = await loop.run_in_executor(
+            self.resource.executor,
+            self.resource.hierarchy_cache.get,
+            project_name
+        )
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            client_etags = {
+                value.strip().replace("W/", "", 1)
+                for value in if_none_match.split(",")
+            }
+            if etag in client_etags or "*" in client_etags:
+                return Response(status=304, headers=headers)
 
         return Response(
             status=200,
-            body=self.resource.encode(roots[0]),
+            body=body,
+            headers=headers,
             content_type="application/json"
         )
 
 
-class Node(dict):
-    """Node element in context tree."""
-
-    def __init__(self, uid, node_type, name):
-        self._parent = None  # pointer to parent Node
-        self["type"] = node_type
-        self["name"] = name
-        self['id'] = uid  # keep reference to id #
-        self['children'] = []  # collection of pointers to child Nodes
-
-    @property
-    def parent(self):
-        return self._parent  # simply return the object at the _parent pointer
-
-    @parent.setter
-    def parent(self, node):
-        self._parent = node
-        # add this node to parent's list of children
-        node['children'].append(self)
-
-
-class TaskNode(Node):
-    """Special node type only for Tasks."""
-
-    def __init__(self, node_type, name):
-        self._parent = None
-        self["type"] = node_type
-        self["name"] = name
-        self["attributes"] = {}
-
-
 class BatchPublishEndpoint(WebpublishApiEndpoint):
     """Triggers headless publishing of batch."""
     async def post(self, request) -> Response:
@@ -289,6 +237,33 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
             for item in value:
                 args += [arg_key, item]
 
+        worker_pool = self.resource.worker_pool
+        if command == "publish" and worker_pool is not None:
+            try:
+                job_id = worker_pool.submit(
+                    add_args["project"],
+                    batch_dir,
+                    add_args["user"],
+                    add_args["targets"],
+                    timeout=self._get_batch_timeout(
+                        add_args["project"], batch_dir
+                    )
+                )
+            except PoolQueueFull as exc:
+                log.warning(str(exc))
+                return Response(
+                    status=503,
+                    headers={"Retry-After": "30"},
+                    body=self.resource.encode({"msg": str(exc)}),
+                    content_type="application/json"
+                )
+            log.info("Batch {} queued as job {}".format(batch_dir, job_id))
+            return Response(
+                status=200,
+                body=self.resource.encode({"job_id": job_id}),
+                content_type="application/json"
+            )
+
         log.info("args:: {}".format(args))
         if add_to_queue:
             log.debug("Adding to queue")
@@ -301,6 +276,42 @@ class BatchPublishEndpoint(WebpublishApiEndpoint):
             content_type="application/json"
         )
 
+    @staticmethod
+    def _get_batch_timeout(project_name, batch_dir):
+        """Timeout of batch from webpublisher 'timeout_profiles' settings.
+
+        Returns:
+            Union[int, None]: Timeout in seconds or None if batch context
+                can't be parsed (batch fails in worker).
+        """
+        try:
+            task_data = get_task_data(batch_dir)
+            _, _, task_type = get_batch_asset_task_info(task_data["context"])
+            return get_timeout(project_name, "webpublisher", task_type)
+        except Exception:
+            log.warning(
+                "Failed to get timeout of batch {}".format(batch_dir),
+                exc_info=True
+            )
+        return None
+
+
+class WorkerPoolEndpoint(ResourceRestApiEndpoint):
+    """Returns utilisation of publish workers."""
+    async def get(self) -> Response:
+        worker_pool = self.resource.worker_pool
+        if worker_pool is None:
+            output = {"msg": "Publish workers are not used"}
+            status = 404
+        else:
+            output = worker_pool.get_status()
+            status = 200
+        return Response(
+            status=status,
+            body=self.resource.encode(output),
+            content_type="application/json"
+        )
+
 
 class TaskPublishEndpoint(WebpublishApiEndpoint):
     """Prepared endpoint triggered after each task - for future development."""
@@ -11,6 +11,8 @@ from openpype.modules import ModulesManager
 from openpype.lib import Logger
 
 from openpype_modules.webpublisher.lib import (
+    get_webpublish_conn,
+    fail_unfinished_batch,
     ERROR_STATUS,
     REPROCESS_STATUS,
     SENT_REPROCESSING_STATUS
@@ -26,14 +28,43 @@ from .webpublish_routes import (
     BatchReprocessEndpoint,
     BatchStatusEndpoint,
     TaskPublishEndpoint,
-    UserReportEndpoint
+    UserReportEndpoint,
+    WorkerPoolEndpoint
 )
+from .worker_pool import PublishWorkerPool
 
 log = Logger.get_logger("webserver_gui")
 
 
-def run_webserver(executable, upload_dir, host=None, port=None):
-    """Runs webserver in command line, adds routes."""
+def run_webserver(
+    executable,
+    upload_dir,
+    host=None,
+    port=None,
+    workers=2,
+    queue_size=20,
+    max_jobs_per_worker=None,
+    max_worker_rss=None,
+    job_timeout=3600
+):
+    """Runs webserver in command line, adds routes.
+
+    Args:
+        executable (str): OpenPype executable used to process batches.
+        upload_dir (str): Directory with uploaded batches.
+        host (Optional[str]): Host of server.
+        port (Optional[int]): Port of server.
+        workers (int): Number of warm publish workers. Process is started
+            for each batch if is 0.
+        queue_size (int): Number of batches waiting for publish worker.
+        max_jobs_per_worker (Optional[int]): Publish worker is restarted
+            after processing the number of batches.
+        max_worker_rss (Optional[int]): Publish worker is restarted when its
+            peak memory is above the value in MB.
+        job_timeout (Optional[int]): Publish worker is killed when batch
+            takes longer (seconds). Used for batches without matching
+            webpublisher 'timeout_profiles' settings.
+    """
 
     if not host:
         host = "localhost"
@@ -48,10 +79,24 @@ def run_webserver(executable, upload_dir, host=None, port=None):
     # queue for publishfromapp tasks
     studio_task_queue = collections.deque()
 
+    worker_pool = None
+    if workers:
+        worker_pool = PublishWorkerPool(
+            [executable, "module", "webpublisher", "publish_worker"],
+            max_workers=workers,
+            queue_size=queue_size,
+            max_jobs_per_worker=max_jobs_per_worker,
+            max_rss=(max_worker_rss or 0) * 1024 * 1024,
+            job_timeout=job_timeout,
+            on_result=_on_publish_result,
+        )
+        worker_pool.start()
+
     resource = RestApiResource(server_manager,
                                upload_dir=upload_dir,
                                executable=executable,
-                               studio_task_queue=studio_task_queue)
+                               studio_task_queue=studio_task_queue,
+                               worker_pool=worker_pool)
     projects_endpoint = ProjectsEndpoint(resource)
     server_manager.add_route(
         "GET",
@@ -88,6 +133,13 @@ def run_webserver(executable, upload_dir, host=None, port=None):
         webpublisher_batch_publish_endpoint.dispatch
     )
 
+    worker_pool_endpoint = WorkerPoolEndpoint(resource)
+    server_manager.add_route(
+        "GET",
+        "/api/webpublish/workers",
+        worker_pool_endpoint.dispatch
+    )
+
     # reporting
     webpublish_resource = WebpublishRestApiResource()
     batch_status_endpoint = BatchStatusEndpoint(webpublish_resource)
@@ -113,15 +165,34 @@ def run_webserver(executable, upload_dir, host=None, port=None):
 
     server_manager.start_server()
     last_reprocessed = time.time()
-    while True:
-        if time.time() - last_reprocessed > 20:
-            reprocess_failed(upload_dir, webserver_url)
-            last_reprocessed = time.time()
-        if studio_task_queue:
-            args = studio_task_queue.popleft()
-            subprocess.call(args)  # blocking call
-
-        time.sleep(1.0)
+    try:
+        while True:
+            if time.time() - last_reprocessed > 20:
+                reprocess_failed(upload_dir, webserver_url)
+                last_reprocessed = time.time()
+            if studio_task_queue:
+                args = studio_task_queue.popleft()
+                subprocess.call(args)  # blocking call
+
+            time.sleep(1.0)
+    finally:
+        if worker_pool is not None:
+            worker_pool.stop()
+
+
+def _on_publish_result(job, result):
+    """Fail record of batch which publish worker did not finish."""
+    if result["success"]:
+        return
+
+    batch_id = os.path.basename(os.path.normpath(job["path"]))
+    fail_unfinished_batch(
+        get_webpublish_conn(),
+        batch_id,
+        job["user"],
+        result["error"],
+        since=datetime.fromtimestamp(job["submitted"])
+    )
 
 
 def reprocess_failed(upload_dir, webserver_url):
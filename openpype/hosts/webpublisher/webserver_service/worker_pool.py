@@ -0,0 +1,376 @@
+"""Pool of warm publish workers for webpublisher batches.
+
+Each worker is a long living process started with 'publish_worker' command
+which has modules and settings already loaded. Batches wait in a bounded
+queue for a free worker and new batches are refused when the queue is full
+so the server is not overloaded by spawned processes.
+
+Workers are restarted after processing 'max_jobs_per_worker' batches or when
+their peak memory reaches 'max_rss'. Crashed workers are started again and
+workers processing a job longer than its timeout are killed.
+"""
+import json
+import time
+import uuid
+import queue
+import threading
+import subprocess
+
+from openpype.lib import Logger
+
+log = Logger.get_logger("WebpublishWorkerPool")
+
+
+class PoolQueueFull(Exception):
+    """Queue of worker pool is full and batch can't be accepted."""
+
+
+class _WorkerProcess:
+    def __init__(self, slot, process):
+        self.slot = slot
+        self.process = process
+        self.pid = process.pid
+        self.started = time.time()
+        self.jobs_done = 0
+        self.peak_rss = None
+        self.job = None
+        self.busy_since = None
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def to_data(self):
+        job_id = None
+        if self.job is not None:
+            job_id = self.job["id"]
+        return {
+            "slot": self.slot,
+            "pid": self.pid,
+            "started": self.started,
+            "jobs_done": self.jobs_done,
+            "peak_rss": self.peak_rss,
+            "job_id": job_id,
+            "busy_since": self.busy_since,
+        }
+
+
+class PublishWorkerPool:
+    """Warm publish worker processes taking batches from bounded queue.
+
+    Args:
+        args (list[str]): Command starting worker process.
+        max_workers (int): Number of concurrently running workers.
+        queue_size (int): Maximum number of waiting jobs.
+        max_jobs_per_worker (Optional[int]): Restart worker after number of
+            processed jobs.
+        max_rss (Optional[int]): Restart worker when its peak memory is
+            above the value in bytes.
+        job_timeout (Optional[float]): Kill worker when job takes longer,
+            used for jobs submitted without timeout.
+        env (Optional[dict[str, str]]): Environment of worker processes.
+        on_result (Optional[Callable[[dict, dict], None]]): Called with job
+            and its result when job is done.
+    """
+
+    def __init__(
+        self,
+        args,
+        max_workers=2,
+        queue_size=20,
+        max_jobs_per_worker=None,
+        max_rss=None,
+        job_timeout=None,
+        env=None,
+        on_result=None
+    ):
+        self.args = list(args)
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss = max_rss
+        self.job_timeout = job_timeout
+        self.env = env
+        self.on_result = on_result
+        self.restart_delay = 5
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._workers = {}
+        self._lock = threading.Lock()
+        self._counts = {
+            "submitted": 0,
+            "refused": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "recycled": 0,
+            "crashed": 0,
+        }
+
+    def start(self):
+        """Start workers so they are warm before first job arrives."""
+        for slot in range(self.max_workers):
+            thread = threading.Thread(
+                target=self._slot_loop,
+                args=(slot, ),
+                name="WebpublishWorker-{}".format(slot),
+            )
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=10):
+        """Stop workers after their current job.
+
+        Workers which are still busy after timeout are killed.
+        """
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        with self._lock:
+            workers = list(self._workers.values())
+        for worker in workers:
+            if worker.is_alive():
+                worker.process.kill()
+
+    def submit(
+        self, project_name, batch_path, user_email, targets=None, timeout=None
+    ):
+        """Add job to queue.
+
+        Args:
+            project_name (str): Project of batch.
+            batch_path (str): Path to batch directory.
+            user_email (str): Email of user publishing the batch.
+            targets (Optional[list[str]]): Pyblish targets.
+            timeout (Optional[float]): Kill worker when job takes longer,
+                'job_timeout' of pool is used if not passed.
+
+        Returns:
+            str: Id of job.
+
+        Raises:
+            PoolQueueFull: When queue is full.
+        """
+        job = {
+            "id": uuid.uuid4().hex,
+            "project": project_name,
+            "path": batch_path,
+            "user": user_email,
+            "targets": list(targets or []),
+            "timeout": timeout or self.job_timeout,
+            "submitted": time.time(),
+            "timed_out": False,
+        }
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            self._increment("refused")
+            raise PoolQueueFull(
+                "Queue of publish workers is full ({} batches)".format(
+                    self.queue_size
+                )
+            )
+        self._increment("submitted")
+        return job["id"]
+
+    def get_status(self):
+        """Utilisation of pool.
+
+        Returns:
+            dict[str, Any]: Counts of jobs and state of each worker.
+        """
+        with self._lock:
+            workers = [
+                worker.to_data()
+                for _, worker in sorted(self._workers.items())
+            ]
+            output = dict(self._counts)
+        busy = len([worker for worker in workers if worker["job_id"]])
+        output.update({
+            "max_workers": self.max_workers,
+            "running_workers": len(workers),
+            "busy_workers": busy,
+            "utilisation": float(busy) / self.max_workers,
+            "queued": self._queue.qsize(),
+            "queue_size": self.queue_size,
+            "workers": workers,
+        })
+        return output
+
+    def _increment(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def _spawn(self, slot):
+        process = subprocess.Popen(
+            self.args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=self.env,
+            universal_newlines=True,
+            bufsize=1,
+        )
+        worker = _WorkerProcess(slot, process)
+        message = self._read_message(worker)
+        if message is None or message.get("type") != "ready":
+            self._stop_worker(worker)
+            raise RuntimeError(
+                "Publish worker {} did not start".format(worker.pid)
+            )
+        log.info("Publish worker {} started".format(worker.pid))
+        with self._lock:
+            self._workers[slot] = worker
+        return worker
+
+    def _read_message(self, worker):
+        line = worker.process.stdout.readline()
+        if not line:
+            return None
+        return json.loads(line)
+
+    def _stop_worker(self, worker, timeout=10):
+        with self._lock:
+            if self._workers.get(worker.slot) is worker:
+                self._workers.pop(worker.slot)
+
+        process = worker.process
+        if process.poll() is None:
+            try:
+                process.stdin.write("\n")
+                process.stdin.flush()
+            except (OSError, ValueError):
+                pass
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        for stream in (process.stdin, process.stdout):
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+
+    def _should_recycle(self, worker):
+        if (
+            self.max_jobs_per_worker
+            and worker.jobs_done >= self.max_jobs_per_worker
+        ):
+            return True
+        return bool(
+            self.max_rss
+            and worker.peak_rss
+            and worker.peak_rss >= self.max_rss
+        )
+
+    def _slot_loop(self, slot):
+        worker = None
+        while not self._stop_event.is_set():
+            if worker is None or not worker.is_alive():
+                if worker is not None:
+                    self._stop_worker(worker)
+                try:
+                    worker = self._spawn(slot)
+                except Exception:
+                    log.warning(
+                        "Failed to start publish worker", exc_info=True
+                    )
+                    worker = None
+                    self._stop_event.wait(self.restart_delay)
+                    continue
+
+            try:
+                job = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            result = self._process_job(worker, job)
+            if result is None:
+                self._increment("crashed")
+                if job["timed_out"]:
+                    error = (
+                        "Publish worker {} was killed after timeout {}s"
+                    ).format(worker.pid, job["timeout"])
+                else:
+                    error = "Publish worker {} crashed".format(worker.pid)
+                result = {"success": False, "error": error}
+                self._stop_worker(worker)
+            self._increment("succeeded" if result["success"] else "failed")
+            if not result["success"]:
+                log.warning("Publish of {} failed: {}".format(
+                    job["path"], result["error"]
+                ))
+            if self.on_result is not None:
+                try:
+                    self.on_result(job, result)
+                except Exception:
+                    log.warning("Result callback failed", exc_info=True)
+
+            if not worker.is_alive():
+                worker = None
+
+            elif self._should_recycle(worker):
+                log.info("Recycling publish worker {} ({} jobs)".format(
+                    worker.pid, worker.jobs_done
+                ))
+                self._increment("recycled")
+                self._stop_worker(worker)
+                worker = None
+
+        if worker is not None:
+            self._stop_worker(worker)
+
+    def _kill_on_timeout(self, worker, job):
+        log.warning("Publish of {} timed out after {}s".format(
+            job["path"], job["timeout"]
+        ))
+        job["timed_out"] = True
+        worker.process.kill()
+
+    def _process_job(self, worker, job):
+        """Send job to worker and wait for result.
+
+        Returns:
+            Union[dict[str, Any], None]: Result or None when worker ended
+                before result was received.
+        """
+        data = {
+            key: job[key]
+            for key in ("id", "project", "path", "user", "targets")
+        }
+        worker.job = job
+        worker.busy_since = time.time()
+        timer = None
+        if job["timeout"]:
+            timer = threading.Timer(
+                job["timeout"], self._kill_on_timeout, args=(worker, job)
+            )
+            timer.daemon = True
+            timer.start()
+        try:
+            worker.process.stdin.write(json.dumps(data) + "\n")
+            worker.process.stdin.flush()
+            while True:
+                message = self._read_message(worker)
+                if message is None or message.get("type") == "result":
+                    break
+
+        except (OSError, ValueError):
+            log.warning("Communication with publish worker {} failed".format(
+                worker.pid
+            ), exc_info=True)
+            message = None
+
+        finally:
+            if timer is not None:
+                timer.cancel()
+            worker.job = None
+            worker.busy_since = None
+
+        if message is None:
+            return None
+        worker.jobs_done += 1
+        worker.peak_rss = message.get("peak_rss")
+        return message
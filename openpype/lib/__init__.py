@@ -150,11 +150,19 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    create_reflink,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
 )
 
+from .file_sequences import (
+    FileSequence,
+    assemble_sequences,
+    scan_directory,
+    clear_scan_cache,
+)
+
 from .openpype_version import (
     op_version_control_available,
     get_openpype_version,
@@ -266,10 +274,16 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "create_reflink",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
 
+    "FileSequence",
+    "assemble_sequences",
+    "scan_directory",
+    "clear_scan_cache",
+
     "merge_dict",
     "TemplateMissingKey",
     "TemplateUnsolved",
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""Discovery of file sequences in directories and lists of files.
+
+Frame of a file is the last group of digits in the file name which is
+followed only by non-digit characters or by extensions (e.g. '.mp4').
+Files with the same head, tail and padding of the frame create a sequence.
+
+Sequence is stored as list of frame ranges so checks for gaps and for
+frames are cheap even for sequences with many frames.
+
+Directories are listed with a single 'os.scandir' call and the result is
+cached until modification time of the directory changes.
+"""
+import os
+import re
+import time
+import bisect
+import threading
+import collections
+
+import clique
+
+FRAME_REGEX = re.compile(
+    r"^(?P<head>.*?)(?P<frame>\d+)(?P<tail>\D*(?:\.\w*[^\W\d]\w*)*)$"
+)
+
+
+class FileSequence(object):
+    """Sequence of files with the same head, tail and frame padding.
+
+    Sequence should be treated as immutable, it may be shared by cache.
+
+    Args:
+        head (str): Part of file name before frame.
+        tail (str): Part of file name after frame.
+        padding (int): Padding of frame, 0 when frames are not padded.
+        frames (Iterable[int]): Frames of sequence.
+    """
+
+    def __init__(self, head, tail, padding, frames):
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+
+        ranges = []
+        count = 0
+        for frame in sorted(set(frames)):
+            count += 1
+            if ranges and ranges[-1][1] == frame - 1:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+        self._ranges = [tuple(frame_range) for frame_range in ranges]
+        self._range_starts = [frame_range[0] for frame_range in ranges]
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """File names of sequence sorted by frame."""
+        for frame in self.frames:
+            yield self.get_file_name(frame)
+
+    def __contains__(self, frame):
+        idx = bisect.bisect_right(self._range_starts, frame) - 1
+        return idx >= 0 and frame <= self._ranges[idx][1]
+
+    def __repr__(self):
+        return "<{} '{}'>".format(self.__class__.__name__, self.format())
+
+    @property
+    def pattern(self):
+        """File name with frame replaced by '%d' or '%0Xd' for padding."""
+        if self.padding:
+            frame_format = "%0{}d".format(self.padding)
+        else:
+            frame_format = "%d"
+        return "{}{}{}".format(
+            self.head.replace("%", "%%"),
+            frame_format,
+            self.tail.replace("%", "%%")
+        )
+
+    @property
+    def ranges(self):
+        """Ranges of frames as list of inclusive (start, end) tuples."""
+        return list(self._ranges)
+
+    @property
+    def start(self):
+        return self._ranges[0][0]
+
+    @property
+    def end(self):
+        return self._ranges[-1][1]
+
+    @property
+    def frames(self):
+        """Frames of sequence in ascending order."""
+        for start, end in self._ranges:
+            for frame in range(start, end + 1):
+                yield frame
+
+    @property
+    def has_gaps(self):
+        return len(self._ranges) > 1
+
+    def get_missing_frames(self, start=None, end=None):
+        """Frames missing in sequence between start and end.
+
+        Args:
+            start (Optional[int]): First expected frame, first frame of
+                sequence is used if not passed.
+            end (Optional[int]): Last expected frame, last frame of
+                sequence is used if not passed.
+
+        Returns:
+            list[int]: Missing frames in ascending order.
+        """
+        if start is None:
+            start = self.start
+        if end is None:
+            end = self.end
+
+        missing = []
+        current = start
+        for range_start, range_end in self._ranges:
+            if range_end < current:
+                continue
+            if range_start > end:
+                break
+            missing.extend(range(current, min(range_start, end + 1)))
+            current = range_end + 1
+        missing.extend(range(current, end + 1))
+        return missing
+
+    def format_frame(self, frame):
+        """Frame as string with padding of sequence."""
+        return str(frame).zfill(self.padding)
+
+    def get_file_name(self, frame):
+        return "{}{}{}".format(self.head, self.format_frame(frame), self.tail)
+
+    def format(self):
+        """Pattern with frame ranges, e.g. 'render.%04d.exr [1-10, 12]'."""
+        ranges = []
+        for start, end in self._ranges:
+            if start == end:
+                ranges.append(str(start))
+            else:
+                ranges.append("{}-{}".format(start, end))
+        return "{} [{}]".format(self.pattern, ", ".join(ranges))
+
+    def to_clique(self):
+        """Sequence as 'clique.Collection'."""
+        return clique.Collection(
+            self.head, self.tail, self.padding, indexes=set(self.frames)
+        )
+
+
+def _get_padding(frame_str):
+    if len(frame_str) > 1 and frame_str[0] == "0":
+        return len(frame_str)
+    return 0
+
+
+def assemble_sequences(file_names, minimum_items=2, frame_regex=None):
+    """Find sequences in file names.
+
+    Unpadded frames are added to padded sequence with the same head and tail
+    when they have the same length as the padding (e.g. '1001' to '0999').
+
+    Args:
+        file_names (Iterable[str]): File names or paths.
+        minimum_items (int): Minimum number of files in sequence.
+        frame_regex (Optional[re.Pattern]): Regex with 'head', 'frame' and
+            'tail' groups. 'FRAME_REGEX' is used if not passed.
+
+    Returns:
+        tuple[list[FileSequence], list[str]]: Sequences and file names
+            which are not part of any sequence.
+    """
+    if frame_regex is None:
+        frame_regex = FRAME_REGEX
+
+    match_func = frame_regex.match
+    frames_by_key = collections.defaultdict(set)
+    remainder = []
+    for file_name in set(file_names):
+        result = match_func(file_name)
+        if result is None:
+            remainder.append(file_name)
+            continue
+        head, frame_str, tail = result.group("head", "frame", "tail")
+        frames_by_key[(head, tail, _get_padding(frame_str))].add(
+            int(frame_str)
+        )
+
+    # Move unpadded frames with length of padding to padded sequence
+    for key, frames in list(frames_by_key.items()):
+        head, tail, padding = key
+        if not padding:
+            continue
+        unpadded = frames_by_key.get((head, tail, 0))
+        if not unpadded:
+            continue
+        matching = {
+            frame
+            for frame in unpadded
+            if len(str(frame)) == padding
+        }
+        if matching:
+            frames |= matching
+            unpadded -= matching
+
+    sequences = []
+    for key, frames in frames_by_key.items():
+        if not frames:
+            continue
+        sequence = FileSequence(key[0], key[1], key[2], frames)
+        if len(sequence) < minimum_items:
+            remainder.extend(sequence)
+        else:
+            sequences.append(sequence)
+
+    sequences.sort(key=lambda seq: (seq.head, seq.tail, seq.padding))
+    remainder.sort()
+    return sequences, remainder
+
+
+class _ScanCache(object):
+    """Results of directory scans by modification time of directory."""
+
+    # Directory modified more recently can still change within the same
+    #   modification time (filesystems with coarse timestamps)
+    racy_interval = 2
+    max_items = 256
+
+    def __init__(self):
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, mtime):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] != mtime:
+                return None
+            self._items.pop(key)
+            self._items[key] = item
+            return item[1]
+
+    def set(self, key, mtime, value):
+        if time.time() - mtime / 1e9 < self.racy_interval:
+            return
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (mtime, value)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_scan_cache = _ScanCache()
+
+
+def scan_directory(
+    dir_path, minimum_items=2, frame_regex=None, use_cache=True
+):
+    """Find sequences of files in directory.
+
+    Args:
+        dir_path (str): Path to directory.
+        minimum_items (int): Minimum number of files in sequence.
+        frame_regex (Optional[re.Pattern]): Regex with 'head', 'frame' and
+            'tail' groups. 'FRAME_REGEX' is used if not passed.
+        use_cache (bool): Use result of previous scan if directory did not
+            change.
+
+    Returns:
+        tuple[list[FileSequence], list[str]]: Sequences and names of files
+            which are not part of any sequence.
+    """
+    if frame_regex is None:
+        frame_regex = FRAME_REGEX
+
+    dir_path = os.path.abspath(dir_path)
+    key = (os.path.normcase(dir_path), frame_regex.pattern, minimum_items)
+    mtime = os.stat(dir_path).st_mtime_ns
+    if use_cache:
+        cached = _scan_cache.get(key, mtime)
+        if cached is not None:
+            sequences, remainder = cached
+            return list(sequences), list(remainder)
+
+    with os.scandir(dir_path) as scanned:
+        file_names = [entry.name for entry in scanned if entry.is_file()]
+
+    sequences, remainder = assemble_sequences(
+        file_names, minimum_items, frame_regex
+    )
+    _scan_cache.set(key, mtime, (sequences, remainder))
+    return list(sequences), list(remainder)
+
+
+def clear_scan_cache():
+    """Drop cached results of directory scans."""
+    _scan_cache.clear()
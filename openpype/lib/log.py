@@ -12,6 +12,7 @@ Best place for it is in ``repos/pype-config/environments/global.json``
 """
 
 
+import atexit
 import datetime
 import getpass
 import logging
@@ -23,6 +24,9 @@ import time
 import traceback
 import threading
 import copy
+import collections
+
+from six.moves import queue
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
@@ -162,7 +166,7 @@ class MongoFormatter(logging.Formatter):
             'method': record.funcName,
             'lineNumber': record.lineno
         }
-        document.update(Logger.get_process_data())
+        document.update(Logger.get_process_data(copy_data=False))
 
         # Standard document decorated with exception info
         if record.exc_info is not None:
@@ -182,6 +186,269 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class BufferedMongoHandler(logging.Handler):
+    """Handler storing log records to mongo in batches from a thread.
+
+    Records are formatted to documents in the emitting thread and put into
+    a bounded queue. Background thread takes documents from the queue and
+    stores them with 'insert_many' when 'batch_size' documents are collected
+    or when 'flush_interval' seconds passed from the first document in batch.
+
+    Emitting never blocks. When the queue is full (database is lagging or
+    is not reachable) documents are appended to a spill file if is set,
+    otherwise they're dropped. Batches which failed to be inserted are
+    handled the same way.
+
+    Closing waits at most 'close_timeout' seconds for background thread.
+    Documents which are not stored by then, or all remaining documents if
+    last insertion failed, are spilled without waiting for database.
+
+    Args:
+        database_name (str): Name of database where logs are stored.
+        collection_name (str): Name of collection where logs are stored.
+        formatter (Optional[logging.Formatter]): Formatter converting records
+            to documents. 'MongoFormatter' is used by default.
+        batch_size (Optional[int]): Max number of documents inserted at once.
+        flush_interval (Optional[float]): Max time in seconds a document
+            waits in queue before it is inserted.
+        max_queue_size (Optional[int]): Max number of documents waiting
+            for insertion.
+        spill_filepath (Optional[str]): Path to file where documents which
+            could not be stored to database are appended as json lines.
+    """
+
+    default_batch_size = 100
+    default_flush_interval = 1.0
+    default_max_queue_size = 10000
+    # Insert to unreachable database blocks for server selection timeout
+    close_timeout = 5.0
+
+    def __init__(
+        self,
+        database_name,
+        collection_name,
+        formatter=None,
+        batch_size=None,
+        flush_interval=None,
+        max_queue_size=None,
+        spill_filepath=None
+    ):
+        super(BufferedMongoHandler, self).__init__()
+        if formatter is None:
+            formatter = MongoFormatter()
+        if batch_size is None:
+            batch_size = self.default_batch_size
+        if flush_interval is None:
+            flush_interval = self.default_flush_interval
+        if max_queue_size is None:
+            max_queue_size = self.default_max_queue_size
+
+        self.setFormatter(formatter)
+
+        self._database_name = database_name
+        self._collection_name = collection_name
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval = float(flush_interval)
+        self._spill_filepath = spill_filepath
+        self._spill_lock = threading.Lock()
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._counters = collections.Counter()
+        self._counters_lock = threading.Lock()
+        self._collection = None
+        self._last_insert_failed = False
+
+        self._thread = threading.Thread(
+            target=self._worker_loop,
+            name="BufferedMongoHandler"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def queued_count(self):
+        """Number of documents waiting in queue for insertion."""
+        return self._queue.qsize()
+
+    @property
+    def dropped_count(self):
+        """Number of documents that were not stored anywhere."""
+        return self._counters["dropped"]
+
+    def get_stats(self):
+        """Counters of handler.
+
+        Returns:
+            dict[str, int]: Count of queued, inserted, spilled and dropped
+                documents and number of failed insertions.
+        """
+        with self._counters_lock:
+            output = {
+                key: self._counters[key]
+                for key in ("inserted", "spilled", "dropped", "failed")
+            }
+        output["queued"] = self.queued_count
+        return output
+
+    def _add_count(self, key, count=1):
+        with self._counters_lock:
+            self._counters[key] += count
+
+    def emit(self, record):
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            self._store_unprocessed([document])
+
+    def flush(self):
+        """Process queued documents and wait until are all processed."""
+        if self._thread.is_alive():
+            self._wake_up()
+            self._queue.join()
+
+    def close(self):
+        """Stop background thread and process remaining documents.
+
+        Documents which were not processed in 'close_timeout' are spilled.
+        """
+        if not self._stop_event.is_set():
+            self._stop_event.set()
+            self._wake_up()
+            self._thread.join(self.close_timeout)
+            self._spill_queued()
+        super(BufferedMongoHandler, self).close()
+
+    def _spill_queued(self):
+        """Spill documents left in queue without waiting for database."""
+        documents = []
+        while True:
+            try:
+                document = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if document is not None:
+                documents.append(document)
+            self._queue.task_done()
+
+        if documents:
+            self._store_unprocessed(documents)
+
+    def _wake_up(self):
+        """Stop waiting for more documents in background thread."""
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            # Thread is not waiting if queue is full
+            pass
+
+    def _get_collection(self):
+        if self._collection is None:
+            client = Logger.get_log_mongo_connection()
+            database = client[self._database_name]
+            self._collection = database[self._collection_name]
+        return self._collection
+
+    def _worker_loop(self):
+        while True:
+            batch = self._collect_batch()
+            if batch:
+                if self._stop_event.is_set() and self._last_insert_failed:
+                    # Closing - don't wait for database which is failing
+                    self._store_unprocessed(batch)
+                else:
+                    self._insert_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+            elif self._stop_event.is_set():
+                break
+
+    def _collect_batch(self):
+        """Wait for documents and return them in a batch.
+
+        Waits until first document is available then collects more documents
+        until batch is full or flush interval has passed.
+        """
+        batch = []
+        timeout = self._flush_interval
+        while len(batch) < self._batch_size:
+            if self._stop_event.is_set():
+                # Take what is available without waiting
+                try:
+                    document = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if document is None:
+                    self._queue.task_done()
+                else:
+                    batch.append(document)
+                continue
+
+            start = time.time()
+            try:
+                document = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if document is None:
+                # Sentinel from 'flush' or 'close' - don't wait for more
+                self._queue.task_done()
+                break
+            batch.append(document)
+
+            if len(batch) == 1:
+                # Flush interval starts with first document of the batch
+                timeout = self._flush_interval
+            else:
+                timeout -= time.time() - start
+            if timeout <= 0:
+                break
+        return batch
+
+    def _insert_batch(self, batch):
+        try:
+            self._get_collection().insert_many(batch, ordered=False)
+            self._add_count("inserted", len(batch))
+            self._last_insert_failed = False
+
+        except Exception:
+            self._last_insert_failed = True
+            self._add_count("failed")
+            self._store_unprocessed(batch)
+
+    def _store_unprocessed(self, documents):
+        """Spill documents to file or drop them."""
+        if self._spill_filepath:
+            try:
+                self._spill_documents(documents)
+                self._add_count("spilled", len(documents))
+                return
+            except Exception:
+                pass
+        self._add_count("dropped", len(documents))
+
+    def _spill_documents(self, documents):
+        from bson import json_util
+
+        lines = [
+            json_util.dumps(document) + "\n"
+            for document in documents
+        ]
+        with self._spill_lock:
+            dirpath = os.path.dirname(self._spill_filepath)
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+            with open(self._spill_filepath, "a") as stream:
+                stream.writelines(lines)
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -207,6 +474,10 @@ class Logger:
     use_mongo_logging = None
     mongo_process_id = None
 
+    # Buffered mongo handler shared by all loggers in process
+    _mongo_handler = None
+    _mongo_handler_lock = threading.Lock()
+
     # Backwards compatibility - was used in start.py
     # TODO remove when all old builds are replaced with new one
     #   not using 'log_mongo_url_components'
@@ -238,7 +509,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (MongoHandler, BufferedMongoHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -285,22 +556,23 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
+        with cls._mongo_handler_lock:
+            if cls._mongo_handler is None:
+                cls._mongo_handler = BufferedMongoHandler(
+                    cls.log_database_name,
+                    cls.log_collection_name,
+                    spill_filepath=(
+                        os.environ.get("OPENPYPE_LOG_SPILL_FILEPATH") or None
+                    )
+                )
+                atexit.register(cls._close_mongo_handler)
+        return cls._mongo_handler
 
-        return MongoHandler(**kwargs)
+    @classmethod
+    def _close_mongo_handler(cls):
+        handler = cls._mongo_handler
+        if handler is not None:
+            handler.close()
 
     @classmethod
     def _get_console_handler(cls):
@@ -381,12 +653,18 @@ class Logger:
         cls.initialized = True
 
     @classmethod
-    def get_process_data(cls):
+    def get_process_data(cls, copy_data=True):
         """Data about current process which should be same for all records.
 
         Process data are used for each record sent to mongo database.
+
+        Args:
+            copy_data (Optional[bool]): Return deep copy of the data. Pass
+                'False' only if returned data are not modified.
         """
         if cls.process_data is not None:
+            if not copy_data:
+                return cls.process_data
             return copy.deepcopy(cls.process_data)
 
         if not cls.initialized:
@@ -408,6 +686,8 @@ class Logger:
             "system_name": platform.system(),
             "process_name": process_name
         }
+        if not copy_data:
+            return cls.process_data
         return copy.deepcopy(cls.process_data)
 
     @classmethod
@@ -1,5 +1,6 @@
 import os
 import re
+import errno
 import logging
 import platform
 
@@ -65,6 +66,81 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+# 'FICLONE' ioctl request code on Linux ('_IOW(0x94, 9, int)')
+_LINUX_FICLONE = 0x40049409
+
+
+def create_reflink(src_path, dst_path):
+    """Create reflink (copy-on-write clone) of file.
+
+    Reflinks share data blocks with source file until one of them is
+    modified. Supported only on filesystems with copy-on-write support
+    (e.g. Btrfs or XFS on Linux, APFS on macOS).
+
+    Args:
+        src_path(str): Full path to a file which is used as source for
+            reflink.
+        dst_path(str): Full path to a file where a clone of source will be
+            created. Must not exist.
+
+    Raises:
+        OSError: When reflink can't be created. Error number is
+            'errno.ENOTSUP' when platform or filesystem does not support
+            reflinks.
+    """
+    platform_name = platform.system().lower()
+    if platform_name == "linux":
+        import fcntl
+
+        src_fd = os.open(src_path, os.O_RDONLY)
+        try:
+            # Exclusive creation to never overwrite existing file
+            dst_fd = os.open(
+                dst_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+            )
+            try:
+                fcntl.ioctl(dst_fd, _LINUX_FICLONE, src_fd)
+                cloned = True
+            except (IOError, OSError):
+                cloned = False
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        if cloned:
+            return
+
+        # Remove empty file created for clone
+        os.remove(dst_path)
+        raise OSError(errno.ENOTSUP, "Reflink is not supported", dst_path)
+
+    if platform_name == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clonefile = getattr(libc, "clonefile", None)
+        if clonefile is not None:
+            clonefile.argtypes = [
+                ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int
+            ]
+            clonefile.restype = ctypes.c_int
+            result = clonefile(
+                os.fsencode(src_path), os.fsencode(dst_path), 0
+            )
+            if result == 0:
+                return
+            error_number = ctypes.get_errno()
+            raise OSError(error_number, os.strerror(error_number), dst_path)
+
+    raise OSError(
+        errno.ENOTSUP,
+        "Reflink is not supported on current platform",
+        dst_path
+    )
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
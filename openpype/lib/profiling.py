@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and process metrics measurement."""
 import os
+import time
+import platform
+import contextlib
 import cProfile
 
 
@@ -27,3 +30,126 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+def _get_peak_rss_windows():
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    success = ctypes.windll.psapi.GetProcessMemoryInfo(
+        process, ctypes.byref(counters), counters.cb
+    )
+    if not success:
+        return None
+    return counters.PeakWorkingSetSize
+
+
+def get_peak_rss():
+    """Peak resident set size of current process.
+
+    Returns:
+        Union[int, None]: Peak RSS in bytes or None if can't be received
+            on current platform.
+    """
+    platform_name = platform.system().lower()
+    if platform_name == "windows":
+        try:
+            return _get_peak_rss_windows()
+        except Exception:
+            return None
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if platform_name != "darwin":
+        peak_rss *= 1024
+    return peak_rss
+
+
+def get_subprocess_time():
+    """CPU time of finished subprocesses of current process.
+
+    Returns:
+        Union[float, None]: User and system time of waited subprocesses
+            in seconds or None on Windows where it is not available.
+    """
+    if platform.system().lower() == "windows":
+        return None
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+@contextlib.contextmanager
+def measure_process_metrics(thread_cpu_time=False):
+    """Measure resources used by current process inside the context.
+
+    Yielded dictionary is filled when context exits:
+        - "wall_time": Real time in milliseconds.
+        - "cpu_time": CPU time of current process (or thread) in
+            milliseconds.
+        - "subprocess_time": CPU time of subprocesses finished inside the
+            context in milliseconds. None if not available.
+        - "peak_rss_delta": Growth of peak RSS of current process in bytes.
+            None if not available.
+
+    Subprocess time and peak RSS are values of whole process so they
+    include work of other threads running at the same time.
+
+    Args:
+        thread_cpu_time (bool): Measure CPU time of current thread instead
+            of whole process. Should be used when other threads are
+            processing at the same time.
+
+    Yields:
+        dict[str, Union[float, int, None]]: Metrics.
+    """
+    metrics = {}
+    cpu_timer = time.process_time
+    if thread_cpu_time:
+        cpu_timer = time.thread_time
+
+    start_peak_rss = get_peak_rss()
+    start_subprocess_time = get_subprocess_time()
+    start_cpu_time = cpu_timer()
+    start_time = time.perf_counter()
+    try:
+        yield metrics
+
+    finally:
+        metrics["wall_time"] = (time.perf_counter() - start_time) * 1000
+        metrics["cpu_time"] = (cpu_timer() - start_cpu_time) * 1000
+
+        subprocess_time = None
+        end_subprocess_time = get_subprocess_time()
+        if start_subprocess_time is not None:
+            subprocess_time = (
+                end_subprocess_time - start_subprocess_time
+            ) * 1000
+        metrics["subprocess_time"] = subprocess_time
+
+        peak_rss_delta = None
+        end_peak_rss = get_peak_rss()
+        if start_peak_rss is not None and end_peak_rss is not None:
+            peak_rss_delta = end_peak_rss - start_peak_rss
+        metrics["peak_rss_delta"] = peak_rss_delta
@@ -6,6 +6,7 @@ import collections
 import tempfile
 import subprocess
 import platform
+import threading
 
 import xml.etree.ElementTree
 
@@ -43,6 +44,9 @@ XML_CHAR_REF_REGEX_HEX = re.compile(r"&#x?[0-9a-fA-F]+;")
 # Regex to parse array attributes
 ARRAY_TYPE_REGEX = re.compile(r"^(int|float|string)\[\d+\]$")
 
+# Number of scanlines read and written at once by in-process conversion
+OIIO_SCANLINES_CHUNK = 64
+
 IMAGE_EXTENSIONS = {
     ".ani", ".anim", ".apng", ".art", ".bmp", ".bpg", ".bsave", ".cal",
     ".cin", ".cpc", ".cpt", ".dds", ".dpx", ".ecw", ".exr", ".fits",
@@ -78,7 +82,133 @@ def get_transcode_temp_directory():
     )
 
 
+class _OIIOModuleCache:
+    lock = threading.Lock()
+    initialized = False
+    module = None
+
+
+def get_oiio_python_module():
+    """OpenImageIO python module if can be used for in-process transcoding.
+
+    Module is imported on first call. In-process transcoding can be disabled
+    with environment variable 'OPENPYPE_OIIO_IN_PROCESS' set to '0'.
+
+    Returns:
+        Union[ModuleType, None]: OpenImageIO module or None if is not
+            available.
+    """
+    if os.environ.get("OPENPYPE_OIIO_IN_PROCESS") == "0":
+        return None
+
+    if not _OIIOModuleCache.initialized:
+        with _OIIOModuleCache.lock:
+            if not _OIIOModuleCache.initialized:
+                try:
+                    import numpy  # noqa: F401
+                    import OpenImageIO
+                except Exception:
+                    OpenImageIO = None
+                _OIIOModuleCache.module = OpenImageIO
+                _OIIOModuleCache.initialized = True
+    return _OIIOModuleCache.module
+
+
+def _convert_oiio_param_value(param, logger):
+    value = param.value
+    if not isinstance(value, (tuple, list)):
+        return value
+
+    # Use same conversion as for values from oiiotool output
+    value_str = ", ".join(str(item) for item in value)
+    return convert_value_by_type_name(str(param.type), value_str, logger)
+
+
+def _get_oiio_info_in_process(oiio, filepath, logger, subimages=False):
+    """Read information about input with OpenImageIO python module.
+
+    Output has same structure as 'parse_oiio_xml_output'.
+    """
+    image_input = oiio.ImageInput.open(filepath)
+    if image_input is None:
+        raise ValueError(
+            "Failed to read input file \"{}\".\n{}".format(
+                filepath, oiio.geterror()
+            )
+        )
+
+    specs = []
+    try:
+        subimage = 0
+        while image_input.seek_subimage(subimage, 0):
+            if subimages or subimage == 0:
+                specs.append(image_input.spec())
+            subimage += 1
+    finally:
+        image_input.close()
+
+    output = []
+    for spec in specs:
+        info = {
+            "x": spec.x,
+            "y": spec.y,
+            "z": spec.z,
+            "width": spec.width,
+            "height": spec.height,
+            "depth": spec.depth,
+            "full_x": spec.full_x,
+            "full_y": spec.full_y,
+            "full_z": spec.full_z,
+            "full_width": spec.full_width,
+            "full_height": spec.full_height,
+            "full_depth": spec.full_depth,
+            "tile_width": spec.tile_width,
+            "tile_height": spec.tile_height,
+            "tile_depth": spec.tile_depth,
+            "format": str(spec.format),
+            "nchannels": spec.nchannels,
+            "channelnames": list(spec.channelnames),
+            "alpha_channel": spec.alpha_channel,
+            "z_channel": spec.z_channel,
+            "deep": int(spec.deep),
+            "subimages": subimage,
+            "attribs": {
+                param.name: _convert_oiio_param_value(param, logger)
+                for param in spec.extra_attribs
+            },
+        }
+        output.append(info)
+
+    if subimages:
+        return output
+    return output[0]
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
+    """Get information about input.
+
+    Information is read with OpenImageIO python module if is available,
+    otherwise oiiotool is called and its xml output is parsed.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    oiio = get_oiio_python_module()
+    if oiio is not None:
+        try:
+            return _get_oiio_info_in_process(
+                oiio, filepath, logger, subimages
+            )
+        except Exception:
+            logger.debug(
+                "Failed to read input info in process, using oiiotool.",
+                exc_info=True
+            )
+
+    return _get_oiio_info_for_input_with_tool(filepath, logger, subimages)
+
+
+def _get_oiio_info_for_input_with_tool(filepath, logger, subimages):
     """Call oiiotool to get information about input and return stdout.
 
     Stdout should contain xml format string.
@@ -489,7 +619,7 @@ def should_convert_for_ffmpeg(src_filepath):
         return False
 
     # Can't determine if should convert or not without oiio_tool
-    if not is_oiio_supported():
+    if get_oiio_python_module() is None and not is_oiio_supported():
         return None
 
     # Load info about file from oiio tool
@@ -706,7 +836,25 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
+    erased_attribs = _get_attribs_to_erase_for_ffmpeg(input_info, logger)
+
+    converted_paths = set()
+    oiio = get_oiio_python_module()
+    if oiio is not None and not input_info.get("deep"):
+        converted_paths = _convert_paths_for_ffmpeg_in_process(
+            oiio,
+            input_paths,
+            output_dir,
+            input_info,
+            compression,
+            erased_attribs,
+            logger
+        )
+
     for input_path in input_paths:
+        if input_path in converted_paths:
+            continue
+
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
@@ -726,35 +874,8 @@ def convert_input_paths_for_ffmpeg(
             "--subimage", "0"
         ])
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        for attr_name in erased_attribs:
+            oiio_cmd.extend(["--eraseattrib", attr_name])
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -767,6 +888,195 @@ def convert_input_paths_for_ffmpeg(
         run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_attribs_to_erase_for_ffmpeg(input_info, logger):
+    """Attributes which must be removed from metadata for ffmpeg.
+
+    Attributes with string value longer than allowed length for ffmpeg or
+    containing prohibited symbols are removed.
+
+    Args:
+        input_info (dict): Information about input from oiio.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list[str]: Names of attributes.
+    """
+    output = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            output.append(attr_name)
+    return output
+
+
+def _convert_paths_for_ffmpeg_in_process(
+    oiio,
+    input_paths,
+    output_dir,
+    input_info,
+    compression,
+    erased_attribs,
+    logger
+):
+    """Convert inputs with OpenImageIO python module in thread pool.
+
+    Reading and writing of pixels in OpenImageIO python module releases
+    GIL so files are converted in parallel.
+
+    Args:
+        oiio (ModuleType): OpenImageIO python module.
+        input_paths (list[str]): Paths to convert.
+        output_dir (str): Directory where output is stored.
+        input_info (dict): Information about first input.
+        compression (Union[str, None]): Compression of output.
+        erased_attribs (list[str]): Attributes not copied to output.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        set[str]: Input paths which were converted. Conversion of other
+            paths failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    channel_names = input_info["channelnames"]
+    review_channels = [
+        channel_name
+        for channel_name in get_convert_rgb_channels(channel_names)
+        if channel_name is not None
+    ]
+    channel_indexes = [
+        channel_names.index(channel_name)
+        for channel_name in review_channels
+    ]
+
+    def _convert(input_path):
+        output_path = os.path.join(output_dir, os.path.basename(input_path))
+        try:
+            _convert_file_for_ffmpeg_in_process(
+                oiio,
+                input_path,
+                output_path,
+                channel_indexes,
+                compression,
+                erased_attribs
+            )
+        except Exception:
+            logger.warning((
+                "In-process conversion of \"{}\" failed. Using oiiotool."
+            ).format(input_path), exc_info=True)
+            return None
+        return input_path
+
+    max_workers = min(len(input_paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        converted = executor.map(_convert, input_paths)
+        return {path for path in converted if path is not None}
+
+
+def _convert_file_for_ffmpeg_in_process(
+    oiio,
+    input_path,
+    output_path,
+    channel_indexes,
+    compression,
+    erased_attribs
+):
+    """Convert single file with OpenImageIO python module.
+
+    Pixels are streamed in chunks of scanlines from first subimage of input
+    to output so whole frame is never held in memory.
+    """
+    image_input = oiio.ImageInput.open(input_path)
+    if image_input is None:
+        raise ValueError(oiio.geterror())
+
+    image_output = None
+    try:
+        spec = image_input.spec()
+        if spec.deep:
+            raise ValueError("Deep images are not supported.")
+
+        # Read only range of channels containing review channels
+        ch_begin = min(channel_indexes)
+        ch_end = max(channel_indexes) + 1
+        relative_indexes = [idx - ch_begin for idx in channel_indexes]
+        channel_names = ["R", "G", "B", "A"][:len(channel_indexes)]
+
+        out_spec = oiio.ImageSpec(
+            spec.width, spec.height, len(channel_indexes), spec.format
+        )
+        out_spec.x = spec.x
+        out_spec.y = spec.y
+        out_spec.full_x = spec.full_x
+        out_spec.full_y = spec.full_y
+        out_spec.full_width = spec.full_width
+        out_spec.full_height = spec.full_height
+        out_spec.channelnames = tuple(channel_names)
+        if len(channel_indexes) == 4:
+            out_spec.alpha_channel = 3
+
+        for param in spec.extra_attribs:
+            if param.name in erased_attribs:
+                continue
+            if param.name.startswith("oiio:"):
+                continue
+            out_spec.attribute(param.name, param.type, param.value)
+
+        if compression:
+            out_spec.attribute("compression", compression)
+
+        image_output = oiio.ImageOutput.create(output_path)
+        if image_output is None or not image_output.open(
+            output_path, out_spec
+        ):
+            raise ValueError(oiio.geterror())
+
+        y_end = spec.y + spec.height
+        for y_begin in range(spec.y, y_end, OIIO_SCANLINES_CHUNK):
+            chunk_end = min(y_begin + OIIO_SCANLINES_CHUNK, y_end)
+            pixels = image_input.read_scanlines(
+                0, 0, y_begin, chunk_end, spec.z, ch_begin, ch_end,
+                spec.format
+            )
+            if pixels is None:
+                raise ValueError(image_input.geterror())
+
+            if relative_indexes != list(range(ch_end - ch_begin)):
+                pixels = pixels[..., relative_indexes]
+
+            if not image_output.write_scanlines(
+                y_begin, chunk_end, spec.z, pixels
+            ):
+                raise ValueError(image_output.geterror())
+
+    finally:
+        image_input.close()
+        if image_output is not None:
+            image_output.close()
+
+
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
@@ -17,6 +17,9 @@ from openpype.lib import EnumDef, is_running_from_build
 from openpype.tests.lib import is_in_tests
 from openpype.pipeline.version_start import get_versioning_start
 
+from openpype.pipeline.farm.expected_files import (
+    compact_publish_metadata
+)
 from openpype.pipeline.farm.pyblish_functions import (
     create_skeleton_instance_cache,
     create_instances_for_cache,
@@ -413,7 +416,10 @@ class ProcessSubmittedCacheJobOnFarm(pyblish.api.InstancePlugin,
             create_metadata_path(instance, anatomy)
 
         with open(metadata_path, "w") as f:
-            json.dump(publish_job, f, indent=4, sort_keys=True)
+            json.dump(
+                compact_publish_metadata(publish_job), f,
+                indent=4, sort_keys=True
+            )
 
     def _get_publish_folder(self, anatomy, template_data,
                             asset, subset, context,
@@ -38,6 +38,40 @@ from openpype_modules.ftrack.lib.avalon_sync import (
 )
 
 
+def _apply_set_changes(doc, set_changes):
+    """Apply '$set' part of mongo update to cached document."""
+    for key, value in set_changes.items():
+        parts = key.split(".")
+        current = doc
+        for part in parts[:-1]:
+            if not isinstance(current.get(part), dict):
+                current[part] = {}
+            current = current[part]
+        current[parts[-1]] = copy.deepcopy(value)
+
+
+def _merge_entity_info(current, ent_info):
+    """Merge changes of entity from later event into current info."""
+    changes = current.get("changes") or {}
+    for key, value in (ent_info.get("changes") or {}).items():
+        current_value = changes.get(key)
+        if isinstance(current_value, dict) and isinstance(value, dict):
+            # Keep the oldest value and use the latest new value
+            value = dict(value, old=current_value.get("old"))
+        changes[key] = copy.deepcopy(value)
+
+    keys = list(current.get("keys") or [])
+    for key in ent_info.get("keys") or []:
+        if key not in keys:
+            keys.append(key)
+
+    current["changes"] = changes
+    current["keys"] = keys
+    for key in ("parents", "parentId"):
+        if key in ent_info:
+            current[key] = copy.deepcopy(ent_info[key])
+
+
 class SyncToAvalonEvent(BaseEvent):
     interest_entTypes = ["show", "task"]
     ignore_ent_types = ["Milestone"]
@@ -78,6 +112,14 @@ class SyncToAvalonEvent(BaseEvent):
     created_entities = []
     report_splitter = {"type": "label", "value": "---"}
 
+    # Events of a project are collected and processed at once when
+    #   processor has no other events to handle, or when the oldest
+    #   collected event is older than window in seconds
+    coalesce_window = 5
+    coalesce_max_events = 500
+    # Seconds for which loaded avalon entities of project are reused
+    avalon_cache_ttl = 60
+
     def __init__(self, session):
         '''Expects a ftrack_api.Session instance'''
         # Debug settings
@@ -92,8 +134,21 @@ class SyncToAvalonEvent(BaseEvent):
         self.dbcon = AvalonMongoDB()
         # Set processing session to not use global
         self.set_process_session(session)
+
+        self._coalesce_enabled = False
+        self._pending_events = collections.OrderedDict()
+        self._project_caches = {}
         super().__init__(session)
 
+    def register(self):
+        super().register()
+        # Event hub of event processor can tell when it has no events
+        #   to handle
+        event_hub = self.session.event_hub
+        if hasattr(event_hub, "add_idle_callback"):
+            event_hub.add_idle_callback(self.flush_pending_events)
+            self._coalesce_enabled = True
+
     def debug_logs(self):
         """This is debug method for printing small debugs messages. """
         now_datetime = datetime.datetime.now()
@@ -161,6 +216,7 @@ class SyncToAvalonEvent(BaseEvent):
             avalon_project = get_project(project_name)
             avalon_entities = list(get_assets(project_name))
             self._avalon_ents = (avalon_project, avalon_entities)
+            self._avalon_ents_loaded_time = time.time()
         return self._avalon_ents
 
     @property
@@ -472,6 +528,7 @@ class SyncToAvalonEvent(BaseEvent):
         self._cust_attr_types_by_id = None
 
         self._avalon_ents = None
+        self._avalon_ents_loaded_time = None
         self._avalon_ents_by_id = None
         self._avalon_ents_by_parent_id = None
         self._avalon_ents_by_ftrack_id = None
@@ -594,7 +651,162 @@ class SyncToAvalonEvent(BaseEvent):
                 return "unknown hierarchy"
         return "/".join([ent["name"] for ent in entity["link"]])
 
+    @staticmethod
+    def get_event_project_id(event):
+        """Ftrack id of project of entities in event."""
+        for ent_info in event["data"].get("entities") or []:
+            for parent in ent_info.get("parents") or []:
+                if parent.get("entityType") == "show":
+                    return parent.get("entityId")
+        return None
+
+    def merge_events(self, events):
+        """Merge events of one project into single change set.
+
+        Changes of the same entity and action are merged into one entity
+        info. Removal of entity drops its earlier changes, entity which
+        was created and removed in the merged events is skipped completely.
+
+        Args:
+            events (list[ftrack_api.event.base.Event]): Events in order
+                in which they were stored.
+
+        Returns:
+            ftrack_api.event.base.Event: Event with merged entities.
+        """
+        infos_by_key = collections.OrderedDict()
+        for event in events:
+            for ent_info in event["data"].get("entities") or []:
+                ftrack_id = ent_info.get("entityId")
+                action = ent_info.get("action")
+                if isinstance(ftrack_id, list):
+                    infos_by_key[(id(ent_info), action)] = ent_info
+                    continue
+
+                if action == "remove":
+                    for other_action in ("update", "move"):
+                        infos_by_key.pop((ftrack_id, other_action), None)
+                    # Entity was created in merged events
+                    if infos_by_key.pop((ftrack_id, "add"), None) is not None:
+                        continue
+
+                key = (ftrack_id, action)
+                current = infos_by_key.get(key)
+                if current is None:
+                    infos_by_key[key] = copy.deepcopy(ent_info)
+                elif action in ("update", "move"):
+                    _merge_entity_info(current, ent_info)
+
+        entities_info = list(infos_by_key.values())
+        # User of last event is used in reports
+        last_event = events[-1]
+        return ftrack_api.event.base.Event(
+            topic=last_event["topic"],
+            data=dict(last_event["data"], entities=entities_info),
+            source=last_event["source"]
+        )
+
     def launch(self, session, event):
+        """Collect event to be processed with other events of project.
+
+        Events are processed directly if event hub does not support
+        coalescing. Collected events are held in event hub so they're not
+        marked as processed before they're processed.
+        """
+        project_id = self.get_event_project_id(event)
+        if not self._coalesce_enabled or project_id is None:
+            return self.process_event(session, event)
+
+        pending = self._pending_events.get(project_id)
+        if pending is None:
+            pending = {"started": time.time(), "events": []}
+            self._pending_events[project_id] = pending
+        pending["events"].append(event)
+        self.session.event_hub.hold_event(
+            event["data"].get("_event_mongo_id")
+        )
+
+        if (
+            len(pending["events"]) >= self.coalesce_max_events
+            or time.time() - pending["started"] >= self.coalesce_window
+        ):
+            self._process_pending_events(project_id)
+        return True
+
+    def flush_pending_events(self):
+        """Process all collected events."""
+        for project_id in tuple(self._pending_events.keys()):
+            self._process_pending_events(project_id)
+
+    def _process_pending_events(self, project_id):
+        pending = self._pending_events.pop(project_id, None)
+        if not pending:
+            return
+
+        events = pending["events"]
+        event = events[0]
+        if len(events) > 1:
+            event = self.merge_events(events)
+            self.log.debug("Processing {} merged events of project".format(
+                len(events)
+            ))
+
+        self.session.rollback()
+        self.session._local_cache.clear()
+        try:
+            self.process_event(self.session, event)
+        except Exception:
+            self.session.rollback()
+            self.log.error(
+                "Failed to process events of project \"{}\"".format(
+                    project_id
+                ),
+                exc_info=True
+            )
+        finally:
+            # Failed events are marked as processed too, same as events
+            #   processed directly
+            self.session.event_hub.release_events([
+                pending_event["data"].get("_event_mongo_id")
+                for pending_event in events
+            ])
+
+    def _restore_project_cache(self, project_name):
+        """Reuse avalon entities of project loaded by previous events."""
+        cache = self._project_caches.get(project_name)
+        if cache is None:
+            return
+
+        if time.time() - cache["loaded_time"] > self.avalon_cache_ttl:
+            self._project_caches.pop(project_name)
+            return
+
+        self.dbcon.install()
+        self.dbcon.Session["AVALON_PROJECT"] = project_name
+        self._avalon_ents = cache["avalon_ents"]
+        self._avalon_ents_loaded_time = cache["loaded_time"]
+        self._avalon_ents_by_id = cache["by_id"]
+        self._avalon_ents_by_ftrack_id = cache["by_ftrack_id"]
+        self._avalon_ents_by_name = cache["by_name"]
+
+    def _store_project_cache(self, project_name):
+        """Keep avalon entities of project for next events.
+
+        Entities and indexes are updated in place during processing.
+        Index by parent is not kept as moved entities don't update it.
+        """
+        if self._avalon_ents is None:
+            return
+
+        self._project_caches[project_name] = {
+            "loaded_time": self._avalon_ents_loaded_time,
+            "avalon_ents": self._avalon_ents,
+            "by_id": self._avalon_ents_by_id,
+            "by_ftrack_id": self._avalon_ents_by_ftrack_id,
+            "by_name": self._avalon_ents_by_name,
+        }
+
+    def process_event(self, session, event):
         """
             Main entry port for synchronization.
             Goes through event (can contain multiple changes) and decides if
@@ -710,6 +922,8 @@ class SyncToAvalonEvent(BaseEvent):
             if turned_on:
                 message += " Triggering syncToAvalon action."
             self.log.debug(message)
+            # Project will be fully synchronized by action
+            self._project_caches.pop(ft_project["full_name"], None)
 
             if turned_on:
                 # Trigger sync to avalon action if auto sync was turned on
@@ -752,6 +966,8 @@ class SyncToAvalonEvent(BaseEvent):
         if auto_sync is not True:
             return True
 
+        self._restore_project_cache(ft_project["full_name"])
+
         debug_msg = "Updated: {}".format(len(updated))
         debug_action_map = {
             "add": "Created",
@@ -834,6 +1050,7 @@ class SyncToAvalonEvent(BaseEvent):
             if self.updates:
                 self.update_entities()
             time_8 = time.time()
+            self._store_project_cache(ft_project["full_name"])
 
             time_removed = time_2 - time_1
             time_renamed = time_3 - time_2
@@ -852,6 +1069,8 @@ class SyncToAvalonEvent(BaseEvent):
             ))
 
         except Exception:
+            # Cached entities may not match database
+            self._project_caches.pop(ft_project["full_name"], None)
             msg = "An error has happened during synchronization"
             self.report_items["error"][msg].append((
                 str(traceback.format_exc()).replace("\n", "<br>")
@@ -2472,6 +2691,8 @@ class SyncToAvalonEvent(BaseEvent):
             mongo_changes_bulk.append(
                 UpdateOne({"_id": mongo_id}, change_data)
             )
+            # Keep cached entity same as in database
+            _apply_set_changes(avalon_ent, change_data["$set"])
 
         if not mongo_changes_bulk:
             return
@@ -2675,6 +2896,10 @@ class SyncToAvalonEvent(BaseEvent):
             change_data["$set"]["data.tasks"] = tasks_per_ftrack_id[ftrack_id]
             mongo_changes_bulk.append(UpdateOne(filter, change_data))
 
+            avalon_ent = self.avalon_ents_by_id.get(mongo_id)
+            if avalon_ent is not None:
+                _apply_set_changes(avalon_ent, change_data["$set"])
+
         if mongo_changes_bulk:
             self.dbcon.bulk_write(mongo_changes_bulk)
 
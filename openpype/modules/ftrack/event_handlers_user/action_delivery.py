@@ -19,6 +19,7 @@ from openpype.lib.dateutils import get_datetime_data
 from openpype.pipeline import Anatomy
 from openpype.pipeline.load import get_representation_path_with_anatomy
 from openpype.pipeline.delivery import (
+    DeliveryPlan,
     get_format_dict,
     check_destination_path,
     deliver_single_file,
@@ -556,6 +557,7 @@ class Delivery(BaseAction):
         format_dict = get_format_dict(anatomy, location_path)
 
         datetime_data = get_datetime_data()
+        delivery_plan = DeliveryPlan(self.log)
         for repre in repres_to_deliver:
             source_path = repre.get("data", {}).get("path")
             debug_msg = "Processing representation {}".format(repre["_id"])
@@ -593,10 +595,15 @@ class Delivery(BaseAction):
                 report_items,
                 self.log
             )
+            kwargs = {"delivery_plan": delivery_plan}
             if not frame:
-                deliver_single_file(*args)
+                deliver_single_file(*args, **kwargs)
             else:
-                deliver_sequence(*args)
+                deliver_sequence(*args, **kwargs)
+
+        self.log.debug(
+            "Delivering {} files.".format(len(delivery_plan)))
+        delivery_plan.execute(report_items)
 
         return self.report(report_items)
 
@@ -112,17 +112,108 @@ class StorerEventHub(SocketBaseEventHub):
 
 
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by event storer.
+
+    New events are tailed with Mongo change stream which wakes up the
+    processing loop. Polling is used when change streams are not available
+    (Mongo is not running as replica set). Processed events are marked in
+    batches and old processed events are removed in background thread.
+
+    Handlers which process events later (e.g. collected events of a
+    project) hold them with 'hold_event' and release them with
+    'release_events' after processing. Held events are not marked as
+    processed so they're loaded again after crash or restart.
+    """
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Maximum number of events loaded from Mongo at once
+    load_limit = 100
+    # Maximum number of processed events waiting to be marked in Mongo
+    ack_batch_size = 100
+    # Interval of polling for new events in seconds
+    poll_interval = 0.5
+    # Polling when change stream is running is only a safety net
+    change_stream_poll_interval = 10
+    # Processed events older than this are removed
+    retention_days = 3
+    # Interval of removing old processed events in seconds
+    cleanup_interval = 60 * 60
+    # Time window of processing speed statistics in seconds
+    stats_window = 60
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._ack_ids = []
+        self._stored_by_mongo_id = {}
+        self._held_counts = collections.Counter()
+        self._handled_held_ids = set()
+        self._new_events_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._background_threads = []
+        self._change_stream_active = False
+
+        self._processed_times = collections.deque()
+        self._processed_count = 0
+        self._last_event_lag = None
+        self._idle_callbacks = []
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
+    def add_idle_callback(self, callback):
+        """Register callback called when there are no events to handle.
+
+        Handlers can use it to process collected events at once.
+
+        Args:
+            callback (Callable[[], None]): Callback without arguments.
+        """
+        self._idle_callbacks.append(callback)
+
+    def hold_event(self, mongo_id):
+        """Don't mark event as processed until it is released.
+
+        Args:
+            mongo_id (ObjectId): Mongo id of event ('_event_mongo_id' in
+                event data).
+        """
+        if mongo_id is not None:
+            self._held_counts[mongo_id] += 1
+
+    def release_events(self, mongo_ids):
+        """Release held events so they can be marked as processed.
+
+        Event is marked when all handlers which held it released it.
+
+        Args:
+            mongo_ids (Iterable[ObjectId]): Mongo ids of held events.
+        """
+        for mongo_id in mongo_ids:
+            if mongo_id not in self._held_counts:
+                continue
+            self._held_counts[mongo_id] -= 1
+            if self._held_counts[mongo_id] > 0:
+                continue
+            del self._held_counts[mongo_id]
+            if mongo_id in self._handled_held_ids:
+                self._handled_held_ids.discard(mongo_id)
+                self._add_ack_id(mongo_id)
+
+    def _process_idle_callbacks(self):
+        for callback in self._idle_callbacks:
+            try:
+                callback()
+            except pymongo.errors.AutoReconnect:
+                raise
+            except Exception:
+                self.pypelog.error(
+                    "Idle callback failed", exc_info=True
+                )
+
     def prepare_dbcon(self):
         try:
             database_name, collection_name = get_ftrack_event_mongo_info()
@@ -145,37 +236,64 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+        try:
+            self.dbcon.create_index([
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ])
+        except pymongo.errors.PyMongoError:
+            self.pypelog.warning(
+                "Failed to create index of stored events.", exc_info=True
+            )
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events
+        are set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
+        self._start_background_threads()
+        try:
+            self._process_events(started, duration)
+        finally:
+            self._stop_background_threads()
+            try:
+                self._process_idle_callbacks()
+                self.acknowledge_events()
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Failed to mark processed events.", exc_info=True
+                )
+
+    def _process_events(self, started, duration):
         while True:
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
+                try:
+                    self._process_idle_callbacks()
+                    # Mark handled events before loading so they are not
+                    #   loaded again
+                    self.acknowledge_events()
+                    self._new_events_event.clear()
+                    if not self.load_events():
+                        self._new_events_event.wait(
+                            self._get_poll_interval()
+                        )
+
+                except pymongo.errors.AutoReconnect:
+                    self._mongo_not_responding()
             else:
                 try:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+                    if mongo_id is not None:
+                        self._on_event_processed(mongo_id)
 
                 except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
+                    self._mongo_not_responding()
                 # Additional special processing of events.
                 if event['topic'] == 'ftrack.meta.disconnected':
                     break
@@ -184,19 +302,62 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
+    def _mongo_not_responding(self):
+        self.pypelog.error((
+            "Mongo server \"{}\" is not responding, exiting."
+        ).format(os.environ["OPENPYPE_MONGO"]))
+        sys.exit(0)
+
+    def _get_poll_interval(self):
+        if self._change_stream_active:
+            return self.change_stream_poll_interval
+        return self.poll_interval
+
+    def _on_event_processed(self, mongo_id):
+        if mongo_id in self._held_counts:
+            self._handled_held_ids.add(mongo_id)
+        else:
+            self._add_ack_id(mongo_id)
+
+        now = time.time()
+        self._processed_count += 1
+        self._processed_times.append(now)
+        while (
+            self._processed_times
+            and now - self._processed_times[0] > self.stats_window
+        ):
+            self._processed_times.popleft()
+
+        stored = self._stored_by_mongo_id.pop(mongo_id, None)
+        if stored is not None:
+            self._last_event_lag = (
+                datetime.datetime.utcnow() - stored
+            ).total_seconds()
+
+    def _add_ack_id(self, mongo_id):
+        self._ack_ids.append(mongo_id)
+        if len(self._ack_ids) >= self.ack_batch_size:
+            self.acknowledge_events()
+
+    def acknowledge_events(self):
+        """Mark handled events as processed in Mongo DB."""
+        if not self._ack_ids:
+            return
+        ack_ids, self._ack_ids = self._ack_ids, []
+        self.dbcon.update_many(
+            {"_id": {"$in": ack_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
     def load_events(self):
         """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
-
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
+        query_filter = {"pype_data.is_processed": False}
+        # Held events are still waiting in a handler
+        if self._held_counts:
+            query_filter["_id"] = {"$nin": list(self._held_counts.keys())}
+        not_processed_events = self.dbcon.find(query_filter).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+        ).limit(self.load_limit)
 
         found = False
         for event_data in not_processed_events:
@@ -214,10 +375,112 @@ class ProcessEventHub(SocketBaseEventHub):
                 ))
                 continue
             found = True
+            stored = (event_data.get("pype_data") or {}).get("stored")
+            if stored is not None:
+                self._stored_by_mongo_id[event_data["_id"]] = stored
             self._event_queue.put(event)
 
         return found
 
+    def remove_old_events(self):
+        """Remove processed events older than retention time."""
+        ago_date = (
+            datetime.datetime.utcnow()
+            - datetime.timedelta(days=self.retention_days)
+        )
+        self.dbcon.delete_many({
+            "pype_data.stored": {"$lte": ago_date},
+            "pype_data.is_processed": True
+        })
+
+    def get_status_info(self):
+        """Processing statistics shown in event server status.
+
+        Returns:
+            list[list[str]]: Pairs of label and value.
+        """
+        now = time.time()
+        recent_count = len([
+            processed_time
+            for processed_time in self._processed_times
+            if now - processed_time <= self.stats_window
+        ])
+        events_per_second = float(recent_count) / self.stats_window
+
+        queue_lag = "N/A"
+        if self._last_event_lag is not None:
+            queue_lag = "{:.1f}s".format(self._last_event_lag)
+
+        pending = "N/A"
+        if self.dbcon is not None:
+            try:
+                pending = str(self.dbcon.count_documents(
+                    {"pype_data.is_processed": False}
+                ))
+            except pymongo.errors.PyMongoError:
+                pass
+
+        return [
+            ["Events tailing", (
+                "change stream" if self._change_stream_active else "polling"
+            )],
+            ["Queue lag", queue_lag],
+            ["Pending events", pending],
+            ["Events/s (last {}s)".format(self.stats_window), (
+                "{:.2f}".format(events_per_second)
+            )],
+            ["Processed events", str(self._processed_count)]
+        ]
+
+    def _start_background_threads(self):
+        self._stop_event.clear()
+        self._background_threads = [
+            threading.Thread(target=self._watch_new_events, daemon=True),
+            threading.Thread(target=self._cleanup_loop, daemon=True),
+        ]
+        for thread in self._background_threads:
+            thread.start()
+
+    def _stop_background_threads(self):
+        self._stop_event.set()
+        for thread in self._background_threads:
+            thread.join(1)
+        self._background_threads = []
+
+    def _watch_new_events(self):
+        """Wake up processing loop when new event is stored."""
+        pipeline = [
+            {"$match": {"operationType": {"$in": ["insert", "replace"]}}}
+        ]
+        try:
+            with self.dbcon.watch(
+                pipeline, max_await_time_ms=1000
+            ) as stream:
+                self._change_stream_active = True
+                while stream.alive and not self._stop_event.is_set():
+                    if stream.try_next() is not None:
+                        self._new_events_event.set()
+
+        except pymongo.errors.PyMongoError as exc:
+            self.pypelog.info((
+                "Change streams are not available ({}),"
+                " polling for new events."
+            ).format(exc))
+
+        finally:
+            self._change_stream_active = False
+
+    def _cleanup_loop(self):
+        """Remove old processed events periodically."""
+        while not self._stop_event.is_set():
+            try:
+                self.remove_old_events()
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Failed to remove old events.", exc_info=True
+                )
+            self._stop_event.wait(self.cleanup_interval)
+
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
         code_name = self._code_name_mapping[code]
@@ -339,6 +339,9 @@ def server_activity(event):
             break
 
     if not is_checked:
+        # Statistics of processes change in time so request new info
+        #   which is shown on next refresh
+        trigger_info_get()
         return {
             "items": ObjectFactory.status_factory.items(),
             "title": "Server current status"
@@ -359,9 +362,10 @@ def server_activity(event):
 def trigger_info_get():
     if ObjectFactory.last_trigger:
         delta = datetime.datetime.now() - ObjectFactory.last_trigger
-        if delta.seconds() < 5:
+        if delta.total_seconds() < 5:
             return
 
+    ObjectFactory.last_trigger = datetime.datetime.now()
     session = ObjectFactory.session
     session.event_hub.publish(
         ftrack_api.event.base.Event(
@@ -1,9 +1,13 @@
 """Functions to update OpenPype data using Kitsu DB (a.k.a Zou)."""
+import collections
+import datetime
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 import re
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple, Union
 
-from pymongo import DeleteOne, UpdateOne
+from bson.objectid import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
 import gazu
 
 from openpype.client import (
@@ -23,6 +27,17 @@ log = Logger.get_logger(__name__)
 # Accepted namin pattern for OP
 naming_pattern = re.compile("^[a-zA-Z0-9_.]*$")
 
+# Key in project document data with 'updated_at' of the latest synchronized
+#   Zou entity or task
+SYNC_WATERMARK_KEY = "zou_updated_at"
+# Entity changed while project is fetched can have older 'updated_at' than
+#   other fetched entities. Watermark is capped by time before fetching minus
+#   margin in seconds, which also covers difference of Zou server clock.
+SYNC_WATERMARK_MARGIN = 60
+ZOU_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# Keys of zou entity with ids of parent entities
+ZOU_PARENT_KEYS = ("entity_type_id", "parent_id", "episode_id", "source_id")
+
 
 def create_op_asset(gazu_entity: dict) -> dict:
     """Create OP asset dict from gazu entity.
@@ -68,6 +83,8 @@ def update_op_assets(
     project_doc: dict,
     entities_list: List[dict],
     asset_doc_ids: Dict[str, dict],
+    root_folder_ids: Dict[str, ObjectId] = None,
+    client: gazu.client.KitsuClient = None,
 ) -> List[Dict[str, dict]]:
     """Update OpenPype assets.
     Set 'data' and 'parent' fields.
@@ -78,6 +95,11 @@ def update_op_assets(
         project_doc (dict): Dict of project,
         entities_list (List[dict]): List of zou entities to update
         asset_doc_ids (Dict[str, dict]): Dicts of [{zou_id: asset_doc}, ...]
+        root_folder_ids (Dict[str, ObjectId]): Ids of root folder docs
+            ("Assets" and "Shots") by name. Root folders are queried from DB
+            if not passed.
+        client (gazu.client.KitsuClient): Client used for requests to Zou,
+            default client of gazu is used if not passed.
 
     Returns:
         List[Dict[str, dict]]: List of (doc_id, update_dict) tuples
@@ -85,6 +107,9 @@ def update_op_assets(
     if not project_doc:
         return
 
+    if client is None:
+        client = gazu.client.default_client
+
     project_name = project_doc["name"]
 
     assets_with_update = []
@@ -182,13 +207,13 @@ def update_op_assets(
         tasks_list = []
         item_type = item["type"]
         if item_type == "Asset":
-            tasks_list = gazu.task.all_tasks_for_asset(item)
+            tasks_list = gazu.task.all_tasks_for_asset(item, client=client)
         elif item_type == "Shot":
-            tasks_list = gazu.task.all_tasks_for_shot(item)
+            tasks_list = gazu.task.all_tasks_for_shot(item, client=client)
         item_data["tasks"] = {
             t["task_type_name"]: {
                 "type": t["task_type_name"],
-                "zou": gazu.task.get_task(t["id"]),
+                "zou": gazu.task.get_task(t["id"], client=client),
             }
             for t in tasks_list
         }
@@ -231,7 +256,10 @@ def update_op_assets(
                     else None
                 )
 
-        if visual_parent_doc_id is None:
+        if visual_parent_doc_id is None and root_folder_ids is not None:
+            visual_parent_doc_id = root_folder_ids.get(entity_root_asset_name)
+
+        elif visual_parent_doc_id is None:
             # Find root folder doc ("Assets" or "Shots")
             root_folder_doc = get_asset_by_name(
                 project_name,
@@ -293,17 +321,26 @@ def update_op_assets(
     return assets_with_update
 
 
-def write_project_to_op(project: dict, dbcon: AvalonMongoDB) -> UpdateOne:
+def write_project_to_op(
+    project: dict,
+    dbcon: AvalonMongoDB,
+    client: gazu.client.KitsuClient = None,
+) -> UpdateOne:
     """Write gazu project to OP database.
     Create project if doesn't exist.
 
     Args:
         project (dict): Gazu project
         dbcon (AvalonMongoDB): DB to create project in
+        client (gazu.client.KitsuClient): Client used for requests to Zou,
+            default client of gazu is used if not passed.
 
     Returns:
         UpdateOne: Update instance for the project
     """
+    if client is None:
+        client = gazu.client.default_client
+
     project_name = project["name"]
     project_dict = get_project(project_name)
     if not project_dict:
@@ -319,7 +356,7 @@ def write_project_to_op(project: dict, dbcon: AvalonMongoDB) -> UpdateOne:
         project["code"] = project_code
 
         # Update Zou
-        gazu.project.update_project(project)
+        gazu.project.update_project(project, client=client)
 
     # Update data
     project_data.update(
@@ -347,8 +384,10 @@ def write_project_to_op(project: dict, dbcon: AvalonMongoDB) -> UpdateOne:
             "$set": {
                 "config.tasks": {
                     t["name"]: {"short_name": t.get("short_name", t["name"])}
-                    for t in gazu.task.all_task_types_for_project(project)
-                    or gazu.task.all_task_types()
+                    for t in gazu.task.all_task_types_for_project(
+                        project, client=client
+                    )
+                    or gazu.task.all_task_types(client=client)
                 },
                 "data": project_data,
             }
@@ -356,19 +395,105 @@ def write_project_to_op(project: dict, dbcon: AvalonMongoDB) -> UpdateOne:
     )
 
 
+def get_changed_zou_ids(
+    project: dict,
+    entities: List[dict],
+    tasks: List[dict],
+    watermark: Union[str, None],
+    sync_started: Union[str, None] = None,
+) -> Tuple[Set[str], Union[str, None]]:
+    """Get ids of zou entities changed since last synchronization.
+
+    Entity is changed if it or any of its tasks was updated after watermark.
+    Descendants of changed entities are changed too as their names and
+    parents are based on parent entities.
+
+    Args:
+        project (dict): Gazu project.
+        entities (List[dict]): All zou entities of project.
+        tasks (List[dict]): All zou tasks of project.
+        watermark (Union[str, None]): 'updated_at' of the latest entity
+            or task from last synchronization.
+        sync_started (Union[str, None]): Time before entities were fetched.
+            New watermark is never newer so changes made during fetching
+            are synchronized next time.
+
+    Returns:
+        Tuple[Set[str], Union[str, None]]: Ids of changed entities and new
+            watermark.
+    """
+    new_watermark = watermark
+    for item in entities + tasks + [project]:
+        updated_at = item.get("updated_at")
+        if updated_at and (
+            new_watermark is None or updated_at > new_watermark
+        ):
+            new_watermark = updated_at
+
+    if (
+        sync_started
+        and new_watermark is not None
+        and new_watermark > sync_started
+    ):
+        new_watermark = max(sync_started, watermark or sync_started)
+
+    # Project values are used as defaults of all entities
+    project_updated_at = project.get("updated_at")
+    if (
+        watermark is None
+        or project_updated_at is None
+        or project_updated_at > watermark
+    ):
+        return {entity["id"] for entity in entities}, new_watermark
+
+    changed_ids = {
+        entity["id"]
+        for entity in entities
+        if (entity.get("updated_at") or "") > watermark
+    }
+    changed_ids |= {
+        task["entity_id"]
+        for task in tasks
+        if (task.get("updated_at") or "") > watermark
+    }
+
+    children_ids_by_parent_id = collections.defaultdict(set)
+    for entity in entities:
+        for key in ZOU_PARENT_KEYS:
+            parent_id = entity.get(key)
+            if parent_id:
+                children_ids_by_parent_id[parent_id].add(entity["id"])
+
+    queue = collections.deque(changed_ids)
+    while queue:
+        parent_id = queue.popleft()
+        for child_id in children_ids_by_parent_id[parent_id]:
+            if child_id not in changed_ids:
+                changed_ids.add(child_id)
+                queue.append(child_id)
+
+    entity_ids = {entity["id"] for entity in entities}
+    return changed_ids & entity_ids, new_watermark
+
+
 def sync_all_projects(
     login: str,
     password: str,
     ignore_projects: list = None,
     filter_projects: tuple = None,
+    max_workers: int = 4,
 ):
     """Update all OP projects in DB with Zou data.
 
+    Projects are synchronized concurrently, each in own thread with own
+    database connection and own gazu client.
+
     Args:
         login (str): Kitsu user login
         password (str): Kitsu user password
         ignore_projects (list): List of unsynced project names
         filter_projects (tuple): Tuple of filter project names to sync with
+        max_workers (int): Maximum number of projects synchronized at once
     Raises:
         gazu.exception.AuthFailedException: Wrong user login and/or password
     """
@@ -380,8 +505,6 @@ def sync_all_projects(
         )
 
     # Iterate projects
-    dbcon = AvalonMongoDB()
-    dbcon.install()
     all_projects = gazu.project.all_projects()
 
     project_to_sync = []
@@ -400,13 +523,61 @@ def sync_all_projects(
         # all project
         project_to_sync = all_projects
 
-    for project in project_to_sync:
-        if ignore_projects and project["name"] in ignore_projects:
-            continue
-        sync_project_from_kitsu(dbcon, project)
+    project_to_sync = [
+        project
+        for project in project_to_sync
+        if not ignore_projects or project["name"] not in ignore_projects
+    ]
+    if not project_to_sync:
+        return
 
+    default_client = gazu.client.default_client
+
+    def _sync_project(project):
+        # Each project has own connection with own session. Default gazu
+        #   client shares one 'requests.Session' which is not thread-safe,
+        #   so each thread uses own client with tokens of logged in user.
+        dbcon = AvalonMongoDB()
+        dbcon.install()
+        client = gazu.client.create_client(
+            default_client.host,
+            ssl_verify=default_client.session.verify
+        )
+        client.tokens = dict(default_client.tokens)
+        sync_project_from_kitsu(dbcon, project, client=client)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(project_to_sync)))
+    ) as executor:
+        futures_by_name = {
+            project["name"]: executor.submit(_sync_project, project)
+            for project in project_to_sync
+        }
+        failed = []
+        for project_name, future in futures_by_name.items():
+            try:
+                future.result()
+            except Exception:
+                log.error(
+                    f"Synchronization of '{project_name}' failed.",
+                    exc_info=True
+                )
+                failed.append(project_name)
+
+    if failed:
+        raise RuntimeError(
+            "Synchronization failed for projects: {}".format(
+                ", ".join(failed)
+            )
+        )
 
-def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
+
+def sync_project_from_kitsu(
+    dbcon: AvalonMongoDB,
+    project: dict,
+    full_sync: bool = False,
+    client: gazu.client.KitsuClient = None,
+):
     """Update OP project in DB with Zou data.
 
     `root_of` is meant to sort entities by type for a better readability in
@@ -414,18 +585,35 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
     asset entities under two different root folders or hierarchy, defined in
     settings.
 
+    Only entities changed since last synchronization are updated. Time of
+    last change is stored to project document. All changes are written with
+    one ordered bulk write, stored time is updated as the last operation.
+
     Args:
         dbcon (AvalonMongoDB): MongoDB connection
         project (dict): Project dict got using gazu.
+        full_sync (bool): Update all entities.
+        client (gazu.client.KitsuClient): Client used for requests to Zou,
+            default client of gazu is used if not passed.
     """
     bulk_writes = []
+    if client is None:
+        client = gazu.client.default_client
+
+    # Changes made from now on are synchronized next time
+    sync_started = (
+        datetime.datetime.utcnow()
+        - datetime.timedelta(seconds=SYNC_WATERMARK_MARGIN)
+    ).strftime(ZOU_DATETIME_FORMAT)
 
     # Get project from zou
     if not project:
-        project = gazu.project.get_project_by_name(project["name"])
+        project = gazu.project.get_project_by_name(
+            project["name"], client=client
+        )
 
     # Get all statuses for projects from Kitsu
-    all_status = gazu.project.all_project_status()
+    all_status = gazu.project.all_project_status(client=client)
     for status in all_status:
         if project["project_status_id"] == status["id"]:
             project["project_status_name"] = status["name"]
@@ -440,11 +628,14 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
     log.info(f"Synchronizing {project['name']}...")
 
     # Get all assets from zou
-    all_assets = gazu.asset.all_assets_for_project(project)
-    all_asset_types = gazu.asset.all_asset_types_for_project(project)
-    all_episodes = gazu.shot.all_episodes_for_project(project)
-    all_seqs = gazu.shot.all_sequences_for_project(project)
-    all_shots = gazu.shot.all_shots_for_project(project)
+    all_assets = gazu.asset.all_assets_for_project(project, client=client)
+    all_asset_types = gazu.asset.all_asset_types_for_project(
+        project, client=client
+    )
+    all_episodes = gazu.shot.all_episodes_for_project(project, client=client)
+    all_seqs = gazu.shot.all_sequences_for_project(project, client=client)
+    all_shots = gazu.shot.all_shots_for_project(project, client=client)
+    all_tasks = gazu.task.all_tasks_for_project(project, client=client)
     all_entities = [
         item
         for item in all_assets
@@ -460,7 +651,7 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
     project_dict = get_project(project_name)
     if not project_dict:
         log.info("Project created: {}".format(project_name))
-    bulk_writes.append(write_project_to_op(project, dbcon))
+    bulk_writes.append(write_project_to_op(project, dbcon, client=client))
 
     if project["project_status_name"] == "Closed":
         return
@@ -470,17 +661,30 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
         project_dict = get_project(project_name)
     dbcon.Session["AVALON_PROJECT"] = project_name
 
+    watermark = None
+    if not full_sync:
+        watermark = project_dict["data"].get(SYNC_WATERMARK_KEY)
+    changed_ids, new_watermark = get_changed_zou_ids(
+        project, all_entities, all_tasks, watermark, sync_started
+    )
+
     # Query all assets of the local project
-    zou_ids_and_asset_docs = {
-        asset_doc["data"]["zou"]["id"]: asset_doc
-        for asset_doc in get_assets(project_name)
-        if asset_doc["data"].get("zou", {}).get("id")
-    }
+    root_folder_ids = {}
+    zou_ids_and_asset_docs = {}
+    for asset_doc in get_assets(project_name):
+        root_of = asset_doc["data"].get("root_of")
+        if root_of and asset_doc["name"] == root_of:
+            root_folder_ids[root_of] = asset_doc["_id"]
+
+        zou_id = (asset_doc["data"].get("zou") or {}).get("id")
+        if zou_id:
+            zou_ids_and_asset_docs[zou_id] = asset_doc
     zou_ids_and_asset_docs[project["id"]] = project_dict
 
     # Create entities root folders
     to_insert = [
         {
+            "_id": ObjectId(),
             "name": r,
             "type": "asset",
             "schema": "openpype:asset-3.0",
@@ -492,33 +696,30 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
             },
         }
         for r in ["Assets", "Shots"]
-        if not get_asset_by_name(
-            project_name, r, fields=["_id", "data.root_of"]
-        )
+        if r not in root_folder_ids
     ]
+    for root_doc in to_insert:
+        root_folder_ids[root_doc["name"]] = root_doc["_id"]
 
     # Create
-    to_insert.extend(
-        [
-            create_op_asset(item)
-            for item in all_entities
-            if item["id"] not in zou_ids_and_asset_docs.keys()
-        ]
-    )
-    if to_insert:
-        # Insert doc in DB
-        dbcon.insert_many(to_insert)
-
-        # Update existing docs
-        zou_ids_and_asset_docs.update(
-            {
-                asset_doc["data"]["zou"]["id"]: asset_doc
-                for asset_doc in get_assets(project_name)
-                if asset_doc["data"].get("zou")
-            }
-        )
+    for item in all_entities:
+        if item["id"] in zou_ids_and_asset_docs:
+            continue
+        asset_doc = create_op_asset(item)
+        asset_doc["_id"] = ObjectId()
+        to_insert.append(asset_doc)
+        zou_ids_and_asset_docs[item["id"]] = asset_doc
+        changed_ids.add(item["id"])
+    bulk_writes.extend(InsertOne(doc) for doc in to_insert)
 
     # Update
+    changed_entities = [
+        item for item in all_entities if item["id"] in changed_ids
+    ]
+    log.info(
+        f"Updating {len(changed_entities)} of {len(all_entities)}"
+        f" entities of {project_name}"
+    )
     bulk_writes.extend(
         [
             UpdateOne({"_id": id}, update)
@@ -526,8 +727,10 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
                 dbcon,
                 project,
                 project_dict,
-                all_entities,
+                changed_entities,
                 zou_ids_and_asset_docs,
+                root_folder_ids,
+                client=client,
             )
         ]
     )
@@ -539,11 +742,21 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
     if diff_assets:
         bulk_writes.extend(
             [
-                DeleteOne(zou_ids_and_asset_docs[asset_id])
+                DeleteOne({"_id": zou_ids_and_asset_docs[asset_id]["_id"]})
                 for asset_id in diff_assets
             ]
         )
 
+    # Store time of the latest change as the last write so it's not
+    #   changed if any of previous writes fails
+    if new_watermark:
+        bulk_writes.append(
+            UpdateOne(
+                {"_id": project_dict["_id"]},
+                {"$set": {f"data.{SYNC_WATERMARK_KEY}": new_watermark}},
+            )
+        )
+
     # Write into DB
     if bulk_writes:
-        dbcon.bulk_write(bulk_writes)
+        dbcon.bulk_write(bulk_writes, ordered=True)
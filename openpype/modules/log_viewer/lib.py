@@ -0,0 +1,130 @@
+"""Queries of log collection used by log viewer.
+
+Logs are grouped by process on database side and summaries of processes are
+returned in pages. Log lines of a process are queried only when needed.
+"""
+import pymongo
+
+PROCESS_KEYS = (
+    "process_id", "hostname", "hostip",
+    "username", "system_name", "process_name"
+)
+LOG_KEYS = (
+    "timestamp", "level", "thread", "threadName", "message", "loggerName",
+    "fileName", "module", "method", "lineNumber"
+)
+
+LOG_INDEXES = (
+    [("process_id", pymongo.ASCENDING), ("timestamp", pymongo.ASCENDING)],
+    [("timestamp", pymongo.DESCENDING)],
+    [("username", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING)],
+)
+
+
+def ensure_log_indexes(collection):
+    """Create indexes used by log viewer queries.
+
+    Args:
+        collection (pymongo.collection.Collection): Log collection.
+    """
+    for keys in LOG_INDEXES:
+        collection.create_index(keys, background=True)
+
+
+def get_process_filter(usernames=None, hostnames=None):
+    """Query filter of logs for log viewer.
+
+    Args:
+        usernames (Optional[Iterable[str]]): Show only logs of users.
+            All users are shown if not passed.
+        hostnames (Optional[Iterable[str]]): Show only logs from hosts.
+            All hosts are shown if not passed.
+
+    Returns:
+        dict[str, Any]: Filter for 'find' or '$match' stage.
+    """
+    # Logs without process id are from older versions
+    query_filter = {"process_id": {"$nin": [None, ""]}}
+    if usernames is not None:
+        query_filter["username"] = {"$in": list(usernames)}
+    if hostnames is not None:
+        query_filter["hostname"] = {"$in": list(hostnames)}
+    return query_filter
+
+
+def get_process_summaries_pipeline(
+    usernames=None, hostnames=None, skip=0, limit=None
+):
+    """Aggregation pipeline grouping logs by process.
+
+    Processes are sorted from the last started.
+
+    Returns:
+        list[dict[str, Any]]: Aggregation pipeline.
+    """
+    group_stage = {
+        "_id": "$process_id",
+        "started": {"$min": "$timestamp"},
+        "last_timestamp": {"$max": "$timestamp"},
+        "logs_count": {"$sum": 1},
+    }
+    for key in PROCESS_KEYS:
+        if key != "process_id":
+            group_stage[key] = {"$first": "${}".format(key)}
+
+    pipeline = [
+        {"$match": get_process_filter(usernames, hostnames)},
+        {"$group": group_stage},
+        {"$sort": {"started": pymongo.DESCENDING, "_id": 1}},
+    ]
+    if skip:
+        pipeline.append({"$skip": skip})
+    if limit:
+        pipeline.append({"$limit": limit})
+    return pipeline
+
+
+def get_process_summaries(
+    collection, usernames=None, hostnames=None, skip=0, limit=None
+):
+    """Summaries of processes from log collection.
+
+    Args:
+        collection (pymongo.collection.Collection): Log collection.
+        usernames (Optional[Iterable[str]]): Filter by users.
+        hostnames (Optional[Iterable[str]]): Filter by hosts.
+        skip (Optional[int]): Skip first processes.
+        limit (Optional[int]): Maximum number of processes.
+
+    Returns:
+        list[dict[str, Any]]: Process information with "started" time
+            and number of logs.
+    """
+    pipeline = get_process_summaries_pipeline(
+        usernames, hostnames, skip, limit
+    )
+    output = []
+    for item in collection.aggregate(pipeline, allowDiskUse=True):
+        item["process_id"] = item.pop("_id")
+        output.append(item)
+    return output
+
+
+def get_process_logs(collection, process_id):
+    """Log lines of a process sorted by time.
+
+    Args:
+        collection (pymongo.collection.Collection): Log collection.
+        process_id (str): Id of process.
+
+    Returns:
+        list[dict[str, Any]]: Logs of process.
+    """
+    projection = {key: True for key in LOG_KEYS}
+    projection["exception"] = True
+    projection["_id"] = False
+    return list(
+        collection
+        .find({"process_id": process_id}, projection=projection)
+        .sort("timestamp", pymongo.ASCENDING)
+    )
@@ -1,9 +1,21 @@
-import collections
 from qtpy import QtCore, QtGui
 from openpype.lib import Logger
 
+from ..lib import (
+    PROCESS_KEYS,
+    LOG_KEYS,
+    ensure_log_indexes,
+    get_process_summaries,
+    get_process_logs,
+)
+
 
 class LogModel(QtGui.QStandardItemModel):
+    """Processes from log collection.
+
+    Processes are loaded in pages when view needs more rows and logs of
+    process are loaded on demand with 'get_process_logs'.
+    """
     COLUMNS = (
         "process_name",
         "hostname",
@@ -21,24 +33,22 @@ class LogModel(QtGui.QStandardItemModel):
         "system_name": "System name",
         "started": "Started at"
     }
-    process_keys = (
-        "process_id", "hostname", "hostip",
-        "username", "system_name", "process_name"
-    )
-    log_keys = (
-        "timestamp", "level", "thread", "threadName", "message", "loggerName",
-        "fileName", "module", "method", "lineNumber"
-    )
+    process_keys = PROCESS_KEYS
+    log_keys = LOG_KEYS
     default_value = "- Not set -"
+    page_size = 200
 
-    ROLE_LOGS = QtCore.Qt.UserRole + 2
     ROLE_PROCESS_ID = QtCore.Qt.UserRole + 3
 
     def __init__(self, parent=None):
         super(LogModel, self).__init__(parent)
 
-        self.log_by_process = None
         self.dbcon = None
+        self._usernames = None
+        self._hostnames = None
+        self._loaded_count = 0
+        self._has_more = False
+        self._logs_by_process_id = {}
 
         # Crash if connection is not possible to skip this module
         if not Logger.initialized:
@@ -49,6 +59,7 @@ class LogModel(QtGui.QStandardItemModel):
             Logger.bootstrap_mongo_log()
             database = connection[Logger.log_database_name]
             self.dbcon = database[Logger.log_collection_name]
+            ensure_log_indexes(self.dbcon)
 
     def headerData(self, section, orientation, role):
         if (
@@ -61,78 +72,95 @@ class LogModel(QtGui.QStandardItemModel):
 
         super(LogModel, self).headerData(section, orientation, role)
 
-    def add_process_logs(self, process_logs):
+    def set_filters(self, usernames=None, hostnames=None):
+        """Show only processes of users and hosts.
+
+        Args:
+            usernames (Optional[Iterable[str]]): Usernames. All users are
+                shown if not passed.
+            hostnames (Optional[Iterable[str]]): Hostnames. All hosts are
+                shown if not passed.
+        """
+        self._usernames = None if usernames is None else set(usernames)
+        self._hostnames = None if hostnames is None else set(hostnames)
+        self.refresh()
+
+    def add_process_logs(self, process_info):
         items = []
         first_item = True
         for key in self.COLUMNS:
-            display_value = str(process_logs[key])
+            display_value = str(process_info[key])
             item = QtGui.QStandardItem(display_value)
             if first_item:
                 first_item = False
-                item.setData(process_logs["_logs"], self.ROLE_LOGS)
-                item.setData(process_logs["process_id"], self.ROLE_PROCESS_ID)
+                item.setData(process_info["process_id"], self.ROLE_PROCESS_ID)
             items.append(item)
         self.appendRow(items)
 
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return self._has_more
+
+    def fetchMore(self, parent):
+        if not parent.isValid():
+            self._fetch_page()
+
+    def _fetch_page(self):
+        if not self.dbcon:
+            self._has_more = False
+            return
+
+        summaries = get_process_summaries(
+            self.dbcon,
+            self._usernames,
+            self._hostnames,
+            skip=self._loaded_count,
+            limit=self.page_size + 1
+        )
+        self._has_more = len(summaries) > self.page_size
+        summaries = summaries[:self.page_size]
+        self._loaded_count += len(summaries)
+        for summary in summaries:
+            process_info = {}
+            for key in self.process_keys:
+                process_info[key] = summary.get(key) or self.default_value
+            process_info["started"] = summary["started"]
+            self.add_process_logs(process_info)
+
+    def get_process_logs(self, process_id):
+        """Logs of process sorted by time.
+
+        Args:
+            process_id (str): Id of process.
+
+        Returns:
+            list[dict[str, Any]]: Logs of process.
+        """
+        if not self.dbcon or not process_id:
+            return []
+
+        logs = self._logs_by_process_id.get(process_id)
+        if logs is not None:
+            return logs
+
+        logs = []
+        for item in get_process_logs(self.dbcon, process_id):
+            log_item = {}
+            for key in self.log_keys:
+                log_item[key] = item.get(key) or self.default_value
+
+            if "exception" in item:
+                log_item["exception"] = item["exception"]
+            logs.append(log_item)
+        self._logs_by_process_id[process_id] = logs
+        return logs
+
     def refresh(self):
-        self.log_by_process = collections.defaultdict(list)
-        self.process_info = {}
+        self._logs_by_process_id = {}
+        self._loaded_count = 0
 
         self.clear()
         self.beginResetModel()
-        if self.dbcon:
-            result = self.dbcon.find({})
-            for item in result:
-                process_id = item.get("process_id")
-                # backwards (in)compatibility
-                if not process_id:
-                    continue
-
-                if process_id not in self.process_info:
-                    proc_dict = {"_logs": []}
-                    for key in self.process_keys:
-                        proc_dict[key] = (
-                            item.get(key) or self.default_value
-                        )
-                    self.process_info[process_id] = proc_dict
-
-                log_item = {}
-                for key in self.log_keys:
-                    log_item[key] = item.get(key) or self.default_value
-
-                if "exception" in item:
-                    log_item["exception"] = item["exception"]
-
-                self.process_info[process_id]["_logs"].append(log_item)
-
-        for item in self.process_info.values():
-            item["_logs"] = sorted(
-                item["_logs"], key=lambda item: item["timestamp"]
-            )
-            item["started"] = item["_logs"][0]["timestamp"]
-            self.add_process_logs(item)
-
+        self._fetch_page()
         self.endResetModel()
-
-
-class LogsFilterProxy(QtCore.QSortFilterProxyModel):
-    def __init__(self, *args, **kwargs):
-        super(LogsFilterProxy, self).__init__(*args, **kwargs)
-        self.col_usernames = None
-        self.filter_usernames = set()
-
-    def update_users_filter(self, users):
-        self.filter_usernames = set()
-        for user in users or tuple():
-            self.filter_usernames.add(user)
-        self.invalidateFilter()
-
-    def filterAcceptsRow(self, source_row, source_parent):
-        if self.col_usernames is not None:
-            index = self.sourceModel().index(
-                source_row, self.col_usernames, source_parent
-            )
-            user = index.data(QtCore.Qt.DisplayRole)
-            if user not in self.filter_usernames:
-                return False
-        return True
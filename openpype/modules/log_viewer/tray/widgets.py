@@ -1,7 +1,7 @@
 import html
 from qtpy import QtCore, QtWidgets
 import qtawesome
-from .models import LogModel, LogsFilterProxy
+from .models import LogModel
 
 
 class SearchComboBox(QtWidgets.QComboBox):
@@ -111,18 +111,21 @@ class LogsWidget(QtWidgets.QWidget):
         super(LogsWidget, self).__init__(parent=parent)
 
         model = LogModel()
-        proxy_model = LogsFilterProxy()
+        proxy_model = QtCore.QSortFilterProxyModel()
         proxy_model.setSourceModel(model)
-        proxy_model.col_usernames = model.COLUMNS.index("username")
 
         filter_layout = QtWidgets.QHBoxLayout()
 
+        # Users and hosts are filtered on server side
         user_filter = CustomCombo("Users", self)
         users = model.dbcon.distinct("username")
         user_filter.populate(users)
-        user_filter.selection_changed.connect(self._user_changed)
+        user_filter.selection_changed.connect(self._filters_changed)
 
-        proxy_model.update_users_filter(users)
+        host_filter = CustomCombo("Hosts", self)
+        hosts = [host for host in model.dbcon.distinct("hostname") if host]
+        host_filter.populate(hosts)
+        host_filter.selection_changed.connect(self._filters_changed)
 
         level_filter = CustomCombo("Levels", self)
         levels = model.dbcon.distinct("level")
@@ -135,6 +138,7 @@ class LogsWidget(QtWidgets.QWidget):
         refresh_btn = QtWidgets.QPushButton(icon, "")
 
         filter_layout.addWidget(user_filter)
+        filter_layout.addWidget(host_filter)
         filter_layout.addWidget(level_filter)
         filter_layout.addStretch(1)
         filter_layout.addWidget(refresh_btn)
@@ -170,6 +174,7 @@ class LogsWidget(QtWidgets.QWidget):
         self.view = view
 
         self.user_filter = user_filter
+        self.host_filter = host_filter
         self.level_filter = level_filter
 
         self.detail_widget = detail_widget
@@ -190,17 +195,32 @@ class LogsWidget(QtWidgets.QWidget):
     def _on_index_change(self, to_index, from_index):
         index = self._selected_log()
         if index:
-            logs = index.data(self.model.ROLE_LOGS)
+            logs = self.model.get_process_logs(
+                index.data(self.model.ROLE_PROCESS_ID)
+            )
         else:
             logs = []
         self.detail_widget.set_detail(logs)
 
-    def _user_changed(self):
-        checked_values = set()
-        for action in self.user_filter.items():
-            if action.isChecked():
-                checked_values.add(action.text())
-        self.proxy_model.update_users_filter(checked_values)
+    @staticmethod
+    def _get_checked_values(combo):
+        """Checked values or None if all values are checked."""
+        actions = list(combo.items())
+        checked_values = {
+            action.text()
+            for action in actions
+            if action.isChecked()
+        }
+        if len(checked_values) == len(actions):
+            return None
+        return checked_values
+
+    def _filters_changed(self):
+        self.detail_widget.set_detail([])
+        self.model.set_filters(
+            self._get_checked_values(self.user_filter),
+            self._get_checked_values(self.host_filter)
+        )
 
     def _level_changed(self):
         checked_values = set()
@@ -16,6 +16,9 @@ from openpype.pipeline.publish import KnownPublishError
 from openpype.pipeline import (
     legacy_io,
 )
+from openpype.pipeline.farm.expected_files import (
+    compact_publish_metadata
+)
 from openpype.pipeline.farm.pyblish_functions import (
     create_skeleton_instance,
     create_instances_for_aov,
@@ -159,7 +162,10 @@ class CreatePublishRoyalRenderJob(pyblish.api.InstancePlugin,
 
         self.log.info("Writing json file: {}".format(metadata_path))
         with open(metadata_path, "w") as f:
-            json.dump(publish_job, f, indent=4, sort_keys=True)
+            json.dump(
+                compact_publish_metadata(publish_job), f,
+                indent=4, sort_keys=True
+            )
 
     def get_job(self, instance, instances):
         """Create RR publishing job.
@@ -0,0 +1,380 @@
+"""Delivery of messages from Slack outbox.
+
+Worker claims due messages from outbox, uploads their files and posts them.
+Rate limited requests are postponed by 'Retry-After' of the response without
+counting as failed attempt, other errors are retried with exponential
+backoff. Users and usergroups needed to translate mentions are cached with
+a TTL for each token.
+"""
+import os
+import time
+import hashlib
+import threading
+from datetime import datetime
+
+from openpype.lib import Logger
+
+from .lib import translate_mentions
+from .outbox import SlackOutbox
+
+# Errors which won't be fixed by retrying
+PERMANENT_ERRORS = {
+    "account_inactive",
+    "channel_not_found",
+    "invalid_auth",
+    "is_archived",
+    "msg_too_long",
+    "no_text",
+    "not_authed",
+    "not_in_channel",
+    "token_revoked",
+}
+
+
+class SlackRateLimited(Exception):
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        super(SlackRateLimited, self).__init__(
+            "Rate limited for {} seconds".format(retry_after)
+        )
+
+
+def _get_token_key(token):
+    # Tokens are not used as keys directly so they don't leak to logs
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _get_error_code(error):
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            return response.get("error")
+        except Exception:
+            pass
+    return None
+
+
+def _get_retry_after(error):
+    """Retry-After of rate limited response or None."""
+    response = getattr(error, "response", None)
+    if response is None or getattr(response, "status_code", None) != 429:
+        return None
+    try:
+        return max(int(response.headers.get("Retry-After", 1)), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+class SlackDirectoryCache(object):
+    """Users and usergroups of Slack workspaces cached by token.
+
+    Args:
+        ttl (float): Seconds after which users and groups are fetched again.
+    """
+
+    def __init__(self, ttl=3600):
+        self.ttl = ttl
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def get(self, token, fetch_func):
+        """Users and groups for token.
+
+        Args:
+            token (str): Slack token.
+            fetch_func (Callable[[], tuple[list, list]]): Fetch users and
+                groups from Slack.
+
+        Returns:
+            tuple[list[dict], list[dict]]: Users and groups.
+        """
+        key = _get_token_key(token)
+        with self._lock:
+            item = self._items.get(key)
+        if item is not None and time.time() - item[0] < self.ttl:
+            return item[1], item[2]
+
+        users, groups = fetch_func()
+        with self._lock:
+            self._items[key] = (time.time(), users, groups)
+        return users, groups
+
+
+def store_notification_message(message, msg_id, file_ids):
+    """Store delivered message to 'notification_messages' collection."""
+    from openpype.client import OpenPypeMongoConnection
+
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    dbcon = mongo_client[database_name]["notification_messages"]
+    dbcon.insert_one({
+        "type": "slack",
+        "msg_id": msg_id,
+        "file_ids": file_ids,
+        "project": message["project"],
+        "created_dt": datetime.fromtimestamp(message["created"])
+    })
+
+
+class SlackOutboxWorker(object):
+    """Deliver messages from Slack outbox.
+
+    Args:
+        outbox (Optional[SlackOutbox]): Outbox to process.
+        base_url (Optional[str]): Url of Slack api. Default of 'slack_sdk'
+            is used if not passed.
+        on_delivered (Optional[Callable[[dict, str, list[str]], None]]):
+            Called with message, message id and ids of uploaded files
+            after delivery.
+        directory_cache (Optional[SlackDirectoryCache]): Cache of users
+            and groups.
+    """
+
+    poll_interval = 5
+    max_attempts = 10
+    retry_delay = 10
+    max_retry_delay = 900
+    users_page_size = 200
+    claim_batch_size = 20
+
+    def __init__(
+        self,
+        outbox=None,
+        base_url=None,
+        on_delivered=None,
+        directory_cache=None,
+        log=None
+    ):
+        if outbox is None:
+            outbox = SlackOutbox()
+        if directory_cache is None:
+            directory_cache = SlackDirectoryCache()
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.outbox = outbox
+        self.directory_cache = directory_cache
+        self.log = log
+        self._base_url = base_url
+        self._on_delivered = on_delivered
+        self._clients = {}
+        # Token key -> time until which requests are rate limited
+        self._blocked_until = {}
+
+    def _get_client(self, token):
+        from slack_sdk import WebClient
+
+        key = _get_token_key(token)
+        client = self._clients.get(key)
+        if client is None:
+            kwargs = {"token": token}
+            if self._base_url:
+                kwargs["base_url"] = self._base_url
+            client = WebClient(**kwargs)
+            self._clients[key] = client
+        return client
+
+    def _call(self, func, **kwargs):
+        from slack_sdk.errors import SlackApiError
+
+        try:
+            return func(**kwargs)
+        except SlackApiError as exc:
+            retry_after = _get_retry_after(exc)
+            if retry_after is not None:
+                raise SlackRateLimited(retry_after)
+            raise
+
+    def _fetch_users_and_groups(self, client):
+        users = []
+        cursor = None
+        while True:
+            kwargs = {"limit": self.users_page_size}
+            if cursor:
+                kwargs["cursor"] = cursor
+            response = self._call(client.users_list, **kwargs)
+            users.extend(response.get("members") or [])
+            cursor = (
+                (response.get("response_metadata") or {}).get("next_cursor")
+            )
+            if not cursor:
+                break
+
+        response = self._call(client.usergroups_list)
+        groups = list(response.get("usergroups") or [])
+        return users, groups
+
+    def _get_users_and_groups(self, token, client):
+        try:
+            return self.directory_cache.get(
+                token, lambda: self._fetch_users_and_groups(client)
+            )
+        except SlackRateLimited:
+            raise
+        except Exception:
+            # Failed fetch is not cached and is tried with next message
+            self.log.warning(
+                "Cannot pull user info, mentions won't work", exc_info=True
+            )
+            return [], []
+
+    def deliver(self, message):
+        """Upload files and post message to Slack.
+
+        Uploaded files are stored to message so they are not uploaded again
+        when posting fails.
+
+        Args:
+            message (dict[str, Any]): Message from outbox.
+
+        Returns:
+            tuple[str, list[str]]: Message id and ids of uploaded files.
+        """
+        client = self._get_client(message["token"])
+        text = message["message"]
+        if "@" in text:
+            users, groups = self._get_users_and_groups(
+                message["token"], client
+            )
+            text = translate_mentions(text, users, groups)
+
+        uploaded = message["uploaded"]
+        for filepath in message["files"]:
+            if filepath in uploaded:
+                continue
+            response = self._call(
+                client.files_upload,
+                file=filepath,
+                filename=os.path.basename(filepath)
+            )
+            uploaded[filepath] = {
+                "id": response["file"]["id"],
+                "permalink": response["file"]["permalink"],
+            }
+
+        if message["files"]:
+            text += "\n\n Attachment links: \n"
+            for filepath in message["files"]:
+                text += "\n<{}|{}>".format(
+                    uploaded[filepath]["permalink"],
+                    os.path.basename(filepath)
+                )
+
+        response = self._call(
+            client.chat_postMessage,
+            channel=message["channel"],
+            text=text
+        )
+        file_ids = [uploaded[filepath]["id"] for filepath in message["files"]]
+        return response["ts"], file_ids
+
+    def _get_retry_delay(self, attempts):
+        return min(self.retry_delay * (2 ** attempts), self.max_retry_delay)
+
+    def _process_message(self, message):
+        token_key = _get_token_key(message["token"])
+        blocked_until = self._blocked_until.get(token_key)
+        now = time.time()
+        if blocked_until is not None and blocked_until > now:
+            self.outbox.release(
+                message, blocked_until - now, count_attempt=False
+            )
+            return False
+
+        try:
+            msg_id, file_ids = self.deliver(message)
+
+        except SlackRateLimited as exc:
+            self.log.info(
+                "Slack rate limit hit, postponing for {} seconds".format(
+                    exc.retry_after
+                )
+            )
+            self._blocked_until[token_key] = now + exc.retry_after
+            self.outbox.release(
+                message, exc.retry_after, str(exc), count_attempt=False
+            )
+            return False
+
+        except Exception as exc:
+            error_code = _get_error_code(exc)
+            error = str(error_code or exc)
+            if error_code == "not_in_channel":
+                error += (
+                    " - application must added to channel '{}'."
+                    " Ask Slack admin."
+                ).format(message["channel"])
+
+            if (
+                error_code in PERMANENT_ERRORS
+                or message["attempts"] + 1 >= self.max_attempts
+            ):
+                self.log.warning(
+                    "Slack message to '{}' failed: {}".format(
+                        message["channel"], error
+                    ),
+                    exc_info=True
+                )
+                self.outbox.fail(message, error)
+            else:
+                delay = self._get_retry_delay(message["attempts"])
+                self.log.info(
+                    "Slack message to '{}' failed, retry in {} seconds: {}"
+                    .format(message["channel"], delay, error)
+                )
+                self.outbox.release(message, delay, error)
+            return False
+
+        self.outbox.complete(message)
+        if self._on_delivered is not None:
+            try:
+                self._on_delivered(message, msg_id, file_ids)
+            except Exception:
+                self.log.warning(
+                    "Failed to store delivered message", exc_info=True
+                )
+        return True
+
+    def process_due(self):
+        """Deliver all due messages.
+
+        Returns:
+            int: Number of delivered messages.
+        """
+        delivered = 0
+        while True:
+            messages = self.outbox.claim_due(limit=self.claim_batch_size)
+            if not messages:
+                break
+            for message in messages:
+                if self._process_message(message):
+                    delivered += 1
+        return delivered
+
+    def run(self, stop_event=None, until_empty=False):
+        """Process outbox until stopped.
+
+        Args:
+            stop_event (Optional[threading.Event]): Stop processing when set.
+            until_empty (Optional[bool]): Stop when there are no pending
+                messages.
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+
+        self.outbox.recover_stale()
+        while not stop_event.is_set():
+            self.outbox.touch_heartbeat()
+            try:
+                self.process_due()
+            except Exception:
+                self.log.warning(
+                    "Processing of Slack outbox failed", exc_info=True
+                )
+
+            if until_empty and self.outbox.get_pending_count() == 0:
+                break
+            stop_event.wait(self.poll_interval)
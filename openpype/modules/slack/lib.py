@@ -0,0 +1,59 @@
+"""Helpers shared by Slack publish plugin and notification delivery.
+
+Module must stay Python 2 compatible as it is used in hosts.
+"""
+import re
+
+
+def get_user_id(users, user_name):
+    """Returns internal slack id for user name"""
+    user_id = None
+    user_name_lower = user_name.lower()
+    for user in users:
+        if (not user.get("deleted") and
+                (user_name_lower == user["name"].lower() or
+                 # bots dont have display_name
+                 user_name_lower == user["profile"].get("display_name",
+                                                        '').lower() or
+                 user_name_lower == user["profile"].get("real_name",
+                                                        '').lower())):
+            user_id = user["id"]
+            break
+    return user_id
+
+
+def get_group_id(groups, group_name):
+    """Returns internal group id for string name"""
+    group_id = None
+    for group in groups:
+        if (not group.get("date_delete") and
+                (group_name.lower() == group["name"].lower() or
+                 group_name.lower() == group["handle"])):
+            group_id = group["id"]
+            break
+    return group_id
+
+
+def translate_mentions(message, users, groups):
+    """Replace all occurences of @mentions with proper <@name> format."""
+    matches = re.findall(r"(?<!<)@\S+", message)
+    in_quotes = re.findall(r"(?<!<)(['\"])(@[^'\"]+)", message)
+    for item in in_quotes:
+        matches.append(item[1])
+    if not matches:
+        return message
+
+    for orig_user in matches:
+        user_name = orig_user.replace("@", '')
+        slack_id = get_user_id(users, user_name)
+        mention = None
+        if slack_id:
+            mention = "<@{}>".format(slack_id)
+        else:
+            slack_id = get_group_id(groups, user_name)
+            if slack_id:
+                mention = "<!subteam^{}>".format(slack_id)
+        if mention:
+            message = message.replace(orig_user, mention)
+
+    return message
@@ -0,0 +1,262 @@
+"""Durable local outbox of Slack notifications.
+
+Publish plugin only stores messages to the outbox and messages are delivered
+by worker running in tray or by 'slack deliver' command. Each message is
+a json file in one of outbox subfolders:
+
+- 'pending' messages waiting for (next attempt of) delivery
+- 'processing' messages claimed by a worker
+- 'failed' messages which could not be delivered
+
+Claiming is done by renaming of the file so multiple workers can process
+one outbox. Module must stay Python 2 compatible as it is used in hosts.
+"""
+import os
+import json
+import time
+import uuid
+
+import appdirs
+
+from openpype import AYON_SERVER_ENABLED
+
+OUTBOX_DIR_ENV_KEY = "OPENPYPE_SLACK_OUTBOX_DIR"
+
+PENDING_DIR = "pending"
+PROCESSING_DIR = "processing"
+FAILED_DIR = "failed"
+HEARTBEAT_FILENAME = "worker.heartbeat"
+
+
+def get_slack_outbox_dir():
+    """Root of local Slack outbox.
+
+    Can be changed with 'OPENPYPE_SLACK_OUTBOX_DIR' environment variable.
+
+    Returns:
+        str: Path to outbox directory.
+    """
+    outbox_dir = os.environ.get(OUTBOX_DIR_ENV_KEY)
+    if outbox_dir:
+        return outbox_dir
+
+    if AYON_SERVER_ENABLED:
+        data_dir = appdirs.user_data_dir("AYON", "Ynput")
+    else:
+        data_dir = appdirs.user_data_dir("openpype", "pypeclub")
+    return os.path.join(data_dir, "slack_outbox")
+
+
+class SlackOutbox(object):
+    """Local outbox of Slack messages.
+
+    Args:
+        root (Optional[str]): Outbox directory. Default outbox directory
+            is used if not passed.
+    """
+
+    def __init__(self, root=None):
+        if not root:
+            root = get_slack_outbox_dir()
+        self._root = root
+
+    @property
+    def root(self):
+        return self._root
+
+    def _get_dir(self, dirname):
+        dirpath = os.path.join(self._root, dirname)
+        if not os.path.exists(dirpath):
+            try:
+                os.makedirs(dirpath)
+            except OSError:
+                # Created by other process in the meantime
+                if not os.path.isdir(dirpath):
+                    raise
+        return dirpath
+
+    def _write(self, dirname, message):
+        dirpath = self._get_dir(dirname)
+        filepath = os.path.join(dirpath, message["filename"])
+        tmp_path = "{}.{}.tmp".format(filepath, uuid.uuid4().hex)
+        # Messages contain token so they are readable only by owner
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as stream:
+            json.dump(message, stream)
+        os.rename(tmp_path, filepath)
+        return filepath
+
+    def _read(self, filepath):
+        with open(filepath, "r") as stream:
+            return json.load(stream)
+
+    def _list(self, dirname):
+        dirpath = os.path.join(self._root, dirname)
+        if not os.path.exists(dirpath):
+            return []
+        return sorted(
+            os.path.join(dirpath, filename)
+            for filename in os.listdir(dirpath)
+            if filename.endswith(".json")
+        )
+
+    def enqueue(self, token, channel, message, files=None, project=None):
+        """Store message for delivery.
+
+        Args:
+            token (str): Slack bot token.
+            channel (str): Target channel.
+            message (str): Message text, mentions are translated on delivery.
+            files (Optional[Iterable[str]]): Paths to files to upload.
+            project (Optional[str]): Project code.
+
+        Returns:
+            str: Message id.
+        """
+        now = time.time()
+        message_id = uuid.uuid4().hex
+        self._write(PENDING_DIR, {
+            "id": message_id,
+            # Names are sorted by creation time
+            "filename": "{:016d}_{}.json".format(
+                int(now * 1000000), message_id
+            ),
+            "token": token,
+            "channel": channel,
+            "message": message,
+            "files": list(files or []),
+            "project": project,
+            "created": now,
+            "attempts": 0,
+            "next_attempt": now,
+            "uploaded": {},
+            "last_error": None,
+        })
+        return message_id
+
+    def claim_due(self, limit=None, now=None):
+        """Claim pending messages which should be delivered now.
+
+        Claimed messages must be passed to one of 'complete', 'release' or
+        'fail'.
+
+        Args:
+            limit (Optional[int]): Maximum number of claimed messages.
+            now (Optional[float]): Current time.
+
+        Returns:
+            list[dict[str, Any]]: Claimed messages in order of creation.
+        """
+        if now is None:
+            now = time.time()
+        processing_dir = self._get_dir(PROCESSING_DIR)
+        output = []
+        for filepath in self._list(PENDING_DIR):
+            if limit is not None and len(output) >= limit:
+                break
+            try:
+                message = self._read(filepath)
+            except (IOError, OSError, ValueError):
+                # Removed, claimed or not fully written yet
+                continue
+
+            if message["next_attempt"] > now:
+                continue
+
+            dst_path = os.path.join(
+                processing_dir, os.path.basename(filepath)
+            )
+            try:
+                os.rename(filepath, dst_path)
+            except OSError:
+                # Claimed by other worker
+                continue
+            # Modification time is used to find claims of crashed workers
+            os.utime(dst_path, None)
+            output.append(message)
+        return output
+
+    def complete(self, message):
+        """Remove delivered message."""
+        filepath = os.path.join(
+            self._root, PROCESSING_DIR, message["filename"]
+        )
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+    def release(self, message, delay=0, error=None, count_attempt=True):
+        """Return claimed message back to pending messages.
+
+        Args:
+            message (dict[str, Any]): Claimed message.
+            delay (Optional[float]): Seconds to wait before next attempt.
+            error (Optional[str]): Reason of failed attempt.
+            count_attempt (Optional[bool]): Increase number of attempts.
+        """
+        if count_attempt:
+            message["attempts"] += 1
+        message["next_attempt"] = time.time() + delay
+        message["last_error"] = error
+        self._write(PENDING_DIR, message)
+        self.complete(message)
+
+    def fail(self, message, error=None):
+        """Move claimed message to failed messages."""
+        message["last_error"] = error
+        self._write(FAILED_DIR, message)
+        self.complete(message)
+
+    def recover_stale(self, max_age=3600):
+        """Return messages of crashed workers back to pending messages.
+
+        Args:
+            max_age (float): Seconds after which claimed message is
+                considered stale.
+
+        Returns:
+            int: Number of recovered messages.
+        """
+        pending_dir = self._get_dir(PENDING_DIR)
+        now = time.time()
+        count = 0
+        for filepath in self._list(PROCESSING_DIR):
+            try:
+                if now - os.path.getmtime(filepath) < max_age:
+                    continue
+                os.rename(
+                    filepath,
+                    os.path.join(pending_dir, os.path.basename(filepath))
+                )
+            except OSError:
+                continue
+            count += 1
+        return count
+
+    def get_pending_count(self):
+        return len(self._list(PENDING_DIR))
+
+    def get_failed_messages(self):
+        output = []
+        for filepath in self._list(FAILED_DIR):
+            try:
+                output.append(self._read(filepath))
+            except (IOError, OSError, ValueError):
+                continue
+        return output
+
+    def touch_heartbeat(self):
+        """Mark that a worker is processing the outbox."""
+        filepath = os.path.join(self._root, HEARTBEAT_FILENAME)
+        if not os.path.exists(self._root):
+            self._get_dir("")
+        with open(filepath, "w") as stream:
+            stream.write(str(os.getpid()))
+
+    def is_worker_alive(self, max_age=60):
+        """Worker touched heartbeat in last 'max_age' seconds."""
+        filepath = os.path.join(self._root, HEARTBEAT_FILENAME)
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            return False
+        return time.time() - mtime < max_age
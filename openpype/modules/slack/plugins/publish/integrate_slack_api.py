@@ -8,8 +8,11 @@ from abc import ABCMeta, abstractmethod
 import time
 
 from openpype.client import OpenPypeMongoConnection
+from openpype.lib import get_openpype_execute_args, run_detached_process
 from openpype.pipeline.publish import get_publish_repre_path
 from openpype.lib.plugin_tools import prepare_template_data
+from openpype_modules.slack.lib import translate_mentions
+from openpype_modules.slack.outbox import SlackOutbox
 
 
 class IntegrateSlackAPI(pyblish.api.InstancePlugin):
@@ -23,12 +26,17 @@ class IntegrateSlackAPI(pyblish.api.InstancePlugin):
         If instance contains 'review' it could upload (if configured) or place
         link with {review_filepath} placeholder.
         Message template can contain {} placeholders from anatomyData.
+
+        Messages are stored to local outbox and delivered by tray service
+        or by detached 'slack deliver' process so publishing does not wait
+        for Slack. Set 'use_outbox' to 'False' to send messages directly.
     """
     order = pyblish.api.IntegratorOrder + 0.499
     label = "Integrate Slack Api"
     families = ["slack"]
 
     optional = True
+    use_outbox = True
 
     def process(self, instance):
         thumbnail_path = self._get_thumbnail_path(instance)
@@ -41,6 +49,7 @@ class IntegrateSlackAPI(pyblish.api.InstancePlugin):
         if additional_message:
             message = "{} \n".format(additional_message)
         users = groups = None
+        outbox = SlackOutbox() if self.use_outbox else None
         for message_profile in instance.data["slack_channel_message_profiles"]:
             message += self._get_filled_message(message_profile["message"],
                                                 instance,
@@ -57,6 +66,13 @@ class IntegrateSlackAPI(pyblish.api.InstancePlugin):
 
             project = instance.context.data["anatomyData"]["project"]["code"]
             for channel in message_profile["channels"]:
+                if outbox is not None:
+                    # Mentions are translated on delivery
+                    outbox.enqueue(
+                        token, channel, message, publish_files, project
+                    )
+                    continue
+
                 if six.PY2:
                     client = SlackPython2Operations(token, self.log)
                 else:
@@ -73,7 +89,7 @@ class IntegrateSlackAPI(pyblish.api.InstancePlugin):
                     else:
                         users = slack_ids["users"]
                         groups = slack_ids["groups"]
-                    message = self._translate_users(message, users, groups)
+                    message = translate_mentions(message, users, groups)
 
                 msg_id, file_ids = client.send_message(channel,
                                                        message,
@@ -93,6 +109,19 @@ class IntegrateSlackAPI(pyblish.api.InstancePlugin):
                 dbcon = mongo_client[database_name]["notification_messages"]
                 dbcon.insert_one(msg)
 
+        if outbox is not None:
+            self._ensure_delivery(outbox)
+
+    def _ensure_delivery(self, outbox):
+        """Start detached delivery process if no worker processes outbox."""
+        if outbox.is_worker_alive():
+            return
+        args = get_openpype_execute_args(
+            "module", "slack", "deliver", "--until-empty"
+        )
+        self.log.debug("Starting Slack delivery process: {}".format(args))
+        run_detached_process(args)
+
     def _handle_review_upload(self, message, message_profile, publish_files,
                               review_path):
         """Check if uploaded file is not too large"""
@@ -193,57 +222,6 @@ class IntegrateSlackAPI(pyblish.api.InstancePlugin):
                     break
         return review_path
 
-    def _get_user_id(self, users, user_name):
-        """Returns internal slack id for user name"""
-        user_id = None
-        user_name_lower = user_name.lower()
-        for user in users:
-            if (not user.get("deleted") and
-                    (user_name_lower == user["name"].lower() or
-                     # bots dont have display_name
-                     user_name_lower == user["profile"].get("display_name",
-                                                            '').lower() or
-                     user_name_lower == user["profile"].get("real_name",
-                                                            '').lower())):
-                user_id = user["id"]
-                break
-        return user_id
-
-    def _get_group_id(self, groups, group_name):
-        """Returns internal group id for string name"""
-        group_id = None
-        for group in groups:
-            if (not group.get("date_delete") and
-                    (group_name.lower() == group["name"].lower() or
-                     group_name.lower() == group["handle"])):
-                group_id = group["id"]
-                break
-        return group_id
-
-    def _translate_users(self, message, users, groups):
-        """Replace all occurences of @mentions with proper <@name> format."""
-        matches = re.findall(r"(?<!<)@\S+", message)
-        in_quotes = re.findall(r"(?<!<)(['\"])(@[^'\"]+)", message)
-        for item in in_quotes:
-            matches.append(item[1])
-        if not matches:
-            return message
-
-        for orig_user in matches:
-            user_name = orig_user.replace("@", '')
-            slack_id = self._get_user_id(users, user_name)
-            mention = None
-            if slack_id:
-                mention = "<@{}>".format(slack_id)
-            else:
-                slack_id = self._get_group_id(groups, user_name)
-                if slack_id:
-                    mention = "<!subteam^{}>".format(slack_id)
-            if mention:
-                message = message.replace(orig_user, mention)
-
-        return message
-
     def _escape_missing_keys(self, message, fill_data):
         """Double escapes placeholder which are missing in 'fill_data'"""
         placeholder_keys = re.findall(r"\{([^}]+)\}", message)
@@ -1,17 +1,28 @@
 import os
-from openpype.modules import OpenPypeModule, IPluginPaths
+import threading
+
+import click
+
+from openpype.modules import OpenPypeModule, IPluginPaths, ITrayService
 
 SLACK_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
-class SlackIntegrationModule(OpenPypeModule, IPluginPaths):
-    """Allows sending notification to Slack channels during publishing."""
+class SlackIntegrationModule(OpenPypeModule, IPluginPaths, ITrayService):
+    """Allows sending notification to Slack channels during publishing.
+
+    Publish plugin stores messages to local outbox which is processed by
+    tray service or by 'slack deliver' command.
+    """
 
     name = "slack"
+    label = "Slack notifications"
 
     def initialize(self, modules_settings):
         slack_settings = modules_settings[self.name]
         self.enabled = slack_settings["enabled"]
+        self._delivery_thread = None
+        self._delivery_stop_event = threading.Event()
 
     def get_launch_hook_paths(self):
         """Implementation for applications launch hooks."""
@@ -24,3 +35,53 @@ class SlackIntegrationModule(OpenPypeModule, IPluginPaths):
         return {
             "publish": [os.path.join(current_dir, "plugins", "publish")]
         }
+
+    @staticmethod
+    def create_outbox_worker(**kwargs):
+        """Worker delivering messages from Slack outbox.
+
+        Delivered messages are stored to 'notification_messages' collection.
+        """
+        from .delivery import SlackOutboxWorker, store_notification_message
+
+        kwargs.setdefault("on_delivered", store_notification_message)
+        return SlackOutboxWorker(**kwargs)
+
+    def tray_init(self):
+        return
+
+    def tray_start(self):
+        worker = self.create_outbox_worker(log=self.log)
+        self._delivery_stop_event.clear()
+        self._delivery_thread = threading.Thread(
+            target=worker.run,
+            args=(self._delivery_stop_event, ),
+            name="SlackOutboxDelivery",
+        )
+        self._delivery_thread.daemon = True
+        self._delivery_thread.start()
+
+    def tray_exit(self):
+        self._delivery_stop_event.set()
+        if self._delivery_thread is not None:
+            self._delivery_thread.join(5)
+            self._delivery_thread = None
+
+    def cli(self, click_group):
+        click_group.add_command(cli_main)
+
+
+@click.group(SlackIntegrationModule.name, help="Slack module commands.")
+def cli_main():
+    pass
+
+
+@cli_main.command("deliver", help="Deliver messages from Slack outbox.")
+@click.option(
+    "--until-empty",
+    is_flag=True,
+    help="Stop when there are no pending messages."
+)
+def cli_deliver(until_empty):
+    worker = SlackIntegrationModule.create_outbox_worker()
+    worker.run(until_empty=until_empty)
@@ -0,0 +1,287 @@
+"""Cache of version availability on sites shared by loader tools.
+
+Values are stored by project, version id and pair of active and remote site
+for 'lifetime' seconds. Tools don't query availability while rows are
+created but request it from 'AvailabilityPrefetcher' which queries missing
+versions in batches in a background thread and fills the cache.
+"""
+import time
+import threading
+import collections
+
+from openpype.lib import Logger
+
+log = Logger.get_logger("SiteSyncAvailability")
+
+
+class SiteAvailabilityCache:
+    """Thread safe cache of availability of versions with lifetime.
+
+    Args:
+        lifetime (float): Seconds for which is value valid.
+        max_items (int): Oldest values are removed when cache has more
+            items.
+    """
+
+    def __init__(self, lifetime=20, max_items=50000):
+        self.lifetime = lifetime
+        self.max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, project_name, active_site, remote_site, version_ids):
+        """Cached values of versions.
+
+        Args:
+            project_name (str): Project name.
+            active_site (str): Active site name.
+            remote_site (str): Remote site name.
+            version_ids (Iterable[Any]): Version ids.
+
+        Returns:
+            tuple[dict[Any, Any], set[Any]]: Values by version id and ids
+                of versions which are not cached or are expired.
+        """
+        output = {}
+        missing = set()
+        now = time.time()
+        with self._lock:
+            for version_id in version_ids:
+                key = (project_name, active_site, remote_site, version_id)
+                item = self._items.get(key)
+                if item is None or now - item[0] > self.lifetime:
+                    missing.add(version_id)
+                else:
+                    output[version_id] = item[1]
+            self._hits += len(output)
+            self._misses += len(missing)
+        return output, missing
+
+    def update(self, project_name, active_site, remote_site, values_by_id):
+        """Store values of versions.
+
+        Args:
+            project_name (str): Project name.
+            active_site (str): Active site name.
+            remote_site (str): Remote site name.
+            values_by_id (dict[Any, Any]): Values by version id.
+        """
+        now = time.time()
+        with self._lock:
+            for version_id, value in values_by_id.items():
+                key = (project_name, active_site, remote_site, version_id)
+                self._items.pop(key, None)
+                self._items[key] = (now, value)
+
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def invalidate(self, project_name=None, version_ids=None):
+        """Remove cached values.
+
+        Args:
+            project_name (Optional[str]): Remove only values of project.
+            version_ids (Optional[Iterable[Any]]): Remove only values of
+                versions.
+        """
+        if version_ids is not None:
+            version_ids = set(version_ids)
+        with self._lock:
+            if project_name is None and version_ids is None:
+                self._items.clear()
+                return
+            for key in list(self._items.keys()):
+                if project_name is not None and key[0] != project_name:
+                    continue
+                if version_ids is not None and key[3] not in version_ids:
+                    continue
+                self._items.pop(key)
+
+    def get_stats(self):
+        """Hits and misses of cache.
+
+        Returns:
+            dict[str, Any]: Number of hits, misses, hit rate and cached
+                values.
+        """
+        with self._lock:
+            hits = self._hits
+            misses = self._misses
+            size = len(self._items)
+        total = hits + misses
+        hit_rate = 0.0
+        if total:
+            hit_rate = float(hits) / total
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hit_rate,
+            "size": size,
+        }
+
+
+_shared_cache = None
+
+
+def get_site_availability_cache():
+    """Availability cache shared by tools in current process."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SiteAvailabilityCache()
+    return _shared_cache
+
+
+class AvailabilityPrefetcher:
+    """Query availability of requested versions in background thread.
+
+    Requests are collected for 'delay' seconds and queried in batches of
+    'batch_size' versions. Last requested versions are queried first as
+    they're most likely still visible.
+
+    Args:
+        fetch_func (Callable[[str, list, str, str], dict]): Function
+            receiving project name, version ids, active and remote site
+            and returning values by version id.
+        callback (Callable[[str, str, str, dict], None]): Called from
+            background thread with fetched values.
+        cache (Optional[SiteAvailabilityCache]): Cache to use, shared cache
+            is used if not passed.
+        batch_size (int): Maximum number of versions in one query.
+        delay (float): Seconds to wait for more requests.
+        default_factory (Optional[Callable[[], Any]]): Value of versions
+            which are not in result of 'fetch_func'.
+    """
+
+    def __init__(
+        self,
+        fetch_func,
+        callback,
+        cache=None,
+        batch_size=200,
+        delay=0.05,
+        default_factory=None
+    ):
+        if cache is None:
+            cache = get_site_availability_cache()
+        self._fetch_func = fetch_func
+        self._callback = callback
+        self._cache = cache
+        self.batch_size = batch_size
+        self.delay = delay
+        self._default_factory = default_factory
+
+        self._pending = collections.OrderedDict()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def request(self, project_name, active_site, remote_site, version_ids):
+        """Cached values of versions, missing versions are queried later.
+
+        Returns:
+            dict[Any, Any]: Cached values by version id.
+        """
+        cached, missing = self._cache.get(
+            project_name, active_site, remote_site, version_ids
+        )
+        if not missing:
+            return cached
+
+        with self._condition:
+            for version_id in missing:
+                key = (project_name, active_site, remote_site, version_id)
+                # Move to the end so it's queried sooner
+                self._pending.pop(key, None)
+                self._pending[key] = None
+            self._ensure_thread()
+            self._condition.notify()
+        return cached
+
+    def clear(self):
+        """Drop requests which were not queried yet."""
+        with self._condition:
+            self._pending.clear()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify()
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="SiteAvailabilityPrefetch"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _pop_batch(self):
+        """Last requested versions of one project and site pair."""
+        last_key = next(reversed(self._pending))
+        context = last_key[:3]
+        version_ids = []
+        for key in reversed(list(self._pending.keys())):
+            if key[:3] != context:
+                continue
+            version_ids.append(key[3])
+            self._pending.pop(key)
+            if len(version_ids) >= self.batch_size:
+                break
+        return context, version_ids
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+
+            if self.delay:
+                time.sleep(self.delay)
+
+            with self._condition:
+                if self._stopped:
+                    return
+                if not self._pending:
+                    continue
+                context, version_ids = self._pop_batch()
+
+            self._fetch(context, version_ids)
+
+    def _fetch(self, context, version_ids):
+        project_name, active_site, remote_site = context
+        try:
+            values_by_id = self._fetch_func(
+                project_name, version_ids, active_site, remote_site
+            )
+        except Exception:
+            log.warning(
+                "Failed to query availability of versions", exc_info=True
+            )
+            return
+
+        values_by_id = dict(values_by_id)
+        if self._default_factory is not None:
+            for version_id in version_ids:
+                if version_id not in values_by_id:
+                    values_by_id[version_id] = self._default_factory()
+
+        self._cache.update(
+            project_name, active_site, remote_site, values_by_id
+        )
+        try:
+            self._callback(
+                project_name, active_site, remote_site, values_by_id
+            )
+        except Exception:
+            log.warning("Availability callback failed", exc_info=True)
@@ -145,6 +145,10 @@ class BaseAnatomy(object):
         """Wrapper for Roots `find_root_template_from_path`."""
         return self.roots_obj.find_root_template_from_path(*args, **kwargs)
 
+    def find_root_templates(self, *args, **kwargs):
+        """Wrapper for Roots `find_root_templates`."""
+        return self.roots_obj.find_root_templates(*args, **kwargs)
+
     def path_remapper(self, *args, **kwargs):
         """Wrapper for Roots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
@@ -1008,6 +1012,31 @@ class AnatomyTemplates(TemplatesDict):
         return self.format(in_data, strict=False)
 
 
+def _find_root_template_in_path(path, lowered_path, root_prefixes):
+    """Replace first matching root prefix in path with formatting key.
+
+    Args:
+        path (str): Path with forward slashes.
+        lowered_path (str): Lowered 'path' used for case insensitive
+            prefixes.
+        root_prefixes (Iterable[tuple[str, bool, str]]): Prefixes prepared
+            by 'RootItem'.
+
+    Returns:
+        Union[str, None]: Path with root formatting key or None if none of
+            prefixes matched.
+    """
+    for prefix, case_insensitive, replacement in root_prefixes:
+        if case_insensitive:
+            matched = lowered_path.startswith(prefix)
+        else:
+            matched = path.startswith(prefix)
+
+        if matched:
+            return replacement + path[len(prefix):]
+    return None
+
+
 class RootItem(FormatObject):
     """Represents one item or roots.
 
@@ -1043,6 +1072,7 @@ class RootItem(FormatObject):
         self.available_platforms = list(lowered_platform_keys.keys())
         self.value = lowered_platform_keys.get(platform.system().lower())
         self.clean_value = self.clean_root(self.value)
+        self.root_prefixes = self._prepare_root_prefixes()
 
     def __format__(self, *args, **kwargs):
         return self.value.__format__(*args, **kwargs)
@@ -1104,6 +1134,29 @@ class RootItem(FormatObject):
             cleaned[key] = self.clean_root(value)
         return cleaned
 
+    def _prepare_root_prefixes(self):
+        """Prepare root prefixes used to find root in a path.
+
+        Windows paths are compared case insensitive so their prefix is
+        lowered.
+
+        Returns:
+            tuple[tuple[str, bool, str], ...]: Prefix, case insensitive flag
+                and replacement for each platform with filled root.
+        """
+        replacement = "{" + self.full_key() + "}"
+        output = []
+        for root_os, root_path in self.cleaned_data.items():
+            # Skip empty paths
+            if not root_path:
+                continue
+
+            case_insensitive = root_os == "windows"
+            if case_insensitive:
+                root_path = root_path.lower()
+            output.append((root_path, case_insensitive, replacement))
+        return tuple(output)
+
     def path_remapper(self, path, dst_platform=None, src_platform=None):
         """Remap path for specific platform.
 
@@ -1208,27 +1261,13 @@ class RootItem(FormatObject):
             If any of raw data value wouldn't match path's root output is::
                 (False, "C:/windows/path/root/projects/my_project/file.ext")
         """
-        result = False
-        output = str(path)
-
         mod_path = self.clean_path(path)
-        for root_os, root_path in self.cleaned_data.items():
-            # Skip empty paths
-            if not root_path:
-                continue
-
-            _mod_path = mod_path  # reset to original cleaned value
-            if root_os == "windows":
-                root_path = root_path.lower()
-                _mod_path = _mod_path.lower()
-
-            if _mod_path.startswith(root_path):
-                result = True
-                replacement = "{" + self.full_key() + "}"
-                output = replacement + mod_path[len(root_path):]
-                break
-
-        return (result, output)
+        result = _find_root_template_in_path(
+            mod_path, mod_path.lower(), self.root_prefixes
+        )
+        if result is None:
+            return (False, str(path))
+        return (True, result)
 
 
 class Roots:
@@ -1245,6 +1284,7 @@ class Roots:
         self.anatomy = anatomy
         self.loaded_project = None
         self._roots = None
+        self._root_prefixes_cache = (None, None)
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -1255,6 +1295,7 @@ class Roots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._root_prefixes_cache = (None, None)
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -1315,26 +1356,79 @@ class Roots:
         Raises:
             ValueError: When roots are not entered and can't be loaded.
         """
-        if roots is None:
-            log.debug(
-                "Looking for matching root in path \"{}\".".format(path)
+        return self.find_root_templates([path], roots)[0]
+
+    def find_root_templates(self, paths, roots=None):
+        """Find root values in entered paths and replace them with key.
+
+        Batch variant of 'find_root_template_from_path'. Root prefixes of
+        all roots and platforms are prepared only once, so it is preferred
+        when many paths are converted at once.
+
+        Args:
+            paths (Iterable[str]): Source paths where root will be searched.
+            roots (Roots/dict, optional): It is possible to use different
+                roots than instance where method was triggered has.
+
+        Returns:
+            list[tuple[bool, str]]: Success and path with or without replaced
+                root with formatting key for each path in order.
+
+        Raises:
+            ValueError: When roots are not entered and can't be loaded.
+        """
+        root_prefixes = self._get_root_prefixes(roots)
+        output = []
+        for path in paths:
+            mod_path = str(path).replace("\\", "/")
+            result = _find_root_template_in_path(
+                mod_path, mod_path.lower(), root_prefixes
             )
+            if result is None:
+                output.append((False, path))
+            else:
+                output.append((True, result))
+        return output
+
+    def _get_root_prefixes(self, roots=None):
+        """Root prefixes of all roots and platforms.
+
+        Prefixes of current roots are cached until roots change.
+
+        Args:
+            roots (Roots/dict, optional): Roots for which prefixes are
+                collected. Current roots are used if not passed.
+
+        Returns:
+            tuple[tuple[str, bool, str], ...]: Prefixes prepared by
+                'RootItem' in order of roots.
+
+        Raises:
+            ValueError: When roots are not entered and can't be loaded.
+        """
+        use_cache = roots is None
+        if use_cache:
             roots = self.roots
+            cached_roots, root_prefixes = self._root_prefixes_cache
+            if roots is not None and cached_roots is roots:
+                return root_prefixes
 
         if roots is None:
             raise ValueError("Roots are not set. Can't find path.")
 
-        if isinstance(roots, RootItem):
-            return roots.find_root_template_from_path(path)
+        root_prefixes = self._collect_root_prefixes(roots)
+        if use_cache:
+            self._root_prefixes_cache = (roots, root_prefixes)
+        return root_prefixes
 
-        for root_name, _root in roots.items():
-            success, result = self.find_root_template_from_path(path, _root)
-            if success:
-                log.info("Found match in root \"{}\".".format(root_name))
-                return success, result
+    def _collect_root_prefixes(self, roots):
+        if isinstance(roots, RootItem):
+            return roots.root_prefixes
 
-        log.warning("No matching root was found in current setting.")
-        return (False, path)
+        output = []
+        for _root in roots.values():
+            output.extend(self._collect_root_prefixes(_root))
+        return tuple(output)
 
     def set_root_environments(self):
         """Set root environments for current project."""
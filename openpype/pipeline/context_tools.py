@@ -17,7 +17,6 @@ from openpype.client import (
     get_project,
     get_asset_by_id,
     get_asset_by_name,
-    version_is_latest,
     get_asset_name_identifier,
     get_ayon_server_api_connection,
 )
@@ -41,6 +40,7 @@ from . import (
     deregister_loader_plugin_path,
     deregister_inventory_action_path
 )
+from .load import get_cached_versions_latest_state
 
 
 _is_installed = False
@@ -465,7 +465,14 @@ def is_representation_from_latest(representation):
     """
 
     project_name = get_current_project_name()
-    return version_is_latest(project_name, representation["parent"])
+    version_id = representation["parent"]
+    states_by_id = get_cached_versions_latest_state(
+        project_name, [version_id]
+    )
+    version_state = states_by_id.get(version_id)
+    if version_state is None:
+        return False
+    return version_state["is_latest"]
 
 
 def get_template_data_from_session(session=None, system_settings=None):
@@ -5,8 +5,9 @@ import shutil
 import glob
 import clique
 import collections
+import concurrent.futures
 
-from openpype.lib import create_hard_link
+from openpype.lib import create_hard_link, scan_directory, Logger
 
 
 def _copy_file(src_path, dst_path):
@@ -27,6 +28,156 @@ def _copy_file(src_path, dst_path):
         shutil.copyfile(src_path, dst_path)
 
 
+class DeliveryPlan(object):
+    """Source to destination file pairs which should be delivered.
+
+    Pairs are collected first and executed at once. Same pair added multiple
+    times is delivered only once. Pair with destination which is already
+    used by different source is refused.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+    """
+
+    default_max_workers = 8
+
+    def __init__(self, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        # Case normalized destination path to source and destination pair
+        self._pairs_by_dst_key = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._pairs_by_dst_key)
+
+    @property
+    def items(self):
+        """Planned pairs.
+
+        Returns:
+            list[tuple[str, str]]: Pairs of source and destination paths.
+        """
+        return list(self._pairs_by_dst_key.values())
+
+    def add(self, src_path, dst_path):
+        """Add source and destination pair to plan.
+
+        Args:
+            src_path (str): Path to source file.
+            dst_path (str): Path to destination file.
+
+        Returns:
+            bool: Pair is planned. False if destination is already used
+                by different source file.
+        """
+        src_path = os.path.normpath(src_path)
+        dst_path = os.path.normpath(dst_path)
+        # Case is ignored only to detect collisions on case insensitive
+        #   platforms, delivered paths keep their case
+        dst_key = os.path.normcase(dst_path)
+        existing_pair = self._pairs_by_dst_key.get(dst_key)
+        if existing_pair is None:
+            self._pairs_by_dst_key[dst_key] = (src_path, dst_path)
+            return True
+
+        existing_src = existing_pair[0]
+        if os.path.normcase(existing_src) == os.path.normcase(src_path):
+            return True
+
+        self.log.warning((
+            "Destination collision: {} -> {} (already used by {})"
+        ).format(src_path, dst_path, existing_src))
+        return False
+
+    def execute(
+        self,
+        report_items=None,
+        max_workers=None,
+        dry_run=False,
+        progress_callback=None
+    ):
+        """Copy or hardlink all planned files.
+
+        Args:
+            report_items (Optional[collections.defaultdict]): To return
+                error messages.
+            max_workers (Optional[int]): Max number of files processed
+                at once.
+            dry_run (Optional[bool]): Only log what would be delivered.
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                with number of processed files and number of all files.
+
+        Returns:
+            (collections.defaultdict, int): Report items and number of
+                delivered files.
+        """
+        if report_items is None:
+            report_items = collections.defaultdict(list)
+
+        items = self.items
+        total = len(items)
+        if dry_run:
+            for src_path, dst_path in items:
+                self.log.info("Dry run: {} -> {}".format(src_path, dst_path))
+            if progress_callback is not None:
+                progress_callback(total, total)
+            return report_items, total
+
+        dst_folders = {
+            os.path.dirname(dst_path)
+            for _, dst_path in items
+        }
+        for dst_folder in dst_folders:
+            if not os.path.exists(dst_folder):
+                os.makedirs(dst_folder)
+
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        max_workers = max(1, min(max_workers, total))
+
+        delivered = 0
+        processed = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = {
+                executor.submit(_copy_file, src_path, dst_path): (
+                    src_path, dst_path
+                )
+                for src_path, dst_path in items
+            }
+            for future in concurrent.futures.as_completed(futures):
+                src_path, dst_path = futures[future]
+                processed += 1
+                try:
+                    future.result()
+                    delivered += 1
+                    self.log.debug(
+                        "Copied: {} -> {}".format(src_path, dst_path))
+
+                except Exception as exc:
+                    report_items["Failed to copy file"].append(
+                        "{} -> {}: {}".format(src_path, dst_path, exc)
+                    )
+                    self.log.warning(
+                        "Failed to copy {} -> {}".format(src_path, dst_path),
+                        exc_info=True
+                    )
+
+                if progress_callback is not None:
+                    progress_callback(processed, total)
+
+        return report_items, delivered
+
+
+def _plan_file(delivery_plan, src_path, dst_path, report_items):
+    if delivery_plan.add(src_path, dst_path):
+        return 1
+    report_items["Destination path is used by another file"].append(
+        "{} -> {}".format(src_path, dst_path)
+    )
+    return 0
+
+
 def get_format_dict(anatomy, location_path):
     """Returns replaced root values from user provider value.
 
@@ -120,7 +271,8 @@ def deliver_single_file(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    delivery_plan=None
 ):
     """Copy single file to calculated path based on template
 
@@ -134,6 +286,8 @@ def deliver_single_file(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        delivery_plan (Optional[DeliveryPlan]): File is only added to
+            the plan and is not copied if passed.
 
     Returns:
         (collections.defaultdict, int)
@@ -160,6 +314,12 @@ def deliver_single_file(
     # Remove newlines from the end of the string to avoid OSError during copy
     delivery_path = delivery_path.rstrip()
 
+    if delivery_plan is not None:
+        planned = _plan_file(
+            delivery_plan, src_path, delivery_path, report_items
+        )
+        return report_items, planned
+
     delivery_folder = os.path.dirname(delivery_path)
     if not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
@@ -180,7 +340,8 @@ def deliver_sequence(
     report_items,
     log,
     has_renumbered_frame=False,
-    new_frame_start=0
+    new_frame_start=0,
+    delivery_plan=None
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -200,6 +361,10 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        has_renumbered_frame (Optional[bool]): Frames should be renumbered.
+        new_frame_start (Optional[int]): First frame of renumbered frames.
+        delivery_plan (Optional[DeliveryPlan]): Files are only added to
+            the plan and are not copied if passed.
 
     Returns:
         (collections.defaultdict, int)
@@ -256,16 +421,16 @@ def deliver_sequence(
     # context.representation could be .psd
     ext = ext.replace("..", ".")
 
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
-    src_collection = None
-    for col in src_collections:
-        if col.tail != ext:
+    src_sequences, _ = scan_directory(dir_path)
+    src_sequence = None
+    for sequence in src_sequences:
+        if sequence.tail != ext:
             continue
 
-        src_collection = col
+        src_sequence = sequence
         break
 
-    if src_collection is None:
+    if src_sequence is None:
         msg = "Source collection of files was not found"
         report_items[msg].append(src_path)
         log.warning("{} <{}>".format(msg, src_path))
@@ -283,23 +448,17 @@ def deliver_sequence(
     delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
     delivery_folder = os.path.dirname(delivery_path)
     dst_head, dst_tail = delivery_path.split(frame_indicator)
-    dst_padding = src_collection.padding
+    dst_padding = src_sequence.padding
     dst_collection = clique.Collection(
         head=dst_head,
         tail=dst_tail,
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
-        os.makedirs(delivery_folder)
-
-    src_head = src_collection.head
-    src_tail = src_collection.tail
-    uploaded = 0
-    first_frame = min(src_collection.indexes)
-    for index in src_collection.indexes:
-        src_padding = src_collection.format("{padding}") % index
-        src_file_name = "{}{}{}".format(src_head, src_padding, src_tail)
+    first_frame = src_sequence.start
+    file_pairs = []
+    for index in src_sequence.frames:
+        src_file_name = src_sequence.get_file_name(index)
         src = os.path.normpath(
             os.path.join(dir_path, src_file_name)
         )
@@ -317,6 +476,19 @@ def deliver_sequence(
                 return report_items, 0
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
+        file_pairs.append((src, dst))
+
+    if delivery_plan is not None:
+        planned = 0
+        for src, dst in file_pairs:
+            planned += _plan_file(delivery_plan, src, dst, report_items)
+        return report_items, planned
+
+    if not os.path.exists(delivery_folder):
+        os.makedirs(delivery_folder)
+
+    uploaded = 0
+    for src, dst in file_pairs:
         log.debug("Copying single: {} -> {}".format(src, dst))
         _copy_file(src, dst)
 
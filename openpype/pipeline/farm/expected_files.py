@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""Compact representation of rendered files in farm publish metadata.
+
+Files of sequence representation are stored as head, tail, padding and
+ranges of frames instead of list of all file names, e.g.
+
+    {
+        "head": "beauty.",
+        "tail": ".exr",
+        "padding": 4,
+        "ranges": [[1001, 1100, 1], [1200, 1300, 2]]
+    }
+
+Metadata files created by older versions contain list of file names which
+is still supported.
+"""
+import copy
+
+import clique
+
+
+def _get_frame_ranges(indexes):
+    """Split sorted frame numbers into ranges with constant step."""
+    ranges = []
+    indexes = sorted(indexes)
+    idx = 0
+    while idx < len(indexes):
+        start = indexes[idx]
+        if idx + 1 == len(indexes):
+            ranges.append([start, start, 1])
+            break
+
+        step = indexes[idx + 1] - start
+        end_idx = idx + 1
+        while (
+            end_idx + 1 < len(indexes)
+            and indexes[end_idx + 1] - indexes[end_idx] == step
+        ):
+            end_idx += 1
+        ranges.append([start, indexes[end_idx], step])
+        idx = end_idx + 1
+    return ranges
+
+
+def is_compact_files(files):
+    """Files are in compact sequence representation.
+
+    Args:
+        files (Union[str, list[str], dict[str, Any]]): Files of
+            representation.
+
+    Returns:
+        bool: Files are stored as compact sequence.
+    """
+    return isinstance(files, dict) and "ranges" in files
+
+
+def compact_files(files):
+    """Convert list of sequence files to compact representation.
+
+    Files which are not single sequence, or which order would change, are
+    returned unchanged.
+
+    Args:
+        files (Union[str, list[str]]): Files of representation.
+
+    Returns:
+        Union[str, list[str], dict[str, Any]]: Compact sequence or
+            unchanged files.
+    """
+    if not isinstance(files, (list, tuple)) or len(files) < 2:
+        return files
+
+    collections, remainders = clique.assemble(files, minimum_items=2)
+    if remainders or len(collections) != 1:
+        return files
+
+    collection = collections[0]
+    compact = {
+        "head": collection.head,
+        "tail": collection.tail,
+        "padding": collection.padding,
+        "ranges": _get_frame_ranges(collection.indexes),
+    }
+    # Keep explicit list if expansion would not give the same files
+    if expand_files(compact) != list(files):
+        return files
+    return compact
+
+
+def expand_files(files):
+    """Convert compact representation of files to list of file names.
+
+    Args:
+        files (Union[str, list[str], dict[str, Any]]): Files of
+            representation.
+
+    Returns:
+        Union[str, list[str]]: File names. Files which are not compact
+            are returned unchanged.
+    """
+    if not is_compact_files(files):
+        return files
+
+    file_template = "{}{{:0{}d}}{}".format(
+        files["head"].replace("{", "{{").replace("}", "}}"),
+        files["padding"],
+        files["tail"].replace("{", "{{").replace("}", "}}"),
+    )
+    output = []
+    for start, end, step in files["ranges"]:
+        output.extend(
+            file_template.format(frame)
+            for frame in range(start, end + 1, step)
+        )
+    return output
+
+
+def compact_publish_metadata(publish_job):
+    """Compact files of representations in farm publish metadata.
+
+    Passed data are not modified.
+
+    Args:
+        publish_job (dict[str, Any]): Publish metadata with instances.
+
+    Returns:
+        dict[str, Any]: Metadata with compact representation files.
+    """
+    output = copy.copy(publish_job)
+    instances = []
+    for instance_data in publish_job.get("instances") or []:
+        representations = instance_data.get("representations")
+        if representations:
+            instance_data = copy.copy(instance_data)
+            instance_data["representations"] = [
+                dict(repre, files=compact_files(repre["files"]))
+                if "files" in repre else repre
+                for repre in representations
+            ]
+        instances.append(instance_data)
+    output["instances"] = instances
+    return output
@@ -1,6 +1,137 @@
 # -*- coding: utf-8 -*-
 import re
 
+# Backreferences would point to wrong groups in combined pattern
+_BACKREFERENCE_REGEX = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class AOVPatternMatcher(object):
+    """Match render file names against AOV patterns of one host.
+
+    Patterns are compiled once into single regex. Results are memoized by
+    file name and by head and tail of collections.
+
+    Args:
+        aov_patterns (Iterable[str]): AOV patterns of host.
+    """
+
+    # Maximum number of memoized results
+    cache_limit = 100000
+
+    def __init__(self, aov_patterns):
+        self._patterns = tuple(aov_patterns or [])
+        self._match_funcs = self._compile(self._patterns)
+        self._cache = {}
+
+    @property
+    def patterns(self):
+        return self._patterns
+
+    @staticmethod
+    def _compile(patterns):
+        if not patterns:
+            return []
+
+        if not any(
+            _BACKREFERENCE_REGEX.search(pattern)
+            for pattern in patterns
+        ):
+            try:
+                combined = re.compile("|".join(
+                    "(?:{})".format(pattern)
+                    for pattern in patterns
+                ))
+                return [combined.match]
+            except re.error:
+                pass
+        return [re.compile(pattern).match for pattern in patterns]
+
+    def _cache_result(self, key, result):
+        if len(self._cache) >= self.cache_limit:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+    def match(self, render_file_name):
+        """Render file name matches any AOV pattern.
+
+        Args:
+            render_file_name (str): File name to match against.
+
+        Returns:
+            bool: Review state for rendered file.
+        """
+        if not self._match_funcs:
+            return False
+
+        result = self._cache.get(render_file_name)
+        if result is None:
+            result = any(
+                match_func(render_file_name) is not None
+                for match_func in self._match_funcs
+            )
+            self._cache_result(render_file_name, result)
+        return result
+
+    def match_collection(self, collection):
+        """First file of collection matches any AOV pattern.
+
+        Result is shared by collections with the same head and tail.
+
+        Args:
+            collection (clique.Collection): Collection of rendered files.
+
+        Returns:
+            bool: Review state for rendered collection.
+        """
+        if not self._match_funcs:
+            return False
+
+        key = (collection.head, collection.tail)
+        result = self._cache.get(key)
+        if result is None:
+            result = self.match(next(iter(collection)))
+            self._cache_result(key, result)
+        return result
+
+    def match_files(self, file_names):
+        """Classify multiple file names in one pass.
+
+        Args:
+            file_names (Iterable[str]): File names to match against.
+
+        Returns:
+            dict[str, bool]: Review state by file name.
+        """
+        return {
+            file_name: self.match(file_name)
+            for file_name in file_names
+        }
+
+
+_matchers_by_key = {}
+
+
+def get_aov_matcher(host_name, aov_patterns):
+    """Get matcher with compiled AOV patterns of host.
+
+    Matchers are cached so patterns are compiled only once for each host.
+
+    Args:
+        host_name (str): Host name.
+        aov_patterns (dict): AOV patterns from AOV filters.
+
+    Returns:
+        AOVPatternMatcher: Matcher for host.
+    """
+    patterns = tuple((aov_patterns or {}).get(host_name) or [])
+    key = (host_name, patterns)
+    matcher = _matchers_by_key.get(key)
+    if matcher is None:
+        matcher = AOVPatternMatcher(patterns)
+        _matchers_by_key[key] = matcher
+    return matcher
+
 
 def match_aov_pattern(host_name, aov_patterns, render_file_name):
     """Matching against a `AOV` pattern in the render files.
@@ -18,7 +149,4 @@ def match_aov_pattern(host_name, aov_patterns, render_file_name):
     Returns:
         bool: Review state for rendered file (render_file_name).
     """
-    aov_pattern = aov_patterns.get(host_name, [])
-    if not aov_pattern:
-        return False
-    return any(re.match(p, render_file_name) for p in aov_pattern)
+    return get_aov_matcher(host_name, aov_patterns).match(render_file_name)
@@ -16,9 +16,9 @@ from openpype.client import (
     get_last_version_by_subset_name,
     get_representations
 )
-from openpype.lib import Logger
+from openpype.lib import Logger, assemble_sequences
 from openpype.pipeline.publish import KnownPublishError
-from openpype.pipeline.farm.patterning import match_aov_pattern
+from openpype.pipeline.farm.patterning import get_aov_matcher
 
 
 @attr.s
@@ -322,7 +322,9 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     """
     representations = []
     host_name = os.environ.get("AVALON_APP", "")
+    aov_matcher = get_aov_matcher(host_name, aov_filter)
     collections, remainders = clique.assemble(exp_files)
+    remainder_previews = aov_matcher.match_files(remainders)
 
     log = Logger.get_logger("farm_publishing")
 
@@ -343,12 +345,9 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 )
                 preview = True
             else:
-                render_file_name = list(collection)[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
-                preview = match_aov_pattern(
-                    host_name, aov_filter, render_file_name
-                )
+                preview = aov_matcher.match_collection(collection)
 
         staging = os.path.dirname(list(collection)[0])
         success, rootless_staging_dir = (
@@ -421,9 +420,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
             "stagingDir": staging,
         }
 
-        preview = match_aov_pattern(
-            host_name, aov_filter, remainder
-        )
+        preview = remainder_previews[remainder]
         preview = preview and not do_not_add_review
         if preview:
             rep.update({
@@ -548,6 +545,7 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     cameras = instance.data.get("cameras", [])
     exp_files = instance.data["expectedFiles"]
     log = Logger.get_logger("farm_publishing")
+    aov_matcher = get_aov_matcher(os.environ.get("AVALON_APP", ""), aov_filter)
 
     instances = []
     # go through AOVs in expected files
@@ -611,15 +609,12 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
 
         log.info("Creating data for: {}".format(subset_name))
 
-        app = os.environ.get("AVALON_APP", "")
-
         if isinstance(col, list):
             render_file_name = os.path.basename(col[0])
         else:
             render_file_name = os.path.basename(col)
-        aov_patterns = aov_filter
 
-        preview = match_aov_pattern(app, aov_patterns, render_file_name)
+        preview = aov_matcher.match(render_file_name)
         # toggle preview on if multipart is on
         if instance.data.get("multipartExr"):
             log.debug("Adding preview tag because its multipartExr")
@@ -1018,15 +1013,19 @@ def copy_extend_frames(instance, representation):
     subset_resources = get_resources(
         project_name, version, representation.get("ext")
     )
-    r_col, _ = clique.assemble(subset_resources)
+    r_sequences, _ = assemble_sequences(subset_resources)
+    assert r_sequences, "No sequence found in published files"
+    r_sequence = max(r_sequences, key=len)
+    frames = list(r_sequence.frames)
 
     # if override remove all frames we are expecting to be rendered,
     # so we'll copy only those missing from current render
     if instance.data.get("overrideExistingFrame"):
-        for frame in range(start, end + 1):
-            if frame not in r_col.indexes:
-                continue
-            r_col.indexes.remove(frame)
+        frames = [
+            frame
+            for frame in frames
+            if not start <= frame <= end
+        ]
 
     # now we need to translate published names from representation
     # back. This is tricky, right now we'll just use same naming
@@ -1038,17 +1037,15 @@ def copy_extend_frames(instance, representation):
     pre = r_filename[:op.start("frame")]
     post = r_filename[op.end("frame"):]
     assert op is not None, "padding string wasn't found"
-    for frame in list(r_col):
-        fn = re.search(R_FRAME_NUMBER, frame)
-        # silencing linter as we need to compare to True, not to
-        # type
-        assert fn is not None, "padding string wasn't found"
+    staging = representation.get("stagingDir")
+    staging = anatomy.fill_root(staging)
+    for frame in frames:
         # list of tuples (source, destination)
-        staging = representation.get("stagingDir")
-        staging = anatomy.fill_root(staging)
         resource_files.append(
-            (frame, os.path.join(
-                staging, "{}{}{}".format(pre, fn["frame"], post)))
+            (r_sequence.get_file_name(frame), os.path.join(
+                staging, "{}{}{}".format(
+                    pre, r_sequence.format_frame(frame), post
+                )))
         )
 
     # test if destination dir exists and create it if not
@@ -37,6 +37,9 @@ from .utils import (
     any_outdated_containers,
     get_outdated_containers,
     filter_containers,
+
+    get_cached_versions_latest_state,
+    invalidate_versions_latest_state,
 )
 
 from .plugins import (
@@ -92,6 +95,9 @@ __all__ = (
     "get_outdated_containers",
     "filter_containers",
 
+    "get_cached_versions_latest_state",
+    "invalidate_versions_latest_state",
+
     # plugins.py
     "LoaderPlugin",
     "SubsetLoaderPlugin",
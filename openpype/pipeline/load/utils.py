@@ -6,6 +6,8 @@ import logging
 import inspect
 import collections
 import numbers
+import threading
+import time
 
 from openpype.host import ILoadHost
 from openpype.client import (
@@ -17,11 +19,11 @@ from openpype.client import (
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
     get_version_by_name,
-    get_last_versions,
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_versions_latest_state,
 )
 from openpype.lib import (
     StringTemplate,
@@ -815,6 +817,98 @@ def loaders_from_representation(loaders, representation):
     return loaders_from_repre_context(loaders, context)
 
 
+class _VersionsStateCache(object):
+    """Latest state of versions queried in current process.
+
+    Cache is invalidated by integration of new versions in current process.
+    Publishes from other processes (e.g. on farm) are not tracked so values
+    are valid only for 'lifetime' seconds.
+    """
+
+    lifetime = 60
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, project_name, version_ids):
+        output = {}
+        missing = set()
+        now = time.time()
+        with self._lock:
+            project_items = self._items.get(project_name) or {}
+            for version_id in version_ids:
+                item = project_items.get(str(version_id))
+                if item is None or now - item[0] > self.lifetime:
+                    missing.add(version_id)
+                else:
+                    output[version_id] = item[1]
+        return output, missing
+
+    def update(self, project_name, states_by_id):
+        now = time.time()
+        with self._lock:
+            project_items = self._items.setdefault(project_name, {})
+            for version_id, state in states_by_id.items():
+                project_items[str(version_id)] = (now, state)
+
+    def invalidate(self, project_name=None):
+        with self._lock:
+            if project_name is None:
+                self._items.clear()
+            else:
+                self._items.pop(project_name, None)
+
+
+_versions_state_cache = _VersionsStateCache()
+
+
+def get_cached_versions_latest_state(project_name, version_ids):
+    """Latest and hero state of versions with per-process cache.
+
+    Versions which are not cached are queried with single call of
+    'get_versions_latest_state'.
+
+    Args:
+        project_name (str): Project name.
+        version_ids (Iterable[Union[str, ObjectId]]): Version ids.
+
+    Returns:
+        dict[Union[str, ObjectId], dict[str, Any]]: State of versions by
+            passed version ids. Versions which were not found are not in
+            output.
+    """
+
+    version_ids = set(version_ids)
+    output, missing = _versions_state_cache.get(project_name, version_ids)
+    if not missing:
+        return output
+
+    states_by_id = get_versions_latest_state(project_name, missing)
+    _versions_state_cache.update(project_name, states_by_id)
+    states_by_str_id = {
+        str(version_id): state
+        for version_id, state in states_by_id.items()
+    }
+    for version_id in missing:
+        state = states_by_str_id.get(str(version_id))
+        if state is not None:
+            output[version_id] = state
+    return output
+
+
+def invalidate_versions_latest_state(project_name=None):
+    """Drop cached latest state of versions.
+
+    Should be called when new version of any subset is integrated.
+
+    Args:
+        project_name (Optional[str]): Drop only versions of project.
+    """
+
+    _versions_state_cache.invalidate(project_name)
+
+
 def any_outdated_containers(host=None, project_name=None):
     """Check if there are any outdated containers in scene."""
 
@@ -905,42 +999,11 @@ def filter_containers(containers, project_name):
         repre_docs_by_str_id[repre_id] = repre_doc
         repre_docs_by_version_id[version_id].append(repre_doc)
 
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
+    # Latest state of versions (including hero versions) is resolved in
+    #   one query and cached for next calls
+    states_by_version_id = get_cached_versions_latest_state(
+        project_name, repre_docs_by_version_id.keys()
     )
-    verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
-        #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
-            continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
-
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
-    )
-    # Figure out which versions are outdated
-    outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
-                outdated_version_ids.add(version_id)
 
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
@@ -960,18 +1023,18 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
-            outdated_containers.append(container)
-
-        elif version_id not in verisons_by_id:
+        version_state = states_by_version_id.get(repre_doc["parent"])
+        if version_state is None:
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
             ).format(container_name))
             not_found_containers.append(container)
 
-        else:
+        elif version_state["is_latest"]:
             uptodate_containers.append(container)
 
+        else:
+            outdated_containers.append(container)
+
     return output
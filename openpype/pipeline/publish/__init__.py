@@ -43,6 +43,17 @@ from .lib import (
     get_publish_instance_families,
 )
 
+from .instrumentation import (
+    process_with_metrics,
+    install_publish_instrumentation,
+    uninstall_publish_instrumentation,
+    publish_instrumentation,
+    create_publish_report,
+    write_publish_report,
+    get_plugin_timings,
+    format_plugin_timings,
+)
+
 from .abstract_expected_files import ExpectedFiles
 from .abstract_collect_render import (
     RenderInstance,
@@ -90,6 +101,15 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "process_with_metrics",
+    "install_publish_instrumentation",
+    "uninstall_publish_instrumentation",
+    "publish_instrumentation",
+    "create_publish_report",
+    "write_publish_report",
+    "get_plugin_timings",
+    "format_plugin_timings",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -0,0 +1,292 @@
+"""Instrumentation of publish plugins processing.
+
+Processing of each plugin and instance is measured with wall time, CPU time,
+time of subprocesses and growth of peak RSS. Metrics are stored to pyblish
+result under "metrics" key and are part of publish report.
+
+Headless publishing (e.g. 'remote_publish' on farm) can write the report
+to path set in 'OPENPYPE_PUBLISH_REPORT_PATH' environment variable. Saved
+reports can be inspected with 'publish_report_timings' command.
+"""
+import os
+import json
+import uuid
+import contextlib
+
+import pyblish.plugin
+
+from openpype.lib.profiling import measure_process_metrics
+
+PUBLISH_REPORT_ENV_KEY = "OPENPYPE_PUBLISH_REPORT_PATH"
+
+_METRIC_KEYS = ("wall_time", "cpu_time", "subprocess_time")
+
+# Original 'pyblish.plugin.process' when instrumentation is installed
+_original_process = None
+
+
+def process_with_metrics(plugin, context, instance=None, action=None):
+    """Process plugin using pyblish and measure used resources.
+
+    Arguments are same as for 'pyblish.plugin.process'.
+
+    Returns:
+        dict[str, Any]: Pyblish result with "metrics" key.
+    """
+    process = _original_process or pyblish.plugin.process
+    with measure_process_metrics() as metrics:
+        result = process(plugin, context, instance, action)
+    result["metrics"] = metrics
+    return result
+
+
+def install_publish_instrumentation():
+    """Measure all plugins processed by pyblish.
+
+    Replaces 'pyblish.plugin.process' so plugins processed using
+    'pyblish.util' functions are measured too.
+    """
+    global _original_process
+    if _original_process is not None:
+        return
+    _original_process = pyblish.plugin.process
+    pyblish.plugin.process = process_with_metrics
+
+
+def uninstall_publish_instrumentation():
+    """Restore original 'pyblish.plugin.process'."""
+    global _original_process
+    if _original_process is None:
+        return
+    pyblish.plugin.process = _original_process
+    _original_process = None
+
+
+@contextlib.contextmanager
+def publish_instrumentation():
+    """Install publish instrumentation for duration of the context."""
+    installed = _original_process is None
+    install_publish_instrumentation()
+    try:
+        yield
+    finally:
+        if installed:
+            uninstall_publish_instrumentation()
+
+
+def _get_instance_label(instance):
+    return instance.data.get("label") or instance.data.get("name")
+
+
+def create_publish_report(context):
+    """Create publish report from results of processed plugins.
+
+    Report has the same structure as report of Publisher tool so it can be
+    opened in publish report viewer. Logs are not included.
+
+    Args:
+        context (pyblish.api.Context): Processed publish context.
+
+    Returns:
+        dict[str, Any]: Publish report.
+    """
+    plugins_data_by_id = {}
+    instances_data = {}
+    for result in context.data.get("results") or []:
+        plugin = result["plugin"]
+        instance = result["instance"]
+        plugin_data = plugins_data_by_id.get(plugin.id)
+        if plugin_data is None:
+            plugin_data = {
+                "id": plugin.id,
+                "name": plugin.__name__,
+                "label": getattr(plugin, "label", None),
+                "order": plugin.order,
+                "targets": list(plugin.targets),
+                "instances_data": [],
+                "actions_data": [],
+                "skipped": False,
+                "passed": True
+            }
+            plugins_data_by_id[plugin.id] = plugin_data
+
+        instance_id = None
+        if instance is not None:
+            instance_id = instance.id
+            if instance_id not in instances_data:
+                instances_data[instance_id] = {
+                    "name": instance.data.get("name"),
+                    "label": _get_instance_label(instance),
+                    "family": instance.data.get("family"),
+                    "families": instance.data.get("families") or [],
+                    "exists": True,
+                    "creator_identifier": instance.data.get(
+                        "creator_identifier"),
+                    "instance_id": instance.data.get("instance_id"),
+                }
+
+        plugin_data["instances_data"].append({
+            "id": instance_id,
+            "logs": [],
+            "process_time": result["duration"],
+            "metrics": result.get("metrics"),
+        })
+
+    return {
+        "plugins_data": list(plugins_data_by_id.values()),
+        "instances": instances_data,
+        "context": {"label": context.data.get("label")},
+        "crashed_file_paths": {},
+        "id": uuid.uuid4().hex,
+        "report_version": "1.0.0"
+    }
+
+
+def write_publish_report(context, filepath=None):
+    """Write publish report with metrics to a json file.
+
+    Args:
+        context (pyblish.api.Context): Processed publish context.
+        filepath (Optional[str]): Output path. Path from
+            'OPENPYPE_PUBLISH_REPORT_PATH' environment is used if not
+            passed.
+
+    Returns:
+        Union[str, None]: Path to written report or None if path is
+            not set.
+    """
+    if not filepath:
+        filepath = os.environ.get(PUBLISH_REPORT_ENV_KEY)
+    if not filepath:
+        return None
+
+    dirpath = os.path.dirname(filepath)
+    if dirpath and not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+
+    with open(filepath, "w") as stream:
+        json.dump(create_publish_report(context), stream, indent=4)
+    return filepath
+
+
+def get_plugin_timings(report):
+    """Summarize metrics of plugins from publish report.
+
+    Reports without metrics (e.g. from older versions) use only process time
+    of plugins as wall time.
+
+    Args:
+        report (dict[str, Any]): Publish report data.
+
+    Returns:
+        list[dict[str, Any]]: Metrics summary of each processed plugin
+            sorted from the slowest plugin.
+    """
+    instances = report.get("instances") or {}
+    output = []
+    for plugin_data in report.get("plugins_data") or []:
+        instances_data = plugin_data.get("instances_data") or []
+        if not instances_data:
+            continue
+
+        summary = {
+            "name": plugin_data["name"],
+            "label": plugin_data.get("label") or plugin_data["name"],
+            "order": plugin_data.get("order"),
+            "count": len(instances_data),
+            "wall_time": 0.0,
+            "cpu_time": None,
+            "subprocess_time": None,
+            "peak_rss_delta": None,
+            "instances": [],
+        }
+        for instance_data in instances_data:
+            metrics = dict(instance_data.get("metrics") or {})
+            metrics.setdefault("wall_time", instance_data["process_time"])
+            for key in _METRIC_KEYS:
+                value = metrics.get(key)
+                if value is not None:
+                    summary[key] = (summary[key] or 0.0) + value
+
+            peak_rss_delta = metrics.get("peak_rss_delta")
+            if peak_rss_delta is not None:
+                summary["peak_rss_delta"] = max(
+                    summary["peak_rss_delta"] or 0, peak_rss_delta
+                )
+
+            instance_id = instance_data["id"]
+            instance_label = "Context"
+            if instance_id is not None:
+                instance_label = (
+                    (instances.get(instance_id) or {}).get("label")
+                    or instance_id
+                )
+            summary["instances"].append(
+                dict(metrics, label=instance_label)
+            )
+
+        summary["instances"].sort(
+            key=lambda item: item["wall_time"], reverse=True
+        )
+        output.append(summary)
+
+    output.sort(key=lambda item: item["wall_time"], reverse=True)
+    return output
+
+
+def _format_time(value):
+    if value is None:
+        return "-"
+    return "{:.3f}".format(value / 1000.0)
+
+
+def _format_memory(value):
+    if value is None:
+        return "-"
+    return "{:.1f}".format(value / (1024.0 * 1024.0))
+
+
+def format_plugin_timings(timings, top=None, with_instances=False):
+    """Format summary from 'get_plugin_timings' as text table.
+
+    Args:
+        timings (list[dict[str, Any]]): Summary of plugins.
+        top (Optional[int]): Show only the slowest plugins.
+        with_instances (Optional[bool]): Add rows of instances under
+            plugins.
+
+    Returns:
+        str: Table with times in seconds and memory in MiB.
+    """
+    if top:
+        timings = timings[:top]
+
+    row_format = "{:<48} {:>6} {:>10} {:>10} {:>12} {:>15}"
+    lines = [
+        row_format.format(
+            "Plugin", "Count", "Wall (s)", "CPU (s)", "Subproc (s)",
+            "Peak RSS (MiB)"
+        )
+    ]
+    for summary in timings:
+        lines.append(row_format.format(
+            summary["label"][:48],
+            summary["count"],
+            _format_time(summary["wall_time"]),
+            _format_time(summary["cpu_time"]),
+            _format_time(summary["subprocess_time"]),
+            _format_memory(summary["peak_rss_delta"]),
+        ))
+        if not with_instances:
+            continue
+
+        for metrics in summary["instances"]:
+            lines.append(row_format.format(
+                "    {}".format(metrics["label"])[:48],
+                "",
+                _format_time(metrics.get("wall_time")),
+                _format_time(metrics.get("cpu_time")),
+                _format_time(metrics.get("subprocess_time")),
+                _format_memory(metrics.get("peak_rss_delta")),
+            ))
+    return "\n".join(lines)
@@ -25,6 +25,10 @@ from openpype.pipeline import (
 )
 from openpype.pipeline.plugin_discover import DiscoverResult
 
+from .instrumentation import (
+    publish_instrumentation,
+    write_publish_report,
+)
 from .constants import (
     DEFAULT_PUBLISH_TEMPLATE,
     DEFAULT_HERO_PUBLISH_TEMPLATE,
@@ -488,6 +492,9 @@ def filter_pyblish_plugins(plugins):
 def remote_publish(log):
     """Loops through all plugins, logs to console. Used for tests.
 
+    Processing of plugins is measured and publish report with the metrics
+    is written to path from 'OPENPYPE_PUBLISH_REPORT_PATH' if is set.
+
     Args:
         log (Logger)
     """
@@ -495,14 +502,22 @@ def remote_publish(log):
     # Error exit as soon as any error occurs.
     error_format = "Failed {plugin.__name__}: {error}\n{error.traceback}"
 
-    for result in pyblish.util.publish_iter():
-        if not result["error"]:
-            continue
+    context = pyblish.api.Context()
+    try:
+        with publish_instrumentation():
+            for result in pyblish.util.publish_iter(context):
+                if not result["error"]:
+                    continue
+
+                error_message = error_format.format(**result)
+                log.error(error_message)
+                # 'Fatal Error: ' is because of Deadline
+                raise RuntimeError("Fatal Error: {}".format(error_message))
 
-        error_message = error_format.format(**result)
-        log.error(error_message)
-        # 'Fatal Error: ' is because of Deadline
-        raise RuntimeError("Fatal Error: {}".format(error_message))
+    finally:
+        report_path = write_publish_report(context)
+        if report_path:
+            log.info("Publish report saved to \"{}\"".format(report_path))
 
 
 def get_errored_instances_from_context(context, plugin=None):
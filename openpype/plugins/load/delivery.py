@@ -15,6 +15,7 @@ from openpype.lib import (
 )
 from openpype.pipeline.load import get_representation_path_with_anatomy
 from openpype.pipeline.delivery import (
+    DeliveryPlan,
     get_format_dict,
     check_destination_path,
     deliver_single_file,
@@ -103,6 +104,11 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
         root_line_edit = QtWidgets.QLineEdit()
 
+        dry_run_checkbox = QtWidgets.QCheckBox()
+        dry_run_checkbox.setToolTip(
+            "Only report files which would be delivered"
+        )
+
         repre_checkboxes_layout = QtWidgets.QFormLayout()
         repre_checkboxes_layout.setContentsMargins(10, 5, 5, 10)
 
@@ -127,6 +133,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         input_layout.addRow("Renumber Frame", renumber_frame)
         input_layout.addRow("Renumber start frame", first_frame_start)
         input_layout.addRow("Root", root_line_edit)
+        input_layout.addRow("Dry run", dry_run_checkbox)
         input_layout.addRow("Representations", repre_checkboxes_layout)
 
         btn_delivery = QtWidgets.QPushButton("Deliver")
@@ -156,6 +163,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.first_frame_start = first_frame_start
         self.renumber_frame = renumber_frame
         self.root_line_edit = root_line_edit
+        self.dry_run_checkbox = dry_run_checkbox
         self.progress_bar = progress_bar
         self.text_area = text_area
         self.btn_delivery = btn_delivery
@@ -193,6 +201,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
+        delivery_plan = DeliveryPlan(self.log)
         for repre in self._representations:
             if repre["name"] not in selected_repres:
                 continue
@@ -222,6 +231,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 report_items,
                 self.log
             ]
+            kwargs = {"delivery_plan": delivery_plan}
 
             if repre.get("files"):
                 src_paths = []
@@ -256,20 +266,28 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
                     if frame is not None:
                         anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, **kwargs
+                    )
                     report_items.update(new_report_items)
-                    self._update_progress(uploaded)
             else:  # fallback for Pype2 and representations without files
                 frame = repre['context'].get('frame')
                 if frame:
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
                 if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, **kwargs
+                    )
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
+                    new_report_items, _ = deliver_sequence(*args, **kwargs)
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+
+        report_items, _ = delivery_plan.execute(
+            report_items,
+            dry_run=self.dry_run_checkbox.isChecked(),
+            progress_callback=self._update_progress
+        )
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -349,12 +367,15 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
+    def _update_progress(self, processed, total):
+        """Update progress bar after each file copied."""
+        self.currently_uploaded = processed
 
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+        ratio = 1.0
+        if total:
+            ratio = processed / total
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
@@ -13,6 +13,7 @@ import json
 import pyblish.api
 
 from openpype.pipeline import legacy_io, KnownPublishError
+from openpype.pipeline.farm.expected_files import expand_files
 from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
 
 
@@ -125,6 +126,9 @@ class CollectRenderedFiles(pyblish.api.ContextPlugin):
             representations = []
             for repre_data in instance_data.get("representations") or []:
                 self._fill_staging_dir(repre_data, anatomy)
+                # files of sequences can be stored in compact form
+                if "files" in repre_data:
+                    repre_data["files"] = expand_files(repre_data["files"])
                 representations.append(repre_data)
 
                 if not staging_dir_persistent:
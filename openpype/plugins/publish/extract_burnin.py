@@ -33,6 +33,9 @@ class ExtractBurnin(publish.Extractor):
 
     label = "Extract burnins"
     order = pyblish.api.ExtractorOrder + 0.03
+    # Uses only data of processed instance and runs ffmpeg in subprocess
+    #   so it can be processed concurrently for multiple instances
+    parallel_safe = True
 
     families = ["review", "burnin"]
     hosts = [
@@ -13,6 +13,7 @@ import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_args,
+    assemble_sequences,
     filter_profiles,
     path_to_subprocess_arg,
     run_subprocess,
@@ -45,6 +46,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     label = "Extract Review"
     order = pyblish.api.ExtractorOrder + 0.02
+    # Uses only data of processed instance and runs ffmpeg in subprocess
+    #   so it can be processed concurrently for multiple instances
+    parallel_safe = True
     families = ["review"]
     hosts = [
         "nuke",
@@ -864,19 +868,19 @@ class ExtractReview(pyblish.api.InstancePlugin):
             KnownPublishError: if more than one collection is obtained.
         """
 
-        collections = clique.assemble(files)[0]
-        if len(collections) != 1:
+        sequences = assemble_sequences(files)[0]
+        if len(sequences) != 1:
             raise KnownPublishError(
-                "Multiple collections {} found.".format(collections))
+                "Multiple collections {} found.".format(sequences))
 
-        col = collections[0]
+        sequence = sequences[0]
 
         # Prepare which hole is filled with what frame
         #   - the frame is filled only with already existing frames
-        prev_frame = next(iter(col.indexes))
+        prev_frame = sequence.start
         hole_frame_to_nearest = {}
         for frame in range(int(start_frame), int(end_frame) + 1):
-            if frame in col.indexes:
+            if frame in sequence:
                 prev_frame = frame
             else:
                 # Use previous frame as source for hole
@@ -884,10 +888,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Calculate paths
         added_files = []
-        col_format = col.format("{head}{padding}{tail}")
         for hole_frame, src_frame in hole_frame_to_nearest.items():
-            hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
-            src_fpath = os.path.join(staging_dir, col_format % src_frame)
+            hole_fpath = os.path.join(
+                staging_dir, sequence.get_file_name(hole_frame))
+            src_fpath = os.path.join(
+                staging_dir, sequence.get_file_name(src_frame))
             if not os.path.isfile(src_fpath):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
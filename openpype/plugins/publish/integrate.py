@@ -33,6 +33,7 @@ from openpype.pipeline.publish import (
     KnownPublishError,
     get_publish_template_name,
 )
+from openpype.pipeline.load import invalidate_versions_latest_state
 
 log = logging.getLogger(__name__)
 
@@ -307,6 +308,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # publish to the same version number since that chance can greatly
         # increase if the file transaction takes a long time.
         op_session.commit()
+        # New version changes which versions are latest
+        invalidate_versions_latest_state(project_name)
 
         self.log.info("Subset '{subset[name]}' version {version[name]} "
                       "written to database..".format(subset=subset,
@@ -945,15 +948,34 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             + warning logged
         """
 
-        success, rootless_path = anatomy.find_root_template_from_path(path)
-        if success:
-            path = rootless_path
-        else:
-            self.log.warning((
-                "Could not find root path for remapping \"{}\"."
-                " This may cause issues on farm."
-            ).format(path))
-        return path
+        return self.get_rootless_paths(anatomy, [path])[0]
+
+    def get_rootless_paths(self, anatomy, paths):
+        """Returns, if possible, paths without absolute portion from root.
+
+        Batch variant of 'get_rootless_path' which converts all paths
+        at once.
+
+        Args:
+            anatomy: anatomy part from instance
+            paths (list[str]): absolute paths
+        Returns:
+            list[str]: modified paths if possible, or unmodified paths
+            + warning logged
+        """
+        paths = list(paths)
+        output = []
+        results = anatomy.find_root_templates(paths)
+        for path, (success, rootless_path) in zip(paths, results):
+            if success:
+                path = rootless_path
+            else:
+                self.log.warning((
+                    "Could not find root path for remapping \"{}\"."
+                    " This may cause issues on farm."
+                ).format(path))
+            output.append(path)
+        return output
 
     def get_files_info(self, destinations, sites, anatomy):
         """Prepare 'files' info portion for representations.
@@ -967,13 +989,17 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             in representation
         """
 
+        destinations = list(destinations)
         file_infos = []
-        for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+        rootless_paths = self.get_rootless_paths(anatomy, destinations)
+        for file_path, rootless_path in zip(destinations, rootless_paths):
+            file_info = self.prepare_file_info(
+                file_path, anatomy, sites=sites, rootless_path=rootless_path
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, rootless_path=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -982,14 +1008,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            rootless_path (Optional[str]): already converted rootless path,
+                is converted from 'path' if not passed
 
         Returns:
             dict: file info dictionary
         """
+        if rootless_path is None:
+            rootless_path = self.get_rootless_path(anatomy, path)
 
         return {
             "_id": ObjectId(),
-            "path": self.get_rootless_path(anatomy, path),
+            "path": rootless_path,
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
@@ -3,12 +3,14 @@ import copy
 import clique
 import errno
 import shutil
+import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client import (
-    get_version_by_id,
+    get_versions,
     get_hero_version_by_subset_id,
     get_archived_representations,
     get_representations,
@@ -19,10 +21,11 @@ from openpype.client.operations import (
     prepare_hero_version_update_data,
     prepare_representation_update_data,
 )
-from openpype.lib import create_hard_link
+from openpype.lib import create_hard_link, create_reflink
 from openpype.pipeline import (
     schema
 )
+from openpype.pipeline.load import invalidate_versions_latest_state
 from openpype.pipeline.publish import get_publish_template_name
 
 
@@ -56,6 +59,9 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
     _default_template_name = "hero"
 
+    # Maximum number of threads used to link or copy files
+    transfer_workers = 8
+
     def process(self, instance):
         self.log.debug(
             "--- Integration of Hero version for subset `{}` begins.".format(
@@ -297,15 +303,11 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             self.log.debug("Backup folder path is \"{}\"".format(
                 backup_hero_publish_dir
             ))
-            try:
-                os.rename(hero_publish_dir, backup_hero_publish_dir)
-            except PermissionError:
-                raise AssertionError((
-                    "Could not create hero version because it is not"
-                    " possible to replace current hero files."
-                ))
+
+        staging_hero_publish_dir = self.get_staging_dir(hero_publish_dir)
         try:
             src_to_dst_file_paths = []
+            rootless_by_path = {}
             path_template_obj = anatomy.templates_obj[template_key]["path"]
             for repre_info in published_repres.values():
 
@@ -375,6 +377,11 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                             (src_file, dst_file)
                         )
 
+                # Convert all new paths to rootless at once
+                self._fill_rootless_paths(
+                    anatomy, rootless_by_path, src_to_dst_file_paths
+                )
+
                 # replace original file name with hero name in repre doc
                 for index in range(len(repre.get("files"))):
                     file = repre.get("files")[index]
@@ -384,7 +391,7 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                         if src_file_name == file_name:
                             repre["files"][index]["path"] = self._update_path(
                                 anatomy, repre["files"][index]["path"],
-                                src_file, dst_file)
+                                src_file, dst_file, rootless_by_path)
 
                             repre["files"][index]["hash"] = self._update_hash(
                                 repre["files"][index]["hash"],
@@ -455,14 +462,19 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
             self.path_checks = []
 
-            # Copy(hardlink) paths of source and destination files
-            # TODO should we *only* create hardlinks?
-            # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            # Stage files next to hero folder so current hero files are
+            #   available until staged folder is swapped in
+            transfers = self.prepare_transfers(
+                hero_publish_dir,
+                staging_hero_publish_dir,
+                src_to_dst_file_paths + other_file_paths_mapping
+            )
+            self.transfer_files(transfers)
+            self.swap_hero_dir(
+                hero_publish_dir,
+                staging_hero_publish_dir,
+                backup_hero_publish_dir
+            )
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -488,6 +500,7 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                                              repre)
 
             op_session.commit()
+            invalidate_versions_latest_state(project_name)
 
             # Remove backuped previous hero
             if (
@@ -497,6 +510,9 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                 shutil.rmtree(backup_hero_publish_dir)
 
         except Exception:
+            if os.path.exists(staging_hero_publish_dir):
+                shutil.rmtree(staging_hero_publish_dir)
+
             if (
                 backup_hero_publish_dir is not None and
                 os.path.exists(backup_hero_publish_dir)
@@ -588,8 +604,107 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             family = instance.data["families"][0]
         return family
 
+    def get_staging_dir(self, hero_publish_dir):
+        """Sibling folder of hero folder where new files are staged.
+
+        Previous staging folder left by crashed publish is removed.
+        """
+        staging_dir = hero_publish_dir + ".STAGING"
+        if os.path.exists(staging_dir):
+            self.log.debug(
+                "Removing previous staging folder \"{}\"".format(staging_dir)
+            )
+            shutil.rmtree(staging_dir)
+        return staging_dir
+
+    def prepare_transfers(self, hero_publish_dir, staging_dir, file_pairs):
+        """Plan transfers of files into hero folder.
+
+        Destinations inside hero folder are redirected to staging folder.
+
+        Args:
+            hero_publish_dir (str): Hero publish folder.
+            staging_dir (str): Staging folder which replaces hero folder.
+            file_pairs (Iterable[tuple[str, str]]): Source and destination
+                paths.
+
+        Returns:
+            list[tuple[str, str]]: Source and destination paths of unique
+                destinations.
+        """
+        hero_dir_prefix = os.path.join(hero_publish_dir, "")
+        transfers = []
+        dst_paths = set()
+        for src_path, dst_path in file_pairs:
+            dst_path = os.path.normpath(str(dst_path))
+            if dst_path in dst_paths:
+                continue
+            dst_paths.add(dst_path)
+
+            if dst_path.startswith(hero_dir_prefix):
+                dst_path = os.path.join(
+                    staging_dir, dst_path[len(hero_dir_prefix):]
+                )
+            transfers.append((os.path.normpath(src_path), dst_path))
+        return transfers
+
+    def transfer_files(self, transfers):
+        """Reflink, hardlink or copy files using multiple threads.
+
+        Args:
+            transfers (list[tuple[str, str]]): Source and destination paths.
+        """
+        dirnames = {
+            os.path.dirname(dst_path)
+            for _, dst_path in transfers
+        }
+        for dirname in sorted(dirnames):
+            os.makedirs(dirname, exist_ok=True)
+
+        # Modes which failed because are not supported by filesystem
+        #   are not tried again for other files
+        skip_modes = set()
+
+        def _transfer(transfer):
+            src_path, dst_path = transfer
+            return self._transfer_file(src_path, dst_path, skip_modes)
+
+        workers = min(self.transfer_workers, len(transfers))
+        if workers < 2:
+            modes = [_transfer(transfer) for transfer in transfers]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                modes = list(executor.map(_transfer, transfers))
+
+        self.log.debug("Transferred files: {}".format(
+            ", ".join(
+                "{} {}".format(count, mode)
+                for mode, count in collections.Counter(modes).items()
+            )
+        ))
+
+    def swap_hero_dir(self, hero_publish_dir, staging_dir, backup_dir):
+        """Replace current hero folder with staged folder.
+
+        Args:
+            hero_publish_dir (str): Hero publish folder.
+            staging_dir (str): Folder with staged files.
+            backup_dir (Union[str, None]): Where current hero folder is
+                moved. None if hero folder does not exist.
+        """
+        # Make sure staging folder exists even if nothing was staged
+        os.makedirs(staging_dir, exist_ok=True)
+        if backup_dir is not None:
+            try:
+                os.rename(hero_publish_dir, backup_dir)
+            except PermissionError:
+                raise AssertionError((
+                    "Could not create hero version because it is not"
+                    " possible to replace current hero files."
+                ))
+        os.rename(staging_dir, hero_publish_dir)
+
     def copy_file(self, src_path, dst_path):
-        # TODO check drives if are the same to check if cas hardlink
         dirname = os.path.dirname(dst_path)
 
         try:
@@ -602,31 +717,69 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
             self.log.debug("Folder already exists: \"{}\"".format(dirname))
 
+        self._transfer_file(src_path, dst_path)
+
+    def _transfer_file(self, src_path, dst_path, skip_modes=None):
+        """Reflink, hardlink or copy file.
+
+        Args:
+            src_path (str): Source file path.
+            dst_path (str): Destination file path.
+            skip_modes (Optional[set[str]]): Modes which should not be tried.
+                Modes not supported by filesystem are added.
+
+        Returns:
+            str: Used mode "reflink", "hardlink" or "copy".
+        """
+        if skip_modes is None:
+            skip_modes = set()
+
         self.log.debug("Copying file \"{}\" to \"{}\"".format(
             src_path, dst_path
         ))
 
-        # First try hardlink and copy if paths are cross drive
-        try:
-            create_hard_link(src_path, dst_path)
-            # Return when successful
-            return
+        # First try copy-on-write clone which does not share file with
+        #   previous version
+        if "reflink" not in skip_modes:
+            try:
+                create_reflink(src_path, dst_path)
+                return "reflink"
+
+            except OSError as exc:
+                if exc.errno not in (
+                    errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV,
+                    errno.EINVAL, errno.ENOTTY
+                ):
+                    raise
+                skip_modes.add("reflink")
+
+        # Try hardlink and copy if paths are cross drive
+        if "hardlink" not in skip_modes:
+            try:
+                create_hard_link(src_path, dst_path)
+                return "hardlink"
 
-        except OSError as exc:
-            # re-raise exception if different than
-            # EXDEV - cross drive path
-            # EINVAL - wrong format, must be NTFS
-            self.log.debug("Hardlink failed with errno:'{}'".format(exc.errno))
-            if exc.errno not in [errno.EXDEV, errno.EINVAL]:
-                raise
+            except OSError as exc:
+                # re-raise exception if different than
+                # EXDEV - cross drive path
+                # EINVAL - wrong format, must be NTFS
+                self.log.debug(
+                    "Hardlink failed with errno:'{}'".format(exc.errno)
+                )
+                if exc.errno not in [errno.EXDEV, errno.EINVAL]:
+                    raise
+                skip_modes.add("hardlink")
 
         shutil.copy(src_path, dst_path)
+        return "copy"
 
     def version_from_representations(self, project_name, repres):
-        for repre in repres:
-            version = get_version_by_id(project_name, repre["parent"])
-            if version:
-                return version
+        version_ids = {
+            repre_info["representation"]["parent"]
+            for repre_info in repres.values()
+        }
+        for version in get_versions(project_name, version_ids=version_ids):
+            return version
 
     def current_hero_ents(self, project_name, version):
         hero_version = get_hero_version_by_subset_id(
@@ -641,7 +794,32 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
         ))
         return (hero_version, hero_repres)
 
-    def _update_path(self, anatomy, path, src_file, dst_file):
+    def _fill_rootless_paths(self, anatomy, rootless_by_path, paths_pairs):
+        """
+            Adds rootless paths of not yet converted paths to cache
+
+            Args:
+                anatomy (Anatomy) - to get rootless style of path
+                rootless_by_path (dict) - rootless paths by path
+                paths_pairs (list) - source and destination file paths
+        """
+        paths = set()
+        for src_file, dst_file in paths_pairs:
+            for path in (str(src_file), str(dst_file)):
+                if path not in rootless_by_path:
+                    paths.add(path)
+
+        if not paths:
+            return
+
+        paths = list(paths)
+        results = anatomy.find_root_templates(paths)
+        for path, (_, rootless) in zip(paths, results):
+            rootless_by_path[path] = rootless
+
+    def _update_path(
+        self, anatomy, path, src_file, dst_file, rootless_by_path=None
+    ):
         """
             Replaces source path with new hero path
 
@@ -653,9 +831,16 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                 path (string) - path from DB
                 src_file (string) - original file path
                 dst_file (string) - hero file path
+                rootless_by_path (dict) - optional cache of rootless paths
+                    filled by '_fill_rootless_paths'
         """
-        _, rootless = anatomy.find_root_template_from_path(dst_file)
-        _, rtls_src = anatomy.find_root_template_from_path(src_file)
+        if rootless_by_path is None:
+            rootless_by_path = {}
+        self._fill_rootless_paths(
+            anatomy, rootless_by_path, [(src_file, dst_file)]
+        )
+        rootless = rootless_by_path[str(dst_file)]
+        rtls_src = rootless_by_path[str(src_file)]
         return path.replace(rtls_src, rootless)
 
     def _update_hash(self, hash, src_file_name, dst_file):
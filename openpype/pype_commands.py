@@ -97,6 +97,10 @@ class PypeCommands:
             install_openpype_plugins,
             get_global_context,
         )
+        from openpype.pipeline.publish import (
+            publish_instrumentation,
+            write_publish_report,
+        )
         from openpype.tools.utils.host_tools import show_publish
         from openpype.tools.utils.lib import qt_app_context
 
@@ -157,14 +161,44 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            context = pyblish.api.Context()
+            try:
+                with publish_instrumentation():
+                    for result in pyblish.util.publish_iter(context):
+                        if result["error"]:
+                            log.error(error_format.format(**result))
+                            # uninstall()
+                            sys.exit(1)
+            finally:
+                report_path = write_publish_report(context)
+                if report_path:
+                    log.info(
+                        "Publish report saved to \"{}\"".format(report_path)
+                    )
 
         log.info("Publish finished.")
 
+    @staticmethod
+    def publish_report_timings(report_path, top=None, with_instances=False):
+        """Print the slowest plugins from saved publish report.
+
+        Args:
+            report_path (str): Path to publish report json.
+            top (int): Print only the slowest plugins.
+            with_instances (bool): Print also times of instances.
+        """
+        from openpype.pipeline.publish import (
+            get_plugin_timings,
+            format_plugin_timings,
+        )
+
+        with open(report_path, "r") as stream:
+            report = json.load(stream)
+
+        print(format_plugin_timings(
+            get_plugin_timings(report), top, with_instances
+        ))
+
     @staticmethod
     def extractenvironments(output_json_path, project, asset, task, app,
                             env_group):
@@ -0,0 +1,93 @@
+"""Performance test of conversion of paths to rootless paths.
+
+Converts synthetic published paths using 'find_root_template_from_path'
+for each path and using batch 'find_root_templates'. Does not require
+running server.
+
+Run:
+    python -m openpype.tests.anatomy_roots_performance [count]
+"""
+import sys
+import time
+
+from openpype.pipeline.anatomy import Roots
+
+
+class FakeAnatomy(dict):
+    """Anatomy providing only data for roots."""
+
+    project_name = "performance_test"
+
+
+ROOTS_DATA = {
+    "work": {
+        "windows": "P:/projects/work",
+        "linux": "/mnt/share/projects/work",
+        "darwin": "/Volumes/share/projects/work"
+    },
+    "publish": {
+        "windows": "P:/projects/publish",
+        "linux": "/mnt/share/projects/publish",
+        "darwin": "/Volumes/share/projects/publish"
+    },
+    "cache": {
+        "windows": "Q:/cache",
+        "linux": "/mnt/cache",
+        "darwin": "/Volumes/cache"
+    }
+}
+
+
+def create_paths(count):
+    """Create synthetic paths spread over roots and platforms.
+
+    Every tenth path is outside of roots.
+    """
+    prefixes = [
+        "P:\\projects\\publish",
+        "/mnt/share/projects/publish",
+        "/Volumes/share/projects/work",
+        "q:/cache",
+        "/mnt/cache",
+    ]
+    paths = []
+    for idx in range(count):
+        if idx % 10 == 9:
+            prefix = "/tmp/local"
+        else:
+            prefix = prefixes[idx % len(prefixes)]
+        paths.append(
+            "{}/sq{:03d}/sh{:04d}/publish/render/v{:03d}/file.{:04d}.exr"
+            .format(prefix, idx % 50, idx % 1000, idx % 20, idx)
+        )
+    return paths
+
+
+def main(count=100000):
+    roots = Roots(FakeAnatomy(roots=ROOTS_DATA))
+    paths = create_paths(count)
+
+    start = time.time()
+    single_results = [
+        roots.find_root_template_from_path(path)
+        for path in paths
+    ]
+    single_duration = time.time() - start
+
+    start = time.time()
+    batch_results = roots.find_root_templates(paths)
+    batch_duration = time.time() - start
+
+    assert single_results == batch_results
+    print("Converted {} paths ({} rootless)".format(
+        count, sum(1 for success, _ in batch_results if success)
+    ))
+    print("Per path: {:.3f}s".format(single_duration))
+    print("Batch: {:.3f}s".format(batch_duration))
+
+
+if __name__ == "__main__":
+    path_count = 100000
+    if len(sys.argv) > 1:
+        path_count = int(sys.argv[1])
+    main(path_count)
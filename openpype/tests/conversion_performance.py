@@ -0,0 +1,280 @@
+"""Performance test of v4 to v3 entity conversion.
+
+Converts synthetic folders, products and representations to v3 structure
+using per-entity conversion and using cached converters applied on
+a stream of entities. Conversion of queried fields is measured too.
+Does not require running server.
+
+Run:
+    python -m openpype.tests.conversion_performance --count 100000
+"""
+import time
+import uuid
+
+import click
+
+from openpype.client.server.conversion_utils import (
+    folder_fields_v3_to_v4,
+    convert_v4_folder_to_v3,
+    convert_v4_folders_to_v3,
+    subset_fields_v3_to_v4,
+    convert_v4_subset_to_v3,
+    convert_v4_subsets_to_v3,
+    representation_fields_v3_to_v4,
+    convert_v4_representation_to_v3,
+    convert_v4_representations_to_v3,
+)
+
+PROJECT_NAME = "benchmark"
+
+
+class FakeConnection:
+    """Connection providing only attributes for fields conversion."""
+
+    attributes = {
+        "path": {},
+        "template": {},
+        "extension": {},
+        "frameStart": {},
+        "frameEnd": {},
+        "resolutionWidth": {},
+        "resolutionHeight": {},
+        "productGroup": {},
+    }
+
+    def get_attributes_for_type(self, entity_type):
+        return self.attributes
+
+
+def create_folders(count):
+    """Create synthetic v4 folders with tasks.
+
+    Args:
+        count (int): Number of folders.
+
+    Returns:
+        list[dict[str, Any]]: Folders.
+    """
+
+    parent_id = uuid.uuid4().hex
+    return [
+        {
+            "id": uuid.uuid4().hex,
+            "name": "sh{:04d}".format(idx),
+            "folderType": "Shot",
+            "parentId": parent_id,
+            "active": True,
+            "thumbnailId": None,
+            "parents": ["sq010"],
+            "attrib": {"frameStart": 1001, "frameEnd": 1100},
+            "tasks": [
+                {"name": "animation", "taskType": "Animation"},
+                {"name": "lighting", "taskType": "Lighting"},
+            ],
+            "data": {},
+        }
+        for idx in range(count)
+    ]
+
+
+def create_subsets(count):
+    """Create synthetic v4 products.
+
+    Args:
+        count (int): Number of products.
+
+    Returns:
+        list[dict[str, Any]]: Products.
+    """
+
+    folder_id = uuid.uuid4().hex
+    return [
+        {
+            "id": uuid.uuid4().hex,
+            "name": "renderMain{}".format(idx),
+            "folderId": folder_id,
+            "productType": "render",
+            "active": True,
+            "attrib": {"productGroup": "renders"},
+            "data": {},
+        }
+        for idx in range(count)
+    ]
+
+
+def create_representations(count, files_count=3):
+    """Create synthetic v4 representations.
+
+    Args:
+        count (int): Number of representations.
+        files_count (int): Number of files in each representation.
+
+    Returns:
+        list[dict[str, Any]]: Representations.
+    """
+
+    version_id = uuid.uuid4().hex
+    representations = []
+    for idx in range(count):
+        files = [
+            {
+                "id": uuid.uuid4().hex,
+                "name": "file.{:04d}.exr".format(frame),
+                "path": "{{root[work]}}/project/file.{:04d}.exr".format(
+                    frame),
+                "size": 1024,
+                "hash": "file_{}".format(frame),
+            }
+            for frame in range(files_count)
+        ]
+        representations.append({
+            "id": uuid.uuid4().hex,
+            "name": "exr_{}".format(idx),
+            "versionId": version_id,
+            "active": True,
+            "context": {
+                "folder": {"name": "sh010"},
+                "product": {"name": "renderMain", "type": "render"},
+                "version": 1,
+                "representation": "exr",
+            },
+            "files": files,
+            "attrib": {
+                "path": "{root[work]}/project/file.####.exr",
+                "template": "{root[work]}/{product[name]}/{product[type]}",
+            },
+            "data": {},
+        })
+    return representations
+
+
+def _copy_entities(entities):
+    # Conversion modifies source entities
+    output = []
+    for entity in entities:
+        entity = dict(entity)
+        for key in ("attrib", "context"):
+            if key in entity:
+                entity[key] = dict(entity[key])
+        if "files" in entity:
+            entity["files"] = [
+                dict(file_info) for file_info in entity["files"]
+            ]
+        entity["data"] = {}
+        output.append(entity)
+    return output
+
+
+def _measure(func, entities, repeat):
+    durations = []
+    result = None
+    for _ in range(repeat):
+        source = _copy_entities(entities)
+        start = time.perf_counter()
+        result = func(source)
+        durations.append(time.perf_counter() - start)
+    return min(durations), result
+
+
+def _measure_fields(func, v3_fields, con, count, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(count):
+            func(v3_fields, con)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def _print_result(label, entity_type, count, per_entity, stream):
+    print("{} x{}:".format(label, count))
+    print("  per entity {} conversion: {:.3f}s".format(
+        entity_type, per_entity))
+    print("  stream {} conversion:     {:.3f}s".format(entity_type, stream))
+    if stream:
+        print("  speedup: {:.1f}x".format(per_entity / stream))
+
+
+@click.command()
+@click.option("--count", default=100000,
+              help="Number of entities of each type.")
+@click.option("--repeat", default=3, help="Repeats of each measurement.")
+def main(count, repeat):
+    con = FakeConnection()
+
+    for label, func, v3_fields in (
+        (
+            "folder",
+            folder_fields_v3_to_v4,
+            ["_id", "name", "data.tasks", "data.frameStart"]
+        ),
+        ("subset", subset_fields_v3_to_v4, ["_id", "name", "parent", "data"]),
+        (
+            "representation",
+            representation_fields_v3_to_v4,
+            ["_id", "name", "parent", "context", "files", "data"]
+        ),
+    ):
+        duration = _measure_fields(func, v3_fields, con, count, repeat)
+        print("Fields conversion of {} x{}: {:.3f}s".format(
+            label, count, duration))
+
+    folder_fields = folder_fields_v3_to_v4(None, con)
+    folders = create_folders(count)
+    per_entity, _ = _measure(
+        lambda source: [
+            convert_v4_folder_to_v3(item, PROJECT_NAME) for item in source
+        ],
+        folders,
+        repeat
+    )
+    stream, _ = _measure(
+        lambda source: list(
+            convert_v4_folders_to_v3(source, PROJECT_NAME, folder_fields)
+        ),
+        folders,
+        repeat
+    )
+    _print_result("Folders", "folder", count, per_entity, stream)
+
+    subset_fields = subset_fields_v3_to_v4(["_id", "name", "parent"], con)
+    subset_fields.add("active")
+    subsets = create_subsets(count)
+    per_entity, _ = _measure(
+        lambda source: [convert_v4_subset_to_v3(item) for item in source],
+        subsets,
+        repeat
+    )
+    stream, _ = _measure(
+        lambda source: list(convert_v4_subsets_to_v3(source, subset_fields)),
+        subsets,
+        repeat
+    )
+    _print_result("Subsets", "subset", count, per_entity, stream)
+
+    repre_fields = representation_fields_v3_to_v4(
+        ["_id", "name", "parent", "context", "files", "data"], con
+    )
+    repre_fields.add("active")
+    representations = create_representations(count)
+    per_entity, _ = _measure(
+        lambda source: [
+            convert_v4_representation_to_v3(item) for item in source
+        ],
+        representations,
+        repeat
+    )
+    stream, _ = _measure(
+        lambda source: list(
+            convert_v4_representations_to_v3(source, repre_fields)
+        ),
+        representations,
+        repeat
+    )
+    _print_result(
+        "Representations", "representation", count, per_entity, stream
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Performance test of sequence discovery in 'openpype.lib' against clique.
+
+Creates directory with empty files (sequences with gaps and some single
+files) and measures time of listing and assembling sequences with clique
+and with 'scan_directory' with and without cache. Gap checks of all found
+sequences are measured too.
+
+Run:
+    python -m openpype.tests.file_sequences_performance --files 100000
+"""
+import os
+import time
+import shutil
+import tempfile
+
+import click
+import clique
+
+from openpype.lib.file_sequences import (
+    scan_directory,
+    clear_scan_cache,
+)
+
+
+def _create_files(dir_path, files_count, sequences_count):
+    single_count = max(files_count // 100, 1)
+    frames_count = (files_count - single_count) // sequences_count
+    for seq_idx in range(sequences_count):
+        for frame in range(1001, 1001 + frames_count):
+            # Make a gap in every second sequence
+            if seq_idx % 2 and frame == 1010:
+                continue
+            file_name = "sh{:03d}_beauty_v001.{:04d}.exr".format(
+                seq_idx, frame
+            )
+            open(os.path.join(dir_path, file_name), "w").close()
+
+    for idx in range(single_count):
+        file_name = "notes_{}.txt".format(idx)
+        open(os.path.join(dir_path, file_name), "w").close()
+
+
+def _measure(func, repeat):
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return min(durations), result
+
+
+def _clique_scan(dir_path):
+    collections, remainder = clique.assemble(os.listdir(dir_path))
+    return [
+        collection
+        for collection in collections
+        if list(collection.holes())
+    ]
+
+
+def _engine_scan(dir_path, use_cache):
+    sequences, _ = scan_directory(dir_path, use_cache=use_cache)
+    return [sequence for sequence in sequences if sequence.has_gaps]
+
+
+@click.command()
+@click.option("--files", "files_count", default=100000,
+              help="Number of files in directory.")
+@click.option("--sequences", "sequences_count", default=10,
+              help="Number of sequences in directory.")
+@click.option("--repeat", default=3, help="Repeats of each measurement.")
+@click.option("--directory", default=None,
+              help="Use existing directory instead of creating files.")
+def main(files_count, sequences_count, repeat, directory):
+    tmp_dir = None
+    if directory is None:
+        tmp_dir = tempfile.mkdtemp(prefix="op_sequences_")
+        directory = tmp_dir
+        print("Creating {} files in {}".format(files_count, directory))
+        _create_files(directory, files_count, sequences_count)
+        # Keep directory older than racy interval so the result is cached
+        os.utime(directory, (time.time() - 10, time.time() - 10))
+
+    try:
+        clique_time, clique_gaps = _measure(
+            lambda: _clique_scan(directory), repeat
+        )
+        clear_scan_cache()
+        engine_time, engine_gaps = _measure(
+            lambda: _engine_scan(directory, False), repeat
+        )
+        _engine_scan(directory, True)
+        cached_time, _ = _measure(
+            lambda: _engine_scan(directory, True), repeat
+        )
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir)
+
+    print("clique listdir + assemble + holes: {:.3f}s ({} with gaps)".format(
+        clique_time, len(clique_gaps)
+    ))
+    print("scan_directory:                    {:.3f}s ({} with gaps)".format(
+        engine_time, len(engine_gaps)
+    ))
+    print("scan_directory cached:             {:.6f}s".format(cached_time))
+    if engine_time:
+        print("Speedup: {:.1f}x".format(clique_time / engine_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark of communication between Harmony server and client.
+
+Harmony is replaced with 'HarmonyStandInClient' which speaks the same
+protocol as 'TB_sceneOpened.js' so latency and throughput of the server can
+be measured without the DCC.
+
+Run with:
+    openpype_console run openpype/tests/harmony_server_performance.py
+"""
+import json
+import socket
+import struct
+import threading
+import time
+
+from openpype.hosts.harmony.api.server import Server
+
+
+class HarmonyStandInClient(threading.Thread):
+    """Stand-in of Harmony client implemented in 'TB_sceneOpened.js'.
+
+    Requests are processed one by one in order as Harmony does. Functions
+    are looked up in 'functions' by name, unknown functions return their
+    arguments.
+
+    Args:
+        port (int): Port of server.
+        functions (Optional[dict[str, Callable]]): Functions by name which
+            can be called by requests.
+        processing_delay (Optional[float]): Seconds spent on each function
+            call to simulate work in Harmony.
+    """
+
+    def __init__(self, port, functions=None, processing_delay=0):
+        super(HarmonyStandInClient, self).__init__()
+        self.daemon = True
+        self.functions = functions or {}
+        self.processing_delay = processing_delay
+        self.processed_count = 0
+        self.socket = socket.create_connection(("127.0.0.1", port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _recv_exact(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.socket.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _send(self, message):
+        # Harmony sends content length as 8 hexadecimal characters
+        encoded = message.encode("utf-8")
+        header = "AH{:08x}".format(len(encoded)).encode("ascii")
+        self.socket.sendall(header + encoded)
+
+    def call_function(self, request):
+        if self.processing_delay:
+            time.sleep(self.processing_delay)
+        self.processed_count += 1
+        func = self.functions.get(request["function"])
+        if func is None:
+            return request.get("args")
+        return func(request.get("args"))
+
+    def process_request(self, request):
+        if "batch" in request:
+            return [
+                self.call_function(sub_request)
+                for sub_request in request["batch"]
+            ]
+        if "function" in request:
+            return self.call_function(request)
+        return None
+
+    def run(self):
+        while True:
+            header = self._recv_exact(6)
+            if header is None:
+                break
+            length = struct.unpack(">I", header[2:])[0]
+            data = self._recv_exact(length)
+            if data is None:
+                break
+
+            request = json.loads(data.decode("utf-8"))
+            if request.get("reply"):
+                continue
+            request["result"] = self.process_request(request)
+            request["reply"] = True
+            self._send(json.dumps(request))
+
+    def close(self):
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+
+def _measure(label, count, func):
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    print("{:<28} {:>8.2f} ms total {:>10.1f} calls/s".format(
+        label, duration * 1000, count / duration
+    ))
+
+
+def main(count=1000, processing_delay=0):
+    server = Server(0)
+    server.log.setLevel("WARNING")
+    server.start()
+    client = HarmonyStandInClient(server.port, None, processing_delay)
+    client.start()
+
+    requests = [
+        {"function": "AvalonHarmony.echo", "args": [idx]}
+        for idx in range(count)
+    ]
+
+    def sequential():
+        for request in requests:
+            server.send(dict(request))
+
+    def pipelined():
+        server.send_many([dict(request) for request in requests])
+
+    def batched():
+        server.send_batch(requests)
+
+    print("{} calls, processing delay {} s".format(count, processing_delay))
+    _measure("Sequential send", count, sequential)
+    _measure("Pipelined send_many", count, pipelined)
+    _measure("Single send_batch", count, batched)
+
+    client.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
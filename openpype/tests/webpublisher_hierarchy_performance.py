@@ -0,0 +1,127 @@
+"""Load test of webpublisher hierarchy endpoint with concurrent clients.
+
+Each client requests hierarchy of a project repeatedly. With '--etag' the
+clients send ETag of previous response in 'If-None-Match' header. Latency
+of a cheap endpoint ('--probe-path') is measured at the same time to show
+if the server is blocked while hierarchy is loaded.
+
+Requires running webpublisher server.
+
+Run:
+    python -m openpype.tests.webpublisher_hierarchy_performance
+        --project MyProject --clients 50
+"""
+import time
+import asyncio
+
+import aiohttp
+import click
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    idx = min(int(round(percent / 100.0 * (len(values) - 1))), len(values) - 1)
+    return values[idx]
+
+
+def _format_stats(label, latencies, statuses, duration):
+    count = len(latencies)
+    status_str = ", ".join(
+        "{}: {}".format(status, statuses[status])
+        for status in sorted(statuses)
+    )
+    return (
+        "{label}: {count} requests, {rps:.1f} req/s, latency ms"
+        " p50 {p50:.1f} p95 {p95:.1f} max {max:.1f} ({statuses})"
+    ).format(
+        label=label,
+        count=count,
+        rps=count / duration if duration else 0.0,
+        p50=_percentile(latencies, 50) * 1000,
+        p95=_percentile(latencies, 95) * 1000,
+        max=max(latencies or [0]) * 1000,
+        statuses=status_str,
+    )
+
+
+async def _client(session, url, requests, use_etag, latencies, statuses):
+    etag = None
+    for _ in range(requests):
+        headers = {}
+        if use_etag and etag:
+            headers["If-None-Match"] = etag
+        start = time.perf_counter()
+        async with session.get(url, headers=headers) as response:
+            await response.read()
+            etag = response.headers.get("ETag")
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+        latencies.append(time.perf_counter() - start)
+
+
+async def _probe(session, url, stop_event, latencies, statuses):
+    while not stop_event.is_set():
+        start = time.perf_counter()
+        async with session.get(url) as response:
+            await response.read()
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.05)
+
+
+async def run_load_test(
+    server_url, project, clients, requests, use_etag, probe_path
+):
+    hierarchy_url = "{}/api/hierarchy/{}".format(server_url, project)
+    probe_url = "{}{}".format(server_url, probe_path)
+    latencies, statuses = [], {}
+    probe_latencies, probe_statuses = [], {}
+    stop_event = asyncio.Event()
+
+    connector = aiohttp.TCPConnector(limit=clients + 1)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        probe_task = asyncio.ensure_future(_probe(
+            session, probe_url, stop_event, probe_latencies, probe_statuses
+        ))
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _client(
+                session,
+                hierarchy_url,
+                requests,
+                use_etag,
+                latencies,
+                statuses
+            )
+            for _ in range(clients)
+        ))
+        duration = time.perf_counter() - start
+        stop_event.set()
+        await probe_task
+
+    print(_format_stats("hierarchy", latencies, statuses, duration))
+    print(_format_stats(
+        "probe {}".format(probe_path), probe_latencies, probe_statuses,
+        duration
+    ))
+
+
+@click.command()
+@click.option("--url", default="http://localhost:8079",
+              help="Webpublisher server url.")
+@click.option("--project", required=True, help="Project name.")
+@click.option("--clients", default=20, help="Number of concurrent clients.")
+@click.option("--requests", default=10, help="Requests of each client.")
+@click.option("--etag/--no-etag", default=True,
+              help="Send 'If-None-Match' with ETag of previous response.")
+@click.option("--probe-path", default="/api/projects",
+              help="Endpoint measured during the test.")
+def main(url, project, clients, requests, etag, probe_path):
+    asyncio.run(run_load_test(
+        url.rstrip("/"), project, clients, requests, etag, probe_path
+    ))
+
+
+if __name__ == "__main__":
+    main()
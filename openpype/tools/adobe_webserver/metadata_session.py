@@ -0,0 +1,147 @@
+"""Local mirror of metadata stored in document of Adobe host.
+
+Photoshop and After Effects store metadata of containers and instances as
+single JSON in document. Host stubs implement only reading and writing of
+the metadata and query of existing item ids.
+"""
+
+
+def _get_meta_ids(item_meta):
+    """Ids under which is metadata item stored (item id or instance id)."""
+    ids = []
+    members = item_meta.get("members")
+    if members:
+        ids.append(str(members[0]))
+    instance_id = item_meta.get("instance_id")
+    if instance_id:
+        ids.append(str(instance_id))
+    return ids
+
+
+class AdobeMetadataSession(object):
+    """Local mirror of metadata stored in document.
+
+    Changes made by 'imprint' and 'remove_instance' are applied in memory
+    and metadata are written to document only once on 'flush'. Metadata and
+    items are queried from host only once per session.
+
+    Args:
+        stub (Any): Host stub used for communication.
+        items_meta (Optional[list[dict]]): Already queried metadata.
+        item_ids (Optional[Iterable[int]]): Ids of existing items.
+    """
+
+    def __init__(self, stub, items_meta=None, item_ids=None):
+        self._stub = stub
+        self._items_meta = items_meta
+        self._index = None
+        self._removed = set()
+        self._item_ids = None
+        if item_ids:
+            self._item_ids = set(item_ids)
+        self._changed = False
+
+    @property
+    def changed(self):
+        return self._changed
+
+    def _query_metadata(self):
+        """Query metadata stored in document."""
+        raise NotImplementedError
+
+    def _query_item_ids(self):
+        """Query ids of existing items in document."""
+        raise NotImplementedError
+
+    def _write_metadata(self, items_meta):
+        """Write metadata to document."""
+        raise NotImplementedError
+
+    def _get_items_meta(self):
+        if self._items_meta is None:
+            self._items_meta = self._query_metadata()
+        return self._items_meta
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = {}
+            for item_meta in self._get_items_meta():
+                for item_id in _get_meta_ids(item_meta):
+                    self._index.setdefault(item_id, item_meta)
+        return self._index
+
+    def get_metadata(self):
+        """Current state of metadata including not flushed changes."""
+        return [
+            item_meta
+            for item_meta in self._get_items_meta()
+            if id(item_meta) not in self._removed
+        ]
+
+    def imprint(self, item_id, data):
+        """Update, add or remove (with empty 'data') metadata of item."""
+        # json.dumps writes integer values in a dictionary to string, so
+        # anticipating it here.
+        item_id = str(item_id)
+        index = self._get_index()
+        item_meta = index.get(item_id)
+        if item_meta is None:
+            if not data:
+                return
+            self._get_items_meta().append(data)
+            for _item_id in _get_meta_ids(data) or [item_id]:
+                index.setdefault(_item_id, data)
+
+        elif data:
+            item_meta.update(data)
+
+        else:
+            self._remove_item_meta(item_meta)
+        self._changed = True
+
+    def remove_instance(self, instance_id):
+        for item_meta in self.get_metadata():
+            inst_id = item_meta.get("instance_id") or item_meta.get("uuid")
+            if inst_id == instance_id:
+                self._remove_item_meta(item_meta)
+                self._changed = True
+
+    def _remove_item_meta(self, item_meta):
+        self._removed.add(id(item_meta))
+        index = self._get_index()
+        for item_id in _get_meta_ids(item_meta):
+            if index.get(item_id) is item_meta:
+                index.pop(item_id)
+
+    def flush(self):
+        """Write metadata to document if there are any changes.
+
+        Metadata of items which don't exist anymore are not stored.
+
+        Returns:
+            Any: Result of write or None if there was nothing to write.
+        """
+        if not self._changed:
+            return None
+
+        items_meta = self.get_metadata()
+        # Ensure only valid ids are stored.
+        if self._item_ids is None and any(
+            item_meta.get("members") for item_meta in items_meta
+        ):
+            self._item_ids = set(self._query_item_ids())
+
+        cleaned_data = []
+        for item_meta in items_meta:
+            # do not add metadata with nonexistent item id
+            if item_meta.get("members"):
+                if int(item_meta["members"][0]) not in self._item_ids:
+                    continue
+
+            cleaned_data.append(item_meta)
+
+        result = self._write_metadata(cleaned_data)
+        # Items may change after write
+        self._item_ids = None
+        self._changed = False
+        return result
@@ -4,6 +4,9 @@ from openpype.lib import Logger
 from openpype.client.entities import get_representations
 from openpype.client import get_linked_representation_id
 from openpype.modules import ModulesManager
+from openpype.modules.sync_server.availability import (
+    get_site_availability_cache,
+)
 from openpype.tools.ayon_utils.models import NestedCacheItem
 from openpype.tools.ayon_loader.abstract import ActionItem
 
@@ -45,11 +48,8 @@ class SiteSyncModel:
         self._remote_site_cache = NestedCacheItem(
             levels=1, lifetime=self.lifetime
         )
-        self._version_availability_cache = NestedCacheItem(
-            levels=2,
-            default_factory=_default_version_availability,
-            lifetime=self.status_lifetime
-        )
+        # Shared with other loaders, keyed by project, version and sites
+        self._version_availability_cache = get_site_availability_cache()
         self._repre_status_cache = NestedCacheItem(
             levels=2,
             default_factory=_default_repre_status,
@@ -64,7 +64,7 @@ class SiteSyncModel:
         self._site_sync_enabled_cache.reset()
         self._active_site_cache.reset()
         self._remote_site_cache.reset()
-        self._version_availability_cache.reset()
+        self._version_availability_cache.invalidate()
         self._repre_status_cache.reset()
 
     def is_site_sync_enabled(self, project_name=None):
@@ -185,25 +185,26 @@ class SiteSyncModel:
                 for version_id in version_ids
             }
 
-        output = {}
-        project_cache = self._version_availability_cache[project_name]
-        invalid_ids = set()
-        for version_id in version_ids:
-            repre_cache = project_cache[version_id]
-            if repre_cache.is_valid:
-                output[version_id] = repre_cache.get_data()
-            else:
-                invalid_ids.add(version_id)
-
+        active_site = self.get_active_site(project_name)
+        remote_site = self.get_remote_site(project_name)
+        output, invalid_ids = self._version_availability_cache.get(
+            project_name, active_site, remote_site, version_ids
+        )
         if invalid_ids:
-            self._refresh_version_availability(
+            output.update(self._refresh_version_availability(
                 project_name, invalid_ids
-            )
-            for version_id in invalid_ids:
-                version_cache = project_cache[version_id]
-                output[version_id] = version_cache.get_data()
+            ))
         return output
 
+    def get_version_availability_cache_stats(self):
+        """Hits and misses of version availability cache.
+
+        Returns:
+            dict[str, Any]: Cache statistics.
+        """
+
+        return self._version_availability_cache.get_stats()
+
     def get_representations_sync_status(
         self, project_name, representation_ids
     ):
@@ -393,20 +394,26 @@ class SiteSyncModel:
 
     def _refresh_version_availability(self, project_name, version_ids):
         if not project_name or not version_ids:
-            return
-        project_cache = self._version_availability_cache[project_name]
+            return {}
 
+        active_site = self.get_active_site(project_name)
+        remote_site = self.get_remote_site(project_name)
         avail_by_id = self._site_sync_addon.get_version_availability(
             project_name,
             version_ids,
-            self.get_active_site(project_name),
-            self.get_remote_site(project_name),
+            active_site,
+            remote_site,
         )
+        output = {}
         for version_id in version_ids:
             status = avail_by_id.get(version_id)
             if status is None:
                 status = _default_version_availability()
-            project_cache[version_id].update_data(status)
+            output[version_id] = status
+        self._version_availability_cache.update(
+            project_name, active_site, remote_site, output
+        )
+        return output
 
     def _refresh_representations_sync_status(
         self, project_name, representation_ids
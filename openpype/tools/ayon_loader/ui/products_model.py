@@ -309,7 +309,6 @@ class ProductsModel(QtGui.QStandardItemModel):
         model_item.setData(
             version_item.thumbnail_id, VERSION_THUMBNAIL_ID_ROLE)
 
-        # TODO call site sync methods for all versions at once
         project_name = self._last_project_name
         version_id = version_item.version_id
         repre_count = self._controller.get_versions_representation_count(
@@ -387,6 +386,17 @@ class ProductsModel(QtGui.QStandardItemModel):
             product_item.product_id: product_item
             for product_item in product_items
         }
+        # Query site availability of last versions at once, items then
+        #   receive them from cache
+        last_version_ids = [
+            sorted(product_item.version_items.values())[-1].version_id
+            for product_item in product_items_by_id.values()
+            if product_item.version_items
+        ]
+        if last_version_ids:
+            self._controller.get_version_sync_availability(
+                project_name, last_version_ids
+            )
 
         # Prepare product groups
         product_name_matches_by_group = collections.defaultdict(dict)
@@ -2,6 +2,7 @@ import copy
 import re
 import math
 import time
+import collections
 from uuid import uuid4
 
 from qtpy import QtCore, QtGui
@@ -29,6 +30,7 @@ from openpype.tools.utils import lib
 from openpype.host import ILoadHost
 
 from openpype.modules import ModulesManager
+from openpype.modules.sync_server.availability import AvailabilityPrefetcher
 from openpype.tools.utils.constants import (
     LOCAL_PROVIDER_ROLE,
     REMOTE_PROVIDER_ROLE,
@@ -133,7 +135,20 @@ class BaseRepresentationModel(object):
 
 
 class SubsetsModel(BaseRepresentationModel, TreeModel):
-    doc_fetched = QtCore.Signal()
+    """Model of subsets with their last versions under selected assets.
+
+    Documents are queried in a thread. Each refresh gets new fetch id and
+    results of previous (stale) fetches are ignored. Last versions are
+    queried in pages of subset ids.
+
+    Top level rows are created in pages when view requests them with
+    'fetchMore'. Availability on sites is queried only for rows which are
+    painted. It's queried in background and kept in cache shared with
+    other loaders.
+    """
+
+    doc_fetched = QtCore.Signal(object)
+    repre_info_fetched = QtCore.Signal(object)
     refreshed = QtCore.Signal(bool)
 
     Columns = [
@@ -195,6 +210,14 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         "data.families": 1,
         "data.subsetGroup": 1
     }
+    # Number of subset ids used for one query of versions
+    fetch_page_size = 1000
+    # Number of top level rows created on 'fetchMore'
+    fetch_more_count = 200
+    # Delay of availability query to collect version ids of visible rows
+    repre_info_request_delay = 0.05
+    # Number of version ids used for one availability query
+    repre_info_batch_size = 200
 
     def __init__(
         self,
@@ -240,11 +263,23 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             )
         }
         self._items_by_id = {}
+        self._items_by_version_id = collections.defaultdict(list)
+        self._pending_rows = collections.deque()
+        self._fill_data = {}
 
-        self._doc_fetching_thread = None
-        self._doc_fetching_stop = False
+        self._fetch_id = 0
+        self._fetch_threads = []
         self._doc_payload = {}
 
+        self._repre_info_requested = set()
+        self._repre_info_prefetcher = AvailabilityPrefetcher(
+            self._fetch_repre_info,
+            self._on_repre_info_prefetched,
+            batch_size=self.repre_info_batch_size,
+            delay=self.repre_info_request_delay,
+            default_factory=dict
+        )
+
         self._host = registered_host()
         self._loaded_representation_ids = set()
 
@@ -253,6 +288,7 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         self._host_loaded_refresh_time = 0
 
         self.doc_fetched.connect(self._on_doc_fetched)
+        self.repre_info_fetched.connect(self._on_repre_info_fetched)
         self.refresh()
 
     def get_item_by_id(self, item_id):
@@ -290,21 +326,10 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
                     project_name, value, subset_id
                 )
 
-                # update availability on active site when version changes
-                if self.sync_server_enabled and version_doc:
-                    repres_info = list(
-                        self.sync_server.get_repre_info_for_versions(
-                            project_name,
-                            [version_doc["_id"]],
-                            self.active_site,
-                            self.remote_site
-                        )
-                    )
-                    if repres_info:
-                        version_doc["data"].update(
-                            self._get_repre_dict(repres_info[0]))
-
             self.set_version(index, version_doc)
+            # Availability of new version is queried when row is painted
+            item.pop("repre_info_local", None)
+            item.pop("repre_info_remote", None)
 
         return super(SubsetsModel, self).setData(index, value, role)
 
@@ -350,8 +375,9 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         if not index.isValid():
             return
 
-        item = index.internalPointer()
+        self._set_item_version(index.internalPointer(), version)
 
+    def _set_item_version(self, item, version):
         assert version["parent"] == item["_id"], (
             "Version does not belong to subset"
         )
@@ -421,7 +447,23 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         if repre_info:
             item["repre_info"] = repre_info
 
-    def _fetch(self):
+        self._items_by_version_id[version["_id"]].append(item)
+
+    def _is_fetch_stale(self, fetch_id):
+        return fetch_id != self._fetch_id
+
+    def _start_thread(self, func, *args):
+        # Keep reference to running threads so they're not garbage collected
+        self._fetch_threads = [
+            thread
+            for thread in self._fetch_threads
+            if thread.isRunning()
+        ]
+        thread = lib.create_qthread(func, *args)
+        self._fetch_threads.append(thread)
+        thread.start()
+
+    def _fetch(self, fetch_id):
         project_name = self.dbcon.active_project()
         asset_docs = get_assets(
             project_name,
@@ -443,7 +485,7 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         subset_families = set()
         for subset_doc in subset_docs:
-            if self._doc_fetching_stop:
+            if self._is_fetch_stale(fetch_id):
                 return
 
             families = subset_doc.get("data", {}).get("families")
@@ -453,14 +495,24 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             subset_docs_by_id[subset_doc["_id"]] = subset_doc
 
         subset_ids = list(subset_docs_by_id.keys())
-        last_versions_by_subset_id = get_last_versions(
-            project_name,
-            subset_ids,
-            active=True,
-            fields=["_id", "parent", "name", "type", "data", "schema"]
-        )
+        last_versions_by_subset_id = {}
+        hero_versions = []
+        page_size = self.fetch_page_size
+        for idx in range(0, len(subset_ids), page_size):
+            if self._is_fetch_stale(fetch_id):
+                return
+
+            page_subset_ids = subset_ids[idx:idx + page_size]
+            last_versions_by_subset_id.update(get_last_versions(
+                project_name,
+                page_subset_ids,
+                active=True,
+                fields=["_id", "parent", "name", "type", "data", "schema"]
+            ))
+            hero_versions.extend(
+                get_hero_versions(project_name, subset_ids=page_subset_ids)
+            )
 
-        hero_versions = get_hero_versions(project_name, subset_ids=subset_ids)
         missing_versions = []
         for hero_version in hero_versions:
             version_id = hero_version["version_id"]
@@ -498,7 +550,7 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         loaded_subset_ids = set()
         ids = self._loaded_representation_ids
         if ids:
-            if self._doc_fetching_stop:
+            if self._is_fetch_stale(fetch_id):
                 return
 
             # Get subset ids from loaded representations in workfile
@@ -512,41 +564,19 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
                                     fields=["parent"])
             loaded_subset_ids = set(version["parent"] for version in versions)
 
-        if self._doc_fetching_stop:
+        if self._is_fetch_stale(fetch_id):
             return
 
-        repre_info_by_version_id = {}
-        if self.sync_server_enabled:
-            versions_by_id = {}
-            for _subset_id, doc in last_versions_by_subset_id.items():
-                versions_by_id[doc["_id"]] = doc
-
-            repres_info = self.sync_server.get_repre_info_for_versions(
-                project_name,
-                list(versions_by_id.keys()),
-                self.active_site,
-                self.remote_site
-            )
-            for repre_info in repres_info:
-                if self._doc_fetching_stop:
-                    return
-
-                version_id = repre_info["_id"]
-                doc = versions_by_id[version_id]
-                doc["active_provider"] = self.active_provider
-                doc["remote_provider"] = self.remote_provider
-                repre_info_by_version_id[version_id] = repre_info
-
-        self._doc_payload = {
+        # Payload is passed with signal so results of different fetches
+        #   can't overwrite each other
+        self.doc_fetched.emit({
+            "fetch_id": fetch_id,
             "asset_docs_by_id": asset_docs_by_id,
             "subset_docs_by_id": subset_docs_by_id,
             "subset_families": subset_families,
             "last_versions_by_subset_id": last_versions_by_subset_id,
-            "repre_info_by_version_id": repre_info_by_version_id,
             "subsets_loaded_by_id": loaded_subset_ids
-        }
-
-        self.doc_fetched.emit()
+        })
 
     def fetch_subset_and_version(self):
         """Query all subsets and latest versions from aggregation
@@ -555,24 +585,28 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             some of the first level field may not be presented.
         """
         self._doc_payload = {}
-        self._doc_fetching_stop = False
-        self._doc_fetching_thread = lib.create_qthread(self._fetch)
-        self._doc_fetching_thread.start()
+        self._start_thread(self._fetch, self._fetch_id)
 
     def stop_fetch_thread(self):
-        if self._doc_fetching_thread is not None:
-            self._doc_fetching_stop = True
-            while self._doc_fetching_thread.isRunning():
-                pass
+        """Mark currently running fetch as stale.
+
+        Thread is not waited for, its results are ignored.
+        """
+        self._fetch_id += 1
 
     def refresh(self):
         self.stop_fetch_thread()
         self.clear()
         self._items_by_id = {}
+        self._items_by_version_id = collections.defaultdict(list)
+        self._pending_rows = collections.deque()
+        self._repre_info_requested = set()
+        self._repre_info_prefetcher.clear()
         self.reset_sync_server()
 
         if not self._asset_ids:
-            self.doc_fetched.emit()
+            self._doc_payload = {}
+            self.doc_fetched.emit({"fetch_id": self._fetch_id})
             return
 
         # Collect scene container representations to compare loaded state
@@ -591,11 +625,27 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         self.fetch_subset_and_version()
 
-    def _on_doc_fetched(self):
+    def _on_doc_fetched(self, payload=None):
+        """Fill items from fetched documents.
+
+        Args:
+            payload (Optional[dict[str, Any]]): Result of fetch. Last
+                accepted payload is used if not passed.
+        """
+        if payload is not None:
+            # Results of stale fetch are ignored and don't change items
+            #   filled by newer fetch
+            if self._is_fetch_stale(payload.get("fetch_id")):
+                return
+            self._doc_payload = payload
+
         self.clear()
         self._items_by_id = {}
+        self._items_by_version_id = collections.defaultdict(list)
+        self._pending_rows = collections.deque()
         self.beginResetModel()
 
+        fetch_id = self._doc_payload.get("fetch_id")
         asset_docs_by_id = self._doc_payload.get(
             "asset_docs_by_id"
         )
@@ -606,16 +656,13 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             "last_versions_by_subset_id"
         )
 
-        repre_info_by_version_id = self._doc_payload.get(
-            "repre_info_by_version_id"
-        )
-
         subsets_loaded_by_id = self._doc_payload.get(
             "subsets_loaded_by_id"
         )
 
         if (
-            asset_docs_by_id is None
+            self._is_fetch_stale(fetch_id)
+            or asset_docs_by_id is None
             or subset_docs_by_id is None
             or last_versions_by_subset_id is None
             or len(self._asset_ids) == 0
@@ -628,12 +675,28 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
             asset_docs_by_id,
             subset_docs_by_id,
             last_versions_by_subset_id,
-            repre_info_by_version_id,
             subsets_loaded_by_id
         )
         self.endResetModel()
         self.refreshed.emit(True)
 
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        return bool(self._pending_rows)
+
+    def fetchMore(self, parent):
+        if parent.isValid() or not self._pending_rows:
+            return
+
+        count = min(self.fetch_more_count, len(self._pending_rows))
+        start_row = self._root_item.childCount()
+        self.beginInsertRows(
+            QtCore.QModelIndex(), start_row, start_row + count - 1
+        )
+        self._create_pending_rows(count)
+        self.endInsertRows()
+
     def create_multiasset_group(
         self, subset_name, asset_ids, subset_counter, parent_item=None
     ):
@@ -661,102 +724,194 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
         asset_docs_by_id,
         subset_docs_by_id,
         last_versions_by_subset_id,
-        repre_info_by_version_id,
         subsets_loaded_by_id
     ):
+        """Prepare top level rows and create first page of them.
+
+        Rows are stored as pending and created in pages by 'fetchMore'.
+        Subsets without version are skipped.
+        """
+        subset_docs = [
+            subset_doc
+            for subset_doc in subset_docs_by_id.values()
+            if subset_doc["_id"] in last_versions_by_subset_id
+        ]
         _groups_tuple = self.groups_config.split_subsets_for_groups(
-            subset_docs_by_id.values(), self._grouping
+            subset_docs, self._grouping
         )
         groups, subset_docs_without_group, subset_docs_by_group = _groups_tuple
 
-        group_item_by_name = {}
+        fill_data = {
+            "asset_docs_by_id": asset_docs_by_id,
+            "last_versions_by_subset_id": last_versions_by_subset_id,
+            "subsets_loaded_by_id": subsets_loaded_by_id
+        }
+
+        subset_counter = 0
+        pending_rows = collections.deque()
         for group_data in groups:
             group_name = group_data["name"]
-            group_item = Item()
-            group_item.update({
-                "subset": group_name,
-                "isGroup": True
-            })
-            group_item.update(group_data)
-
-            self.add_child(group_item)
-
-            group_item_by_name[group_name] = {
-                "item": group_item,
-                "index": self.index(group_item.row(), 0)
-            }
+            subset_docs_by_name = subset_docs_by_group.get(group_name) or {}
+            subset_entries = []
+            for subset_name in sorted(subset_docs_by_name.keys()):
+                subset_docs = subset_docs_by_name[subset_name]
+                subset_entries.append(
+                    (subset_name, subset_docs, subset_counter)
+                )
+                if len(subset_docs) > 1:
+                    subset_counter += 1
+            pending_rows.append((group_data, subset_entries))
 
-        def _add_subset_item(subset_doc, parent_item, parent_index):
-            last_version = last_versions_by_subset_id.get(
-                subset_doc["_id"]
+        for subset_name in sorted(subset_docs_without_group.keys()):
+            subset_docs = subset_docs_without_group[subset_name]
+            pending_rows.append(
+                (None, [(subset_name, subset_docs, subset_counter)])
             )
-            # do not show subset without version
-            if not last_version:
-                return
-
-            data = copy.deepcopy(subset_doc)
-            data["subset"] = subset_doc["name"]
-
-            asset_id = subset_doc["parent"]
-            data["asset"] = asset_docs_by_id[asset_id]["name"]
-
-            data["last_version"] = last_version
-            data["loaded_in_scene"] = subset_doc["_id"] in subsets_loaded_by_id
+            if len(subset_docs) > 1:
+                subset_counter += 1
 
-            # Sync server data
-            data.update(
-                self._get_last_repre_info(repre_info_by_version_id,
-                                          last_version["_id"]))
+        self._fill_data = fill_data
+        self._pending_rows = pending_rows
+        self._create_pending_rows(self.fetch_more_count)
 
-            item = Item()
-            item.update(data)
-            self.add_child(item, parent_item)
+    def _create_pending_rows(self, count):
+        """Create top level rows from pending rows.
 
-            index = self.index(item.row(), 0, parent_index)
-            self.set_version(index, last_version)
+        Each pending row is one group, merged subsets item or single subset.
 
-        subset_counter = 0
-        for group_name, subset_docs_by_name in subset_docs_by_group.items():
-            parent_item = group_item_by_name[group_name]["item"]
-            parent_index = group_item_by_name[group_name]["index"]
-            for subset_name in sorted(subset_docs_by_name.keys()):
-                subset_docs = subset_docs_by_name[subset_name]
-                asset_ids = [
-                    subset_doc["parent"] for subset_doc in subset_docs
-                ]
+        Args:
+            count (int): Max number of top level rows to create.
+        """
+        while count > 0 and self._pending_rows:
+            count -= 1
+            group_data, subset_entries = self._pending_rows.popleft()
+            parent_item = None
+            if group_data is not None:
+                parent_item = Item()
+                parent_item.update({
+                    "subset": group_data["name"],
+                    "isGroup": True
+                })
+                parent_item.update(group_data)
+                self.add_child(parent_item)
+
+            for subset_name, subset_docs, subset_counter in subset_entries:
+                _parent_item = parent_item
                 if len(subset_docs) > 1:
+                    asset_ids = [
+                        subset_doc["parent"] for subset_doc in subset_docs
+                    ]
                     _parent_item = self.create_multiasset_group(
                         subset_name, asset_ids, subset_counter, parent_item
                     )
-                    _parent_index = self.index(
-                        _parent_item.row(), 0, parent_index
-                    )
-                    subset_counter += 1
-                else:
-                    _parent_item = parent_item
-                    _parent_index = parent_index
 
                 for subset_doc in subset_docs:
-                    _add_subset_item(subset_doc,
-                                     parent_item=_parent_item,
-                                     parent_index=_parent_index)
+                    self._add_subset_item(subset_doc, _parent_item)
 
-        for subset_name in sorted(subset_docs_without_group.keys()):
-            subset_docs = subset_docs_without_group[subset_name]
-            asset_ids = [subset_doc["parent"] for subset_doc in subset_docs]
-            parent_item = None
-            parent_index = None
-            if len(subset_docs) > 1:
-                parent_item = self.create_multiasset_group(
-                    subset_name, asset_ids, subset_counter
-                )
-                parent_index = self.index(parent_item.row(), 0)
-                subset_counter += 1
+    def _add_subset_item(self, subset_doc, parent_item):
+        fill_data = self._fill_data
+        last_version = fill_data["last_versions_by_subset_id"].get(
+            subset_doc["_id"]
+        )
+        # do not show subset without version
+        if not last_version:
+            return
+
+        data = copy.deepcopy(subset_doc)
+        data["subset"] = subset_doc["name"]
+
+        asset_id = subset_doc["parent"]
+        data["asset"] = fill_data["asset_docs_by_id"][asset_id]["name"]
+
+        data["last_version"] = last_version
+        data["loaded_in_scene"] = (
+            subset_doc["_id"] in fill_data["subsets_loaded_by_id"]
+        )
+
+        item = Item()
+        item.update(data)
+        self.add_child(item, parent_item)
+        self._set_item_version(item, last_version)
 
-            for subset_doc in subset_docs:
-                _add_subset_item(subset_doc,
-                                 parent_item=parent_item,
-                                 parent_index=parent_index)
+    def _request_repre_info(self, item):
+        """Fill availability of item's version on sites.
+
+        Called for rows which are painted so only availability of visible
+        versions is queried. Values which are not cached are queried in
+        background and filled to items when they're received.
+        """
+        if not self.sync_server_enabled:
+            return
+
+        version_doc = item.get("version_document")
+        if not version_doc:
+            return
+
+        version_id = version_doc["_id"]
+        if version_id in self._repre_info_requested:
+            return
+
+        self._repre_info_requested.add(version_id)
+        cached = self._repre_info_prefetcher.request(
+            self.dbcon.active_project(),
+            self.active_site,
+            self.remote_site,
+            [version_id]
+        )
+        if version_id in cached:
+            item.update(self._get_repre_dict(cached[version_id]))
+
+    def get_repre_info_cache_stats(self):
+        """Hits and misses of availability cache."""
+        return self._repre_info_prefetcher.cache.get_stats()
+
+    def _fetch_repre_info(
+        self, project_name, version_ids, active_site, remote_site
+    ):
+        repres_info = self.sync_server.get_repre_info_for_versions(
+            project_name,
+            version_ids,
+            active_site,
+            remote_site
+        )
+        return {
+            repre_info["_id"]: repre_info
+            for repre_info in repres_info
+        }
+
+    def _on_repre_info_prefetched(
+        self, project_name, active_site, remote_site, repre_info_by_version_id
+    ):
+        # Called from prefetcher thread
+        self.repre_info_fetched.emit({
+            "project_name": project_name,
+            "active_site": active_site,
+            "remote_site": remote_site,
+            "repre_info_by_version_id": repre_info_by_version_id
+        })
+
+    def _on_repre_info_fetched(self, payload):
+        if (
+            payload["project_name"] != self.dbcon.active_project()
+            or payload["active_site"] != self.active_site
+            or payload["remote_site"] != self.remote_site
+        ):
+            return
+
+        column = self.columns_index["repre_info"]
+        repre_info_by_version_id = payload["repre_info_by_version_id"]
+        for version_id, repre_info in repre_info_by_version_id.items():
+            repre_data = self._get_repre_dict(repre_info)
+            if not repre_data:
+                continue
+
+            for item in self._items_by_version_id.get(version_id, []):
+                version_doc = item.get("version_document")
+                if not version_doc or version_doc["_id"] != version_id:
+                    continue
+                item.update(repre_data)
+                index = self.createIndex(item.row(), column, item)
+                self.dataChanged.emit(index, index)
 
     def data(self, index, role):
         if not index.isValid():
@@ -822,12 +977,14 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         elif role == LOCAL_AVAILABILITY_ROLE:
             if not item.get("isGroup"):
+                self._request_repre_info(item)
                 return item.get("repre_info_local")
             else:
                 return None
 
         elif role == REMOTE_AVAILABILITY_ROLE:
             if not item.get("isGroup"):
+                self._request_repre_info(item)
                 return item.get("repre_info_remote")
             else:
                 return None
@@ -858,14 +1015,6 @@ class SubsetsModel(BaseRepresentationModel, TreeModel):
 
         super(TreeModel, self).headerData(section, orientation, role)
 
-    def _get_last_repre_info(self, repre_info_by_version_id, last_version_id):
-        data = {}
-        if repre_info_by_version_id:
-            repre_info = repre_info_by_version_id.get(last_version_id)
-            return self._get_repre_dict(repre_info)
-
-        return data
-
     def _get_repre_dict(self, repre_info):
         """Returns str representation of availability"""
         data = {}
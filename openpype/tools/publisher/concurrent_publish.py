@@ -0,0 +1,267 @@
+"""Concurrent processing of parallel safe publish plugins.
+
+Instance plugins with class attribute 'parallel_safe' set to 'True' promise
+they don't communicate with host and don't change data of other instances.
+Consecutive parallel safe plugins in the same order band (e.g. extractors)
+can be processed for multiple instances at once. Plugins of one instance are
+still processed in order one by one.
+
+Concurrent processing is disabled by default and is enabled by setting
+number of worker threads to 'OPENPYPE_PUBLISH_CONCURRENCY' environment
+variable.
+"""
+import os
+import math
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
+
+import pyblish.api
+import pyblish.lib
+
+from openpype.lib.profiling import measure_process_metrics
+
+CONCURRENCY_ENV_KEY = "OPENPYPE_PUBLISH_CONCURRENCY"
+
+log = logging.getLogger(__name__)
+_results_lock = threading.Lock()
+
+
+def get_publish_concurrency():
+    """Number of worker threads used for parallel safe plugins.
+
+    Returns:
+        int: Number of threads. Value '1' means concurrent processing
+            is disabled.
+    """
+    value = os.environ.get(CONCURRENCY_ENV_KEY)
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def is_plugin_parallel_safe(plugin):
+    """Instance plugin can be processed concurrently for instances.
+
+    Only explicit instance plugins are allowed. Pyblish calls them with
+    instance as the only argument. Implicit plugins get arguments injected
+    by names in their signature which is done only by pyblish.
+
+    Args:
+        plugin (pyblish.api.Plugin): Publish plugin.
+
+    Returns:
+        bool: Plugin is explicit instance plugin marked as parallel safe.
+    """
+    return (
+        issubclass(plugin, pyblish.api.InstancePlugin)
+        and bool(getattr(plugin, "parallel_safe", False))
+    )
+
+
+def get_order_band(order):
+    """Band of plugin order, e.g. 'ExtractorOrder' for 'ExtractorOrder + 0.2'.
+
+    Uses the same +-0.5 range around base orders as pyblish.
+
+    Args:
+        order (float): Order of plugin.
+
+    Returns:
+        int: Base order of band.
+    """
+    return int(math.floor(order + 0.5))
+
+
+def get_parallel_plugins_group(plugins, idx):
+    """Parallel safe plugins which can be processed at once.
+
+    Following parallel safe plugins in the same order band as plugin on
+    passed index are in the group. Group ends with first plugin which is
+    not parallel safe so plugins are never processed out of order.
+
+    Args:
+        plugins (list[pyblish.api.Plugin]): Sorted publish plugins.
+        idx (int): Index of first parallel safe plugin.
+
+    Returns:
+        list[pyblish.api.Plugin]: Plugins of group starting with plugin on
+            passed index.
+    """
+    plugin = plugins[idx]
+    order_band = get_order_band(plugin.order)
+    output = [plugin]
+    for next_plugin in plugins[idx + 1:]:
+        if (
+            get_order_band(next_plugin.order) != order_band
+            or not is_plugin_parallel_safe(next_plugin)
+        ):
+            break
+        output.append(next_plugin)
+    return output
+
+
+class _ThreadRecordsHandler(logging.Handler):
+    """Collect pyblish log records emitted from one thread.
+
+    Same as 'pyblish.lib.MessageHandler' but ignores records from other
+    threads, so records of plugins processed at the same time don't mix.
+    """
+
+    def __init__(self, records, thread_id):
+        super(_ThreadRecordsHandler, self).__init__()
+        self.records = records
+        self.thread_id = thread_id
+
+    def emit(self, record):
+        if (
+            record.thread == self.thread_id
+            and record.name.startswith("pyblish")
+        ):
+            self.records.append(record)
+
+
+def process_plugin(plugin, context, instance):
+    """Process instance plugin in current thread.
+
+    Replacement of 'pyblish.plugin.process' for explicit instance plugins
+    which is safe to be called from multiple threads at once. Root logger
+    level is not changed, it is expected to be set by caller. Same as
+    pyblish, "pluginFailed" and "pluginProcessed" callbacks are emitted
+    (from current thread).
+
+    Args:
+        plugin (pyblish.api.InstancePlugin): Plugin to process.
+        context (pyblish.api.Context): Publish context.
+        instance (pyblish.api.Instance): Instance to process.
+
+    Returns:
+        dict[str, Any]: Result with the same structure as pyblish result
+            with "metrics" of processing.
+    """
+    result = {
+        "success": False,
+        "plugin": plugin,
+        "instance": instance,
+        "action": None,
+        "error": None,
+        "records": [],
+        "duration": None,
+        "progress": 0,
+        "context": context,
+    }
+
+    root_logger = logging.getLogger()
+    handler = _ThreadRecordsHandler(result["records"], threading.get_ident())
+    root_logger.addHandler(handler)
+    start = time.time()
+    try:
+        with measure_process_metrics(thread_cpu_time=True) as metrics:
+            plugin().process(instance)
+        result["success"] = True
+
+    except Exception as error:
+        pyblish.lib.emit("pluginFailed", plugin=plugin, context=context,
+                         instance=instance, error=error)
+        pyblish.lib.extract_traceback(error, plugin.__module__)
+        result["error"] = error
+        log.exception(error.formatted_traceback)
+
+    finally:
+        root_logger.removeHandler(handler)
+
+    result["duration"] = (time.time() - start) * 1000  # ms
+    result["metrics"] = metrics
+
+    with _results_lock:
+        context.data.setdefault("results", []).append(result)
+
+    pyblish.lib.emit("pluginProcessed", result=result)
+    return result
+
+
+class ConcurrentPublishGroup:
+    """Parallel safe plugins processed for multiple instances at once.
+
+    Each instance has own chain of plugins which is processed in a worker
+    thread. Same as in serial processing, error of a plugin does not stop
+    processing of following plugins.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        plugins_with_instances (list[tuple[type, list]]): Plugins in order
+            with instances they should process.
+        workers (int): Maximum number of worker threads.
+    """
+
+    def __init__(self, context, plugins_with_instances, workers):
+        plugins_by_instance_id = {}
+        instances = []
+        for plugin, plugin_instances in plugins_with_instances:
+            for instance in plugin_instances:
+                if instance.id not in plugins_by_instance_id:
+                    plugins_by_instance_id[instance.id] = []
+                    instances.append(instance)
+                plugins_by_instance_id[instance.id].append(plugin)
+
+        self._context = context
+        self._instances = instances
+        self._plugins_by_instance_id = plugins_by_instance_id
+        self._workers = max(min(workers, len(instances)), 1)
+        self._executor = None
+        self._futures = []
+        self._root_level = None
+
+    @property
+    def instances(self):
+        return list(self._instances)
+
+    def start(self):
+        """Start processing of instances in worker threads."""
+        # Same as 'pyblish.plugin.logger' but only once for all threads
+        root_logger = logging.getLogger()
+        self._root_level = root_logger.level
+        root_logger.setLevel(logging.DEBUG)
+
+        self._executor = ThreadPoolExecutor(max_workers=self._workers)
+        self._futures = [
+            self._executor.submit(
+                self._process_instance,
+                instance,
+                self._plugins_by_instance_id[instance.id]
+            )
+            for instance in self._instances
+        ]
+
+    def wait(self, timeout=None):
+        """Wait for processing to finish.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds.
+                Waits until all instances are processed if not passed.
+
+        Returns:
+            bool: All instances were processed.
+        """
+        _, not_done = futures_wait(self._futures, timeout)
+        return not not_done
+
+    def finish(self):
+        """Cleanup after processing and return results.
+
+        Returns:
+            list[list[dict[str, Any]]]: Results of each instance in order
+                of processing.
+        """
+        results = [future.result() for future in self._futures]
+        self._executor.shutdown()
+        logging.getLogger().setLevel(self._root_level)
+        return results
+
+    def _process_instance(self, instance, plugins):
+        results = []
+        for plugin in plugins:
+            results.append(process_plugin(plugin, self._context, instance))
+        return results
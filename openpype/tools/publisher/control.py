@@ -42,7 +42,17 @@ from openpype.pipeline.create.context import (
     CreatorsOperationFailed,
     ConvertorsOperationFailed,
 )
-from openpype.pipeline.publish import get_publish_instance_label
+from openpype.pipeline.publish import (
+    get_publish_instance_label,
+    process_with_metrics,
+)
+
+from .concurrent_publish import (
+    ConcurrentPublishGroup,
+    get_publish_concurrency,
+    get_parallel_plugins_group,
+    is_plugin_parallel_safe,
+)
 
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
@@ -186,6 +196,7 @@ class PublishReportMaker:
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = None
+        self._timing_stages = []
 
     def reset(self, context, create_context):
         """Reset report and clear all data."""
@@ -201,6 +212,7 @@ class PublishReportMaker:
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = context
+        self._timing_stages = []
 
         for plugin in create_context.publish_plugins_mismatch_targets:
             plugin_data = self._add_plugin_data_item(plugin)
@@ -255,15 +267,44 @@ class PublishReportMaker:
     def add_result(self, result):
         """Handle result of one plugin and it's instance."""
 
+        timing_item = self._add_result_data(result)
+        self._timing_stages.append([[timing_item]])
+
+    def add_concurrent_results(self, results_by_instance):
+        """Handle results of plugins processed concurrently for instances.
+
+        Args:
+            results_by_instance (list[list[dict[str, Any]]]): Results of
+                each instance in order of processing.
+        """
+        stage = []
+        for results in results_by_instance:
+            stage.append([
+                self._add_result_data(result)
+                for result in results
+            ])
+        self._timing_stages.append(stage)
+
+    def _add_result_data(self, result):
         instance = result["instance"]
         instance_id = None
         if instance is not None:
             instance_id = instance.id
-        self._current_plugin_data["instances_data"].append({
+
+        plugin_data = self._plugin_data_by_id.get(result["plugin"].id)
+        if plugin_data is None:
+            plugin_data = self._current_plugin_data
+        plugin_data["instances_data"].append({
             "id": instance_id,
             "logs": self._extract_instance_log_items(result),
-            "process_time": result["duration"]
+            "process_time": result["duration"],
+            "metrics": result.get("metrics")
         })
+        return {
+            "plugin_id": result["plugin"].id,
+            "instance_id": instance_id,
+            "process_time": result["duration"]
+        }
 
     def add_action_result(self, action, result):
         """Add result of single action."""
@@ -333,10 +374,54 @@ class PublishReportMaker:
             "instances": instances_details,
             "context": self._extract_context_data(self._current_context),
             "crashed_file_paths": crashed_file_paths,
+            "timings": self._get_timings_data(),
             "id": uuid.uuid4().hex,
             "report_version": "1.0.0"
         }
 
+    def _get_timings_data(self):
+        """Process times of plugins and instances with critical path.
+
+        Critical path is the sequence of processed plugins which defined
+        duration of publishing. Of plugins processed concurrently only the
+        longest chain of one instance is part of it.
+
+        Returns:
+            dict[str, Any]: Timings in milliseconds.
+        """
+        plugins_time = collections.defaultdict(float)
+        instances_time = collections.defaultdict(float)
+        total_time = 0.0
+        critical_path = []
+        critical_path_time = 0.0
+        for stage in self._timing_stages:
+            longest_chain = []
+            longest_chain_time = -1.0
+            for chain in stage:
+                chain_time = 0.0
+                for item in chain:
+                    process_time = item["process_time"]
+                    chain_time += process_time
+                    plugins_time[item["plugin_id"]] += process_time
+                    if item["instance_id"] is not None:
+                        instances_time[item["instance_id"]] += process_time
+
+                if chain_time > longest_chain_time:
+                    longest_chain = chain
+                    longest_chain_time = chain_time
+                total_time += chain_time
+
+            critical_path.extend(copy.deepcopy(longest_chain))
+            critical_path_time += max(longest_chain_time, 0.0)
+
+        return {
+            "total_process_time": total_time,
+            "critical_path_time": critical_path_time,
+            "critical_path": critical_path,
+            "plugins": dict(plugins_time),
+            "instances": dict(instances_time),
+        }
+
     def _extract_context_data(self, context):
         context_label = "Context"
         if context is not None:
@@ -1695,6 +1780,9 @@ class PublisherController(BasePublisherController):
     """
 
     _log = None
+    # Seconds to wait for concurrent publish group in one main thread item,
+    #   'None' blocks until whole group is processed
+    _concurrent_wait_timeout = None
 
     def __init__(self, headless=False):
         super(PublisherController, self).__init__()
@@ -1720,6 +1808,8 @@ class PublisherController(BasePublisherController):
         # This information is not much important for controller but for widget
         #   which can change (and set) the comment.
         self._publish_comment_is_set = False
+        # Number of threads used for parallel safe plugins
+        self._publish_concurrency = 1
 
         # Validation order
         # - plugin with order same or higher than this value is extractor or
@@ -2237,6 +2327,7 @@ class PublisherController(BasePublisherController):
 
         self._publish_up_validation = False
         self._publish_comment_is_set = False
+        self._publish_concurrency = get_publish_concurrency()
 
         self._main_thread_iter = self._publish_iterator()
         self._publish_context = pyblish.api.Context()
@@ -2394,9 +2485,17 @@ class PublisherController(BasePublisherController):
         change state of processed orders like validation order has passed etc.
 
         Also stops publishing, if should stop on validation.
+
+        Parallel safe instance plugins are processed concurrently for
+        instances when concurrent publishing is enabled.
         """
 
+        grouped_plugin_ids = set()
         for idx, plugin in enumerate(self._publish_plugins):
+            # Plugin was already processed in concurrent group
+            if plugin.id in grouped_plugin_ids:
+                continue
+
             self._publish_progress = idx
 
             # Check if plugin is over validation order
@@ -2444,6 +2543,37 @@ class PublisherController(BasePublisherController):
                     self._publish_report.set_plugin_skipped()
                     continue
 
+                if (
+                    self._publish_concurrency > 1
+                    and is_plugin_parallel_safe(plugin)
+                ):
+                    plugins_with_instances = self._collect_concurrent_plugins(
+                        idx, instances
+                    )
+                    for _plugin, _ in plugins_with_instances:
+                        grouped_plugin_ids.add(_plugin.id)
+
+                    group = ConcurrentPublishGroup(
+                        self._publish_context,
+                        plugins_with_instances,
+                        self._publish_concurrency
+                    )
+                    if not group.instances:
+                        continue
+
+                    self._emit_event(
+                        "publish.process.instance.changed",
+                        {"instance_label": ", ".join(
+                            instance.data.get("label")
+                            or instance.data["name"]
+                            for instance in group.instances
+                        )}
+                    )
+                    yield MainThreadItem(
+                        self._process_concurrent_group, group
+                    )
+                    continue
+
                 for instance in instances:
                     if instance.data.get("publish") is False:
                         continue
@@ -2496,11 +2626,81 @@ class PublisherController(BasePublisherController):
             result["instance"]
         )
 
+    def _collect_concurrent_plugins(self, idx, instances):
+        """Collect parallel safe plugins which can be processed at once.
+
+        Following parallel safe instance plugins in the same order band as
+        plugin on passed index are added to publish report same way as
+        plugins in '_publish_iterator'.
+
+        Args:
+            idx (int): Index of first parallel safe plugin.
+            instances (list[pyblish.api.Instance]): Instances of the plugin.
+
+        Returns:
+            list[tuple[type, list]]: Plugins with instances to process.
+        """
+        plugin = self._publish_plugins[idx]
+        output = [(plugin, [
+            instance
+            for instance in instances
+            if instance.data.get("publish") is not False
+        ])]
+        group_plugins = get_parallel_plugins_group(self._publish_plugins, idx)
+        for next_plugin in group_plugins[1:]:
+            self._publish_report.add_plugin_iter(
+                next_plugin, self._publish_context)
+            plugin_instances = []
+            if self._is_publish_plugin_active(next_plugin):
+                plugin_instances = [
+                    instance
+                    for instance in pyblish.logic.instances_by_plugin(
+                        self._publish_context, next_plugin
+                    )
+                    if instance.data.get("publish") is not False
+                ]
+
+            if not plugin_instances:
+                self._publish_report.set_plugin_skipped()
+            output.append((next_plugin, plugin_instances))
+        return output
+
+    def _process_concurrent_group(self, group):
+        group.start()
+        self._wait_for_concurrent_group(group)
+
+    def _wait_for_concurrent_group(self, group):
+        """Wait until all instances of concurrent group are processed.
+
+        Controller blocks until group is finished. Controllers with
+        asynchronous main thread processing may set
+        '_concurrent_wait_timeout' to check the group again later.
+        """
+        if not group.wait(self._concurrent_wait_timeout):
+            self._process_main_thread_item(
+                MainThreadItem(self._wait_for_concurrent_group, group)
+            )
+            return
+
+        results_by_instance = group.finish()
+        for results in results_by_instance:
+            for result in results:
+                self._handle_publish_result(result)
+        self._publish_report.add_concurrent_results(results_by_instance)
+
+        self._publish_next_process()
+
     def _process_and_continue(self, plugin, instance):
-        result = pyblish.plugin.process(
+        result = process_with_metrics(
             plugin, self._publish_context, instance
         )
 
+        self._handle_publish_result(result)
+        self._publish_report.add_result(result)
+
+        self._publish_next_process()
+
+    def _handle_publish_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2524,10 +2724,6 @@ class PublisherController(BasePublisherController):
 
             result["is_validation_error"] = has_validation_error
 
-        self._publish_report.add_result(result)
-
-        self._publish_next_process()
-
 
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
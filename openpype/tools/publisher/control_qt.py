@@ -70,6 +70,9 @@ class MainThreadProcess(QtCore.QObject):
 
 
 class QtPublisherController(PublisherController):
+    # Check concurrent publish group repeatedly to keep UI responsive
+    _concurrent_wait_timeout = 0.01
+
     def __init__(self, *args, **kwargs):
         self._main_thread_processor = MainThreadProcess()
 
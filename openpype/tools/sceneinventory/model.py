@@ -8,11 +8,10 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_representation_by_id,
+    get_assets,
+    get_subsets,
+    get_versions,
+    get_representations,
 )
 from openpype.pipeline import (
     get_current_project_name,
@@ -20,6 +19,7 @@ from openpype.pipeline import (
     HeroVersionType,
     registered_host,
 )
+from openpype.pipeline.load import get_cached_versions_latest_state
 from openpype.style import get_default_entity_icon_color
 from openpype.tools.utils.models import TreeModel, Item
 from openpype.modules import ModulesManager
@@ -331,50 +331,103 @@ class InventoryModel(TreeModel):
         for item in items:
             grouped[item["representation"]]["items"].append(item)
 
+        # Query parenthood of all groups at once
+        repre_docs_by_id = {
+            str(repre_doc["_id"]): repre_doc
+            for repre_doc in get_representations(
+                project_name, representation_ids=grouped.keys()
+            )
+        }
+        version_docs_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in get_versions(
+                project_name,
+                version_ids={
+                    repre_doc["parent"]
+                    for repre_doc in repre_docs_by_id.values()
+                },
+                hero=True
+            )
+        }
+        hero_source_ids = {
+            version_doc["version_id"]
+            for version_doc in version_docs_by_id.values()
+            if version_doc["type"] == "hero_version"
+        }
+        hero_source_docs_by_id = {}
+        if hero_source_ids:
+            hero_source_docs_by_id = {
+                version_doc["_id"]: version_doc
+                for version_doc in get_versions(
+                    project_name, version_ids=hero_source_ids
+                )
+            }
+        subset_docs_by_id = {
+            subset_doc["_id"]: subset_doc
+            for subset_doc in get_subsets(
+                project_name,
+                subset_ids={
+                    version_doc["parent"]
+                    for version_doc in version_docs_by_id.values()
+                }
+            )
+        }
+        asset_docs_by_id = {
+            asset_doc["_id"]: asset_doc
+            for asset_doc in get_assets(
+                project_name,
+                asset_ids={
+                    subset_doc["parent"]
+                    for subset_doc in subset_docs_by_id.values()
+                }
+            )
+        }
+        # Store the highest available version so the model can know
+        #   whether current version is currently up-to-date.
+        version_states_by_id = get_cached_versions_latest_state(
+            project_name, version_docs_by_id.keys()
+        )
+
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
-            # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
-            )
+            representation = repre_docs_by_id.get(repre_id)
             if not representation:
                 not_found["representation"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            version = get_version_by_id(
-                project_name, representation["parent"]
-            )
+            version = version_docs_by_id.get(representation["parent"])
             if not version:
                 not_found["version"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
             elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
-                )
+                _version = hero_source_docs_by_id[version["version_id"]]
+                version = dict(version)
                 version["name"] = HeroVersionType(_version["name"])
                 version["data"] = _version["data"]
 
-            subset = get_subset_by_id(project_name, version["parent"])
+            subset = subset_docs_by_id.get(version["parent"])
             if not subset:
                 not_found["subset"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            asset = get_asset_by_id(project_name, subset["parent"])
+            asset = asset_docs_by_id.get(subset["parent"])
             if not asset:
                 not_found["asset"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
+            version_state = version_states_by_id.get(version["_id"]) or {}
             grouped[repre_id].update({
                 "representation": representation,
                 "version": version,
+                "highest_version": version_state.get("last_version_name"),
                 "subset": subset,
                 "asset": asset
             })
@@ -407,6 +460,7 @@ class InventoryModel(TreeModel):
             version = grouped[repre_id]["version"]
             subset = grouped[repre_id]["subset"]
             asset = grouped[repre_id]["asset"]
+            highest_version = grouped[repre_id]["highest_version"]
 
             # Get the primary family
             no_family = ""
@@ -425,12 +479,6 @@ class InventoryModel(TreeModel):
             family = family_config.get("label", prim_family)
             family_icon = family_config.get("icon", None)
 
-            # Store the highest available version so the model can know
-            # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
-            )
-
             # create the group header
             group_node = Item()
             group_node["Name"] = "%s_%s: (%s)" % (asset["name"],
@@ -438,7 +486,7 @@ class InventoryModel(TreeModel):
                                                   representation["name"])
             group_node["representation"] = repre_id
             group_node["version"] = version["name"]
-            group_node["highest_version"] = highest_version["name"]
+            group_node["highest_version"] = highest_version
             group_node["family"] = family
             group_node["familyIcon"] = family_icon
             group_node["count"] = len(group_items)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Test building and validation of OpenPype zip files."""
+import os
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from igniter import bootstrap_repos
+from igniter.bootstrap_repos import BootstrapRepos, zip_validation_cache
+
+
+def _write(path: Path, content: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def openpype_sources(tmp_path):
+    root = tmp_path / "sources"
+    for idx in range(20):
+        _write(root / "openpype" / f"module_{idx}.py", f"value = {idx}\n")
+    _write(root / "LICENSE", "license")
+    return root
+
+
+@pytest.fixture
+def bootstrap(tmp_path):
+    bs = BootstrapRepos()
+    bs.set_data_dir(tmp_path / "data")
+    yield bs
+    zip_validation_cache.set_filepath(None)
+    zip_validation_cache.clear()
+
+
+def test_incremental_zip(bootstrap, openpype_sources, tmp_path, monkeypatch):
+    previous_zip = tmp_path / "previous.zip"
+    bootstrap._create_openpype_zip(previous_zip, openpype_sources)
+    assert bootstrap._validate_zip(previous_zip) == (True, "All ok")
+
+    _write(openpype_sources / "openpype" / "module_3.py", "value = 'new'\n")
+    _write(openpype_sources / "openpype" / "added.py", "added = True\n")
+
+    written = []
+    original_write = ZipFile.write
+
+    def _write_member(zip_file, filename, arcname=None, *args, **kwargs):
+        written.append(Path(arcname).as_posix())
+        return original_write(zip_file, filename, arcname, *args, **kwargs)
+
+    monkeypatch.setattr(ZipFile, "write", _write_member)
+
+    new_zip = tmp_path / "new.zip"
+    bootstrap._create_openpype_zip(new_zip, openpype_sources, previous_zip)
+
+    # only changed files are compressed again
+    assert sorted(written) == ["openpype/added.py", "openpype/module_3.py"]
+    with ZipFile(new_zip) as zip_file:
+        assert zip_file.testzip() is None
+        assert len(zip_file.namelist()) == 23
+        assert zip_file.read("openpype/module_3.py") == b"value = 'new'\n"
+        assert zip_file.read("openpype/module_4.py") == b"value = 4\n"
+    assert bootstrap._validate_zip(new_zip) == (True, "All ok")
+
+
+def test_validation_cache(bootstrap, openpype_sources, tmp_path, monkeypatch):
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    bootstrap._create_openpype_zip(zip_path, openpype_sources)
+
+    calls = []
+    original_validate = BootstrapRepos._validate_zip_checksums
+
+    def _validate(path):
+        calls.append(path)
+        return original_validate(path)
+
+    monkeypatch.setattr(
+        BootstrapRepos, "_validate_zip_checksums", staticmethod(_validate))
+
+    assert bootstrap._validate_zip(zip_path)[0]
+    assert bootstrap._validate_zip(zip_path)[0]
+    assert len(calls) == 1
+
+    # results are persisted in data dir
+    assert (
+        Path(bootstrap.data_dir) / "zip_validation_cache.json"
+    ).exists()
+    new_cache = bootstrap_repos.ZipValidationCache()
+    new_cache.set_filepath(zip_validation_cache.filepath)
+    assert new_cache.get(zip_path, "checksums") == (True, "All ok")
+
+    # change of file invalidates cached result
+    with ZipFile(zip_path, "a") as zip_file:
+        zip_file.writestr("openpype/injected.py", "injected = True\n")
+    stat = zip_path.stat()
+    os.utime(zip_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    valid, reason = bootstrap._validate_zip(zip_path)
+    assert not valid
+    assert "openpype/injected.py" in reason
+    assert len(calls) == 2
+
+
+def test_invalid_checksum(bootstrap, openpype_sources, tmp_path):
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    bootstrap._create_openpype_zip(zip_path, openpype_sources)
+
+    broken_path = tmp_path / "broken.zip"
+    with ZipFile(zip_path) as source, ZipFile(broken_path, "w") as target:
+        for name in source.namelist():
+            data = source.read(name)
+            if name == "openpype/module_7.py":
+                data = b"value = 'broken'\n"
+            target.writestr(name, data)
+
+    assert bootstrap._validate_zip(broken_path) == (
+        False, "Invalid checksum on openpype/module_7.py")
@@ -0,0 +1,212 @@
+from openpype.client.server.conversion_utils import (
+    CONVERTERS_CACHE_SIZE,
+    get_v4_subset_converter,
+    convert_v4_folder_to_v3,
+    convert_v4_folders_to_v3,
+    convert_v4_subsets_to_v3,
+    convert_v4_tasks_to_v3,
+    convert_v4_workfile_info_to_v3,
+    get_v4_workfile_info_converter,
+    representation_fields_v3_to_v4,
+    convert_v4_representation_to_v3,
+    convert_v4_representations_to_v3,
+    convert_v4_versions_to_v3,
+)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.attributes = {"path": {}, "template": {}}
+
+    def get_attributes_for_type(self, entity_type):
+        return self.attributes
+
+
+def _get_representation():
+    return {
+        "id": "repre_id",
+        "name": "exr",
+        "versionId": "version_id",
+        "active": True,
+        "context": {
+            "folder": {"name": "sh010"},
+            "product": {"name": "renderMain", "type": "render"},
+        },
+        "files": [{"id": "file_id", "name": "a.exr"}],
+        "attrib": {"template": "{root[work]}/{product[name]}"},
+    }
+
+
+def test_fields_conversion_is_cached_per_attributes():
+    con = FakeConnection()
+    fields = representation_fields_v3_to_v4(["_id", "data"], con)
+    assert fields == {"id", "attrib.path", "attrib.template"}
+
+    # Returned value can be modified without affecting cache
+    fields.add("active")
+    assert "active" not in representation_fields_v3_to_v4(
+        ["_id", "data"], con
+    )
+
+    con.attributes = {"path": {}}
+    assert representation_fields_v3_to_v4(["_id", "data"], con) == {
+        "id", "attrib.path"
+    }
+
+
+def test_representation_conversion():
+    representation = convert_v4_representation_to_v3(_get_representation())
+
+    assert representation["_id"] == "repre_id"
+    assert representation["parent"] == "version_id"
+    assert representation["type"] == "representation"
+    assert representation["context"]["asset"] == "sh010"
+    assert representation["context"]["subset"] == "renderMain"
+    assert representation["context"]["family"] == "render"
+    assert representation["files"] == [{
+        "id": "file_id",
+        "_id": "file_id",
+        "name": "a.exr",
+        "sites": [{"name": "studio"}],
+    }]
+    assert representation["data"] == {
+        "active": True,
+        "template": "{root[work]}/{subset}",
+    }
+
+
+def test_representations_stream_conversion_with_fields():
+    source = _get_representation()
+    source["active"] = False
+    representations = list(convert_v4_representations_to_v3(
+        [source], {"id", "name", "versionId", "active"}
+    ))
+
+    assert len(representations) == 1
+    representation = representations[0]
+    assert representation["type"] == "archived_representation"
+    assert representation["old_id"] == "repre_id"
+    # Not queried fields are not converted
+    assert "context" not in representation
+    assert "files" not in representation
+
+
+def test_versions_stream_conversion():
+    versions = list(convert_v4_versions_to_v3([
+        {
+            "id": "version_id",
+            "version": 3,
+            "productId": "product_id",
+            "author": "artist",
+            "createdAt": "2023-05-10T10:00:00+00:00",
+        },
+        {
+            "id": "hero_id",
+            "version": -3,
+            "productId": "product_id",
+        },
+    ]))
+
+    assert versions[0]["name"] == 3
+    assert versions[0]["parent"] == "product_id"
+    assert versions[0]["data"]["author"] == "artist"
+    assert len(versions[0]["data"]["time"]) == len("20230510T100000Z")
+    assert versions[1]["type"] == "hero_version"
+
+
+def test_folders_stream_conversion_with_fields():
+    folder = {
+        "id": "folder_id",
+        "name": "sh010",
+        "folderType": "Shot",
+        "parentId": "parent_id",
+        "attrib": {"frameStart": 1001, "tools": ["maya"]},
+        "tasks": [{"name": "anim", "taskType": "Animation"}],
+    }
+    asset = convert_v4_folder_to_v3(dict(folder), "test")
+    assert asset["_id"] == "folder_id"
+    assert asset["parent"] == "test"
+    assert asset["name"] == "sh010"
+    assert asset["data"] == {
+        "label": "sh010",
+        "entityType": "Shot",
+        "visualParent": "parent_id",
+        "frameStart": 1001,
+        "tools_env": ["maya"],
+        "tasks": {"anim": {"type": "Animation"}},
+    }
+
+    folder["attrib"] = dict(folder["attrib"])
+    assets = list(convert_v4_folders_to_v3(
+        [folder], "test", {"id", "name", "tasks"}
+    ))
+    assert assets[0]["name"] == "sh010"
+    # Not queried fields are not converted
+    assert assets[0]["data"] == {
+        "label": "sh010",
+        "tasks": {"anim": {"type": "Animation"}},
+    }
+
+
+def test_tasks_conversion():
+    assert convert_v4_tasks_to_v3([
+        {"name": "anim", "taskType": "Animation"},
+        {"name": "comp"},
+    ]) == {"anim": {"type": "Animation"}, "comp": {}}
+
+
+def test_subsets_stream_conversion():
+    subsets = list(convert_v4_subsets_to_v3([
+        {
+            "id": "product_id",
+            "name": "renderMain",
+            "folderId": "folder_id",
+            "productType": "render",
+            "active": True,
+            "attrib": {"productGroup": "renders"},
+        },
+        {"id": "other_id", "name": "modelMain", "productType": "model"},
+    ], {"id", "name", "folderId", "attrib"}))
+
+    assert subsets[0]["parent"] == "folder_id"
+    assert subsets[0]["data"] == {"subsetGroup": "renders"}
+    assert subsets[1]["name"] == "modelMain"
+    assert "parent" not in subsets[1]
+
+
+def test_workfile_info_conversion():
+    task = {"name": "anim", "folderId": "folder_id"}
+    workfile_info = {
+        "id": "workfile_id",
+        "path": "{root[work]}/sh010_anim_v001.ma",
+        "name": "sh010_anim_v001.ma",
+        "taskId": "task_id",
+    }
+    assert convert_v4_workfile_info_to_v3(workfile_info, task) == {
+        "_id": "workfile_id",
+        "type": "workfile",
+        "schema": "openpype:workfile-1.0",
+        "files": ["{root[work]}/sh010_anim_v001.ma"],
+        "filename": "sh010_anim_v001.ma",
+        "task_name": "anim",
+        "parent": "folder_id",
+    }
+
+    converter = get_v4_workfile_info_converter({"id", "name"})
+    assert converter(workfile_info, task) == {
+        "_id": "workfile_id",
+        "type": "workfile",
+        "schema": "openpype:workfile-1.0",
+        "filename": "sh010_anim_v001.ma",
+    }
+
+
+def test_converters_cache_is_bounded():
+    converter = get_v4_subset_converter({"id", "name"})
+    assert get_v4_subset_converter(["name", "id"]) is converter
+
+    for idx in range(CONVERTERS_CACHE_SIZE + 1):
+        get_v4_subset_converter({"id", "attrib.{}".format(idx)})
+
+    # Least recently used converter was dropped
+    assert get_v4_subset_converter({"id", "name"}) is not converter
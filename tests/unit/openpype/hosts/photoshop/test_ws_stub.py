@@ -0,0 +1,152 @@
+import json
+
+import pytest
+
+from openpype.hosts.photoshop.api.ws_stub import PhotoshopServerStub
+
+
+class FakeClient:
+    """Client returning request which is processed by 'FakeWebServer'."""
+
+    def call(self, method, **kwargs):
+        return method, kwargs
+
+
+class FakeWebServer:
+    """Replacement of websocket server holding state of Photoshop document.
+    """
+
+    def __init__(self, layer_ids, metadata, support_batch=True):
+        self.layer_ids = layer_ids
+        self.headline = json.dumps(metadata)
+        self.support_batch = support_batch
+        self.calls = []
+
+    def call(self, request):
+        method, kwargs = request
+        self.calls.append(method)
+        if method == "Photoshop.read":
+            return self.headline
+
+        if method == "Photoshop.imprint":
+            self.headline = kwargs["payload"]
+            return None
+
+        if method == "Photoshop.get_layers":
+            return json.dumps([
+                {"id": layer_id, "name": str(layer_id)}
+                for layer_id in self.layer_ids
+            ])
+
+        if method == "Photoshop.set_visible":
+            return kwargs["layer_id"]
+
+        if method == "Photoshop.batch":
+            if not self.support_batch:
+                # Route not found
+                return None
+            return [
+                self.call((call["method"], call["params"]))
+                for call in kwargs["calls"]
+            ]
+        raise ValueError(method)
+
+
+def _create_stub(web_server):
+    stub = PhotoshopServerStub.__new__(PhotoshopServerStub)
+    stub.websocketserver = web_server
+    stub.client = FakeClient()
+    return stub
+
+
+@pytest.fixture(autouse=True)
+def reset_stub_state():
+    yield
+    PhotoshopServerStub._metadata_session = None
+    PhotoshopServerStub._batch_available = None
+
+
+def test_imprint_without_session():
+    web_server = FakeWebServer(
+        [1, 2],
+        [{"instance_id": "a", "members": ["1"], "subset": "imageA"}]
+    )
+    stub = _create_stub(web_server)
+
+    stub.imprint("a", {"subset": "imageB"})
+    stub.imprint("b", {"instance_id": "b", "members": ["2"]})
+
+    metadata = stub.get_layers_metadata()
+    assert metadata == [
+        {"instance_id": "a", "members": ["1"], "subset": "imageB"},
+        {"instance_id": "b", "members": ["2"]},
+    ]
+
+
+def test_metadata_session_writes_once():
+    web_server = FakeWebServer(
+        [1, 2, 3],
+        [
+            {"instance_id": "a", "members": ["1"]},
+            {"instance_id": "b", "members": ["2"]},
+            # Layer does not exist anymore
+            {"instance_id": "c", "members": ["10"]},
+        ]
+    )
+    stub = _create_stub(web_server)
+
+    with stub.metadata_session():
+        for idx in range(100):
+            stub.imprint("a", {"variant": idx})
+        stub.imprint("3", {"instance_id": "d", "members": ["3"]})
+        stub.remove_instance("b")
+        # Nested session is the same session
+        with stub.metadata_session():
+            _create_stub(web_server).imprint("d", {"active": False})
+
+        # Reads inside session see not written changes
+        instance_ids = [
+            item["instance_id"] for item in stub.get_layers_metadata()
+        ]
+        assert instance_ids == ["a", "c", "d"]
+
+    assert web_server.calls == [
+        "Photoshop.read", "Photoshop.get_layers", "Photoshop.imprint"
+    ]
+    assert stub.get_layers_metadata() == [
+        {"instance_id": "a", "members": ["1"], "variant": 99},
+        {"instance_id": "d", "members": ["3"], "active": False},
+    ]
+
+
+def test_metadata_session_flushed_on_error():
+    web_server = FakeWebServer([1], [{"instance_id": "a", "members": ["1"]}])
+    stub = _create_stub(web_server)
+
+    with pytest.raises(RuntimeError):
+        with stub.metadata_session():
+            stub.imprint("a", {"active": False})
+            raise RuntimeError("Failed")
+
+    # Changes made before the error are written
+    assert web_server.calls.count("Photoshop.imprint") == 1
+    assert json.loads(web_server.headline) == [
+        {"instance_id": "a", "members": ["1"], "active": False}
+    ]
+    assert PhotoshopServerStub._metadata_session is None
+
+
+@pytest.mark.parametrize("support_batch", [True, False])
+def test_batch_call(support_batch):
+    web_server = FakeWebServer([], [], support_batch)
+    stub = _create_stub(web_server)
+
+    calls = [
+        ("Photoshop.set_visible", {"layer_id": idx, "visibility": False})
+        for idx in range(3)
+    ]
+    assert stub.batch_call(calls) == [0, 1, 2]
+    assert stub.batch_call(calls) == [0, 1, 2]
+    assert web_server.calls.count("Photoshop.batch") == (
+        2 if support_batch else 1
+    )
@@ -0,0 +1,161 @@
+"""Tests of communication with TVPaint using mocked websocket client."""
+import asyncio
+import json
+import threading
+import time
+
+import aiohttp
+import pytest
+
+from openpype.hosts.tvpaint.api.communication_server import (
+    BaseCommunicator,
+    MainThreadItem,
+    WebSocketServer,
+)
+
+
+class MockTVPaintClient(threading.Thread):
+    """Websocket client replacing TVPaint plugin.
+
+    George scripts are "executed" by returning output from 'outputs'
+    mapping. Unknown scripts return the script itself.
+
+    Args:
+        port (int): Port of websocket server.
+        outputs (Optional[dict[str, str]]): Output of george scripts.
+        support_many (Optional[bool]): Client has 'execute_george_many'
+            method as newer plugin builds.
+    """
+
+    def __init__(self, port, outputs=None, support_many=True):
+        super(MockTVPaintClient, self).__init__()
+        self.daemon = True
+        self.port = port
+        self.outputs = outputs or {}
+        self.support_many = support_many
+        self.received_methods = []
+        self.loop = asyncio.new_event_loop()
+        self._ws = None
+        self._connected = threading.Event()
+
+    def wait_for_connection(self, timeout=5):
+        return self._connected.wait(timeout)
+
+    def _execute_george(self, george_script):
+        return self.outputs.get(george_script, george_script)
+
+    def _process_request(self, data):
+        method = data["method"]
+        self.received_methods.append(method)
+        if method == "execute_george":
+            return {"result": self._execute_george(data["params"][0])}
+
+        if method == "execute_george_many" and self.support_many:
+            return {"result": [
+                self._execute_george(george_script)
+                for george_script in data["params"][0]
+            ]}
+
+        return {"error": {
+            "code": -32601,
+            "message": "Method \"{}\" not found".format(method)
+        }}
+
+    async def _run(self):
+        async with aiohttp.ClientSession() as session:
+            url = "ws://localhost:{}".format(self.port)
+            async with session.ws_connect(url) as ws:
+                self._ws = ws
+                self._connected.set()
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    data = json.loads(msg.data)
+                    if "method" not in data or "id" not in data:
+                        continue
+                    response = self._process_request(data)
+                    response["jsonrpc"] = "2.0"
+                    response["id"] = data["id"]
+                    await ws.send_str(json.dumps(response))
+
+    def run(self):
+        self.loop.run_until_complete(self._run())
+
+    def stop(self):
+        if self._ws is not None:
+            asyncio.run_coroutine_threadsafe(
+                self._ws.close(), self.loop
+            ).result(5)
+        self.join(5)
+
+
+@pytest.fixture
+def communicator():
+    communicator = BaseCommunicator()
+    communicator.websocket_server = WebSocketServer()
+    communicator._create_routes()
+    communicator._start_webserver()
+    yield communicator
+    communicator._stop_webserver()
+
+
+def _connect_client(communicator, **kwargs):
+    client = MockTVPaintClient(
+        communicator.websocket_server.port, **kwargs
+    )
+    client.start()
+    assert client.wait_for_connection()
+    start = time.time()
+    while not communicator.websocket_rpc.client_connected():
+        assert time.time() - start < 5
+        time.sleep(0.01)
+    return client
+
+
+def test_execute_george(communicator):
+    client = _connect_client(communicator, outputs={"tv_markin": "0 set "})
+
+    assert communicator.execute_george("tv_markin") == "0 set "
+    assert communicator.execute_george("tv_version") == "tv_version"
+
+    metrics = communicator.get_request_metrics()
+    assert metrics["execute_george"]["count"] == 2
+    assert metrics["execute_george"]["errors"] == 0
+    client.stop()
+
+
+def test_execute_george_many(communicator):
+    client = _connect_client(communicator)
+
+    scripts = ["tv_markin", "tv_markout", "tv_startframe"]
+    assert communicator.execute_george_many(scripts) == scripts
+    assert client.received_methods == ["execute_george_many"]
+    client.stop()
+
+
+def test_execute_george_many_fallback(communicator):
+    client = _connect_client(communicator, support_many=False)
+
+    scripts = ["tv_script_{}".format(idx) for idx in range(20)]
+    assert communicator.execute_george_many(scripts) == scripts
+    assert communicator.execute_george_many(scripts[:2]) == scripts[:2]
+    # Unsupported method is requested only once
+    assert client.received_methods.count("execute_george_many") == 1
+    assert client.received_methods.count("execute_george") == 22
+
+    metrics = communicator.get_request_metrics()
+    assert metrics["execute_george_many"]["errors"] == 1
+    client.stop()
+
+
+def test_main_thread_item_wait():
+    item = MainThreadItem(lambda value: value * 2, 21)
+    threading.Timer(0.05, item.execute).start()
+    assert item.wait() == 42
+
+    item = MainThreadItem(lambda: 1 / 0)
+    loop = asyncio.new_event_loop()
+    loop.call_later(0.05, item.execute)
+    with pytest.raises(ZeroDivisionError):
+        loop.run_until_complete(item.async_wait())
+    loop.close()
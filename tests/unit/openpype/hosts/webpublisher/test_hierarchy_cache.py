@@ -0,0 +1,113 @@
+import os
+import json
+import importlib.util
+
+import pytest
+from bson.objectid import ObjectId
+
+import openpype.hosts
+
+# Package of webserver service requires loaded OpenPype modules
+_spec = importlib.util.spec_from_file_location(
+    "webpublisher_hierarchy",
+    os.path.join(
+        os.path.dirname(openpype.hosts.__file__),
+        "webpublisher", "webserver_service", "hierarchy.py"
+    )
+)
+hierarchy = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hierarchy)
+
+
+def _asset(asset_id, name, parent_id=None, tasks=None):
+    return {
+        "_id": asset_id,
+        "name": name,
+        "type": "asset",
+        "data": {
+            "visualParent": parent_id,
+            "entityType": "Shot" if parent_id else "Folder",
+            "tasks": {
+                task_name: {"type": task_name}
+                for task_name in tasks or []
+            },
+        },
+    }
+
+
+def _names(node):
+    return [child["name"] for child in node["children"]]
+
+
+@pytest.fixture
+def asset_docs():
+    seq_id, sh1_id, sh2_id = ObjectId(), ObjectId(), ObjectId()
+    return [
+        # Child is before its parent
+        _asset(sh1_id, "sh010", seq_id, ["comp"]),
+        _asset(seq_id, "sq01"),
+        _asset(sh2_id, "sh020", seq_id, ["comp", "anim"]),
+    ]
+
+
+def test_project_hierarchy(asset_docs):
+    sh1, seq, sh2 = asset_docs
+    tree = hierarchy.ProjectHierarchy("prj", asset_docs)
+
+    root = tree.root
+    assert root["type"] == "project"
+    assert _names(root) == ["sq01"]
+    seq_node = root["children"][0]
+    assert _names(seq_node) == ["sh010", "sh020"]
+    assert _names(seq_node["children"][1]) == ["comp", "anim"]
+
+    # Rename, change tasks and move to project
+    tree.upsert_asset(_asset(sh2["_id"], "sh030", None, ["light"]))
+    assert _names(root) == ["sq01", "sh030"]
+    assert _names(root["children"][1]) == ["light"]
+
+    # Children of removed asset are shown under project until it's back
+    tree.remove_asset(seq["_id"])
+    assert _names(root) == ["sh030", "sh010"]
+    tree.upsert_asset(seq)
+    assert _names(root) == ["sh030", "sq01"]
+    assert _names(root["children"][1]) == ["sh010"]
+
+
+def test_hierarchy_cache(monkeypatch, asset_docs):
+    queries = []
+
+    def get_assets(project_name, fields=None):
+        queries.append(project_name)
+        return list(asset_docs)
+
+    monkeypatch.setattr(hierarchy, "get_assets", get_assets)
+    monkeypatch.setattr(
+        hierarchy.HierarchyCache, "_open_stream", lambda *args: None
+    )
+    cache = hierarchy.HierarchyCache(
+        lambda data: json.dumps(data, default=str).encode("utf-8"),
+        reload_interval=3600
+    )
+
+    body, etag = cache.get("prj")
+    assert cache.get("prj") == (body, etag)
+    assert queries == ["prj"]
+    assert json.loads(body)["children"][0]["name"] == "sq01"
+
+    # Change which does not affect tree keeps the version
+    cache.apply_changes("prj", upserted=[asset_docs[1]])
+    assert cache.get("prj")[1] == etag
+
+    cache.apply_changes("prj", removed_ids=[asset_docs[0]["_id"]])
+    new_body, new_etag = cache.get("prj")
+    assert new_etag != etag
+    assert "sh010" not in new_body.decode("utf-8")
+    assert queries == ["prj"]
+
+    # Tree is reloaded when changes are not watched
+    cache.reload_interval = 0
+    reloaded_body, reloaded_etag = cache.get("prj")
+    assert queries == ["prj", "prj"]
+    assert reloaded_body == body
+    assert reloaded_etag not in (etag, new_etag)
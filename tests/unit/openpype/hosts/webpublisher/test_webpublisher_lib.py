@@ -0,0 +1,79 @@
+import types
+from datetime import datetime, timedelta
+
+from openpype.hosts.webpublisher.lib import (
+    fail_unfinished_batch,
+    ERROR_STATUS,
+    IN_PROGRESS_STATUS,
+    FINISHED_OK_STATUS,
+)
+
+
+class FakeWebpublishes:
+    """Collection of batch records with methods used by 'lib'."""
+
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+
+    def _matches(self, doc, query_filter):
+        for key, condition in query_filter.items():
+            value = doc.get(key)
+            if isinstance(condition, dict):
+                if "$gte" in condition and value < condition["$gte"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def update_many(self, query_filter, update):
+        modified = 0
+        for doc in self.docs:
+            if self._matches(doc, query_filter):
+                doc.update(update["$set"])
+                modified += 1
+        return types.SimpleNamespace(modified_count=modified)
+
+    def count_documents(self, query_filter):
+        return len([
+            doc for doc in self.docs if self._matches(doc, query_filter)
+        ])
+
+    def insert_one(self, doc):
+        self.docs.append(doc)
+
+
+def test_fail_unfinished_batch():
+    submitted = datetime.now() - timedelta(minutes=5)
+    dbcon = FakeWebpublishes([
+        {
+            "batch_id": "b1",
+            "start_date": submitted - timedelta(days=1),
+            "status": FINISHED_OK_STATUS,
+        },
+        {
+            "batch_id": "b1",
+            "start_date": submitted,
+            "status": IN_PROGRESS_STATUS,
+        },
+    ])
+
+    # Record created by crashed worker is failed
+    fail_unfinished_batch(dbcon, "b1", "user@studio.com", "crashed",
+                          since=submitted)
+    assert [doc["status"] for doc in dbcon.docs] == [
+        FINISHED_OK_STATUS, ERROR_STATUS
+    ]
+    assert dbcon.docs[1]["log"] == "crashed"
+
+    # Record which failed on its own is not changed
+    fail_unfinished_batch(dbcon, "b1", "user@studio.com", "other",
+                          since=submitted)
+    assert len(dbcon.docs) == 2
+    assert dbcon.docs[1]["log"] == "crashed"
+
+    # Worker crashed before it created record
+    fail_unfinished_batch(dbcon, "b2", "user@studio.com", "crashed",
+                          since=submitted)
+    assert len(dbcon.docs) == 3
+    assert dbcon.docs[2]["status"] == ERROR_STATUS
+    assert dbcon.docs[2]["user"] == "user@studio.com"
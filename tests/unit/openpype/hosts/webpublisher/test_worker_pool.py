@@ -0,0 +1,194 @@
+import os
+import sys
+import time
+import threading
+import importlib.util
+
+import pytest
+
+import openpype
+import openpype.hosts
+
+# Package of webserver service requires loaded OpenPype modules
+_spec = importlib.util.spec_from_file_location(
+    "webpublisher_worker_pool",
+    os.path.join(
+        os.path.dirname(openpype.hosts.__file__),
+        "webpublisher", "webserver_service", "worker_pool.py"
+    )
+)
+worker_pool = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker_pool)
+
+# Worker with the same protocol as 'publish_worker' command
+FAKE_WORKER = """
+import os
+import sys
+import json
+import time
+
+print(json.dumps({"type": "ready", "pid": os.getpid()}), flush=True)
+for line in sys.stdin:
+    if not line.strip():
+        break
+    job = json.loads(line)
+    if job["path"] == "crash":
+        sys.exit(1)
+    if job["path"] == "slow":
+        time.sleep(0.5)
+    print("publish output", file=sys.stderr)
+    print(json.dumps({
+        "type": "result",
+        "id": job["id"],
+        "success": job["path"] != "fail",
+        "error": "failed" if job["path"] == "fail" else None,
+        "peak_rss": 1000 if job["path"] == "big" else 10,
+    }), flush=True)
+"""
+
+# Real 'run_publish_worker' where publish fails without exception, as
+#   'publish_and_log' stores the error to batch log
+PUBLISH_WORKER = """
+import sys
+sys.path[:0] = {sys_path!r}
+
+from openpype.hosts.webpublisher import publish_functions
+
+
+def cli_publish(project_name, batch_path, user_email, targets):
+    return batch_path != "fail"
+
+
+publish_functions.cli_publish = cli_publish
+publish_functions.install_openpype_plugins = lambda: None
+publish_functions.get_webpublish_conn = lambda: None
+publish_functions.uninstall_host = lambda: None
+publish_functions.run_publish_worker()
+"""
+
+
+class _Results:
+    def __init__(self):
+        self.items = []
+        self._condition = threading.Condition()
+
+    def add(self, job, result):
+        with self._condition:
+            self.items.append((job, result))
+            self._condition.notify_all()
+
+    def wait(self, count, timeout=20):
+        with self._condition:
+            assert self._condition.wait_for(
+                lambda: len(self.items) >= count, timeout
+            )
+        return self.items
+
+
+@pytest.fixture
+def create_pool():
+    pools = []
+
+    def _create(worker_code=FAKE_WORKER, **kwargs):
+        results = _Results()
+        pool = worker_pool.PublishWorkerPool(
+            [sys.executable, "-c", worker_code],
+            on_result=results.add,
+            **kwargs
+        )
+        pool.restart_delay = 0.1
+        pool.start()
+        pools.append(pool)
+        return pool, results
+
+    yield _create
+    for pool in pools:
+        pool.stop()
+
+
+def test_workers_are_recycled(create_pool):
+    pool, results = create_pool(
+        max_workers=1, max_jobs_per_worker=3, max_rss=100
+    )
+    for path in ("a", "b", "c", "big", "fail"):
+        pool.submit("project", path, "user@studio.com")
+
+    items = results.wait(5)
+    assert [result["success"] for _, result in items] == [
+        True, True, True, True, False
+    ]
+    assert [job["path"] for job, _ in items] == ["a", "b", "c", "big", "fail"]
+
+    status = pool.get_status()
+    assert status["succeeded"] == 4
+    assert status["failed"] == 1
+    # After 3 jobs and after job with high memory
+    assert status["recycled"] == 2
+
+
+def test_queue_backpressure(create_pool):
+    pool, results = create_pool(max_workers=1, queue_size=1)
+    pool.submit("project", "slow", "user@studio.com")
+    start = time.time()
+    while not pool.get_status()["busy_workers"]:
+        assert time.time() - start < 20
+        time.sleep(0.01)
+
+    pool.submit("project", "a", "user@studio.com")
+    with pytest.raises(worker_pool.PoolQueueFull):
+        pool.submit("project", "b", "user@studio.com")
+
+    status = pool.get_status()
+    assert status["refused"] == 1
+    assert status["queued"] == 1
+    assert status["utilisation"] == 1.0
+    results.wait(2)
+
+
+def test_crashed_worker_is_restarted(create_pool):
+    pool, results = create_pool(max_workers=2)
+    pool.submit("project", "crash", "user@studio.com")
+    job, result = results.wait(1)[0]
+    assert not result["success"]
+    assert "crashed" in result["error"]
+
+    pool.submit("project", "a", "user@studio.com")
+    assert results.wait(2)[1][1]["success"]
+    status = pool.get_status()
+    assert status["crashed"] == 1
+    assert status["max_workers"] == 2
+
+
+def test_job_timeout(create_pool):
+    pool, results = create_pool(max_workers=1, job_timeout=30)
+    pool.submit("project", "slow", "user@studio.com", timeout=0.1)
+    job, result = results.wait(1)[0]
+    assert job["timeout"] == 0.1
+    assert not result["success"]
+    assert "timeout" in result["error"]
+
+    # Pool timeout is used for jobs without timeout
+    pool.submit("project", "slow", "user@studio.com")
+    job, result = results.wait(2)[1]
+    assert job["timeout"] == 30
+    assert result["success"]
+
+
+def test_failed_publish_without_exception(create_pool):
+    # Paths of test process don't depend on current working directory
+    sys_path = [os.path.dirname(os.path.dirname(openpype.__file__))]
+    sys_path.extend(path for path in sys.path if path)
+    pool, results = create_pool(
+        worker_code=PUBLISH_WORKER.format(sys_path=sys_path), max_workers=1
+    )
+    pool.submit("project", "fail", "user@studio.com")
+    pool.submit("project", "a", "user@studio.com")
+
+    items = results.wait(2)
+    assert [result["success"] for _, result in items] == [False, True]
+    assert items[0][1]["error"]
+
+    status = pool.get_status()
+    assert status["succeeded"] == 1
+    assert status["failed"] == 1
+    assert status["crashed"] == 0
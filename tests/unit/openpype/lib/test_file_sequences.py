@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file sequence discovery."""
+import os
+
+from openpype.lib.file_sequences import (
+    assemble_sequences,
+    scan_directory,
+    clear_scan_cache,
+)
+
+
+def test_assemble_sequences():
+    files = [
+        "render.0001.exr",
+        "render.0002.exr",
+        "render.0004.exr",
+        "render.1000.exr",
+        "Asset_v001.0001.png",
+        "clip_001.mp4",
+        "clip_002.mp4",
+        "notes.txt",
+        "single.0001.exr",
+    ]
+    sequences, remainder = assemble_sequences(files)
+
+    assert [seq.format() for seq in sequences] == [
+        "clip_%03d.mp4 [1-2]",
+        "render.%04d.exr [1-2, 4, 1000]",
+    ]
+    assert remainder == ["Asset_v001.0001.png", "notes.txt", "single.0001.exr"]
+
+    render = sequences[1]
+    assert render.has_gaps
+    assert len(render) == 4
+    assert 4 in render and 3 not in render and 1001 not in render
+    assert render.get_missing_frames(end=6) == [3, 5, 6]
+    assert list(render)[-1] == "render.1000.exr"
+    assert render.to_clique().indexes == {1, 2, 4, 1000}
+
+    sequences, remainder = assemble_sequences(files, minimum_items=1)
+    assert "single.%04d.exr [1]" in [seq.format() for seq in sequences]
+    assert remainder == ["notes.txt"]
+
+
+def test_scan_directory_cache(tmp_path):
+    for frame in range(1, 6):
+        (tmp_path / "beauty.{:04d}.exr".format(frame)).write_bytes(b"")
+    (tmp_path / "subdir.0001.exr").mkdir()
+    # Modification time older than racy interval so result is cached
+    os.utime(str(tmp_path), (1000000000, 1000000000))
+
+    clear_scan_cache()
+    sequences, remainder = scan_directory(str(tmp_path))
+    assert [seq.format() for seq in sequences] == ["beauty.%04d.exr [1-5]"]
+    assert remainder == []
+
+    # Cached result is used while modification time is the same
+    (tmp_path / "beauty.0006.exr").write_bytes(b"")
+    os.utime(str(tmp_path), (1000000000, 1000000000))
+    assert scan_directory(str(tmp_path))[0][0].end == 5
+    assert scan_directory(str(tmp_path), use_cache=False)[0][0].end == 6
+
+    os.utime(str(tmp_path), (1000000001, 1000000001))
+    assert scan_directory(str(tmp_path))[0][0].end == 6
@@ -0,0 +1,144 @@
+import json
+import time
+import logging
+import threading
+
+from openpype.lib.log import BufferedMongoHandler
+
+
+class FakeCollection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def insert_many(self, documents, ordered=True):
+        if self.fail:
+            raise RuntimeError("Database is not available")
+        self.calls.append(list(documents))
+
+
+class _TestHandler(BufferedMongoHandler):
+    def __init__(self, collection, *args, **kwargs):
+        self._fake_collection = collection
+        super(_TestHandler, self).__init__("db", "logs", *args, **kwargs)
+
+    def _get_collection(self):
+        return self._fake_collection
+
+
+def _make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_buffered_handler_batches_records():
+    collection = FakeCollection()
+    handler = _TestHandler(collection, batch_size=10, flush_interval=5)
+    logger = _make_logger("test_buffered_handler_batches", handler)
+
+    for idx in range(25):
+        logger.info("Message %s", idx)
+    handler.flush()
+    handler.close()
+    logger.removeHandler(handler)
+
+    messages = [
+        document["message"]
+        for batch in collection.calls
+        for document in batch
+    ]
+    assert messages == ["Message {}".format(idx) for idx in range(25)]
+    assert all(len(batch) <= 10 for batch in collection.calls)
+    stats = handler.get_stats()
+    assert stats["inserted"] == 25
+    assert stats["dropped"] == 0
+    assert stats["queued"] == 0
+
+
+def test_buffered_handler_drops_on_failure():
+    collection = FakeCollection(fail=True)
+    handler = _TestHandler(collection, batch_size=5, flush_interval=0.1)
+    logger = _make_logger("test_buffered_handler_drops", handler)
+
+    for idx in range(7):
+        logger.info("Message %s", idx)
+    handler.close()
+    logger.removeHandler(handler)
+
+    assert handler.dropped_count == 7
+    assert handler.get_stats()["inserted"] == 0
+
+
+def test_buffered_handler_spills_to_file(tmp_path):
+    spill_filepath = tmp_path / "spill" / "logs.jsonl"
+    collection = FakeCollection(fail=True)
+    handler = _TestHandler(
+        collection,
+        batch_size=5,
+        flush_interval=0.1,
+        spill_filepath=str(spill_filepath)
+    )
+    logger = _make_logger("test_buffered_handler_spills", handler)
+
+    for idx in range(3):
+        logger.warning("Message %s", idx)
+    handler.close()
+    logger.removeHandler(handler)
+
+    with open(str(spill_filepath), "r") as stream:
+        documents = [json.loads(line) for line in stream]
+
+    assert [doc["message"] for doc in documents] == [
+        "Message 0", "Message 1", "Message 2"
+    ]
+    assert handler.get_stats()["spilled"] == 3
+    assert handler.dropped_count == 0
+
+
+def test_buffered_handler_close_does_not_wait(tmp_path):
+    spill_filepath = tmp_path / "logs.jsonl"
+    release = threading.Event()
+
+    class HangingCollection(FakeCollection):
+        def insert_many(self, documents, ordered=True):
+            self.calls.append(list(documents))
+            # Database is not reachable
+            release.wait(10)
+            raise RuntimeError("Database is not available")
+
+    collection = HangingCollection()
+    handler = _TestHandler(
+        collection,
+        batch_size=2,
+        flush_interval=0.1,
+        spill_filepath=str(spill_filepath)
+    )
+    handler.close_timeout = 0.2
+    logger = _make_logger("test_buffered_handler_close", handler)
+
+    logger.info("Message 0")
+    while not collection.calls:
+        time.sleep(0.01)
+    for idx in range(1, 6):
+        logger.info("Message %s", idx)
+
+    start = time.time()
+    handler.close()
+    logger.removeHandler(handler)
+    assert time.time() - start < 5
+
+    # Queued documents are spilled without trying database
+    with open(str(spill_filepath), "r") as stream:
+        documents = [json.loads(line) for line in stream]
+    assert [doc["message"] for doc in documents] == [
+        "Message {}".format(idx) for idx in range(1, 6)
+    ]
+    assert len(collection.calls) == 1
+
+    # Document being inserted is spilled when insertion fails
+    release.set()
+    handler._thread.join(5)
+    assert handler.get_stats()["spilled"] == 6
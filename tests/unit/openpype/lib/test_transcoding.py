@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from openpype.lib import transcoding
+
+oiio = pytest.importorskip("OpenImageIO")
+np = pytest.importorskip("numpy")
+
+
+def _create_exr(filepath):
+    spec = oiio.ImageSpec(16, 8, 5, "half")
+    spec.channelnames = (
+        "beauty.R", "beauty.G", "beauty.B", "beauty.A", "depth.Z"
+    )
+    spec.attribute("compression", "dwaa")
+    spec.attribute("comment", 'has "quote"')
+    spec.attribute("Copyright", "artist")
+    pixels = np.arange(16 * 8 * 5, dtype=np.float16).reshape(8, 16, 5)
+    image_output = oiio.ImageOutput.create(filepath)
+    image_output.open(filepath, spec)
+    image_output.write_image(pixels)
+    image_output.close()
+    return pixels
+
+
+def test_in_process_info(tmp_path):
+    filepath = str(tmp_path / "input.exr")
+    _create_exr(filepath)
+
+    info = transcoding.get_oiio_info_for_input(filepath)
+
+    assert info["width"] == 16
+    assert info["height"] == 8
+    assert info["nchannels"] == 5
+    assert info["channelnames"][-1] == "depth.Z"
+    assert info["attribs"]["compression"] == "dwaa"
+    assert info["attribs"]["Copyright"] == "artist"
+
+
+def test_in_process_conversion(tmp_path):
+    filepath = str(tmp_path / "input.exr")
+    output_dir = str(tmp_path / "output")
+    os.makedirs(output_dir)
+    pixels = _create_exr(filepath)
+
+    transcoding.convert_input_paths_for_ffmpeg([filepath], output_dir)
+
+    image_input = oiio.ImageInput.open(
+        os.path.join(output_dir, "input.exr")
+    )
+    spec = image_input.spec()
+    output_pixels = image_input.read_image(spec.format)
+    image_input.close()
+
+    assert tuple(spec.channelnames) == ("R", "G", "B", "A")
+    assert spec.get_string_attribute("compression") == "none"
+    assert spec.get_string_attribute("Copyright") == "artist"
+    # Attribute with unsupported character is erased
+    assert spec.getattribute("comment") is None
+    assert np.array_equal(output_pixels, pixels[..., :4])
@@ -0,0 +1,139 @@
+"""Make ftrack addon importable without loading all OpenPype modules.
+
+OpenPype modules are importable from dynamic 'openpype_modules' package
+which is created by 'load_modules'. That requires connection to settings
+database so the package is created here pointing to modules directory.
+"""
+import os
+import sys
+import types
+
+import pytest
+import pymongo
+
+pytest.importorskip("ftrack_api")
+
+import openpype.modules  # noqa: E402
+
+if "openpype_modules" not in sys.modules:
+    _package = types.ModuleType("openpype_modules")
+    _package.__path__ = [os.path.dirname(openpype.modules.__file__)]
+    sys.modules["openpype_modules"] = _package
+
+
+def _get_value(doc, key):
+    value = doc
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def _matches(doc, query_filter):
+    for key, condition in query_filter.items():
+        value = _get_value(doc, key)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        for operator, expected in condition.items():
+            if operator == "$in" and value not in expected:
+                return False
+            if operator == "$nin" and value in expected:
+                return False
+            if operator == "$lte" and (value is None or value > expected):
+                return False
+    return True
+
+
+class FakeEventsCollection:
+    """Collection of stored ftrack events with methods used by processor.
+
+    Change streams are not available same as on standalone Mongo server.
+    """
+
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+        self.calls = []
+
+    def find(self, query_filter):
+        self.calls.append("find")
+        return _FakeCursor([
+            doc for doc in self.docs if _matches(doc, query_filter)
+        ])
+
+    def update_many(self, query_filter, update):
+        self.calls.append("update_many")
+        for doc in self.docs:
+            if not _matches(doc, query_filter):
+                continue
+            for key, value in update["$set"].items():
+                parts = key.split(".")
+                target = doc
+                for part in parts[:-1]:
+                    target = target.setdefault(part, {})
+                target[parts[-1]] = value
+
+    def delete_many(self, query_filter):
+        self.calls.append("delete_many")
+        self.docs = [
+            doc for doc in self.docs if not _matches(doc, query_filter)
+        ]
+
+    def count_documents(self, query_filter):
+        return len([
+            doc for doc in self.docs if _matches(doc, query_filter)
+        ])
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def watch(self, *args, **kwargs):
+        self.calls.append("watch")
+        raise pymongo.errors.OperationFailure(
+            "The $changeStream stage is only supported on replica sets"
+        )
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, sort_items):
+        for key, direction in reversed(sort_items):
+            self._docs.sort(
+                key=lambda doc: _get_value(doc, key),
+                reverse=direction < 0
+            )
+        return self
+
+    def limit(self, limit):
+        self._docs = self._docs[:limit]
+        return self
+
+    def __iter__(self):
+        return iter(self._docs)
+
+
+@pytest.fixture
+def events_collection():
+    return FakeEventsCollection()
+
+
+class _FakeSocket:
+    def sendall(self, data):
+        pass
+
+
+@pytest.fixture
+def process_hub(events_collection):
+    """Event processor hub using fake collection of stored events."""
+    from openpype_modules.ftrack.ftrack_server.lib import ProcessEventHub
+
+    hub = ProcessEventHub(
+        "https://ftrack.test", "user", "key", sock=_FakeSocket()
+    )
+    hub.dbcon = events_collection
+    hub.prepare_dbcon = lambda: None
+    return hub
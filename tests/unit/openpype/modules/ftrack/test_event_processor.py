@@ -0,0 +1,97 @@
+import time
+import datetime
+
+import ftrack_api
+
+
+def _stored_event(mongo_id, is_processed=False, days_ago=0):
+    stored = datetime.datetime.utcnow() - datetime.timedelta(days=days_ago)
+    return {
+        "_id": mongo_id,
+        "topic": "ftrack.update",
+        "data": {},
+        "source": {},
+        "pype_data": {"is_processed": is_processed, "stored": stored},
+    }
+
+
+def _processed_ids(collection):
+    return sorted(
+        doc["_id"]
+        for doc in collection.docs
+        if doc["pype_data"]["is_processed"]
+    )
+
+
+def test_polling_without_change_streams(process_hub, events_collection):
+    events_collection.docs.append(_stored_event("m1"))
+    handled = []
+    process_hub.subscribe(
+        "topic=ftrack.update",
+        lambda event: handled.append(event["data"]["_event_mongo_id"])
+    )
+    process_hub.poll_interval = 0.01
+
+    process_hub.wait(duration=0.5)
+
+    assert "watch" in events_collection.calls
+    assert process_hub._get_poll_interval() == process_hub.poll_interval
+    assert dict(process_hub.get_status_info())["Events tailing"] == (
+        "polling"
+    )
+    assert handled == ["m1"]
+    assert _processed_ids(events_collection) == ["m1"]
+
+
+def test_acknowledge_when_batch_is_full(process_hub, events_collection):
+    for mongo_id in ("m1", "m2", "m3"):
+        events_collection.docs.append(_stored_event(mongo_id))
+    process_hub.ack_batch_size = 2
+
+    process_hub._on_event_processed("m1")
+    assert "update_many" not in events_collection.calls
+
+    process_hub._on_event_processed("m2")
+    process_hub._on_event_processed("m3")
+    assert events_collection.calls.count("update_many") == 1
+    assert _processed_ids(events_collection) == ["m1", "m2"]
+    assert process_hub._ack_ids == ["m3"]
+
+
+def test_acknowledge_on_shutdown(process_hub, events_collection):
+    events_collection.docs.append(_stored_event("m1"))
+    event = ftrack_api.event.base.Event(
+        topic="ftrack.update", data={"_event_mongo_id": "m1"}
+    )
+    process_hub._event_queue.put(event)
+
+    # Loop ends after first handled event
+    process_hub.wait(duration=0)
+
+    assert _processed_ids(events_collection) == ["m1"]
+    assert process_hub._ack_ids == []
+
+
+def test_cleanup_removes_only_old_processed(process_hub, events_collection):
+    events_collection.docs.extend([
+        _stored_event("old_processed", True, days_ago=10),
+        _stored_event("old_pending", False, days_ago=10),
+        _stored_event("new_processed", True, days_ago=1),
+    ])
+    process_hub.cleanup_interval = 60
+
+    process_hub._start_background_threads()
+    try:
+        timeout = time.time() + 10
+        while (
+            "delete_many" not in events_collection.calls
+            and time.time() < timeout
+        ):
+            time.sleep(0.01)
+    finally:
+        process_hub._stop_background_threads()
+
+    assert "delete_many" in events_collection.calls
+    assert sorted(doc["_id"] for doc in events_collection.docs) == [
+        "new_processed", "old_pending"
+    ]
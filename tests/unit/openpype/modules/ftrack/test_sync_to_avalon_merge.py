@@ -0,0 +1,151 @@
+import types
+import logging
+
+import ftrack_api
+
+from openpype_modules.ftrack.event_handlers_server.event_sync_to_avalon import (  # noqa: E501
+    SyncToAvalonEvent,
+    _apply_set_changes,
+)
+
+
+def _event(*entities, **kwargs):
+    return ftrack_api.event.base.Event(
+        topic="ftrack.update",
+        data={"entities": list(entities)},
+        source={"user": {"username": kwargs.get("user", "john")}}
+    )
+
+
+def _info(ftrack_id, action, changes=None, **kwargs):
+    info = {
+        "entityId": ftrack_id,
+        "action": action,
+        "entityType": "task",
+        "changes": changes or {},
+        "keys": list((changes or {}).keys()),
+    }
+    info.update(kwargs)
+    return info
+
+
+def _merge(events):
+    handler = object.__new__(SyncToAvalonEvent)
+    merged = handler.merge_events(events)
+    return [
+        (info["entityId"], info["action"])
+        for info in merged["data"]["entities"]
+    ], merged
+
+
+def test_merge_updates_of_entity():
+    entities, merged = _merge([
+        _event(_info("e1", "update", {
+            "name": {"old": "a", "new": "b"},
+        })),
+        _event(_info("e1", "update", {
+            "name": {"old": "b", "new": "c"},
+            "fstart": {"old": 1, "new": 2},
+        }), user="jane"),
+    ])
+
+    assert entities == [("e1", "update")]
+    info = merged["data"]["entities"][0]
+    # Oldest old value and latest new value
+    assert info["changes"] == {
+        "name": {"old": "a", "new": "c"},
+        "fstart": {"old": 1, "new": 2},
+    }
+    assert info["keys"] == ["name", "fstart"]
+    # User of last event is used in reports
+    assert merged["source"]["user"]["username"] == "jane"
+
+
+def test_merge_remove_cancels_earlier_actions():
+    entities, _ = _merge([
+        _event(_info("e1", "add"), _info("e2", "update")),
+        _event(_info("e1", "update"), _info("e2", "move")),
+        _event(_info("e1", "remove"), _info("e2", "remove")),
+    ])
+    # Entity created and removed in the window is skipped completely,
+    #   earlier changes of removed entity are dropped
+    assert entities == [("e2", "remove")]
+
+
+def test_merge_keeps_add_after_remove():
+    entities, _ = _merge([
+        _event(_info("e1", "remove")),
+        _event(_info("e1", "add")),
+        _event(_info("e1", "update", {"name": {"old": "a", "new": "b"}})),
+    ])
+    assert entities == [("e1", "remove"), ("e1", "add"), ("e1", "update")]
+
+
+def test_apply_set_changes():
+    doc = {"data": {"tasks": "invalid", "fps": 25}}
+    value = {"compositing": {"type": "Compositing"}}
+    _apply_set_changes(doc, {
+        "name": "sh010",
+        "data.fps": 24,
+        "data.tasks": value,
+        "data.frame.start": 1001,
+    })
+    assert doc == {
+        "name": "sh010",
+        "data": {
+            "fps": 24,
+            "tasks": {"compositing": {"type": "Compositing"}},
+            "frame": {"start": 1001},
+        },
+    }
+    # Cached document does not share values with update
+    value["compositing"]["type"] = "Lighting"
+    assert doc["data"]["tasks"]["compositing"]["type"] == "Compositing"
+
+
+def test_coalesced_events_are_released_after_processing(
+    process_hub, monkeypatch
+):
+    processed = []
+    handler = object.__new__(SyncToAvalonEvent)
+    handler._session = types.SimpleNamespace(
+        event_hub=process_hub,
+        rollback=lambda: None,
+        _local_cache={}
+    )
+    handler._coalesce_enabled = True
+    handler._pending_events = {}
+    handler.log = logging.getLogger("test")
+    monkeypatch.setattr(
+        handler, "process_event",
+        lambda session, event: processed.append(event),
+        raising=False
+    )
+
+    for mongo_id in ("m1", "m2", "m3"):
+        process_hub.dbcon.docs.append({
+            "_id": mongo_id,
+            "topic": "ftrack.update",
+            "data": {},
+            "pype_data": {"is_processed": False, "stored": mongo_id},
+        })
+
+    parents = [{"entityType": "show", "entityId": "p1"}]
+    for mongo_id in ("m1", "m2"):
+        event = _event(_info("e1", "update", parents=parents))
+        event["data"]["_event_mongo_id"] = mongo_id
+        handler.launch(None, event)
+        process_hub._on_event_processed(mongo_id)
+
+    # Collected events are not marked as processed nor loaded again
+    process_hub.acknowledge_events()
+    assert process_hub._ack_ids == []
+    assert processed == []
+    process_hub.load_events()
+    loaded = process_hub._event_queue.get_nowait()
+    assert loaded["data"]["_event_mongo_id"] == "m3"
+    assert process_hub._event_queue.empty()
+
+    handler.flush_pending_events()
+    assert len(processed) == 1
+    assert sorted(process_hub._ack_ids) == ["m1", "m2"]
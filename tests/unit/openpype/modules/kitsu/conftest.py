@@ -0,0 +1,210 @@
+"""Local HTTP stand-in for Zou (Kitsu API).
+
+Implements routes used by project synchronization. Entities can be changed
+while they are fetched to test synchronization of concurrent changes.
+"""
+import json
+import uuid
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+ACCESS_TOKEN = "fake-access-token"
+
+
+class FakeZouState:
+    def __init__(self):
+        self.project_statuses = [
+            {"id": "st1", "name": "Open"},
+            {"id": "st2", "name": "Closed"},
+        ]
+        self.projects = []
+        self.task_types = [
+            {"id": "tt1", "name": "Animation", "short_name": "anim"},
+        ]
+        # Project id -> route name -> entities
+        self.entities = {}
+        self.tasks = []
+        self.users = {"john@example.com": "secret"}
+        self.calls = []
+        self.auth_headers = set()
+        # Callbacks called with route path before response is created
+        self.on_request = []
+        self._lock = threading.Lock()
+
+    def add_project(self, project_id, name, **kwargs):
+        project = {
+            "id": project_id,
+            "name": name,
+            "code": name,
+            "fps": "25",
+            "resolution": "1920x1080",
+            "project_status_id": "st1",
+            "updated_at": "2023-01-01T09:00:00",
+        }
+        project.update(kwargs)
+        self.projects.append(project)
+        self.entities[project_id] = {
+            "assets": [],
+            "asset-types": [],
+            "episodes": [],
+            "sequences": [],
+            "shots": [],
+        }
+        return project
+
+    def add_entity(self, project_id, route, entity):
+        entity.setdefault("project_id", project_id)
+        self.entities[project_id][route].append(entity)
+        return entity
+
+    def add_task(self, entity, task_type, **kwargs):
+        task = {
+            "id": str(uuid.uuid4()),
+            "entity_id": entity["id"],
+            "project_id": entity["project_id"],
+            "task_type_id": task_type["id"],
+            "task_type_name": task_type["name"],
+            "updated_at": entity.get("updated_at"),
+        }
+        task.update(kwargs)
+        self.tasks.append(task)
+        return task
+
+    def find_entity(self, entity_id):
+        for entities_by_route in self.entities.values():
+            for entities in entities_by_route.values():
+                for entity in entities:
+                    if entity["id"] == entity_id:
+                        return entity
+        return None
+
+    def handle(self, method, path, body, headers):
+        for callback in tuple(self.on_request):
+            callback(path)
+
+        with self._lock:
+            self.calls.append((method, path))
+            if path == "auth/login":
+                return self._login(body)
+
+            authorization = headers.get("Authorization")
+            if authorization != "Bearer {}".format(ACCESS_TOKEN):
+                return 401, {"message": "Missing authorization"}
+            self.auth_headers.add(authorization)
+
+            parts = path.split("/")
+            if parts[0] != "data":
+                return 404, {"message": "Not found"}
+            parts = parts[1:]
+
+            if parts == ["project-status"]:
+                return 200, self.project_statuses
+
+            if parts == ["projects"]:
+                return 200, self.projects
+
+            if parts == ["task-types"]:
+                return 200, self.task_types
+
+            if parts[0] == "projects" and len(parts) == 2:
+                for project in self.projects:
+                    if project["id"] == parts[1]:
+                        if method == "PUT":
+                            project.update(body)
+                        return 200, project
+
+            if parts[0] == "projects" and len(parts) == 3:
+                project_id, route = parts[1:]
+                if route == "tasks":
+                    return 200, [
+                        task
+                        for task in self.tasks
+                        if task["project_id"] == project_id
+                    ]
+                if route == "task-types":
+                    return 200, self.task_types
+                entities = self.entities.get(project_id, {}).get(route)
+                if entities is not None:
+                    return 200, entities
+
+            if parts[0] in ("assets", "shots") and parts[2:] == ["tasks"]:
+                return 200, [
+                    task
+                    for task in self.tasks
+                    if task["entity_id"] == parts[1]
+                ]
+
+            if parts[0] == "tasks" and parts[2:] == ["full"]:
+                for task in self.tasks:
+                    if task["id"] == parts[1]:
+                        return 200, task
+
+        return 404, {"message": "Not found"}
+
+    def _login(self, body):
+        email = body.get("email")
+        if not email or "password" not in body:
+            return 400, {"message": "Missing parameters"}
+        if self.users.get(email) != body.get("password"):
+            return 200, {"login": False}
+        return 200, {
+            "login": True,
+            "access_token": ACCESS_TOKEN,
+            "refresh_token": "fake-refresh-token",
+        }
+
+
+def _create_handler(state):
+    class FakeZouHandler(BaseHTTPRequestHandler):
+        def _send(self, status, data):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _handle(self):
+            path = urlparse(self.path).path
+            if not path.startswith("/api/"):
+                self._send(404, b"{}")
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length)
+            status, response = state.handle(
+                self.command,
+                path[len("/api/"):].strip("/"),
+                json.loads(body) if body else {},
+                self.headers
+            )
+            self._send(status, json.dumps(response).encode())
+
+        do_GET = _handle
+        do_POST = _handle
+        do_PUT = _handle
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    return FakeZouHandler
+
+
+@pytest.fixture
+def fake_zou_server():
+    """Running fake Zou with 'base_url' for 'gazu.client.create_client'."""
+    state = FakeZouState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = "http://127.0.0.1:{}/api".format(server.server_port)
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
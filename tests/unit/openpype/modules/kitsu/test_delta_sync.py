@@ -0,0 +1,109 @@
+import gazu
+from bson.objectid import ObjectId
+
+from openpype.modules.kitsu.utils.update_op_with_zou import (
+    get_changed_zou_ids,
+    update_op_assets,
+)
+
+WATERMARK = "2023-01-01T10:00:00"
+OLD = "2023-01-01T09:00:00"
+NEW = "2023-01-01T11:00:00"
+
+
+def _entities():
+    return [
+        {"id": "ep1", "type": "Episode", "name": "ep1", "updated_at": OLD},
+        {
+            "id": "sq1", "type": "Sequence", "name": "sq1",
+            "parent_id": "ep1", "updated_at": OLD
+        },
+        {
+            "id": "sh1", "type": "Shot", "name": "sh1",
+            "parent_id": "sq1", "updated_at": OLD
+        },
+        {
+            "id": "sh2", "type": "Shot", "name": "sh2",
+            "parent_id": "sq1", "updated_at": OLD
+        },
+        {"id": "at1", "type": "AssetType", "name": "chars"},
+        {
+            "id": "as1", "type": "Asset", "name": "hero",
+            "entity_type_id": "at1", "updated_at": OLD
+        },
+    ]
+
+
+def test_changed_ids_without_watermark():
+    entities = _entities()
+    project = {"id": "p", "updated_at": OLD}
+    changed, watermark = get_changed_zou_ids(project, entities, [], None)
+
+    assert changed == {entity["id"] for entity in entities}
+    assert watermark == OLD
+
+
+def test_changed_ids_since_watermark():
+    entities = _entities()
+    project = {"id": "p", "updated_at": OLD}
+    changed, watermark = get_changed_zou_ids(
+        project, entities, [], WATERMARK
+    )
+    assert changed == set()
+    assert watermark == WATERMARK
+
+    # Changed sequence changes names of its shots
+    entities[1]["updated_at"] = NEW
+    tasks = [{"id": "t1", "entity_id": "as1", "updated_at": NEW}]
+    changed, watermark = get_changed_zou_ids(
+        project, entities, tasks, WATERMARK
+    )
+    assert changed == {"sq1", "sh1", "sh2", "as1"}
+    assert watermark == NEW
+
+    # Watermark is not newer than start of synchronization
+    changed, watermark = get_changed_zou_ids(
+        project, entities, tasks, WATERMARK, sync_started=OLD
+    )
+    assert changed == {"sq1", "sh1", "sh2", "as1"}
+    assert watermark == WATERMARK
+    _, watermark = get_changed_zou_ids(
+        project, entities, tasks, None, sync_started=WATERMARK
+    )
+    assert watermark == WATERMARK
+
+    # Project values are defaults of all entities
+    project["updated_at"] = NEW
+    changed, _ = get_changed_zou_ids(project, entities, [], WATERMARK)
+    assert len(changed) == len(entities)
+
+
+def test_update_assets_with_root_folder_ids(monkeypatch):
+    monkeypatch.setattr(
+        gazu.task, "all_tasks_for_shot", lambda item, client=None: []
+    )
+    shots_id = ObjectId()
+    project_doc = {"_id": ObjectId(), "name": "test", "data": {
+        "frameStart": 1001, "frameEnd": 1100, "fps": 25,
+        "resolutionWidth": 1920, "resolutionHeight": 1080,
+        "pixelAspect": 1.0, "handleStart": 0, "handleEnd": 0,
+        "clipIn": 1, "clipOut": 1,
+    }}
+    episode = {"id": "ep1", "type": "Episode", "name": "ep1"}
+    asset_docs = {
+        "ep1": {"_id": ObjectId(), "name": "ep1", "data": {}},
+    }
+    updates = update_op_assets(
+        None,
+        {"resolution": "1920x1080"},
+        project_doc,
+        [episode],
+        asset_docs,
+        {"Assets": ObjectId(), "Shots": shots_id},
+    )
+
+    assert len(updates) == 1
+    doc_id, update = updates[0]
+    assert doc_id == asset_docs["ep1"]["_id"]
+    assert update["$set"]["data"]["visualParent"] == shots_id
+    assert update["$set"]["data"]["parents"] == ["Shots"]
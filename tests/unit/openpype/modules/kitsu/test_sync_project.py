@@ -0,0 +1,205 @@
+import datetime
+import threading
+
+import gazu
+from bson.objectid import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+from openpype.modules.kitsu.utils import update_op_with_zou
+from openpype.modules.kitsu.utils.update_op_with_zou import (
+    SYNC_WATERMARK_KEY,
+    ZOU_DATETIME_FORMAT,
+    sync_all_projects,
+    sync_project_from_kitsu,
+)
+
+
+def _zou_time(seconds_ago=0):
+    return (
+        datetime.datetime.utcnow() - datetime.timedelta(seconds=seconds_ago)
+    ).strftime(ZOU_DATETIME_FORMAT)
+
+
+class FakeProjectDB:
+    """Project and asset documents changed by bulk writes of sync."""
+
+    def __init__(self, project_name):
+        self.Session = {}
+        self.project_doc = {
+            "_id": ObjectId(),
+            "name": project_name,
+            "type": "project",
+            "data": {
+                "frameStart": 1001, "frameEnd": 1100, "fps": 25,
+                "resolutionWidth": 1920, "resolutionHeight": 1080,
+                "pixelAspect": 1.0, "handleStart": 0, "handleEnd": 0,
+                "clipIn": 1, "clipOut": 1,
+            },
+        }
+        self.asset_docs = {}
+        self.updated_ids = []
+
+    def get_project(self, project_name, *args, **kwargs):
+        return self.project_doc
+
+    def get_assets(self, project_name, *args, **kwargs):
+        return list(self.asset_docs.values())
+
+    def get_asset_by_zou_id(self, zou_id):
+        for asset_doc in self.asset_docs.values():
+            if asset_doc["data"].get("zou", {}).get("id") == zou_id:
+                return asset_doc
+        return None
+
+    def bulk_write(self, requests, ordered=True):
+        self.updated_ids = []
+        for request in requests:
+            if isinstance(request, InsertOne):
+                doc = request._doc
+                self.asset_docs[doc["_id"]] = doc
+                continue
+
+            doc_id = request._filter["_id"]
+            if isinstance(request, DeleteOne):
+                self.asset_docs.pop(doc_id)
+                continue
+
+            assert isinstance(request, UpdateOne)
+            if doc_id == self.project_doc["_id"]:
+                doc = self.project_doc
+            else:
+                doc = self.asset_docs[doc_id]
+                self.updated_ids.append(doc_id)
+            for key, value in request._doc["$set"].items():
+                parts = key.split(".")
+                target = doc
+                for part in parts[:-1]:
+                    target = target.setdefault(part, {})
+                target[parts[-1]] = value
+
+
+def _prepare_project(fake_zou_server, monkeypatch):
+    project = fake_zou_server.add_project("p1", "test")
+    fake_zou_server.add_entity("p1", "sequences", {
+        "id": "sq1", "type": "Sequence", "name": "sq010",
+        "updated_at": _zou_time(3600),
+    })
+    fake_zou_server.add_entity("p1", "shots", {
+        "id": "sh1", "type": "Shot", "name": "sh010", "parent_id": "sq1",
+        "nb_frames": 10, "updated_at": _zou_time(3600),
+    })
+    fake_zou_server.add_entity("p1", "shots", {
+        "id": "sh2", "type": "Shot", "name": "sh020", "parent_id": "sq1",
+        "nb_frames": 10, "updated_at": _zou_time(3600),
+    })
+
+    db = FakeProjectDB("test")
+    monkeypatch.setattr(update_op_with_zou, "get_project", db.get_project)
+    monkeypatch.setattr(update_op_with_zou, "get_assets", db.get_assets)
+    return project, db
+
+
+def _create_client(fake_zou_server):
+    client = gazu.client.create_client(fake_zou_server.base_url)
+    gazu.log_in("john@example.com", "secret", client=client)
+    return client
+
+
+def test_sync_project_with_fake_zou(fake_zou_server, monkeypatch):
+    project, db = _prepare_project(fake_zou_server, monkeypatch)
+    client = _create_client(fake_zou_server)
+    task_type = fake_zou_server.task_types[0]
+    shot = fake_zou_server.find_entity("sh1")
+    fake_zou_server.add_task(shot, task_type)
+
+    sync_project_from_kitsu(db, dict(project), client=client)
+
+    names = sorted(doc["name"] for doc in db.asset_docs.values())
+    assert names == ["Assets", "Shots", "sq010", "sq010_sh010", "sq010_sh020"]
+    shot_doc = db.get_asset_by_zou_id("sh1")
+    assert shot_doc["data"]["frameEnd"] == 1010
+    assert list(shot_doc["data"]["tasks"]) == ["Animation"]
+    assert db.project_doc["config"]["tasks"] == {
+        "Animation": {"short_name": "anim"}
+    }
+    # Requests are made only with passed client
+    assert fake_zou_server.auth_headers
+
+    # Nothing changed
+    sync_project_from_kitsu(db, dict(project), client=client)
+    assert db.updated_ids == []
+
+
+def test_sync_change_made_during_fetch(fake_zou_server, monkeypatch):
+    project, db = _prepare_project(fake_zou_server, monkeypatch)
+    client = _create_client(fake_zou_server)
+    sync_project_from_kitsu(db, dict(project), client=client)
+
+    task_type = fake_zou_server.task_types[0]
+    shot = fake_zou_server.find_entity("sh1")
+    other_shot = fake_zou_server.find_entity("sh2")
+
+    def change_during_fetch(path):
+        # Shot is changed after shots were fetched and task of other shot
+        #   is changed after that
+        if path != "data/projects/p1/tasks":
+            return
+        fake_zou_server.on_request.remove(change_during_fetch)
+        shot["nb_frames"] = 20
+        shot["updated_at"] = _zou_time(2)
+        fake_zou_server.add_task(
+            other_shot, task_type, updated_at=_zou_time(1)
+        )
+
+    fake_zou_server.on_request.append(change_during_fetch)
+    sync_project_from_kitsu(db, dict(project), client=client)
+    assert db.get_asset_by_zou_id("sh1")["data"]["frameEnd"] == 1010
+    assert db.get_asset_by_zou_id("sh2")["data"]["tasks"]
+
+    watermark = db.project_doc["data"][SYNC_WATERMARK_KEY]
+    assert watermark < shot["updated_at"]
+
+    sync_project_from_kitsu(db, dict(project), client=client)
+    assert db.get_asset_by_zou_id("sh1")["data"]["frameEnd"] == 1020
+
+
+def test_sync_all_projects_uses_client_per_thread(
+    fake_zou_server, monkeypatch
+):
+    fake_zou_server.add_project("p1", "first")
+    fake_zou_server.add_project("p2", "second")
+    default_client = gazu.client.default_client
+    monkeypatch.setattr(default_client, "host", default_client.host)
+    monkeypatch.setattr(default_client, "tokens", dict(default_client.tokens))
+    monkeypatch.setenv("KITSU_SERVER", fake_zou_server.base_url)
+
+    class FakeAvalonMongoDB:
+        def install(self):
+            pass
+
+    used_clients = {}
+    barrier = threading.Barrier(2, timeout=10)
+
+    def sync_project(dbcon, project, full_sync=False, client=None):
+        # Both projects are synchronized at the same time
+        barrier.wait()
+        gazu.project.all_project_status(client=client)
+        used_clients[project["name"]] = client
+
+    monkeypatch.setattr(
+        update_op_with_zou, "AvalonMongoDB", FakeAvalonMongoDB
+    )
+    monkeypatch.setattr(
+        update_op_with_zou, "sync_project_from_kitsu", sync_project
+    )
+
+    sync_all_projects("john@example.com", "secret", max_workers=2)
+
+    assert sorted(used_clients) == ["first", "second"]
+    first, second = used_clients["first"], used_clients["second"]
+    assert first is not second
+    for client in (first, second):
+        assert client is not default_client
+        assert client.session is not default_client.session
+        assert client.host == fake_zou_server.base_url
+        assert client.tokens == default_client.tokens
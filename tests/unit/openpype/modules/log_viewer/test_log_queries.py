@@ -0,0 +1,45 @@
+from openpype.modules.log_viewer.lib import (
+    get_process_filter,
+    get_process_summaries,
+    get_process_summaries_pipeline,
+)
+
+
+class _Collection:
+    def __init__(self, results):
+        self.results = results
+        self.pipelines = []
+
+    def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        return iter(self.results)
+
+
+def test_process_filter():
+    assert get_process_filter() == {"process_id": {"$nin": [None, ""]}}
+    query_filter = get_process_filter(usernames={"john"}, hostnames=[])
+    assert query_filter["username"] == {"$in": ["john"]}
+    assert query_filter["hostname"] == {"$in": []}
+
+
+def test_process_summaries_pipeline():
+    pipeline = get_process_summaries_pipeline(
+        usernames=["john"], skip=200, limit=201
+    )
+    stages = [list(stage.keys())[0] for stage in pipeline]
+    assert stages == ["$match", "$group", "$sort", "$skip", "$limit"]
+    assert pipeline[0]["$match"]["username"] == {"$in": ["john"]}
+    group = pipeline[1]["$group"]
+    assert group["_id"] == "$process_id"
+    assert group["started"] == {"$min": "$timestamp"}
+    assert "process_id" not in group
+
+    pipeline = get_process_summaries_pipeline()
+    assert len(pipeline) == 3
+
+
+def test_process_summaries():
+    collection = _Collection([{"_id": "abc", "started": 1, "username": "a"}])
+    summaries = get_process_summaries(collection, limit=10)
+    assert summaries == [{"process_id": "abc", "started": 1, "username": "a"}]
+    assert collection.pipelines[0][-1] == {"$limit": 10}
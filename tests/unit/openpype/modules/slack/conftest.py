@@ -0,0 +1,164 @@
+"""Local HTTP stand-in for Slack API.
+
+Implements methods used by Slack outbox worker. Responses of methods can be
+rate limited or can fail with an error to test retries.
+"""
+import json
+import email
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+
+class FakeSlackState:
+    def __init__(self):
+        self.users = [
+            {
+                "id": "U1",
+                "name": "john",
+                "profile": {"display_name": "John", "real_name": "John Doe"},
+            },
+            {
+                "id": "U2",
+                "name": "jane",
+                "profile": {"display_name": "Jane", "real_name": "Jane Doe"},
+            },
+        ]
+        self.groups = [
+            {"id": "S1", "name": "Artists", "handle": "artists"},
+        ]
+        self.users_page_size = 1
+        self.calls = []
+        self.posted = []
+        self.uploaded = []
+        # Method name -> list of (status, headers, body) returned first
+        self.scripted = {}
+        self._lock = threading.Lock()
+
+    def script(self, method, status=200, body=None, headers=None):
+        """Return response for next call of method."""
+        if body is None:
+            body = {"ok": False, "error": "ratelimited"}
+        self.scripted.setdefault(method, []).append(
+            (status, headers or {}, body)
+        )
+
+    def rate_limit(self, method, retry_after=1):
+        self.script(method, 429, headers={"Retry-After": str(retry_after)})
+
+    def fail(self, method, error):
+        self.script(method, 200, body={"ok": False, "error": error})
+
+    def handle(self, method, params):
+        with self._lock:
+            self.calls.append(method)
+            scripted = self.scripted.get(method)
+            if scripted:
+                return scripted.pop(0)
+
+            if method == "users.list":
+                cursor = int(params.get("cursor") or 0)
+                end = cursor + self.users_page_size
+                next_cursor = str(end) if end < len(self.users) else ""
+                return 200, {}, {
+                    "ok": True,
+                    "members": self.users[cursor:end],
+                    "response_metadata": {"next_cursor": next_cursor},
+                }
+
+            if method == "usergroups.list":
+                return 200, {}, {"ok": True, "usergroups": self.groups}
+
+            if method == "files.upload":
+                file_id = "F{}".format(len(self.uploaded) + 1)
+                self.uploaded.append(params.get("filename"))
+                return 200, {}, {"ok": True, "file": {
+                    "id": file_id,
+                    "permalink": "https://slack.test/files/{}".format(
+                        file_id
+                    ),
+                }}
+
+            if method == "chat.postMessage":
+                ts = "{}.000".format(len(self.posted) + 1)
+                self.posted.append({
+                    "channel": params.get("channel"),
+                    "text": params.get("text"),
+                    "ts": ts,
+                })
+                return 200, {}, {"ok": True, "ts": ts}
+
+        return 404, {}, {"ok": False, "error": "unknown_method"}
+
+
+def _parse_body(content_type, body):
+    if not body:
+        return {}
+    if content_type.startswith("application/json"):
+        return json.loads(body)
+    if content_type.startswith("multipart/form-data"):
+        message = email.message_from_bytes(
+            b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+        )
+        output = {}
+        for part in message.get_payload():
+            name = part.get_param("name", header="content-disposition")
+            if name == "file":
+                output.setdefault("filename", part.get_filename())
+            else:
+                output[name] = part.get_payload(decode=True).decode()
+        return output
+    return {
+        key: values[0]
+        for key, values in parse_qs(body.decode()).items()
+    }
+
+
+def _create_handler(state):
+    class FakeSlackHandler(BaseHTTPRequestHandler):
+        def _handle(self):
+            parsed = urlparse(self.path)
+            method = parsed.path.rsplit("/", 1)[-1]
+            params = {
+                key: values[0]
+                for key, values in parse_qs(parsed.query).items()
+            }
+            length = int(self.headers.get("Content-Length") or 0)
+            params.update(_parse_body(
+                self.headers.get("Content-Type") or "",
+                self.rfile.read(length)
+            ))
+            status, headers, body = state.handle(method, params)
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = _handle
+        do_POST = _handle
+
+        def log_message(self, *args):
+            pass
+
+    return FakeSlackHandler
+
+
+@pytest.fixture
+def fake_slack_server():
+    """Running fake Slack API with 'base_url' for 'slack_sdk.WebClient'."""
+    state = FakeSlackState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = "http://127.0.0.1:{}/api/".format(server.server_port)
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
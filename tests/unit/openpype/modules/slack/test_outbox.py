@@ -0,0 +1,117 @@
+import time
+
+from openpype.modules.slack.outbox import SlackOutbox
+from openpype.modules.slack.delivery import (
+    SlackDirectoryCache,
+    SlackOutboxWorker,
+)
+
+
+def _create_worker(outbox, fake_slack_server, delivered):
+    worker = SlackOutboxWorker(
+        outbox,
+        base_url=fake_slack_server.base_url,
+        on_delivered=lambda *args: delivered.append(args),
+    )
+    worker.retry_delay = 0
+    return worker
+
+
+def test_outbox_claim_and_release(tmp_path):
+    outbox = SlackOutbox(str(tmp_path))
+    first_id = outbox.enqueue("token", "#a", "first")
+    outbox.enqueue("token", "#b", "second")
+    assert outbox.get_pending_count() == 2
+
+    claimed = outbox.claim_due(limit=1)
+    assert [message["id"] for message in claimed] == [first_id]
+    # Claimed message is not claimed again
+    assert [m["message"] for m in outbox.claim_due()] == ["second"]
+    assert outbox.claim_due() == []
+
+    outbox.release(claimed[0], delay=60, error="timeout")
+    assert outbox.get_pending_count() == 1
+    assert outbox.claim_due() == []
+    released = outbox.claim_due(now=time.time() + 61)
+    assert released[0]["attempts"] == 1
+    assert released[0]["last_error"] == "timeout"
+
+    outbox.fail(released[0], "channel_not_found")
+    assert [m["id"] for m in outbox.get_failed_messages()] == [first_id]
+
+
+def test_deliver_messages(tmp_path, fake_slack_server):
+    review_path = tmp_path / "review.mp4"
+    review_path.write_bytes(b"review")
+    outbox = SlackOutbox(str(tmp_path / "outbox"))
+    outbox.enqueue("token", "#review", "Published @john", [str(review_path)])
+    outbox.enqueue("token", "#review", "Ping @artists", project="prj")
+
+    delivered = []
+    worker = _create_worker(outbox, fake_slack_server, delivered)
+    assert worker.process_due() == 2
+    assert outbox.get_pending_count() == 0
+
+    first, second = fake_slack_server.posted
+    assert first["text"].startswith("Published <@U1>")
+    assert "<https://slack.test/files/F1|review.mp4>" in first["text"]
+    assert second["text"] == "Ping <!subteam^S1>"
+    assert fake_slack_server.uploaded == ["review.mp4"]
+    assert [(msg_id, file_ids) for _, msg_id, file_ids in delivered] == [
+        ("1.000", ["F1"]), ("2.000", [])
+    ]
+    # Users are paginated and fetched only once for both messages
+    assert fake_slack_server.calls.count("users.list") == 2
+    assert fake_slack_server.calls.count("usergroups.list") == 1
+
+
+def test_rate_limit_and_retries(tmp_path, fake_slack_server):
+    review_path = tmp_path / "review.mp4"
+    review_path.write_bytes(b"review")
+    outbox = SlackOutbox(str(tmp_path / "outbox"))
+    outbox.enqueue("token", "#review", "first", [str(review_path)])
+    outbox.enqueue("token", "#review", "second")
+    outbox.enqueue("other", "#missing", "third")
+
+    fake_slack_server.rate_limit("chat.postMessage", retry_after=30)
+    fake_slack_server.fail("chat.postMessage", "channel_not_found")
+    delivered = []
+    worker = _create_worker(outbox, fake_slack_server, delivered)
+    assert worker.process_due() == 0
+
+    # Rate limited token is postponed without counting attempts,
+    #   message with unknown channel failed
+    assert outbox.get_pending_count() == 2
+    assert [m["message"] for m in outbox.get_failed_messages()] == ["third"]
+    assert outbox.claim_due() == []
+
+    messages = outbox.claim_due(now=time.time() + 31)
+    assert [m["attempts"] for m in messages] == [0, 0]
+    for message in messages:
+        outbox.release(message, count_attempt=False)
+
+    # Transient error is retried and uploaded file is not uploaded again
+    fake_slack_server.fail("chat.postMessage", "internal_error")
+    worker._blocked_until.clear()
+    assert worker.process_due() == 2
+    assert fake_slack_server.uploaded == ["review.mp4"]
+    assert [p["text"].split("\n")[0] for p in fake_slack_server.posted] == [
+        "second", "first"
+    ]
+
+
+def test_directory_cache_ttl():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return ["user"], ["group"]
+
+    cache = SlackDirectoryCache(ttl=60)
+    assert cache.get("token", fetch) == (["user"], ["group"])
+    assert cache.get("token", fetch) == (["user"], ["group"])
+    assert len(calls) == 1
+
+    cache.ttl = 0
+    cache.get("token", fetch)
+    assert len(calls) == 2
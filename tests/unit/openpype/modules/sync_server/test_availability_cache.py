@@ -0,0 +1,91 @@
+import threading
+
+from openpype.modules.sync_server.availability import (
+    SiteAvailabilityCache,
+    AvailabilityPrefetcher,
+)
+
+
+def test_cache_lifetime_and_stats():
+    cache = SiteAvailabilityCache(lifetime=60)
+    cache.update("prj", "local", "studio", {"v1": (1, 2), "v2": (0, 2)})
+
+    cached, missing = cache.get("prj", "local", "studio", ["v1", "v2", "v3"])
+    assert cached == {"v1": (1, 2), "v2": (0, 2)}
+    assert missing == {"v3"}
+
+    # Other pair of sites is cached separately
+    cached, missing = cache.get("prj", "local", "gdrive", ["v1"])
+    assert cached == {}
+    assert missing == {"v1"}
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+    assert stats["hit_rate"] == 0.5
+
+    cache.lifetime = -1
+    assert cache.get("prj", "local", "studio", ["v1"])[1] == {"v1"}
+
+    cache.invalidate("prj", ["v1"])
+    assert cache.get_stats()["size"] == 1
+
+
+def test_cache_max_items():
+    cache = SiteAvailabilityCache(max_items=2)
+    cache.update("prj", "local", "studio", {"v1": 1, "v2": 2})
+    cache.update("prj", "local", "studio", {"v3": 3})
+    cached, missing = cache.get("prj", "local", "studio", ["v1", "v2", "v3"])
+    assert cached == {"v2": 2, "v3": 3}
+    assert missing == {"v1"}
+
+
+def test_prefetcher_batches():
+    queried = []
+    received = []
+    done = threading.Event()
+    started = threading.Event()
+    gate = threading.Event()
+
+    def fetch(project_name, version_ids, active_site, remote_site):
+        started.set()
+        gate.wait(10)
+        queried.append(list(version_ids))
+        return {
+            version_id: (1, 1)
+            for version_id in version_ids
+            if version_id != "v0"
+        }
+
+    def callback(project_name, active_site, remote_site, values):
+        received.append(values)
+        if sum(len(item) for item in received) == 5:
+            done.set()
+
+    cache = SiteAvailabilityCache()
+    prefetcher = AvailabilityPrefetcher(
+        fetch,
+        callback,
+        cache=cache,
+        batch_size=2,
+        delay=0,
+        default_factory=tuple
+    )
+    try:
+        assert prefetcher.request("prj", "local", "studio", ["v0"]) == {}
+        assert started.wait(10)
+        # First batch is waiting in 'fetch', next requests are collected
+        for version_id in ("v1", "v2", "v3", "v4"):
+            prefetcher.request("prj", "local", "studio", [version_id])
+        gate.set()
+        assert done.wait(10)
+    finally:
+        prefetcher.stop()
+
+    # Last requested versions are queried first
+    assert queried == [["v0"], ["v4", "v3"], ["v2", "v1"]]
+    assert received[0] == {"v0": ()}
+
+    assert prefetcher.request(
+        "prj", "local", "studio", ["v0", "v1", "v4"]
+    ) == {"v0": (), "v1": (1, 1), "v4": (1, 1)}
+    assert cache.get_stats()["hits"] == 3
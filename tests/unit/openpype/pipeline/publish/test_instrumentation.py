@@ -0,0 +1,97 @@
+import json
+import subprocess
+import sys
+
+import pyblish.api
+import pyblish.plugin
+import pyblish.util
+
+from openpype.pipeline.publish import (
+    publish_instrumentation,
+    write_publish_report,
+    get_plugin_timings,
+    format_plugin_timings,
+)
+
+
+class CollectInstances(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+
+    def process(self, context):
+        for name in ("instance_a", "instance_b"):
+            instance = context.create_instance(name)
+            instance.data["family"] = "test"
+            instance.data["label"] = name.upper()
+
+
+class ExtractSubprocess(pyblish.api.InstancePlugin):
+    label = "Extract Subprocess"
+    order = pyblish.api.ExtractorOrder
+    families = ["test"]
+
+    def process(self, instance):
+        subprocess.check_call([
+            sys.executable, "-c", "sum(range(1000000))"
+        ])
+
+
+def test_publish_report_metrics(tmp_path):
+    original_process = pyblish.plugin.process
+    plugins = [CollectInstances, ExtractSubprocess]
+    context = pyblish.api.Context()
+    with publish_instrumentation():
+        assert pyblish.plugin.process is not original_process
+        for result in pyblish.util.publish_iter(context, plugins):
+            assert result["error"] is None
+    assert pyblish.plugin.process is original_process
+
+    report_path = str(tmp_path / "report.json")
+    assert write_publish_report(context, report_path) == report_path
+    with open(report_path, "r") as stream:
+        report = json.load(stream)
+
+    assert len(report["instances"]) == 2
+    timings = get_plugin_timings(report)
+    assert [summary["name"] for summary in timings] == [
+        "ExtractSubprocess", "CollectInstances"
+    ]
+    extract_timings = timings[0]
+    assert extract_timings["count"] == 2
+    assert extract_timings["wall_time"] > 0
+    assert {
+        metrics["label"] for metrics in extract_timings["instances"]
+    } == {"INSTANCE_A", "INSTANCE_B"}
+    if extract_timings["subprocess_time"] is not None:
+        assert extract_timings["subprocess_time"] > 0
+
+    table = format_plugin_timings(timings, top=1, with_instances=True)
+    lines = table.splitlines()
+    assert len(lines) == 4
+    assert lines[1].startswith("Extract Subprocess")
+
+
+def test_timings_without_metrics():
+    report = {
+        "plugins_data": [
+            {
+                "name": "Fast",
+                "instances_data": [{"id": None, "process_time": 5}],
+            },
+            {
+                "name": "Slow",
+                "instances_data": [
+                    {"id": "a", "process_time": 10},
+                    {"id": "b", "process_time": 20},
+                ],
+            },
+            {"name": "Skipped", "instances_data": []},
+        ],
+        "instances": {"a": {"label": "A"}},
+    }
+    timings = get_plugin_timings(report)
+
+    assert [summary["name"] for summary in timings] == ["Slow", "Fast"]
+    assert timings[0]["wall_time"] == 30
+    assert timings[0]["cpu_time"] is None
+    assert [item["label"] for item in timings[0]["instances"]] == ["b", "A"]
+    assert timings[1]["instances"][0]["label"] == "Context"
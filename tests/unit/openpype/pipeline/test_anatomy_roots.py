@@ -0,0 +1,72 @@
+import pytest
+
+from openpype.pipeline.anatomy import Roots
+
+
+class FakeAnatomy(dict):
+    project_name = "test_project"
+
+
+ROOTS_DATA = {
+    "work": {
+        "windows": "P:/Projects/Work/",
+        "linux": "/mnt/share/projects/work",
+        "darwin": "/Volumes/projects/work"
+    },
+    "publish": {
+        "windows": "P:\\Projects\\Publish",
+        "linux": "/mnt/share/projects/publish",
+        "darwin": ""
+    }
+}
+
+
+@pytest.fixture
+def roots():
+    return Roots(FakeAnatomy(roots=ROOTS_DATA))
+
+
+def test_find_root_templates(roots):
+    paths = [
+        "p:\\projects\\work\\shot\\file.ma",
+        "/mnt/share/projects/publish/shot/v001/file.exr",
+        "/Volumes/projects/work/shot/file.ma",
+        # Only windows roots are case insensitive
+        "/MNT/share/projects/work/file.ma",
+        "/tmp/file.ma",
+    ]
+    assert roots.find_root_templates(paths) == [
+        (True, "{root[work]}/shot/file.ma"),
+        (True, "{root[publish]}/shot/v001/file.exr"),
+        (True, "{root[work]}/shot/file.ma"),
+        (False, "/MNT/share/projects/work/file.ma"),
+        (False, "/tmp/file.ma"),
+    ]
+
+
+def test_find_root_template_matches_root_item(roots):
+    paths = [
+        "P:/Projects/Publish/asset/file.abc",
+        "/mnt/share/projects/work/asset/file.abc",
+        "C:/asset/file.abc",
+    ]
+    for path in paths:
+        expected = (False, path)
+        for root_item in roots.roots.values():
+            success, result = root_item.find_root_template_from_path(path)
+            if success:
+                expected = (success, result)
+                break
+        assert roots.find_root_template_from_path(path) == expected
+
+
+def test_root_prefixes_cache_reset(roots):
+    assert roots.find_root_template_from_path("/mnt/other/file.ma")[0] is False
+
+    roots.anatomy["roots"] = {
+        "work": {"windows": "", "linux": "/mnt/other", "darwin": ""}
+    }
+    roots.reset()
+    assert roots.find_root_template_from_path("/mnt/other/file.ma") == (
+        True, "{root[work]}/file.ma"
+    )
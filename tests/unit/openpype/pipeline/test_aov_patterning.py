@@ -0,0 +1,48 @@
+import clique
+
+from openpype.pipeline.farm.patterning import (
+    AOVPatternMatcher,
+    get_aov_matcher,
+    match_aov_pattern,
+)
+
+AOV_FILTER = {
+    "maya": [r".*([Bb]eauty).*", r".*_(?P<aov>diffuse)_.*"],
+    "nuke": [r".*"],
+}
+
+
+def test_match_aov_pattern():
+    assert match_aov_pattern("maya", AOV_FILTER, "sh010_beauty.1001.exr")
+    assert match_aov_pattern("maya", AOV_FILTER, "sh010_diffuse_.1001.exr")
+    assert not match_aov_pattern("maya", AOV_FILTER, "sh010_spec.1001.exr")
+    assert not match_aov_pattern("houdini", AOV_FILTER, "beauty.1001.exr")
+    assert get_aov_matcher("maya", AOV_FILTER) is get_aov_matcher(
+        "maya", dict(AOV_FILTER))
+
+
+def test_patterns_with_backreference():
+    matcher = AOVPatternMatcher([r"(\w)\1_beauty", r"(a)(b)\2"])
+    assert matcher.match("xx_beauty.exr")
+    assert matcher.match("abb.exr")
+    assert not matcher.match("xy_beauty.exr")
+
+
+def test_match_files_and_collections():
+    matcher = get_aov_matcher("maya", AOV_FILTER)
+    files = [
+        "/render/sh010_beauty.{:04d}.exr".format(frame)
+        for frame in range(1001, 1011)
+    ] + [
+        "/render/sh010_spec.{:04d}.exr".format(frame)
+        for frame in range(1001, 1011)
+    ] + ["/render/sh010_Beauty.mov"]
+
+    results = matcher.match_files(files)
+    assert sum(results.values()) == 11
+
+    collections, _ = clique.assemble(files)
+    assert sorted(
+        matcher.match_collection(collection)
+        for collection in collections
+    ) == [False, True]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for delivery plan."""
+import os
+
+from openpype.pipeline.delivery import DeliveryPlan
+
+
+def _create_files(dirpath, filenames):
+    filepaths = []
+    for filename in filenames:
+        filepath = os.path.join(str(dirpath), filename)
+        with open(filepath, "w") as stream:
+            stream.write(filename)
+        filepaths.append(filepath)
+    return filepaths
+
+
+def test_delivery_plan_deduplicates_and_detects_collisions(tmp_path):
+    src_1, src_2 = _create_files(tmp_path, ["a.exr", "b.exr"])
+    dst = os.path.join(str(tmp_path), "delivery", "a.exr")
+
+    plan = DeliveryPlan()
+    assert plan.add(src_1, dst)
+    assert plan.add(src_1, dst)
+    assert not plan.add(src_2, dst)
+
+    assert len(plan) == 1
+    assert plan.items == [(os.path.normpath(src_1), os.path.normpath(dst))]
+
+
+def test_delivery_plan_keeps_destination_case(tmp_path, monkeypatch):
+    # Case insensitive platform
+    monkeypatch.setattr(os.path, "normcase", lambda path: path.lower())
+    src_1, src_2 = _create_files(tmp_path, ["a.exr", "b.exr"])
+    dst = os.path.join(str(tmp_path), "Delivery", "Shot_A.exr")
+
+    plan = DeliveryPlan()
+    assert plan.add(src_1, dst)
+    assert plan.add(src_1, dst.upper())
+    assert not plan.add(src_2, dst.lower())
+
+    assert len(plan) == 1
+    assert plan.items == [(os.path.normpath(src_1), os.path.normpath(dst))]
+
+
+def test_delivery_plan_execute(tmp_path):
+    filenames = ["shot.{:04d}.exr".format(idx) for idx in range(1001, 1011)]
+    src_paths = _create_files(tmp_path, filenames)
+    dst_dir = os.path.join(str(tmp_path), "delivery", "sub")
+
+    plan = DeliveryPlan()
+    for src_path, filename in zip(src_paths, filenames):
+        plan.add(src_path, os.path.join(dst_dir, filename))
+
+    progress = []
+    report_items, delivered = plan.execute(
+        max_workers=4,
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    assert not report_items
+    assert delivered == 10
+    assert sorted(os.listdir(dst_dir)) == filenames
+    assert progress[-1] == (10, 10)
+
+
+def test_delivery_plan_dry_run(tmp_path):
+    src_path = _create_files(tmp_path, ["a.exr"])[0]
+    dst_dir = os.path.join(str(tmp_path), "delivery")
+
+    plan = DeliveryPlan()
+    plan.add(src_path, os.path.join(dst_dir, "a.exr"))
+    _, delivered = plan.execute(dry_run=True)
+
+    assert delivered == 1
+    assert not os.path.exists(dst_dir)
@@ -0,0 +1,68 @@
+import json
+
+from openpype.pipeline.farm.expected_files import (
+    compact_files,
+    expand_files,
+    is_compact_files,
+    compact_publish_metadata,
+)
+
+
+def _sequence(head, frames, padding=4, tail=".exr"):
+    return [
+        "{}{:0{}d}{}".format(head, frame, padding, tail)
+        for frame in frames
+    ]
+
+
+def test_compact_files():
+    frames = list(range(1001, 1101)) + list(range(1200, 1300, 5)) + [1500]
+    files = _sequence("sh010_beauty.", frames)
+    compact = compact_files(files)
+
+    assert is_compact_files(compact)
+    assert compact["ranges"] == [
+        [1001, 1100, 1], [1200, 1295, 5], [1500, 1500, 1]
+    ]
+    assert expand_files(compact) == files
+
+
+def test_files_kept_unchanged():
+    single_file = "sh010_beauty.mov"
+    assert compact_files(single_file) == single_file
+    assert compact_files([single_file]) == [single_file]
+
+    # multiple sequences and remainders
+    files = _sequence("a.", range(1, 5)) + _sequence("b.", range(1, 5))
+    assert compact_files(files) == files
+    files = _sequence("a.", range(1, 5)) + ["a.mov"]
+    assert compact_files(files) == files
+
+    # negative frames would be expanded with different padding
+    files = _sequence("a.", range(-3, 3))
+    assert expand_files(compact_files(files)) == files
+
+    # old metadata contain explicit lists
+    assert expand_files(files) is files
+
+
+def test_compact_publish_metadata():
+    files = _sequence("sh010_beauty.", range(1001, 11001))
+    repre = {"name": "exr", "files": files}
+    publish_job = {
+        "asset": "sh010",
+        "instances": [
+            {"subset": "renderMain", "representations": [repre]},
+            {"subset": "renderEmpty"},
+        ]
+    }
+    compacted = compact_publish_metadata(publish_job)
+
+    # source data are not modified
+    assert repre["files"] is files
+    assert len(json.dumps(compacted)) * 100 < len(json.dumps(publish_job))
+
+    loaded = json.loads(json.dumps(compacted))
+    loaded_repre = loaded["instances"][0]["representations"][0]
+    assert expand_files(loaded_repre["files"]) == files
+    assert loaded["instances"][1] == {"subset": "renderEmpty"}
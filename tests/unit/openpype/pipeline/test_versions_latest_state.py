@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached latest state of versions."""
+from openpype.pipeline.load import utils
+
+
+def test_versions_latest_state_cache(monkeypatch):
+    queried = []
+
+    def get_versions_latest_state(project_name, version_ids):
+        queried.append(set(version_ids))
+        return {
+            version_id: {"is_latest": version_id == "v2"}
+            for version_id in version_ids
+            if version_id != "missing"
+        }
+
+    monkeypatch.setattr(
+        utils, "get_versions_latest_state", get_versions_latest_state
+    )
+    utils.invalidate_versions_latest_state()
+
+    states = utils.get_cached_versions_latest_state(
+        "prj", ["v1", "v2", "missing"]
+    )
+    assert states == {"v1": {"is_latest": False}, "v2": {"is_latest": True}}
+
+    # Only versions which are not cached are queried
+    utils.get_cached_versions_latest_state("prj", ["v1", "v2", "v3"])
+    utils.get_cached_versions_latest_state("prj", ["v1", "v3"])
+    assert queried == [{"v1", "v2", "missing"}, {"v3"}]
+
+    # Other project is not affected by invalidation
+    utils.get_cached_versions_latest_state("other", ["v1"])
+    utils.invalidate_versions_latest_state("prj")
+    utils.get_cached_versions_latest_state("prj", ["v1"])
+    utils.get_cached_versions_latest_state("other", ["v1"])
+    assert queried[2:] == [{"v1"}, {"v1"}]
+
+    monkeypatch.setattr(utils._VersionsStateCache, "lifetime", -1)
+    utils.get_cached_versions_latest_state("prj", ["v1"])
+    assert len(queried) == 5
+    utils.invalidate_versions_latest_state()
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from openpype.plugins.publish.integrate_hero_version import (
+    IntegrateHeroVersion
+)
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as stream:
+        stream.write(content)
+
+
+def _read(path):
+    with open(path, "r") as stream:
+        return stream.read()
+
+
+@pytest.fixture
+def publish_dirs(tmp_path):
+    version_dir = os.path.join(str(tmp_path), "publish", "v001")
+    hero_dir = os.path.join(str(tmp_path), "publish", "hero")
+    src_paths = []
+    for idx in range(20):
+        src_path = os.path.join(version_dir, "file.{:04d}.exr".format(idx))
+        _write(src_path, str(idx))
+        src_paths.append(src_path)
+
+    _write(os.path.join(hero_dir, "old_file.exr"), "old")
+    return src_paths, hero_dir
+
+
+def test_stage_and_swap_hero_dir(publish_dirs):
+    src_paths, hero_dir = publish_dirs
+    plugin = IntegrateHeroVersion()
+
+    staging_dir = plugin.get_staging_dir(hero_dir)
+    file_pairs = [
+        (src_path, os.path.join(hero_dir, "resources", os.path.basename(
+            src_path
+        )))
+        for src_path in src_paths
+    ]
+    # Duplicated destination is transferred only once
+    file_pairs.append(file_pairs[0])
+    transfers = plugin.prepare_transfers(hero_dir, staging_dir, file_pairs)
+    assert len(transfers) == len(src_paths)
+    assert all(
+        dst_path.startswith(staging_dir)
+        for _, dst_path in transfers
+    )
+
+    plugin.transfer_files(transfers)
+    # Current hero files are untouched until swap
+    assert os.listdir(hero_dir) == ["old_file.exr"]
+
+    backup_dir = hero_dir + ".BACKUP"
+    plugin.swap_hero_dir(hero_dir, staging_dir, backup_dir)
+
+    assert not os.path.exists(staging_dir)
+    assert os.listdir(backup_dir) == ["old_file.exr"]
+    for idx, src_path in enumerate(src_paths):
+        dst_path = os.path.join(
+            hero_dir, "resources", os.path.basename(src_path)
+        )
+        assert _read(dst_path) == str(idx)
+
+
+def test_transfer_file_fallback(publish_dirs):
+    src_paths, hero_dir = publish_dirs
+    plugin = IntegrateHeroVersion()
+
+    dst_path = os.path.join(hero_dir, "copied.exr")
+    mode = plugin._transfer_file(
+        src_paths[0], dst_path, {"reflink", "hardlink"}
+    )
+    assert mode == "copy"
+    assert _read(dst_path) == "0"
+    assert os.stat(dst_path).st_ino != os.stat(src_paths[0]).st_ino
@@ -0,0 +1,173 @@
+import os
+import types
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qtpy import QtWidgets  # noqa: E402
+
+from openpype.tools.loader import model as loader_model  # noqa: E402
+from openpype.tools.utils.lib import GroupsConfig  # noqa: E402
+
+PROJECT_NAME = "test_project"
+ASSET_ID = "asset_id"
+
+
+class FakeDbcon:
+    Session = {"AVALON_PROJECT": PROJECT_NAME}
+
+    def active_project(self):
+        return PROJECT_NAME
+
+
+class FakeFamilyConfigCache:
+    def family_config(self, family_name):
+        return {}
+
+
+class FakeDatabase:
+    """Subsets with one version each returned by patched client functions."""
+
+    def __init__(self, subset_names):
+        self.set_subsets(subset_names)
+        self.last_versions_calls = []
+        self.on_last_versions = None
+
+    def set_subsets(self, subset_names):
+        self.subset_docs = [
+            {
+                "_id": "subset_{}".format(name),
+                "name": name,
+                "parent": ASSET_ID,
+                "schema": "openpype:subset-3.0",
+                "data": {"families": ["render"]},
+            }
+            for name in subset_names
+        ]
+
+    def get_assets(self, project_name, asset_ids=None, fields=None):
+        return [{"_id": ASSET_ID, "name": "sh010"}]
+
+    def get_subsets(self, project_name, asset_ids=None, fields=None):
+        return list(self.subset_docs)
+
+    def get_last_versions(self, project_name, subset_ids, **kwargs):
+        self.last_versions_calls.append(list(subset_ids))
+        if self.on_last_versions is not None:
+            self.on_last_versions()
+        return {
+            subset_id: {
+                "_id": "version_{}".format(subset_id),
+                "parent": subset_id,
+                "name": 1,
+                "type": "version",
+                "data": {},
+            }
+            for subset_id in subset_ids
+        }
+
+
+@pytest.fixture
+def qt_app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase(["a", "b", "c", "d", "e"])
+    monkeypatch.setattr(loader_model, "registered_host", lambda: None)
+    monkeypatch.setattr(
+        loader_model,
+        "ModulesManager",
+        lambda: types.SimpleNamespace(modules_by_name={})
+    )
+    monkeypatch.setattr(loader_model, "get_assets", database.get_assets)
+    monkeypatch.setattr(loader_model, "get_subsets", database.get_subsets)
+    monkeypatch.setattr(
+        loader_model, "get_last_versions", database.get_last_versions
+    )
+    monkeypatch.setattr(
+        loader_model, "get_hero_versions", lambda *args, **kwargs: []
+    )
+    return database
+
+
+@pytest.fixture
+def subsets_model(qt_app, database):
+    dbcon = FakeDbcon()
+    model = loader_model.SubsetsModel(
+        dbcon, GroupsConfig(dbcon), FakeFamilyConfigCache(), grouping=False
+    )
+    model.fetch_page_size = 2
+    model.fetch_more_count = 2
+    model._asset_ids = [ASSET_ID]
+    return model
+
+
+def _fetch(model):
+    """Start new fetch and run it in current thread."""
+    model.stop_fetch_thread()
+    model._fetch(model._fetch_id)
+
+
+def _subset_names(model):
+    return [
+        model.index(row, 0).internalPointer()["subset"]
+        for row in range(model.rowCount())
+    ]
+
+
+def test_rows_are_created_in_pages(subsets_model, database):
+    _fetch(subsets_model)
+
+    # Versions are queried in pages of subset ids
+    assert [len(ids) for ids in database.last_versions_calls] == [2, 2, 1]
+    assert _subset_names(subsets_model) == ["a", "b"]
+
+    root = loader_model.QtCore.QModelIndex()
+    assert subsets_model.canFetchMore(root)
+    subsets_model.fetchMore(root)
+    subsets_model.fetchMore(root)
+    assert _subset_names(subsets_model) == ["a", "b", "c", "d", "e"]
+    assert not subsets_model.canFetchMore(root)
+
+
+def test_stale_fetch_stops_between_pages(subsets_model, database):
+    refreshed = []
+    subsets_model.refreshed.connect(refreshed.append)
+    # Refresh started while first page of versions is queried
+    database.on_last_versions = subsets_model.stop_fetch_thread
+
+    _fetch(subsets_model)
+
+    assert len(database.last_versions_calls) == 1
+    assert refreshed == []
+    assert _subset_names(subsets_model) == []
+
+
+def test_stale_payload_does_not_replace_newer(subsets_model, database):
+    payloads = []
+    subsets_model.doc_fetched.connect(payloads.append)
+    _fetch(subsets_model)
+    stale_payload = payloads[-1]
+
+    database.set_subsets(["new"])
+    _fetch(subsets_model)
+    assert _subset_names(subsets_model) == ["new"]
+
+    # Result of previous fetch is delivered after result of newer fetch
+    refreshed = []
+    subsets_model.refreshed.connect(refreshed.append)
+    subsets_model.doc_fetched.emit(stale_payload)
+
+    assert refreshed == []
+    assert _subset_names(subsets_model) == ["new"]
+    assert subsets_model.get_subsets_families() == {"render"}
+
+    # Grouping change fills items from accepted payload
+    subsets_model.set_grouping(True)
+    assert _subset_names(subsets_model) == ["new"]
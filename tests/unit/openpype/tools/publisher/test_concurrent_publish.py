@@ -0,0 +1,191 @@
+import threading
+import time
+
+import pyblish.api
+
+from openpype.tools.publisher.concurrent_publish import (
+    ConcurrentPublishGroup,
+    get_parallel_plugins_group,
+    is_plugin_parallel_safe,
+)
+from openpype.tools.publisher.control import PublishReportMaker
+
+
+class _Barrier:
+    """Plugins wait until all instances are processed at once."""
+
+    barrier = None
+
+
+class ExtractFirst(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    parallel_safe = True
+
+    def process(self, instance):
+        # Fails with timeout if instances are not processed concurrently
+        _Barrier.barrier.wait(5)
+        self.log.info("first {}".format(instance.data["name"]))
+        instance.data["order"] = ["first"]
+
+
+class ExtractSecond(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    parallel_safe = True
+
+    def process(self, instance):
+        if instance.data["name"] == "broken":
+            raise ValueError("Broken instance")
+        time.sleep(0.01)
+        self.log.info("second {}".format(instance.data["name"]))
+        instance.data["order"].append("second")
+
+
+class ExtractLast(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    parallel_safe = True
+
+    def process(self, instance):
+        instance.data["order"].append("last")
+
+
+def test_is_plugin_parallel_safe():
+    class ContextPlugin(pyblish.api.ContextPlugin):
+        parallel_safe = True
+
+    class HostPlugin(pyblish.api.InstancePlugin):
+        pass
+
+    # Implicit plugins get arguments injected by pyblish
+    class ImplicitPlugin(pyblish.api.Extractor):
+        parallel_safe = True
+
+        def process(self, context, instance):
+            pass
+
+    assert is_plugin_parallel_safe(ExtractFirst)
+    assert not is_plugin_parallel_safe(ContextPlugin)
+    assert not is_plugin_parallel_safe(HostPlugin)
+    assert ImplicitPlugin.__instanceEnabled__
+    assert not is_plugin_parallel_safe(ImplicitPlugin)
+
+
+def test_extract_review_and_burnin_are_grouped():
+    from openpype.plugins.publish.extract_review import ExtractReview
+    from openpype.plugins.publish.extract_burnin import ExtractBurnin
+    from openpype.plugins.publish.extract_review_slate import (
+        ExtractReviewSlate
+    )
+
+    class IntegrateAsset(pyblish.api.InstancePlugin):
+        order = pyblish.api.IntegratorOrder
+        parallel_safe = True
+
+    plugins = [ExtractReview, ExtractBurnin, ExtractReviewSlate]
+    assert get_parallel_plugins_group(plugins, 0) == [
+        ExtractReview, ExtractBurnin
+    ]
+    # Plugins of other order band are not in group
+    plugins = [ExtractReview, ExtractBurnin, IntegrateAsset]
+    assert get_parallel_plugins_group(plugins, 0) == [
+        ExtractReview, ExtractBurnin
+    ]
+
+
+def test_concurrent_group():
+    failed = []
+    processed = []
+
+    def on_failed(plugin, context, instance, error):
+        failed.append((plugin, instance.data["name"]))
+
+    def on_processed(result):
+        processed.append(result)
+
+    pyblish.api.register_callback("pluginFailed", on_failed)
+    pyblish.api.register_callback("pluginProcessed", on_processed)
+    try:
+        _process_concurrent_group(failed, processed)
+    finally:
+        pyblish.api.deregister_callback("pluginFailed", on_failed)
+        pyblish.api.deregister_callback("pluginProcessed", on_processed)
+
+
+def _process_concurrent_group(failed, processed):
+    context = pyblish.api.Context()
+    names = ["instance_a", "instance_b", "broken"]
+    instances = [context.create_instance(name) for name in names]
+    _Barrier.barrier = threading.Barrier(len(instances))
+
+    group = ConcurrentPublishGroup(
+        context,
+        [
+            (ExtractFirst, instances),
+            (ExtractSecond, instances),
+            (ExtractLast, instances),
+        ],
+        workers=4
+    )
+    group.start()
+    assert group.wait(10)
+    results_by_instance = group.finish()
+
+    assert instances[0].data["order"] == ["first", "second", "last"]
+    assert instances[1].data["order"] == ["first", "second", "last"]
+    # Error does not stop following plugins of instance
+    assert instances[2].data["order"] == ["first", "last"]
+    assert [len(results) for results in results_by_instance] == [3, 3, 3]
+    assert isinstance(results_by_instance[2][1]["error"], ValueError)
+    assert len(context.data["results"]) == 9
+    assert failed == [(ExtractSecond, "broken")]
+    assert len(processed) == 9
+
+    # Records are not mixed between threads
+    for instance, results in zip(instances, results_by_instance):
+        messages = [
+            record.getMessage()
+            for result in results
+            for record in result["records"]
+        ]
+        assert all(
+            message.endswith(instance.data["name"])
+            for message in messages
+        )
+
+
+def test_report_timings():
+    report = PublishReportMaker(None)
+    context = pyblish.api.Context()
+    instance_a = context.create_instance("a")
+    instance_b = context.create_instance("b")
+    for plugin in (ExtractFirst, ExtractSecond):
+        report.add_plugin_iter(plugin, context)
+
+    def _result(plugin, instance, duration):
+        return {
+            "plugin": plugin,
+            "instance": instance,
+            "duration": duration,
+            "records": [],
+        }
+
+    report.add_result(_result(ExtractFirst, instance_a, 5))
+    report.add_concurrent_results([
+        [
+            _result(ExtractFirst, instance_a, 10),
+            _result(ExtractSecond, instance_a, 10)
+        ],
+        [
+            _result(ExtractFirst, instance_b, 30),
+        ],
+    ])
+    timings = report._get_timings_data()
+
+    assert timings["total_process_time"] == 55
+    assert timings["critical_path_time"] == 35
+    assert [
+        item["process_time"] for item in timings["critical_path"]
+    ] == [5, 30]
+    assert timings["plugins"] == {
+        ExtractFirst.id: 45, ExtractSecond.id: 10
+    }
+    assert timings["instances"] == {instance_a.id: 25, instance_b.id: 30}